@@ -9,19 +9,23 @@ robotmesh.com/studio/content/docs/vexv5-python/html/namespacedrivetrain.html
 
 
 from collections.abc import Sequence
+from math import pi
 from typing import LiteralString, Optional, Self
 
-from abm.decor import act, sense
-
 from vex.motor import Motor
 from vex.motor.brake import BrakeType
-from vex.motor.direction import DirectionType
-from vex.motor.turn import TurnType
+from vex.motor.direction import DirectionType, REVERSE
+from vex.motor.mailbox import MotorCommand
+from vex.motor.turn import TurnType, RIGHT
+from vex.multi_device_group.engine import GroupEngine
 from vex.time.units import TimeUnits
+from vex._common_enums.percent import PERCENT
 from vex._common_enums.distance import DistanceUnits
 from vex._common_enums.rotation import RotationUnits
-from vex._common_enums.velocity import VelocityUnits
+from vex._common_enums.velocity import VelocityUnits, _Velocity
 
+from vex._util.conversion import convert
+from vex._util.decor import act, sense
 from vex._util.doc import robotmesh_doc
 from vex._util.type import Num
 
@@ -62,6 +66,10 @@ class Drivetrain:  # pylint: disable=too-many-instance-attributes
             distanceUnits: DistanceUnits = DistanceUnits.MM,
             gear_ratio: Num = 1, /):
         """Initialize Drivetrain."""
+        # left & right sides of any numbers of motors, in one shared engine
+        self.engine: GroupEngine = GroupEngine(left_motor, right_motor)
+        self.motors: tuple[Motor, ...] = self.engine.motors
+
         self.left_motor: DrivetrainMotorType = left_motor
         self.right_motor: DrivetrainMotorType = right_motor
         self.wheel_travel: Num = wheel_travel
@@ -69,18 +77,13 @@ class Drivetrain:  # pylint: disable=too-many-instance-attributes
         self.distance_unit: DistanceUnits = distanceUnits
         self.gear_ratio: Num = gear_ratio
 
-        self.drive_velocities: dict[VelocityUnits, Num] = \
-            dict[VelocityUnits, Num]()
-        self.turn_velocities: dict[VelocityUnits, Num] = \
-            dict[VelocityUnits, Num]()
-        self.timeouts: dict[TimeUnits, Num] = dict[TimeUnits, Num]()
-        self.stopping: Optional[BrakeType] = None
+        self.drive_velocity: Optional[_Velocity] = None
+        self.turn_velocity: Optional[_Velocity] = None
 
     def __eq__(self: Self, other: Self) -> bool:
         """Check equality."""
         return (isinstance(other, Drivetrain) and
-                (other.left_motor == self.left_motor) and
-                (other.right_motor == self.right_motor) and
+                (other.engine == self.engine) and
                 (other.wheel_travel == self.wheel_travel) and
                 (other.track_width == self.track_width) and
                 (other.distance_unit == self.distance_unit) and
@@ -88,10 +91,53 @@ class Drivetrain:  # pylint: disable=too-many-instance-attributes
 
     def __hash__(self: Self) -> int:
         """Return integer hash."""
-        return hash((self.left_motor, self.right_motor,
+        return hash((self.engine,
                      self.wheel_travel, self.track_width,
                      self.distance_unit, self.gear_ratio))
 
+    def _percent(self: Self, velocity: Optional[Num], unit: VelocityUnits,
+                 default: Optional[_Velocity], /) -> float:
+        # specified, else set drive/turn velocity, in percent (50% if not set)
+        if velocity is not None:
+            return self.engine.percent(velocity, unit)
+        return (50 if default is None
+                else self.engine.percent(default.measurement, default.unit))
+
+    def _wheel_degrees(self: Self, distance: Num, unit: DistanceUnits, /) \
+            -> float:
+        # wheels turn 360 degrees (times gear ratio) per wheel travel
+        return (convert(distance, unit, DistanceUnits.MM) /
+                convert(self.wheel_travel, self.distance_unit,
+                        DistanceUnits.MM) *
+                360 * self.gear_ratio)
+
+    def _drive_for(self: Self,  # pylint: disable=too-many-arguments
+                   direction: DirectionType,
+                   distance: Num, distance_unit: DistanceUnits,
+                   velocity: Optional[Num], velocity_unit: VelocityUnits, /) \
+            -> tuple[MotorCommand, ...]:
+        # move all wheels by distance in direction
+        rotation: float = self._wheel_degrees(distance, distance_unit)
+        return self.engine.move(
+            'drive_for', -rotation if direction is REVERSE else rotation,
+            self._percent(velocity, velocity_unit, self.drive_velocity))
+
+    def _turn_for(self: Self,  # pylint: disable=too-many-arguments
+                  turn: TurnType, angle: Num, angle_unit: RotationUnits,
+                  velocity: Optional[Num], velocity_unit: VelocityUnits, /) \
+            -> tuple[MotorCommand, ...]:
+        # wheels travel along the turning circle of the track width
+        rotation: float = self._wheel_degrees(
+            pi * self.track_width *
+            convert(angle, angle_unit, RotationUnits.DEG) / 360,
+            self.distance_unit)
+        if turn is not RIGHT:
+            rotation: float = -rotation
+        percent: float = self._percent(velocity, velocity_unit,
+                                       self.turn_velocity)
+        return (self.engine.move('turn_for', rotation, percent, side=0) +
+                self.engine.move('turn_for', -rotation, percent, side=1))
+
     @robotmesh_doc("""
         Turn the motors on and drives in the specified direction.
 
@@ -107,6 +153,9 @@ class Drivetrain:  # pylint: disable=too-many-instance-attributes
               velocity: Optional[Num] = None,
               velocityUnits: VelocityUnits = VelocityUnits.PCT, /):
         """Drive."""
+        percent: float = self._percent(velocity, velocityUnits,
+                                       self.drive_velocity)
+        self.engine.spin(-percent if directionType is REVERSE else percent)
 
     @robotmesh_doc("""
         Drives for a specified distance.
@@ -135,6 +184,9 @@ class Drivetrain:  # pylint: disable=too-many-instance-attributes
             velocityUnits: VelocityUnits = VelocityUnits.PCT,
             waitForCompletion: bool = True, /) -> bool:
         """Drive for specified distance."""
+        commands: tuple[MotorCommand, ...] = self._drive_for(
+            directionType, distance, distanceUnits, velocity, velocityUnits)
+        return waitForCompletion and self.engine.wait(commands)
 
     @robotmesh_doc("""
         Start driving for a specified distance.
@@ -156,6 +208,8 @@ class Drivetrain:  # pylint: disable=too-many-instance-attributes
             velocity: Optional[Num] = None,
             velocityUnits: VelocityUnits = VelocityUnits.PCT, /):
         """Start driving for specified distance."""
+        self._drive_for(directionType, distance, distanceUnits,
+                        velocity, velocityUnits)
 
     @robotmesh_doc("""
         Turn the drivetrain left or right.
@@ -171,6 +225,10 @@ class Drivetrain:  # pylint: disable=too-many-instance-attributes
              velocity: Optional[Num] = None,
              velocityUnits: VelocityUnits = VelocityUnits.PCT, /):
         """Turn."""
+        percent: float = self._percent(velocity, velocityUnits,
+                                       self.turn_velocity)
+        self.engine.spin_sides((percent, -percent) if turnType is RIGHT
+                               else (-percent, percent))
 
     @robotmesh_doc("""
         Turn the drivetrain left or right until the specified angle is reached.
@@ -199,6 +257,9 @@ class Drivetrain:  # pylint: disable=too-many-instance-attributes
                  velocityUnits: VelocityUnits = VelocityUnits.PCT,
                  waitForCompletion: bool = True, /) -> bool:
         """Turn for specified rotational angle."""
+        commands: tuple[MotorCommand, ...] = self._turn_for(
+            turnType, angle, rotationUnits, velocity, velocityUnits)
+        return waitForCompletion and self.engine.wait(commands)
 
     @robotmesh_doc("""
         Start turning drivetrain left or right.
@@ -221,6 +282,7 @@ class Drivetrain:  # pylint: disable=too-many-instance-attributes
                        velocity: Optional[Num] = None,
                        velocityUnits: VelocityUnits = VelocityUnits.PCT, /):
         """Start turning for specified rotational angle."""
+        self._turn_for(turnType, angle, angleUnits, velocity, velocityUnits)
 
     @robotmesh_doc("""
         Drive in arcade mode.
@@ -234,6 +296,12 @@ class Drivetrain:  # pylint: disable=too-many-instance-attributes
     @act
     def arcade(self: Self, drivePower: Num, turnPower: Num, /):
         """Arcade-drive."""
+        # (clamped, as drive & turn powers may add up beyond full speed)
+        sides: tuple[float, float] = (
+            min(max(drivePower + turnPower, -100), 100),
+            min(max(drivePower - turnPower, -100), 100))
+        self.engine.set_side_velocities(sides, PERCENT)
+        self.engine.spin_sides(sides)
 
     @robotmesh_doc("""
         Stop the drive using a specified brake mode.
@@ -245,6 +313,9 @@ class Drivetrain:  # pylint: disable=too-many-instance-attributes
     @act
     def stop(self: Self, brakeType: Optional[BrakeType] = None, /):
         """Stop motors."""
+        if brakeType is not None:
+            self.engine.set_stopping(brakeType)
+        self.engine.stop()
 
     @robotmesh_doc("""
         Set the external gear ratio of the drivetrain.
@@ -273,7 +344,7 @@ class Drivetrain:  # pylint: disable=too-many-instance-attributes
     def set_drive_velocity(self: Self, velocity: Num,
                            velocityUnits: VelocityUnits = VelocityUnits.PCT, /):  # noqa: E501
         """Set driving velocity."""
-        self.drive_velocities[velocityUnits] = velocity
+        self.drive_velocity: _Velocity = _Velocity(velocity, velocityUnits)
 
     @robotmesh_doc("""
         Set the velocity of the turn.
@@ -289,7 +360,7 @@ class Drivetrain:  # pylint: disable=too-many-instance-attributes
     def set_turn_velocity(self: Self, velocity: Num,
                           velocityUnits: VelocityUnits = VelocityUnits.PCT, /):
         """Set turning velocity."""
-        self.turn_velocities[velocityUnits] = velocity
+        self.turn_velocity: _Velocity = _Velocity(velocity, velocityUnits)
 
     @robotmesh_doc("""
         Set the timeout for the drivetrain.
@@ -305,7 +376,7 @@ class Drivetrain:  # pylint: disable=too-many-instance-attributes
     def set_timeout(self: Self,
                     time: Num, timeUnits: TimeUnits = TimeUnits.SEC, /):
         """Set motor timeout."""
-        self.timeouts[timeUnits] = time
+        self.engine.set_timeout(time, timeUnits)
 
     @robotmesh_doc("""
         Return a timeout in given time units.
@@ -313,7 +384,7 @@ class Drivetrain:  # pylint: disable=too-many-instance-attributes
     @sense
     def timeout(self: Self, timeUnits: TimeUnits = TimeUnits.SEC, /) -> Num:  # noqa: E501
         """Return motor timeout."""
-        return self.timeouts[timeUnits]
+        return self.engine.timeout(timeUnits)
 
     @robotmesh_doc("""
         Return True if last drivetrain operation timed out, False otherwise.
@@ -343,7 +414,7 @@ class Drivetrain:  # pylint: disable=too-many-instance-attributes
     @act
     def set_stopping(self: Self, brakeType: BrakeType, /):
         """Set motor stopping mode."""
-        self.stopping: BrakeType = brakeType
+        self.engine.set_stopping(brakeType)
 
     @robotmesh_doc("""
         Get the average current velocity of all motors.
@@ -9,19 +9,21 @@ robotmesh.com/studio/content/docs/vexv5-python/html/namespacemotor__group.html
 
 
 from collections.abc import Sequence
-from typing import LiteralString, Optional, Self
-
-from abm.decor import act, sense
+from typing import Any, LiteralString, Optional, Self
 
+from vex.brain.port import Ports
 from vex.motor import Motor
 from vex.motor.brake import BrakeType
-from vex.motor.direction import DirectionType
+from vex.motor.direction import DirectionType, REVERSE
+from vex.motor.mailbox import MotorCommand
+from vex.motor.state import MotorStates
 from vex.motor.torque import TorqueUnits
+from vex.multi_device_group.engine import GroupEngine
 from vex.time.units import TimeUnits
 from vex._common_enums.rotation import RotationUnits
-from vex._common_enums.percent import PERCENT
 from vex._common_enums.velocity import VelocityUnits
 
+from vex._util.decor import act, sense
 from vex._util.doc import robotmesh_doc
 from vex._util.type import Num
 
@@ -45,23 +47,49 @@ class MotorGroup:  # pylint: disable=too-many-public-methods
     def __init__(self: Self, motors: list[Motor], /):
         """Initialize Motor Group."""
         self.motors: list[Motor] = motors
-        self.rotations: dict[Motor, dict[RotationUnits, Num]] = \
-            {motor: {} for motor in motors}
 
-        self.velocities: dict[VelocityUnits, Num] = \
-            dict[VelocityUnits, Num]()
-        self.stopping: Optional[BrakeType] = None
-        self.timeouts: dict[TimeUnits, Num] = dict[TimeUnits, Num]()
-        self.max_torque: dict[TorqueUnits, Num] = dict[TorqueUnits, Num]()  # noqa: E501
+        # shared group engine, holding motors' settings in one contiguous
+        # array per setting, with motors as views onto their slots
+        self.engine: GroupEngine = GroupEngine(motors)
+
+    @property
+    def states(self: Self, /) -> MotorStates:
+        """Motors' settings storage (followed if motors are regrouped)."""
+        return self.engine.states
 
     def __eq__(self: Self, other: Self) -> bool:
         """Check equality."""
-        return isinstance(other, MotorGroup) and \
-            (set(other.motors) == set(self.motors))
+        return isinstance(other, MotorGroup) and (other.engine == self.engine)
 
     def __hash__(self: Self) -> int:
         """Return integer hash."""
-        return hash(set(self.motors))
+        return hash(self.engine)
+
+    def __contains__(self: Self, member: Motor | Ports, /) -> bool:
+        """Check whether motor (or port) is in group."""
+        return member in self.engine
+
+    def overlaps(self: Self, other: Any, /) -> bool:
+        """Check whether other motor group/drivetrain shares any motor."""
+        return self.engine.overlaps(other)
+
+    def _percent(self: Self, velocity: Optional[Num],
+                 unit: VelocityUnits, /) -> float:
+        # specified, else set velocity, in percent
+        return (self.engine.velocity_percent() if velocity is None
+                else self.engine.percent(velocity, unit))
+
+    def _move(self: Self,  # pylint: disable=too-many-arguments
+              name: str, direction: DirectionType,
+              rotation: Num, rotation_unit: RotationUnits,
+              velocity: Optional[Num], velocity_unit: VelocityUnits, /) \
+            -> tuple[MotorCommand, ...]:
+        # move all motors by rotation in direction
+        rotation: float = self.engine.degrees(rotation, rotation_unit)
+        return self.engine.move(name,
+                                -rotation if direction is REVERSE
+                                else rotation,
+                                self._percent(velocity, velocity_unit))
 
     @robotmesh_doc("""
         Return the number of motors in the motor group.
@@ -89,7 +117,7 @@ class MotorGroup:  # pylint: disable=too-many-public-methods
     def set_velocity(self: Self,
                      velocity: Num, velocityUnits=VelocityUnits.PCT, /):
         """Set motor velocity."""
-        self.velocities[velocityUnits] = velocity
+        self.engine.set_velocity(velocity, velocityUnits)
 
     @robotmesh_doc("""
         Set stopping mode of motor group by passing brake mode as parameter.
@@ -101,7 +129,7 @@ class MotorGroup:  # pylint: disable=too-many-public-methods
     @act
     def set_stopping(self: Self, brakeType: BrakeType, /):
         """Set motor stopping mode."""
-        self.stopping: BrakeType = brakeType
+        self.engine.set_stopping(brakeType)
 
     @robotmesh_doc("""
         Reset all motor encoders to the value of zero.
@@ -109,9 +137,7 @@ class MotorGroup:  # pylint: disable=too-many-public-methods
     @act
     def reset_rotation(self: Self):
         """Reset motors' rotational angle to 0."""
-        for motor in self.motors:
-            for rotation_unit in self.rotations[motor]:
-                self.rotations[motor][rotation_unit] = 0
+        self.engine.reset_rotation()
 
     @robotmesh_doc("""
         Set value of all motor encoders to value specified in parameter.
@@ -124,8 +150,7 @@ class MotorGroup:  # pylint: disable=too-many-public-methods
     @act
     def set_rotation(self: Self, value: Num, rotationUnits=RotationUnits.DEG, /):  # noqa: E501
         """Set motors' rotational angle to specified value."""
-        for motor in self.motors:
-            self.rotations[motor][rotationUnits] = value
+        self.engine.set_rotation(value, rotationUnits)
 
     @robotmesh_doc("""
         Set the timeout for the motor group.
@@ -140,7 +165,7 @@ class MotorGroup:  # pylint: disable=too-many-public-methods
     @act
     def set_timeout(self: Self, time: Num, timeUnits=TimeUnits.SEC, /):
         """Set motor timeout."""
-        self.timeouts[timeUnits] = time
+        self.engine.set_timeout(time, timeUnits)
 
     @robotmesh_doc("""
         Return a timeout in given time units.
@@ -148,7 +173,7 @@ class MotorGroup:  # pylint: disable=too-many-public-methods
     @sense
     def timeout(self: Self, timeUnits: TimeUnits = TimeUnits.SEC, /) -> Num:  # noqa: E501
         """Return motor timeout."""
-        return self.timeouts[timeUnits]
+        return self.engine.timeout(timeUnits)
 
     @robotmesh_doc("""
         Return True if the last motor operation on any motor timed out.
@@ -175,6 +200,8 @@ class MotorGroup:  # pylint: disable=too-many-public-methods
              velocity: Optional[Num] = None,
              velocityUnits: VelocityUnits = VelocityUnits.PCT, /):
         """Spin motors."""
+        percent: float = self._percent(velocity, velocityUnits)
+        self.engine.spin(-percent if dir is REVERSE else percent)
 
     @robotmesh_doc("""
         Turn on the motors and spin them.
@@ -204,6 +231,10 @@ class MotorGroup:  # pylint: disable=too-many-public-methods
                 velocityUnits: VelocityUnits = VelocityUnits.PCT,
                 waitForCompletion: bool = True, /) -> bool:
         """Spin motors to specified target rotational angle."""
+        commands: tuple[MotorCommand, ...] = self.engine.move(
+            'spin_to', self.engine.degrees(rotation, rotationUnits),
+            self._percent(velocity, velocityUnits), absolute=True)
+        return waitForCompletion and self.engine.wait(commands)
 
     @robotmesh_doc("""
         Turn on the motors and spin them.
@@ -234,6 +265,12 @@ class MotorGroup:  # pylint: disable=too-many-public-methods
                  velocityUnits: VelocityUnits = VelocityUnits.PCT,
                  waitForCompletion: bool = True, /) -> bool:
         """Spin motors for specified rotational angle."""
+        commands: tuple[MotorCommand, ...] = self._move('spin_for', dir,
+                                                        rotation,
+                                                        rotationUnits,
+                                                        velocity,
+                                                        velocityUnits)
+        return waitForCompletion and self.engine.wait(commands)
 
     @robotmesh_doc("""
         Turn on the motors and spin them for a given amount of time.
@@ -254,6 +291,14 @@ class MotorGroup:  # pylint: disable=too-many-public-methods
                       velocity: Optional[Num] = None,
                       velocityUnits: VelocityUnits = VelocityUnits.PCT, /):
         """Spin motors for specified time duration."""
+        assert isinstance(time, Num), \
+            TypeError('*** time MUST BE A float OR AN int ***')
+
+        assert isinstance(timeUnits, TimeUnits), \
+            TypeError('*** timeUnits MUST BE ONE OF TimeUnits ***')
+
+        percent: float = self._percent(velocity, velocityUnits)
+        self.engine.spin(-percent if dir is REVERSE else percent)
 
     @robotmesh_doc("""
         Start spinning motors to an absolute target rotation.
@@ -273,6 +318,10 @@ class MotorGroup:  # pylint: disable=too-many-public-methods
                       velocity: Optional[Num] = None,
                       velocityUnits: VelocityUnits = VelocityUnits.PCT, /):
         """Start spinning motors to target rotational angle."""
+        self.engine.move('start_spin_to',
+                         self.engine.degrees(rotation, rotationUnits),
+                         self._percent(velocity, velocityUnits),
+                         absolute=True)
 
     @robotmesh_doc("""
         Start spinning motors to a relative target rotation.
@@ -294,6 +343,8 @@ class MotorGroup:  # pylint: disable=too-many-public-methods
                        velocity: Optional[Num] = None,
                        velocityUnits: VelocityUnits = VelocityUnits.PCT, /):
         """Start spinning motors for specified rotational angle."""
+        self._move('start_spin_for', dir, rotation, rotationUnits,
+                   velocity, velocityUnits)
 
     @robotmesh_doc("""
         Determine if any motor in group is performing spin_for/spin_to command.
@@ -326,6 +377,9 @@ class MotorGroup:  # pylint: disable=too-many-public-methods
     @act
     def stop(self: Self, brakeType: Optional[BrakeType] = None, /):
         """Stop motors."""
+        if brakeType is not None:
+            self.engine.set_stopping(brakeType)
+        self.engine.stop()
 
     @robotmesh_doc("""
         Set the max torque of all motors as a percentage.
@@ -336,7 +390,7 @@ class MotorGroup:  # pylint: disable=too-many-public-methods
     @act
     def set_max_torque_percent(self: Self, value: int, /):
         """Set max torque percentage level."""
-        self.max_torque[PERCENT] = value
+        self.engine.fill('max_torque', value)
 
     @robotmesh_doc("""
         Set the max torque of all motors.
@@ -349,7 +403,7 @@ class MotorGroup:  # pylint: disable=too-many-public-methods
     def set_max_torque(self: Self, value: Num,
                        torqueUnits: TorqueUnits = TorqueUnits.NM, /):
         """Set max torque."""
-        self.max_torque[torqueUnits] = value
+        self.engine.set_max_torque(value, torqueUnits)
 
     @robotmesh_doc("""
         Set the max torque of all motors.
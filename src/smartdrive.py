@@ -11,13 +11,12 @@ robotmesh.com/studio/content/docs/vexv5-python/html/namespacesmartdrive.html
 from collections.abc import Sequence
 from typing import LiteralString, Optional, Self
 
-from abm.decor import act, sense
-
 from vex.gyro_sensor import Gyro
 from vex._common_enums.distance import DistanceUnits
 from vex._common_enums.rotation import RotationUnits
 from vex._common_enums.velocity import VelocityUnits
 
+from vex._util.decor import act, sense
 from vex._util.doc import robotmesh_doc
 from vex._util.type import Num
 
@@ -66,8 +65,7 @@ class Smartdrive(Drivetrain):
     def __eq__(self: Self, other: Self) -> bool:
         """Check equality."""
         return (isinstance(other, Smartdrive) and
-                (other.left_motor == self.left_motor) and
-                (other.right_motor == self.right_motor) and
+                (other.engine == self.engine) and
                 (other.gyro == self.gyro) and
                 (other.wheel_travel == self.wheel_travel) and
                 (other.track_width == self.track_width) and
@@ -76,7 +74,7 @@ class Smartdrive(Drivetrain):
 
     def __hash__(self: Self) -> int:
         """Return integer hash."""
-        return hash((self.left_motor, self.right_motor,
+        return hash((self.engine,
                      self.gyro,
                      self.wheel_travel, self.track_width,
                      self.distance_unit, self.gear_ratio))
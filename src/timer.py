@@ -11,8 +11,7 @@ robotmesh.com/studio/content/docs/vexv5-python/html/namespacetimer.html
 from collections.abc import Sequence
 from typing import LiteralString, Self
 
-from abm.decor import act, sense
-
+from vex._util.decor import act, sense
 from vex._util.doc import robotmesh_doc
 
 
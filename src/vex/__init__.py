@@ -73,6 +73,7 @@ from ._common_enums import (AnalogUnits,
                             TemperatureUnits,
                             VelocityUnits, RPM, DPS)
 
+from ._util.cache import SenseCache
 from ._util.doc import robotmesh_doc
 from ._util.type import Num
 
@@ -138,6 +139,8 @@ __all__: Sequence[LiteralString] = (
     'staticmethod',
 
     'interactive',
+
+    'SenseCache',
 )
 
 
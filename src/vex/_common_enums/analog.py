@@ -3,10 +3,12 @@
 
 from collections.abc import Sequence
 from enum import IntEnum
+from fractions import Fraction
 from typing import LiteralString
 
 from .percent import PERCENT
 
+from .._util.conversion import define_units
 from .._util.doc import robotmesh_doc
 
 
@@ -29,3 +31,11 @@ class AnalogUnits(IntEnum):
     RANGE_12BIT: int = 3  # analog unit on a 12-bit range
 
     MV: int = 4  # milivolt unit
+
+
+# fractions of full scale (0-5V) per unit
+define_units(AnalogUnits, {AnalogUnits.PCT: Fraction(1, 100),
+                           AnalogUnits.RANGE_8BIT: Fraction(1, 255),
+                           AnalogUnits.RANGE_10BIT: Fraction(1, 1023),
+                           AnalogUnits.RANGE_12BIT: Fraction(1, 4095),
+                           AnalogUnits.MV: Fraction(1, 5000)})
@@ -3,8 +3,10 @@
 
 from collections.abc import Sequence
 from enum import IntEnum
+from fractions import Fraction
 from typing import LiteralString
 
+from .._util.conversion import define_units
 from .._util.doc import robotmesh_doc
 from .._util.measurement_with_unit import _MeasurementWithUnitABC
 
@@ -33,3 +35,7 @@ INCHES: DistanceUnits = DistanceUnits.IN
 
 class _Distance(_MeasurementWithUnitABC):  # pylint: disable=too-few-public-methods
     unit: DistanceUnits = MM
+
+
+# sizes in millimeters
+define_units(DistanceUnits, {MM: 1, INCHES: Fraction(254, 10), DistanceUnits.CM: 10})  # noqa: E501
@@ -5,6 +5,7 @@ from collections.abc import Sequence
 from enum import IntEnum
 from typing import LiteralString
 
+from .._util.conversion import define_units
 from .._util.doc import robotmesh_doc
 
 
@@ -25,3 +26,6 @@ class PercentUnits(IntEnum):
 
 # aliases
 PERCENT: PercentUnits = PercentUnits.PCT
+
+
+define_units(PercentUnits, {PERCENT: 1.})
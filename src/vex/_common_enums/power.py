@@ -5,6 +5,7 @@ from collections.abc import Sequence
 from enum import IntEnum
 from typing import LiteralString
 
+from .._util.conversion import define_units
 from .._util.doc import robotmesh_doc
 from .._util.measurement_with_unit import _MeasurementWithUnitABC
 
@@ -26,3 +27,6 @@ class PowerUnits(IntEnum):
 
 class _Power(_MeasurementWithUnitABC):  # pylint: disable=too-few-public-methods
     unit: PowerUnits = PowerUnits.WATT
+
+
+define_units(PowerUnits, {PowerUnits.WATT: 1.})
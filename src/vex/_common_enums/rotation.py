@@ -5,6 +5,7 @@ from collections.abc import Sequence
 from enum import IntEnum
 from typing import LiteralString
 
+from .._util.conversion import define_units
 from .._util.doc import robotmesh_doc
 from .._util.measurement_with_unit import _MeasurementWithUnitABC
 
@@ -33,3 +34,7 @@ TURNS: RotationUnits = RotationUnits.REV
 
 class _Rotation(_MeasurementWithUnitABC):  # pylint: disable=too-few-public-methods
     unit: RotationUnits = DEGREES
+
+
+# sizes in degrees (RAW depends on motor encoder, hence not convertible)
+define_units(RotationUnits, {DEGREES: 1., TURNS: 360.})
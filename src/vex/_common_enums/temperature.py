@@ -3,8 +3,10 @@
 
 from collections.abc import Sequence
 from enum import IntEnum
+from fractions import Fraction
 from typing import LiteralString
 
+from .._util.conversion import define_units
 from .._util.doc import robotmesh_doc
 from .._util.measurement_with_unit import _MeasurementWithUnitABC
 
@@ -29,3 +31,11 @@ class TemperatureUnits(IntEnum):
 class _Temperature(_MeasurementWithUnitABC):  # pylint: disable=too-few-public-methods
     measurement: float
     unit: TemperatureUnits = TemperatureUnits.CELSIUS
+
+
+# sizes & zeros in degrees Celsius
+# (PCT is relative to motor's operating range, hence not convertible)
+define_units(TemperatureUnits,
+             {TemperatureUnits.CELSIUS: 1.,
+              TemperatureUnits.FAHRENHEIT: Fraction(5, 9)},
+             offsets={TemperatureUnits.FAHRENHEIT: Fraction(-160, 9)})
@@ -7,6 +7,7 @@ from typing import LiteralString
 
 from .percent import PERCENT
 
+from .._util.conversion import define_units
 from .._util.doc import robotmesh_doc
 from .._util.measurement_with_unit import _MeasurementWithUnitABC
 
@@ -39,3 +40,8 @@ DPS: VelocityUnits = VelocityUnits.DPS
 
 class _Velocity(_MeasurementWithUnitABC):  # pylint: disable=too-few-public-methods
     unit: VelocityUnits = RPM
+
+
+# sizes in degrees per second
+# (PCT & RAW depend on motor gearing, so are only in motors' own tables)
+define_units(VelocityUnits, {DPS: 1., RPM: 6.})
@@ -5,10 +5,14 @@ from collections.abc import Sequence
 from typing import LiteralString
 
 from .abc import Device
+from .registry import (DeviceRegistry, DEVICE_REGISTRY,
+                       PortConflict, PortConflictWarning)
 from .singleton import SingletonDevice
 from .tri import TriDevice
 from .v5 import V5DeviceType
 
 
 __all__: Sequence[LiteralString] = ('Device', 'SingletonDevice', 'TriDevice',
-                                    'V5DeviceType')
+                                    'V5DeviceType',
+                                    'DeviceRegistry', 'DEVICE_REGISTRY',
+                                    'PortConflict', 'PortConflictWarning')
@@ -8,9 +8,11 @@ from typing import LiteralString, Self, TYPE_CHECKING
 
 from .._util.doc import robotmesh_doc
 
+from .registry import DEVICE_REGISTRY
+from .v5 import V5DeviceType
+
 if TYPE_CHECKING:
     from ..brain.port import Ports
-    from .v5 import V5DeviceType
 
 
 __all__: Sequence[LiteralString] = ('Device',)
@@ -29,6 +31,8 @@ __all__: Sequence[LiteralString] = ('Device',)
 class Device:
     """Base Device class."""
 
+    _V5_DEVICE_TYPE: V5DeviceType = V5DeviceType.UNDEFINED
+
     @property
     def port(self: Self, /) -> Ports:
         """Port."""
@@ -36,8 +40,13 @@ class Device:
 
     @port.setter
     def port(self: Self, port: Ports, /):
+        if hasattr(self, '_port'):
+            DEVICE_REGISTRY.unregister(self)
+
         self._port: Ports = port
 
+        DEVICE_REGISTRY.register(self)
+
     def __eq__(self: Self, other: Self, /) -> bool:
         """Check equality."""
         return isinstance(other, type(self)) and (other.port == self.port)
@@ -52,3 +61,4 @@ class Device:
 
     def type(self, /) -> V5DeviceType:
         """Return type of device, for V5 case only."""
+        return self._V5_DEVICE_TYPE
@@ -0,0 +1,142 @@
+"""Registry of devices by brain port."""
+
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from typing import LiteralString, Optional, Self, TYPE_CHECKING
+from warnings import warn
+from weakref import ref
+
+if TYPE_CHECKING:
+    from ..brain.port import Ports
+    from .abc import Device
+    from .v5 import V5DeviceType
+
+
+__all__: Sequence[LiteralString] = ('DeviceRegistry', 'DEVICE_REGISTRY',
+                                    'PortConflict', 'PortConflictWarning')
+
+
+class PortConflictWarning(UserWarning):
+    """Warning of a device constructed on a port occupied by another."""
+
+
+@dataclass(frozen=True)
+class PortConflict:
+    """Port conflict: port, & classes of its occupant & of the new device.
+
+    Records classes rather than devices, so as not to keep devices alive.
+    """
+
+    port: Ports
+    occupant: type
+    device: type
+
+
+class DeviceRegistry:
+    """Devices indexed by brain port & by V5 device type.
+
+    Slot `i` of the fixed-size slots list holds the device on `Ports(i)`,
+    and each V5 device type maps to its devices keyed by port, so lookups
+    by port or by type, registration & replacement are all constant-time.
+
+    Devices register themselves when their port is set. Constructing a
+    device on a port occupied by a device of a different class is a port
+    conflict: it is recorded & warned about (or asserted against if
+    `strict`), and the new device then takes over the port, as if plugged
+    in in place of the old one. Re-declaring a device of the same class on
+    the same port (e.g. one Motor object per module) is not a conflict.
+
+    Devices are held by weak reference, so that the registry does not keep
+    alive devices the program no longer uses, and their ports free up once
+    they are garbage-collected.
+    """
+
+    N_PORTS: int = 22
+
+    def __init__(self: Self, /, strict: bool = False):
+        """Initialize empty Device Registry."""
+        self.strict: bool = strict
+        self.slots: list[Optional[ref[Device]]] = [None] * self.N_PORTS
+        self.by_type: dict[V5DeviceType, dict[int, ref[Device]]] = {}
+        self.conflicts: list[PortConflict] = []
+
+    def __len__(self: Self, /) -> int:
+        """Return number of occupied ports."""
+        return sum(1 for _ in self)
+
+    def __iter__(self: Self, /) -> Iterator[Device]:
+        """Iterate over registered devices in port order."""
+        return (device
+                for device in (None if slot is None else slot()
+                               for slot in self.slots)
+                if device is not None)
+
+    def __contains__(self: Self, port: Ports, /) -> bool:
+        """Check whether port is occupied."""
+        return self[port] is not None
+
+    def __getitem__(self: Self, port: Ports, /) -> Optional[Device]:
+        """Return device on port (None if unoccupied)."""
+        return None if (slot := self.slots[port]) is None else slot()
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return f'{type(self).__name__}({list(self)})'
+
+    def of_type(self: Self, device_type: V5DeviceType, /) -> tuple[Device, ...]:  # noqa: E501
+        """Return devices of specified V5 device type."""
+        return tuple(device
+                     for device in (slot() for slot in
+                                    self.by_type.get(device_type, {}).values())
+                     if device is not None)
+
+    def register(self: Self, device: Device, /):
+        """Register device on its port, detecting port conflicts."""
+        port: int = int(device.port)
+        assert 0 <= port < self.N_PORTS, \
+            ValueError(f'*** {device.port!r} NOT A BRAIN PORT ***')
+
+        if (occupant := self[port]) is not None:
+            if type(occupant) is not type(device):
+                assert not self.strict, \
+                    ValueError(f'*** {device.port.name} ALREADY OCCUPIED '
+                               f'BY {occupant} ***')
+                self.conflicts.append(PortConflict(device.port,
+                                                   type(occupant),
+                                                   type(device)))
+                warn(f'{type(device).__name__} constructed on '
+                     f'{device.port.name} already occupied by {occupant}',
+                     PortConflictWarning, stacklevel=4)
+
+            self.unregister(occupant)
+
+        device_type: V5DeviceType = device.type()
+        self.slots[port] = slot = ref(
+            device, lambda slot: self._free(port, device_type, slot))
+        self.by_type.setdefault(device_type, {})[port] = slot
+
+    def _free(self: Self,
+              port: int, device_type: V5DeviceType, slot: ref[Device], /):
+        if self.slots[port] is slot:
+            self.slots[port] = None
+            del self.by_type[device_type][port]
+
+    def unregister(self: Self, device: Device, /):
+        """Free device's port, if registered there."""
+        port: int = int(device.port)
+
+        if self[port] is device:
+            self._free(port, device.type(), self.slots[port])
+
+    def clear(self: Self, /):
+        """Free all ports & forget recorded conflicts."""
+        self.slots[:] = [None] * self.N_PORTS
+        self.by_type.clear()
+        self.conflicts.clear()
+
+
+# registry of all devices constructed in this program, shared by the Brain
+DEVICE_REGISTRY: DeviceRegistry = DeviceRegistry()
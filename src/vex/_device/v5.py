@@ -30,6 +30,7 @@ class V5DeviceType(IntEnum):
     BRAIN: int = 10
     VISION: int = 11
     ADI: int = 12
+    OPTICAL: int = 16
     GYRO: int = 0x46
     SONAR: int = 0x47
     GENERIC: int = 128
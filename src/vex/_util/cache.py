@@ -0,0 +1,175 @@
+"""Per-tick memoization of sensor readings."""
+
+
+from collections.abc import Callable, Sequence
+from threading import RLock
+from typing import Any, LiteralString, Optional, Self
+
+from .conversion import UNIT_TABLES, UnitTable
+from .decor import NO_READING, get_sense_cache, set_sense_cache
+
+
+__all__: Sequence[LiteralString] = ('SenseCache',)
+
+
+def _derive(cached_args: tuple, args: tuple, value: Any, /) -> Any:
+    """Derive reading for `args` from reading `value` for `cached_args`.
+
+    Derivation applies when the two argument tuples differ only in one
+    unit of a convertible unit type; otherwise NO_READING is returned.
+    """
+    if (len(cached_args) != len(args)) or not isinstance(value, float | int):
+        return NO_READING
+
+    conversion: Optional[tuple[UnitTable, Any, Any]] = None
+    for cached_arg, arg in zip(cached_args, args):
+        if (cached_arg is arg) or ((type(cached_arg) is type(arg)) and (cached_arg == arg)):  # noqa: E501
+            continue
+
+        if ((conversion is not None) or (type(cached_arg) is not type(arg)) or
+                ((table := UNIT_TABLES.get(type(arg))) is None) or
+                (cached_arg not in table) or (arg not in table)):
+            return NO_READING
+
+        conversion: tuple[UnitTable, Any, Any] = table, cached_arg, arg
+
+    if conversion is None:
+        return NO_READING
+
+    table, cached_unit, unit = conversion
+    return table.convert(value, cached_unit, unit)
+
+
+class SenseCache:
+    """Opt-in memoization of sensor readings within one control tick.
+
+    While active, readings are memoized by (device, method, arguments)
+    until the tick advances, either explicitly through `tick()` or
+    whenever the optional `clock` reports a new time, or until an actuating
+    command touches the device. Readings requested in another unit of a
+    cached reading (e.g. `position(TURNS)` after `position(DEGREES)`)
+    are derived by unit conversion without reading again.
+
+    Use as a context manager, or through `enable()`/`disable()`. Entries &
+    counters are updated under a lock, so that callback threads may share
+    the cache (also on free-threaded builds).
+    """
+
+    def __init__(self: Self, /,
+                 clock: Optional[Callable[[], Any]] = None):
+        """Initialize Sense Cache."""
+        self.clock: Optional[Callable[[], Any]] = clock
+        self._tick_time: Any = None
+
+        # id(device) -> (device, {method name -> {args -> reading}})
+        self._entries: dict[int, tuple[Any, dict[str, dict[tuple, Any]]]] = {}  # noqa: E501
+
+        self.hits: int = 0
+        self.derivations: int = 0
+        self.misses: int = 0
+        self.invalidations: int = 0
+
+        self._lock: RLock = RLock()
+
+    def __enter__(self: Self, /) -> Self:
+        """Activate."""
+        self.enable()
+        return self
+
+    def __exit__(self: Self, *exc_info: Any):
+        """Deactivate."""
+        self.disable()
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return (f'{type(self).__name__}(hits={self.hits}, '
+                f'derivations={self.derivations}, misses={self.misses})')
+
+    @property
+    def is_enabled(self: Self, /) -> bool:
+        """Whether this cache is the active sense cache."""
+        return get_sense_cache() is self
+
+    def enable(self: Self, /):
+        """Make this cache the active sense cache."""
+        self.clear()
+        set_sense_cache(self)
+
+    def disable(self: Self, /):
+        """Deactivate this cache if active."""
+        if self.is_enabled:
+            set_sense_cache(None)
+        self.clear()
+
+    def clear(self: Self, /):
+        """Forget all memoized readings."""
+        with self._lock:
+            self._entries.clear()
+
+    def tick(self: Self, /):
+        """Start a new tick, forgetting all memoized readings."""
+        self.clear()
+
+    def _check_clock(self: Self, /):
+        if (self.clock is not None) and ((now := self.clock()) != self._tick_time):  # noqa: E501
+            self._tick_time: Any = now
+            self.clear()
+
+    def get(self: Self, device: Any, method_name: str, args: tuple, /) -> Any:
+        """Return memoized (or derived) reading, or NO_READING."""
+        with self._lock:
+            return self._get(device, method_name, args)
+
+    def _get(self: Self, device: Any, method_name: str, args: tuple, /) -> Any:
+        self._check_clock()
+
+        if (((entry := self._entries.get(id(device))) is None) or
+                ((readings := entry[1].get(method_name)) is None)):
+            self.misses += 1
+            return NO_READING
+
+        if (reading := readings.get(args, NO_READING)) is not NO_READING:
+            self.hits += 1
+            return reading
+
+        for cached_args, cached_reading in readings.items():
+            if (reading := _derive(cached_args, args, cached_reading)) is not NO_READING:  # noqa: E501
+                readings[args] = reading
+                self.derivations += 1
+                return reading
+
+        self.misses += 1
+        return NO_READING
+
+    def put(self: Self, device: Any, method_name: str, args: tuple,
+            reading: Any, /):
+        """Memoize reading."""
+        with self._lock:
+            if (entry := self._entries.get(id(device))) is None:
+                self._entries[id(device)] = entry = (device, {})
+            entry[1].setdefault(method_name, {})[args] = reading
+
+    def invalidate(self: Self, device: Any, /):
+        """Forget memoized readings of device (& of its member motors)."""
+        with self._lock:
+            if self._entries.pop(id(device), None) is not None:
+                self.invalidations += 1
+
+            for attr in ('motors', 'left_motor', 'right_motor'):
+                members: Any = getattr(device, attr, ())
+                for member in (members if isinstance(members, list | tuple)
+                               else (members,)):
+                    if self._entries.pop(id(member), None) is not None:
+                        self.invalidations += 1
+
+    @property
+    def hit_rate(self: Self, /) -> float:
+        """Fraction of readings answered without reading the device."""
+        n_readings: int = self.hits + self.derivations + self.misses
+        return (self.hits + self.derivations) / n_readings if n_readings else 0.  # noqa: E501
+
+    def stats(self: Self, /) -> dict[str, int | float]:
+        """Return hit/miss counters."""
+        return {'hits': self.hits, 'derivations': self.derivations,
+                'misses': self.misses, 'invalidations': self.invalidations,
+                'hit_rate': self.hit_rate}
@@ -0,0 +1,158 @@
+"""Precomputed unit-conversion tables."""
+
+
+from array import array
+from collections.abc import Iterable, Sequence
+from enum import IntEnum
+from fractions import Fraction
+from typing import Any, LiteralString, Optional, Self
+
+from .type import Num
+
+
+__all__: Sequence[LiteralString] = ('UnitTable', 'UNIT_TABLES',
+                                    'define_units', 'unit_table',
+                                    'convert', 'convert_array')
+
+
+# default conversion table per unit type, registered through define_units()
+UNIT_TABLES: dict[type[IntEnum], 'UnitTable'] = {}
+
+
+class UnitTable:
+    """Precomputed conversion matrix among the units of one quantity.
+
+    Each unit is declared by its size in a common base unit, plus (for
+    affine units such as temperatures) the base-unit value of its zero.
+    Factors & offsets between every pair of units are precomputed (exactly,
+    from Fraction sizes where given) into flat row-major arrays,
+    so that converting is one multiply-add.
+    """
+
+    def __init__(self: Self, unit_type: type[IntEnum],
+                 scales: dict[IntEnum, Num | Fraction], /,
+                 offsets: Optional[dict[IntEnum, Num | Fraction]] = None):
+        """Initialize Unit Table."""
+        self.unit_type: type[IntEnum] = unit_type
+        self.scales: dict[IntEnum, Num | Fraction] = dict(scales)
+        self.zeros: dict[IntEnum, Num | Fraction] = {
+            unit: (offsets or {}).get(unit, 0) for unit in self.scales}
+
+        self.percent_unit: Optional[IntEnum] = \
+            unit_type.__members__.get('PCT')
+
+        self.units: tuple[IntEnum, ...] = tuple(self.scales)
+        self.index: dict[int, int] = {int(unit): i
+                                      for i, unit in enumerate(self.units)}
+
+        scales: list[Fraction] = [Fraction(self.scales[unit])
+                                  for unit in self.units]
+        zeros: list[Fraction] = [Fraction(self.zeros[unit])
+                                 for unit in self.units]
+        self.factors: array = array('d', (scales[a] / scales[b]
+                                          for a in range(len(scales))
+                                          for b in range(len(scales))))
+        self.offsets: array = array('d', ((zeros[a] - zeros[b]) / scales[b]
+                                          for a in range(len(scales))
+                                          for b in range(len(scales))))
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return (f'{type(self).__name__}({self.unit_type.__name__}: '
+                f'{", ".join(unit.name for unit in self.units)})')
+
+    def _own_unit(self: Self, unit: Any, /) -> Optional[IntEnum]:
+        # percentage arguments (e.g. PERCENT) stand for this type's PCT
+        if isinstance(unit, self.unit_type):
+            return unit
+        if isinstance(unit, IntEnum) and (unit.name == 'PCT'):
+            return self.percent_unit
+        return None
+
+    def __contains__(self: Self, unit: Any, /) -> bool:
+        """Check whether unit is convertible by this table."""
+        return (((unit := self._own_unit(unit)) is not None) and
+                (int(unit) in self.index))
+
+    def _row(self: Self, unit: IntEnum, /) -> int:
+        assert (own_unit := self._own_unit(unit)) is not None, \
+            TypeError(f'*** {unit} NOT ONE OF {self.unit_type.__name__} ***')
+
+        assert (row := self.index.get(int(own_unit))) is not None, \
+            ValueError(f'*** {unit} NOT CONVERTIBLE BY {self} ***')
+
+        return row
+
+    def factor(self: Self, from_unit: IntEnum, to_unit: IntEnum, /) -> float:
+        """Return multiplicative factor from one unit to another."""
+        return self.factors[self._row(from_unit) * len(self.units) +
+                            self._row(to_unit)]
+
+    def convert(self: Self, value: Num,
+                from_unit: IntEnum, to_unit: IntEnum, /) -> Num:
+        """Convert scalar value from one unit to another."""
+        if (row := self._row(from_unit)) == (col := self._row(to_unit)):
+            return value
+
+        i: int = row * len(self.units) + col
+        return value * self.factors[i] + self.offsets[i]
+
+    def convert_array(self: Self, values: Iterable[Num],
+                      from_unit: IntEnum, to_unit: IntEnum, /) -> array:
+        """Convert many values from one unit to another in one pass."""
+        if (row := self._row(from_unit)) == (col := self._row(to_unit)):
+            return array('d', values)
+
+        i: int = row * len(self.units) + col
+        factor: float = self.factors[i]
+
+        if offset := self.offsets[i]:
+            return array('d', [value * factor + offset for value in values])
+        return array('d', [value * factor for value in values])
+
+    def with_unit(self: Self, unit: IntEnum, scale: Num | Fraction, /,
+                  offset: Num | Fraction = 0) -> Self:
+        """Return (unregistered) table extended with/rescaling one unit.
+
+        Used for device-dependent units, e.g. a motor's velocity PCT,
+        whose full scale depends on its gear setting.
+        """
+        return type(self)(self.unit_type, self.scales | {unit: scale},
+                          offsets=self.zeros | {unit: offset})
+
+
+def define_units(unit_type: type[IntEnum],
+                 scales: dict[IntEnum, Num | Fraction], /,
+                 offsets: Optional[dict[IntEnum, Num | Fraction]] = None) \
+        -> UnitTable:
+    """Precompute & register default conversion table of a unit type."""
+    UNIT_TABLES[unit_type] = table = UnitTable(unit_type, scales,
+                                               offsets=offsets)
+    return table
+
+
+def unit_table(unit_type: type[IntEnum], /) -> UnitTable:
+    """Return default conversion table of a unit type."""
+    assert (table := UNIT_TABLES.get(unit_type)) is not None, \
+        ValueError(f'*** NO CONVERSION TABLE FOR {unit_type.__name__} ***')
+    return table
+
+
+def _table_for(from_unit: IntEnum, to_unit: IntEnum, /) -> UnitTable:
+    # PERCENT converts within the other unit's table
+    table: UnitTable = unit_table(type(from_unit))
+    return table if to_unit in table else unit_table(type(to_unit))
+
+
+def convert(value: Num, from_unit: IntEnum, to_unit: IntEnum, /) -> Num:
+    """Convert scalar value from one unit to another."""
+    if from_unit is to_unit:
+        return value
+    return _table_for(from_unit, to_unit).convert(value, from_unit, to_unit)
+
+
+def convert_array(values: Iterable[Num],
+                  from_unit: IntEnum, to_unit: IntEnum, /) -> array:
+    """Convert many values from one unit to another in one pass."""
+    return _table_for(from_unit, to_unit).convert_array(values,
+                                                        from_unit, to_unit)
@@ -0,0 +1,108 @@
+"""Sensing & Actuating Decorators with pluggable reading sources & caches."""
+
+
+from collections.abc import Callable, Sequence
+from functools import wraps
+from inspect import Parameter, signature
+from typing import Any, LiteralString, Optional, Self
+
+from abm.decor import act as abm_act, sense as abm_sense
+
+
+__all__: Sequence[LiteralString] = ('act', 'sense', 'NO_READING',
+                                    'get_sense_cache', 'set_sense_cache')
+
+
+class _NoReading:  # pylint: disable=too-few-public-methods
+    """Marker returned by a sense source that cannot answer a reading."""
+
+    def __repr__(self: Self, /) -> LiteralString:
+        """Return string representation."""
+        return 'NO_READING'
+
+
+NO_READING: _NoReading = _NoReading()
+
+
+# currently-active sense cache (see vex._util.cache.SenseCache), if any
+_sense_cache: Optional[Any] = None
+
+
+def get_sense_cache() -> Optional[Any]:
+    """Return currently-active sense cache, if any."""
+    return _sense_cache
+
+
+def set_sense_cache(cache: Optional[Any], /):
+    """Set (or, with None, clear) currently-active sense cache."""
+    global _sense_cache  # pylint: disable=global-statement
+    _sense_cache = cache
+
+
+def _positional_defaults(func: Callable, /) -> Optional[tuple[Any, ...]]:
+    """Return defaults of positional parameters after `self`.
+
+    Returns None if some positional parameter has no default,
+    in which case arguments cannot be normalized.
+    """
+    params: list[Parameter] = [
+        param for param in list(signature(func).parameters.values())[1:]
+        if param.kind in (Parameter.POSITIONAL_ONLY,
+                          Parameter.POSITIONAL_OR_KEYWORD)]
+    if any(param.default is Parameter.empty for param in params):
+        return None
+    return tuple(param.default for param in params)
+
+
+def sense(sensing_func: Callable, /) -> Callable:
+    """Decorate sensing method, letting an attached source answer first.
+
+    When the device's `sense_source` attribute is set, readings come from
+    `sense_source.read(device, method_name, args)`; the source returns
+    `NO_READING` to fall through to ABM sensing.
+
+    When a sense cache is active, readings are memoized by
+    (device, method name, arguments with defaults filled in).
+    """
+    abm_sensing_func: Callable = abm_sense(sensing_func)
+    method_name: str = sensing_func.__name__
+    defaults: Optional[tuple[Any, ...]] = _positional_defaults(sensing_func)
+
+    def read(self, args: tuple[Any, ...], /) -> Any:
+        if (((source := getattr(self, 'sense_source', None)) is not None) and
+                ((reading := source.read(self, method_name, args)) is not NO_READING)):  # noqa: E501
+            return reading
+        return abm_sensing_func(self, *args)
+
+    @wraps(sensing_func)
+    def decor_sensing_func(self, /, *args: Any, **kwargs: Any) -> Any:
+        if kwargs:
+            return abm_sensing_func(self, *args, **kwargs)
+
+        if (cache := _sense_cache) is None:
+            return read(self, args)
+
+        if defaults is not None:
+            args: tuple[Any, ...] = args + defaults[len(args):]
+
+        if (reading := cache.get(self, method_name, args)) is NO_READING:
+            cache.put(self, method_name, args, reading := read(self, args))
+        return reading
+
+    return decor_sensing_func
+
+
+def act(actuating_func: Callable, /) -> Callable:
+    """Decorate actuating method, invalidating its device's cached readings."""
+    abm_actuating_func: Callable = abm_act(actuating_func)
+
+    @wraps(actuating_func)
+    def decor_actuating_func(*args: Any, **kwargs: Any) -> Any:
+        result: Any = abm_actuating_func(*args, **kwargs)
+
+        if ((cache := _sense_cache) is not None) and args:
+            cache.invalidate(args[0])
+
+        return result
+
+    return decor_actuating_func
@@ -0,0 +1,111 @@
+"""Fine-grained locking of device state, for free-threaded builds too."""
+
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from functools import wraps
+import sys
+from threading import RLock, Thread
+from time import sleep
+from typing import Any, LiteralString, Optional, Self
+
+
+__all__: Sequence[LiteralString] = ('LockStripes', 'DEVICE_LOCKS',
+                                    'synchronized', 'free_threaded',
+                                    'poll', 'POLL_INTERVAL')
+
+
+# seconds between checks of callback-triggering conditions
+POLL_INTERVAL: float = .01
+
+
+def free_threaded() -> bool:
+    """Check whether running without the Global Interpreter Lock."""
+    return not getattr(sys, '_is_gil_enabled', lambda: True)()
+
+
+class LockStripes:
+    """Fixed pool of re-entrant locks, striped by object identity.
+
+    Each object maps to one lock of the pool, so that updates of an
+    object's multi-field state (e.g. a velocity & its unit) are atomic
+    without a lock per object, while updates of different objects mostly
+    take different locks & so proceed in parallel on free-threaded builds.
+    """
+
+    def __init__(self: Self, /, n_stripes: int = 64):
+        """Initialize Lock Stripes."""
+        assert n_stripes > 0, \
+            ValueError(f'*** n_stripes {n_stripes} NOT POSITIVE ***')
+
+        self.locks: tuple[RLock, ...] = tuple(RLock()
+                                              for _ in range(n_stripes))
+
+    def __len__(self: Self, /) -> int:
+        """Return number of locks."""
+        return len(self.locks)
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return f'{type(self).__name__}({len(self)})'
+
+    def _index(self: Self, obj: Any, /) -> int:
+        # (object addresses are 16-byte aligned, so drop their low bits)
+        return (id(obj) >> 4) % len(self.locks)
+
+    def lock_for(self: Self, obj: Any, /) -> RLock:
+        """Return lock guarding object's state."""
+        return self.locks[self._index(obj)]
+
+    @contextmanager
+    def locking(self: Self, objs: Iterable[Any], /) -> Iterator[None]:
+        """Hold locks guarding all objects' states.
+
+        Locks are taken in pool order, so that threads locking overlapping
+        sets of objects (e.g. motor groups sharing motors) cannot deadlock.
+        """
+        locks: list[RLock] = [self.locks[index]
+                              for index in sorted({self._index(obj)
+                                                   for obj in objs})]
+        for lock in locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+
+# locks shared by all devices in this program
+DEVICE_LOCKS: LockStripes = LockStripes()
+
+
+def synchronized(method: Callable, /) -> Callable:
+    """Run method holding the lock of its object's stripe."""
+    @wraps(method)
+    def synchronized_method(self: Any, *args: Any, **kwargs: Any) -> Any:
+        with DEVICE_LOCKS.lock_for(self):
+            return method(self, *args, **kwargs)
+
+    return synchronized_method
+
+
+def poll(condition: Callable[[], bool], callback: Callable[[], Any], /,
+         until: Optional[Callable[[], bool]] = None,
+         interval: float = POLL_INTERVAL) -> Thread:
+    """Start thread calling back whenever condition holds, until done.
+
+    The condition is checked every interval seconds rather than in a busy
+    loop, so that many callback threads share cores with the program.
+    """
+    def call_back_whenever_condition_holds():
+        while (until is None) or not until():
+            if condition():
+                callback()
+            sleep(interval)
+
+    thread: Thread = Thread(group=None,
+                            target=call_back_whenever_condition_holds,
+                            name=None, args=(), kwargs={}, daemon=True)
+    thread.start()
+    return thread
@@ -2,9 +2,10 @@
 
 
 from collections.abc import Sequence
+from time import monotonic
 from typing import LiteralString, Self
 
-from .._device import SingletonDevice
+from .._device import SingletonDevice, DeviceRegistry, DEVICE_REGISTRY
 
 from .._util.doc import robotmesh_doc
 
@@ -15,6 +16,7 @@ from .screen import (BrainLcd,
                      MONO_M, MONO_L, MONO_XL, MONO_XXL, MONO_S, MONO_XS,
                      PROP_M, PROP_L, PROP_XL, PROP_XXL,
                      FontType)
+from .snapshot import SnapshotSpec, Snapshot
 from .speaker import BrainSound, NoteType, SoundType
 from .timer import BrainTimer
 
@@ -29,6 +31,7 @@ __all__: Sequence[LiteralString] = (
     'PROP_M', 'PROP_L', 'PROP_XL', 'PROP_XXL',
     'FontType',
     'BrainSound', 'NoteType', 'SoundType',
+    'SnapshotSpec', 'Snapshot',
 )
 
 
@@ -89,7 +92,17 @@ class Brain(SingletonDevice):
         """Play musical note."""
         self.sound.play_note(octave, note, duration)
 
+    @property
+    def devices(self: Self) -> DeviceRegistry:
+        """Registry of devices by port & by V5 device type."""
+        return DEVICE_REGISTRY
+
     @property
     def timer(self: Self) -> BrainTimer:
         """Brain Timer."""
         return self._timer
+
+    def snapshot(self: Self, spec: SnapshotSpec, /) -> Snapshot:
+        """Read declared device readings in one batch, time-stamped together."""  # noqa: E501
+        time: float = monotonic()
+        return Snapshot(spec, spec.read(), time)
@@ -4,10 +4,9 @@
 from collections.abc import Sequence
 from typing import LiteralString, Self
 
-from abm.decor import sense
-
 from .._device import SingletonDevice
 
+from .._util.decor import sense
 from .._util.doc import vexcode_doc
 
 
@@ -4,8 +4,7 @@
 from collections.abc import Sequence
 from typing import LiteralString, Self
 
-from abm.decor import sense
-
+from .._util.decor import sense
 from .._util.doc import robotmesh_doc, vexcode_doc
 
 
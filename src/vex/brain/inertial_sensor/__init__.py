@@ -4,14 +4,13 @@
 from collections.abc import Sequence
 from typing import Literal, LiteralString, Self
 
-from abm.decor import act, sense
-
 from ..._device import SingletonDevice
 from ...motor import VelocityUnits
 from ..._common_enums.axis import AxisType
 from ..._common_enums.orientation import OrientationType
 from ..._common_enums.rotation import RotationUnits, DEGREES
 
+from ..._util.decor import act, sense
 from ..._util.doc import vexcode_doc
 
 
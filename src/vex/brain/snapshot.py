@@ -0,0 +1,162 @@
+"""Batched multi-device sensor snapshots."""
+
+
+from array import array
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any, LiteralString, Self, get_args, get_type_hints
+
+from .._util.decor import NO_READING
+from .._util.type import Num
+
+
+__all__: Sequence[LiteralString] = 'SnapshotSpec', 'Snapshot'
+
+
+def _numeric(annotation: Any, /) -> bool:
+    # whether return annotation only admits numbers (incl. bools & int
+    # enums); union members must all be numeric
+    if members := get_args(annotation):
+        return all(map(_numeric, members))
+    return isinstance(annotation, type) and issubclass(annotation, int | float)  # noqa: E501
+
+
+def _return_annotation(method: Callable, /) -> Any:
+    # (unannotated or unresolvable: assumed numeric, checked when read)
+    try:
+        return get_type_hints(method).get('return', float)
+    except (NameError, TypeError):
+        return float
+
+
+class SnapshotSpec:
+    """Declared set of device readings to be snapshotted together.
+
+    Each reading is a bound sensing method, optionally with its arguments,
+    e.g. `SnapshotSpec(left=(left_motor.position, DEGREES),
+    heading=inertial.heading, stick=controller.axisA.position)`.
+    """
+
+    def __init__(self: Self, /,
+                 **readings: Callable | tuple[Callable, *tuple[Any, ...]]):
+        """Initialize Snapshot Spec from named readings."""
+        assert readings, ValueError('*** NO READINGS DECLARED ***')
+
+        self.names: tuple[str, ...] = tuple(readings)
+        self.indices: dict[str, int] = {name: index
+                                        for index, name
+                                        in enumerate(self.names)}
+
+        self.methods: list[Callable] = []
+        self.args: list[tuple[Any, ...]] = []
+        for name, reading in readings.items():
+            method, *args = reading if isinstance(reading, tuple) else (reading,)  # noqa: E501
+            assert callable(method) and hasattr(method, '__self__'), \
+                TypeError(f'*** {name}={reading} NOT A BOUND SENSING METHOD ***')  # noqa: E501
+            assert _numeric(annotation := _return_annotation(method)), \
+                TypeError(f'*** {name}={reading} READING {annotation} '
+                          'NOT NUMERIC ***')
+            self.methods.append(method)
+            self.args.append(tuple(args))
+
+        self.devices: tuple[Any, ...] = tuple(method.__self__
+                                              for method in self.methods)
+        self.method_names: tuple[str, ...] = tuple(method.__name__
+                                                   for method in self.methods)
+
+    def __len__(self: Self, /) -> int:
+        """Return number of declared readings."""
+        return len(self.names)
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return f'{type(self).__name__}({", ".join(self.names)})'
+
+    def read(self: Self, /) -> array:
+        """Read all declared readings in one batch.
+
+        Readings from devices with an attached sense source are grouped per
+        source and answered by one `read_batch(...)` call when the source
+        supports it (else by direct `read(...)` calls), skipping per-reading
+        sensing dispatch; remaining readings go through their methods.
+        All readings are taken before any non-numeric one is rejected.
+        """
+        values: list[Any] = [None] * len(self.names)
+
+        batches: dict[int, tuple[Any, list[int]]] = {}
+        for index, device in enumerate(self.devices):
+            if (source := getattr(device, 'sense_source', None)) is None:
+                values[index] = self.methods[index](*self.args[index])
+            else:
+                batches.setdefault(id(source), (source, []))[1].append(index)
+
+        for source, indices in batches.values():
+            requests: list[tuple[Any, str, tuple]] = [
+                (self.devices[i], self.method_names[i], self.args[i])
+                for i in indices]
+
+            readings: Sequence[Any] = (
+                source.read_batch(requests) if hasattr(source, 'read_batch')
+                else [source.read(*request) for request in requests])
+
+            for index, reading in zip(indices, readings):
+                values[index] = (self.methods[index](*self.args[index])
+                                 if reading is NO_READING
+                                 else reading)
+
+        for name, value in zip(self.names, values):
+            assert isinstance(value, int | float), \
+                TypeError(f'*** {name} READING {value!r} NOT NUMERIC ***')
+        return array('d', values)
+
+
+class Snapshot:
+    """Immutable, array-backed record of readings taken at one instant."""
+
+    __slots__ = ('spec', 'time', '_values')
+
+    def __init__(self: Self, spec: SnapshotSpec, values: array, time: Num, /):
+        """Initialize Snapshot."""
+        object.__setattr__(self, 'spec', spec)
+        object.__setattr__(self, 'time', time)
+        object.__setattr__(self, '_values', values)
+
+    def __setattr__(self: Self, name: str, value: Any, /):
+        """Disallow mutation."""
+        raise AttributeError(f'*** {type(self).__name__} IS IMMUTABLE ***')
+
+    def __getattr__(self: Self, name: str, /) -> float:
+        """Return named reading."""
+        try:
+            return self._values[self.spec.indices[name]]
+        except KeyError as err:
+            raise AttributeError(name) from err
+
+    def __getitem__(self: Self, key: str | int, /) -> float:
+        """Return reading by name or position."""
+        return self._values[self.spec.indices[key]
+                            if isinstance(key, str)
+                            else key]
+
+    def __len__(self: Self, /) -> int:
+        """Return number of readings."""
+        return len(self._values)
+
+    def __iter__(self: Self, /) -> Iterator[float]:
+        """Iterate through readings in declared order."""
+        return iter(self._values)
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        readings: str = ', '.join(f'{name}={value}'
+                                  for name, value
+                                  in zip(self.spec.names, self._values))
+        return f'{type(self).__name__}(time={self.time}, {readings})'
+
+    @property
+    def values(self: Self, /) -> memoryview:
+        """Read-only view of readings in declared order."""
+        return memoryview(self._values).toreadonly()
+
+    def as_dict(self: Self, /) -> dict[str, float]:
+        """Return readings as a name-to-value dictionary."""
+        return dict(zip(self.spec.names, self._values))
@@ -4,11 +4,10 @@
 from collections.abc import Sequence
 from typing import LiteralString, Self
 
-from abm.decor import act
-
 from ..._device import SingletonDevice
 from ...time import TimeUnits
 
+from ..._util.decor import act
 from ..._util.doc import robotmesh_doc, vexcode_doc
 
 from .note import NoteType
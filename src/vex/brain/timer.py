@@ -4,11 +4,10 @@
 from collections.abc import Callable, Sequence
 from typing import LiteralString, Self
 
-from abm.decor import act, sense
-
 from .._device import SingletonDevice
 from ..time.units import TimeUnits
 
+from .._util.decor import act, sense
 from .._util.doc import vexcode_doc
 
 
@@ -2,15 +2,14 @@
 
 
 from collections.abc import Callable, Sequence
-from threading import Thread
-from typing import LiteralString, Self
+from typing import Any, LiteralString, Optional, Self
 
-from abm.decor import sense
-
-from .._device import Device
+from .._device import Device, V5DeviceType
 from ..brain.port import Ports
 
+from .._util.decor import sense
 from .._util.doc import robotmesh_doc, vexcode_doc
+from .._util.sync import poll
 
 
 __all__: Sequence[LiteralString] = ('Bumper',)
@@ -23,6 +22,8 @@ __all__: Sequence[LiteralString] = ('Bumper',)
 class Bumper(Device):
     """Bumper Switch Sensor."""
 
+    _V5_DEVICE_TYPE: V5DeviceType = V5DeviceType.BUMPER
+
     @robotmesh_doc("""
         Creates a new bumper object on the port specified in the parameter.
 
@@ -33,9 +34,13 @@ class Bumper(Device):
         """Initialize Bumper Switch Sensor."""
         self.port: Ports = index
 
+        self.sense_source: Optional[Any] = None
+        self.pressed_callbacks: list[Callable] = []
+        self.released_callbacks: list[Callable] = []
+
     def __hash__(self: Self) -> int:
         """Return integer hash."""
-        raise hash(self.port)
+        return hash(self.port)
 
     @robotmesh_doc("""
         Get the pressed status of the bumper device.
@@ -73,13 +78,15 @@ class Bumper(Device):
     """)
     def pressed(self: Self, callback: Callable, /):
         """Trigger callback function upon being pressed."""
-        def trigger_callback_whenever_pressing():
-            while True:
-                if self.pressing():
-                    callback()
+        self.pressed_callbacks.append(callback)
 
-        Thread(group=None, target=trigger_callback_whenever_pressing, name=None,  # noqa: E501
-               args=(), kwargs={}, daemon=True).start()
+        # attached sources (e.g. simulated bumpers) dispatch callbacks
+        # themselves, without any polling thread
+        if self.sense_source is not None:
+            return
+
+        poll(self.pressing, callback,
+             until=lambda: self.sense_source is not None)
 
     @vexcode_doc("""
         Bumper Released
@@ -99,10 +106,12 @@ class Bumper(Device):
     """)
     def released(self: Self, callback: Callable, /):
         """Trigger callback function upon being released."""
-        def trigger_callback_whenever_not_pressing():
-            while True:
-                if not self.pressing():
-                    callback()
+        self.released_callbacks.append(callback)
+
+        # attached sources (e.g. simulated bumpers) dispatch callbacks
+        # themselves, without any polling thread
+        if self.sense_source is not None:
+            return
 
-        Thread(group=None, target=trigger_callback_whenever_not_pressing, name=None,  # noqa: E501
-               args=(), kwargs={}, daemon=True).start()
+        poll(lambda: not self.pressing(), callback,
+             until=lambda: self.sense_source is not None)
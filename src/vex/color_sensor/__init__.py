@@ -4,13 +4,12 @@
 from collections.abc import Sequence
 from typing import Literal, LiteralString, Self
 
-from abm.decor import act, sense
-
-from .._device import Device
+from .._device import Device, V5DeviceType
 from ..brain.port import Ports
 from .._common_enums.color import Color
 from .._common_enums.percent import PERCENT
 
+from .._util.decor import act, sense
 from .._util.doc import robotmesh_doc, vexcode_doc
 from .._util.type import Num
 
@@ -25,6 +24,8 @@ __all__: Sequence[LiteralString] = 'ColorSensor', 'Colorsensor'
 class ColorSensor(Device):
     """Color Sensor."""
 
+    _V5_DEVICE_TYPE: V5DeviceType = V5DeviceType.GENERIC
+
     @robotmesh_doc("""
         Creates new color sensor object on the port specified in the parameter.
 
@@ -0,0 +1,15 @@
+"""Feedback control: PID, feedforward, slew-rate limiting & anti-windup."""
+
+
+from collections.abc import Sequence
+from typing import LiteralString
+
+from .loop import ControlLoop
+from .pid import PID
+from .tuning import MotorPlant, StepResponse, step_response
+
+
+__all__: Sequence[LiteralString] = ('PID',
+                                    'ControlLoop',
+                                    'MotorPlant', 'StepResponse',
+                                    'step_response')
@@ -0,0 +1,96 @@
+"""Control loops attaching PID controllers to motors & drivetrains."""
+
+
+from collections.abc import Callable, Sequence
+from functools import partial
+from typing import Any, LiteralString, Optional, Self
+
+from ..motor.direction import FORWARD
+from .._common_enums.percent import PERCENT
+from .._common_enums.rotation import DEGREES
+from ..time.scheduler import LoopStats, PeriodicTask, Scheduler
+
+from .._util.type import Num
+
+from .pid import PID
+
+
+__all__: Sequence[LiteralString] = ('ControlLoop',)
+
+
+DEFAULT_RATE: Num = 50  # ticks per second
+
+
+class ControlLoop:
+    """PID loop from a measurement to a Motor, MotorGroup or DriveTrain.
+
+    Each tick reads the measurement (by default the target's position in
+    degrees, e.g. `inertial.heading` for a drivetrain's heading instead),
+    updates the PID with the period as time step, and applies its output
+    as a velocity percentage: spinning a Motor or all of a MotorGroup's
+    motors at it (negative outputs spinning them in reverse), or,
+    for a two-sided drivetrain, as a turn correction around
+    `base_velocity` (through its `arcade(...)` if it has one, else by
+    writing the side velocities to its group engine).
+
+    Stepped explicitly through `step()`, or registered with a Scheduler's
+    tick loop through `schedule(...)`.
+    """
+
+    def __init__(self: Self, target: Any, pid: PID, /,
+                 measure: Optional[Callable[[], Num]] = None,
+                 setpoint: Num = 0, rate: Num = DEFAULT_RATE,
+                 base_velocity: Num = 0):
+        # pylint: disable=too-many-arguments
+        """Initialize Control Loop."""
+        assert rate > 0, ValueError(f'*** rate {rate} NOT POSITIVE ***')
+
+        if measure is None:
+            assert hasattr(target, 'position'), \
+                ValueError(f'*** {target} HAS NO position(...); '
+                           'PLEASE SPECIFY measure ***')
+            measure: Callable[[], Num] = partial(target.position, DEGREES)
+
+        self.target: Any = target
+        self.pid: PID = pid
+        self.measure: Callable[[], Num] = measure
+        self.setpoint: Num = setpoint
+        self.base_velocity: Num = base_velocity
+
+        self.rate: Num = rate
+        self.period: float = 1 / rate
+        self.stats: LoopStats = LoopStats(self.period)
+
+        engine: Any = getattr(target, 'engine', None)
+        self._steers: bool = (engine is not None) and (len(engine.sides) == 2)
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return f'{type(self).__name__}({self.target}, {self.pid})'
+
+    def apply(self: Self, output: Num, /):
+        """Apply controller output (velocity percentage) to target."""
+        if not self._steers:
+            self.target.set_velocity(output, PERCENT)
+            self.target.spin(FORWARD)
+        elif hasattr(self.target, 'arcade'):
+            self.target.arcade(self.base_velocity, output)
+        else:
+            sides: tuple[Num, Num] = (self.base_velocity + output,
+                                      self.base_velocity - output)
+            self.target.engine.set_side_velocities(sides, PERCENT)
+            self.target.engine.spin_sides(sides)
+
+    def step(self: Self, /) -> float:
+        """Run one tick, returning controller output."""
+        output: float = self.pid.update(self.setpoint, self.measure(),
+                                        self.period)
+        self.apply(output)
+        return output
+
+    def schedule(self: Self, scheduler: Scheduler, /) -> PeriodicTask:
+        """Register loop to run in Scheduler's tick loop at loop's rate."""
+        task: PeriodicTask = scheduler.add(self.step, self.rate,
+                                           name=repr(self))
+        self.stats: LoopStats = task.stats
+        return task
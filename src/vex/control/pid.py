@@ -0,0 +1,145 @@
+"""PID controllers with feedforward, slew-rate limiting & anti-windup."""
+
+
+from array import array
+from collections.abc import Sequence
+from typing import LiteralString, Optional, Self
+
+from .._util.type import Num
+
+
+__all__: Sequence[LiteralString] = ('PID',)
+
+
+def _column(value: Num | Sequence[Num], n: int, /) -> array:
+    """Broadcast scalar (or copy per-slot values) into array of length n."""
+    if isinstance(value, Num):
+        return array('d', [value]) * n
+
+    assert len(value) == n, \
+        ValueError(f'*** {value} NOT OF LENGTH {n} ***')
+    return array('d', value)
+
+
+def _sign(x: float, /) -> int:
+    return (x > 0) - (x < 0)
+
+
+class PID:
+    """Bank of one or more PID + feedforward controllers.
+
+    Output of slot `i` (e.g. a motor velocity percentage) is
+    `kp * e + ki * ∫e dt + kd * de/dt + kf * setpoint + ks * sign(e)`,
+    with error `e = setpoint - measurement`, then:
+    - clamped to [-output_limit, output_limit], not integrating the error
+      while that clamping pushes further in the error's direction
+      (conditional-integration anti-windup), with the integral itself
+      optionally clamped to [-integral_limit, integral_limit];
+    - changed by at most `slew_rate` per second from the previous output.
+
+    Gains & limits are given as scalars (shared by all slots) or per-slot
+    sequences, so that one bank can run e.g. a whole batch of simulated
+    robots, or a sweep of candidate gains, in one `update_all(...)` call
+    over contiguous arrays. Slot `i` is updated alone by `update(...)`.
+    """
+
+    def __init__(self: Self,
+                 kp: Num | Sequence[Num] = 1,
+                 ki: Num | Sequence[Num] = 0,
+                 kd: Num | Sequence[Num] = 0, /,
+                 kf: Num | Sequence[Num] = 0,
+                 ks: Num | Sequence[Num] = 0,
+                 output_limit: Num = 100,
+                 integral_limit: Optional[Num] = None,
+                 slew_rate: Optional[Num] = None,
+                 n: Optional[int] = None):
+        # pylint: disable=too-many-arguments
+        """Initialize PID bank."""
+        if n is None:
+            n: int = max((len(gain) for gain in (kp, ki, kd, kf, ks)
+                          if not isinstance(gain, Num)),
+                         default=1)
+
+        self.kp: array = _column(kp, n)
+        self.ki: array = _column(ki, n)
+        self.kd: array = _column(kd, n)
+        self.kf: array = _column(kf, n)
+        self.ks: array = _column(ks, n)
+
+        self.output_limit: Num = output_limit
+        self.integral_limit: Optional[Num] = integral_limit
+        self.slew_rate: Optional[Num] = slew_rate
+
+        self.integral: array = array('d', bytes(8 * n))
+        self.prev_error: array = array('d', bytes(8 * n))
+        self.output: array = array('d', bytes(8 * n))
+        self._started: array = array('b', bytes(n))
+
+    def __len__(self: Self, /) -> int:
+        """Return number of controller slots."""
+        return len(self.output)
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        if len(self) == 1:
+            return (f'{type(self).__name__}(kp={self.kp[0]}, '
+                    f'ki={self.ki[0]}, kd={self.kd[0]})')
+        return f'{type(self).__name__}({len(self)} slots)'
+
+    def reset(self: Self, /):
+        """Forget integral, previous error & previous output of all slots."""
+        n: int = len(self)
+        self.integral: array = array('d', bytes(8 * n))
+        self.prev_error: array = array('d', bytes(8 * n))
+        self.output: array = array('d', bytes(8 * n))
+        self._started: array = array('b', bytes(n))
+
+    def update(self: Self, setpoint: Num, measurement: Num, dt: Num, /,
+               slot: int = 0) -> float:
+        """Update one slot with latest measurement, returning its output."""
+        error: float = setpoint - measurement
+
+        # no derivative kick on first update
+        derivative: float = ((error - self.prev_error[slot]) / dt
+                             if self._started[slot]
+                             else 0.)
+
+        integral: float = self.integral[slot] + error * dt
+        if self.integral_limit is not None:
+            integral: float = min(max(integral, -self.integral_limit),
+                                  self.integral_limit)
+
+        unclamped: float = (self.kp[slot] * error +
+                            self.ki[slot] * integral +
+                            self.kd[slot] * derivative +
+                            self.kf[slot] * setpoint +
+                            self.ks[slot] * _sign(error))
+        output: float = min(max(unclamped, -self.output_limit),
+                            self.output_limit)
+
+        # anti-windup: keep integrating only if not saturating further
+        if (output == unclamped) or (_sign(error) != _sign(unclamped)):
+            self.integral[slot] = integral
+
+        if (self.slew_rate is not None) and self._started[slot]:
+            max_change: float = self.slew_rate * dt
+            prev_output: float = self.output[slot]
+            output: float = min(max(output, prev_output - max_change),
+                                prev_output + max_change)
+
+        self.prev_error[slot] = error
+        self.output[slot] = output
+        self._started[slot] = True
+        return output
+
+    def update_all(self: Self, setpoints: Num | Sequence[Num],
+                   measurements: Sequence[Num], dt: Num, /) -> array:
+        """Update all slots with latest measurements, returning outputs."""
+        if isinstance(setpoints, Num):
+            setpoints: array = array('d', [setpoints]) * len(self)
+
+        for slot, (setpoint, measurement) in enumerate(zip(setpoints,
+                                                           measurements)):
+            self.update(setpoint, measurement, dt, slot)
+
+        return self.output
@@ -0,0 +1,123 @@
+"""Step-response tuning benchmarks for PID controllers."""
+
+
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+from math import exp
+from typing import LiteralString, Optional, Self
+
+from .._util.type import Num
+
+from .pid import PID
+
+
+__all__: Sequence[LiteralString] = 'MotorPlant', 'StepResponse', 'step_response'  # noqa: E501
+
+
+# free speed of an IQ (Gen 2) Smart Motor at 100% velocity, in degrees/second
+IQ_MOTOR_MAX_SPEED: float = 127 * 6
+
+
+class MotorPlant:
+    """Batch of simulated motors under velocity-percentage commands.
+
+    Each motor's velocity follows its command (as a percentage of
+    `max_speed`) as a first-order lag with `time_constant`, discretized
+    exactly per time step, and its position integrates its velocity.
+    """
+
+    def __init__(self: Self, n_motors: int = 1, /,
+                 max_speed: Num = IQ_MOTOR_MAX_SPEED,
+                 time_constant: Num = .1):
+        """Initialize Motor Plant at rest at position 0."""
+        self.max_speed: Num = max_speed
+        self.time_constant: Num = time_constant
+
+        self.position: array = array('d', bytes(8 * n_motors))  # degrees
+        self.velocity: array = array('d', bytes(8 * n_motors))  # degrees/s
+
+    def __len__(self: Self, /) -> int:
+        """Return number of simulated motors."""
+        return len(self.position)
+
+    def step(self: Self, commands: Sequence[Num], dt: Num, /):
+        """Advance all motors by dt seconds under velocity percentages."""
+        alpha: float = 1 - exp(-dt / self.time_constant)
+        speed_per_percent: float = self.max_speed / 100
+
+        for i, command in enumerate(commands):
+            self.velocity[i] += (command * speed_per_percent -
+                                 self.velocity[i]) * alpha
+            self.position[i] += self.velocity[i] * dt
+
+
+@dataclass
+class StepResponse:
+    """Step-response metrics of one controller.
+
+    Times are in seconds, None if never reached within the benchmark's
+    duration; overshoot is a percentage of the setpoint.
+    """
+
+    settle_time: Optional[float]
+    rise_time: Optional[float]
+    overshoot: float
+    steady_state_error: float
+
+
+def step_response(pid: PID, setpoint: Num, /,
+                  plant: Optional[MotorPlant] = None,
+                  duration: Num = 2, dt: Num = .01,
+                  tolerance: Num = .02) -> tuple[StepResponse, ...]:
+    # pylint: disable=too-many-arguments,too-many-locals
+    """Benchmark all PID slots' responses to a position setpoint step.
+
+    Each slot drives its own motor of the plant (by default a fresh
+    MotorPlant of as many motors) from rest, all slots stepping together
+    through `PID.update_all(...)`. Settle time is when the position last
+    entered (without leaving again) the band of +/- tolerance * setpoint,
+    and rise time is from 10% to 90% of the setpoint.
+    """
+    assert setpoint, ValueError('*** setpoint MUST BE NON-ZERO ***')
+
+    n: int = len(pid)
+    if plant is None:
+        plant: MotorPlant = MotorPlant(n)
+    assert len(plant) == n, \
+        ValueError(f'*** {plant} NOT OF {n} MOTORS LIKE {pid} ***')
+
+    pid.reset()
+
+    sign: int = 1 if setpoint > 0 else -1
+    band: float = abs(setpoint) * tolerance
+    peaks: list[float] = [0.] * n
+    rise_starts: list[Optional[float]] = [None] * n
+    rise_ends: list[Optional[float]] = [None] * n
+    last_times_outside_band: list[float] = [0.] * n
+
+    n_steps: int = round(duration / dt)
+    for k in range(1, n_steps + 1):
+        plant.step(pid.update_all(setpoint, plant.position, dt), dt)
+        time: float = k * dt
+
+        for i, position in enumerate(plant.position):
+            progress: float = position * sign / abs(setpoint)
+            peaks[i] = max(peaks[i], progress)
+            if (rise_starts[i] is None) and (progress >= .1):
+                rise_starts[i] = time
+            if (rise_ends[i] is None) and (progress >= .9):
+                rise_ends[i] = time
+            if abs(position - setpoint) > band:
+                last_times_outside_band[i] = time
+
+    return tuple(
+        StepResponse(
+            settle_time=(None if last_time_outside_band >= n_steps * dt
+                         else last_time_outside_band + dt),
+            rise_time=(None if rise_end is None else rise_end - rise_start),
+            overshoot=max(peak - 1, 0.) * 100,
+            steady_state_error=setpoint - position)
+        for (peak, rise_start, rise_end, last_time_outside_band, position)
+        in zip(peaks, rise_starts, rise_ends, last_times_outside_band,
+               plant.position))
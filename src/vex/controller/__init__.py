@@ -4,20 +4,27 @@
 from collections.abc import Sequence
 from typing import LiteralString, Optional, Self
 
-from abm.decor import act
-
 from .._device.singleton import SingletonDevice
 
+from .._util.decor import act
 from .._util.doc import robotmesh_doc
 
 from .axis import ControllerAxis
 from .button import ControllerButton
+from .drive_mapping import DriveMapping, ResponseCurve
+from .recording import (ControllerRecording,
+                        ControllerRecorder,
+                        ControllerReplay)
 from .type import ControllerType, PRIMARY, PARTNER
 
 
 __all__: Sequence[LiteralString] = ('Controller',
                                     'ControllerAxis',
                                     'ControllerButton',
+                                    'DriveMapping', 'ResponseCurve',
+                                    'ControllerRecording',
+                                    'ControllerRecorder',
+                                    'ControllerReplay',
                                     'ControllerType', 'PRIMARY', 'PARTNER')
 
 
@@ -3,19 +3,56 @@
 
 from collections.abc import Callable, Sequence
 from threading import Thread
-from typing import LiteralString, Self
-
-from abm.decor import sense
+from time import sleep
+from typing import Any, LiteralString, Optional, Self
 
+from .._util.decor import sense
 from .._util.doc import robotmesh_doc, vexcode_doc
+from .._util.type import Num
 
 
-__all__: Sequence[LiteralString] = ('ControllerAxis',)
+__all__: Sequence[LiteralString] = 'ControllerAxis', 'AxisChangeFilter'
 
 
 Controller = None  # *** FIXME: TypeVar(name='Controller') causes segfault! ***
 
 
+DEFAULT_CHANGE_MIN_DELTA: int = 1  # percent
+DEFAULT_CHANGE_MAX_RATE: Num = 50  # callbacks per second
+
+
+class AxisChangeFilter:
+    """Deadband & minimum-delta filter for axis change detection.
+
+    Positions are compared against the last delivered position rather than
+    against a second reading, so only one reading is needed per check.
+    """
+
+    def __init__(self: Self, initial_position: int = 0, /,
+                 min_delta: int = DEFAULT_CHANGE_MIN_DELTA,
+                 deadband: Optional[int] = None):
+        """Initialize Axis Change Filter."""
+        assert min_delta > 0, \
+            ValueError(f'*** min_delta {min_delta} NOT POSITIVE ***')
+
+        self.min_delta: int = min_delta
+        self.deadband: Optional[int] = deadband
+        self.delivered_position: int = self.apply_deadband(initial_position)
+
+    def apply_deadband(self: Self, position: int, /) -> int:
+        """Report positions within deadband as zero."""
+        return (0 if (self.deadband is not None) and (abs(position) < self.deadband)  # noqa: E501
+                else position)
+
+    def update(self: Self, position: int, /) -> bool:
+        """Check whether position change warrants delivering a callback."""
+        position: int = self.apply_deadband(position)
+        if abs(position - self.delivered_position) < self.min_delta:
+            return False
+        self.delivered_position: int = position
+        return True
+
+
 @robotmesh_doc("""
     Use the Axis class to get values from one of the controller's joysticks
 
@@ -30,6 +67,13 @@ class ControllerAxis:
         self.parent: Controller = parent
         self.axtype: LiteralString = axtype
 
+        self.sense_source: Optional[Any] = None
+        self.changed_callbacks: list[Callable] = []
+        self.changed_position: Optional[int] = None
+
+        # (min_delta, max_rate) of changed callbacks, by callback index
+        self.changed_options: dict[int, tuple[int, Num]] = {}
+
     def __eq__(self: Self, other: Self) -> bool:
         """Check equality."""
         return (isinstance(other, ControllerAxis) and
@@ -98,11 +142,38 @@ class ControllerAxis:
         as an argument. The code inside the callback function will run
         whenever the event occurs.
     """)
-    def changed(self: Self, callback: Callable, /):
-        """Trigger callback function upon being moved."""
+    def changed(self: Self, callback: Callable, /,
+                min_delta: int = DEFAULT_CHANGE_MIN_DELTA,
+                max_rate: Num = DEFAULT_CHANGE_MAX_RATE):
+        """Trigger callback function upon being moved.
+
+        The axis is read once per 1/max_rate seconds and compared against
+        the last delivered position (after applying the Controller's
+        deadband), so a burst of movements between two checks is coalesced
+        into a single callback; the delivered position is available as
+        `changed_position` when the callback runs.
+        """
+        assert max_rate > 0, \
+            ValueError(f'*** max_rate {max_rate} NOT POSITIVE ***')
+
+        self.changed_options[len(self.changed_callbacks)] = min_delta, max_rate
+        self.changed_callbacks.append(callback)
+
         def trigger_callback_whenever_changed():
+            change_filter: AxisChangeFilter = AxisChangeFilter(
+                self.position(), min_delta=min_delta,
+                deadband=self.parent.deadband)
+
             while True:
-                if self.position() != self.position():
+                sleep(1 / max_rate)
+
+                # attached sources (e.g. replays) dispatch callbacks themselves
+                if self.sense_source is not None:
+                    continue
+
+                change_filter.deadband = self.parent.deadband
+                if change_filter.update(self.position()):
+                    self.changed_position = change_filter.delivered_position
                     callback()
 
         Thread(group=None, target=trigger_callback_whenever_changed, name=None,
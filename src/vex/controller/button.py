@@ -2,12 +2,11 @@
 
 
 from collections.abc import Callable, Sequence
-from threading import Thread
-from typing import LiteralString, Self
-
-from abm.decor import sense, act
+from typing import Any, LiteralString, Optional, Self
 
+from .._util.decor import act, sense
 from .._util.doc import robotmesh_doc, vexcode_doc
+from .._util.sync import poll
 
 
 __all__: Sequence[LiteralString] = ('ControllerButton',)
@@ -26,6 +25,10 @@ class ControllerButton:
         """Initialize Controller Button."""
         self.mask: LiteralString = mask
 
+        self.sense_source: Optional[Any] = None
+        self.pressed_callbacks: list[Callable] = []
+        self.released_callbacks: list[Callable] = []
+
     def __eq__(self: Self, other: Self) -> bool:
         """Check equality."""
         return isinstance(other, ControllerButton) and (other.mask == self.mask)   # noqa: E501
@@ -95,13 +98,11 @@ class ControllerButton:
     @act
     def pressed(self: Self, callback: Callable, /):
         """Trigger callback function when upon being pressed."""
-        def trigger_callback_whenever_pressing():
-            while True:
-                if self.pressing():
-                    callback()
+        self.pressed_callbacks.append(callback)
 
-        Thread(group=None, target=trigger_callback_whenever_pressing, name=None,  # noqa: E501
-               args=(), kwargs={}, daemon=True).start()
+        # attached sources (e.g. replays) dispatch callbacks themselves
+        poll(lambda: (self.sense_source is None) and self.pressing(),
+             callback)
 
     @vexcode_doc("""
         Controller Button Released
@@ -127,10 +128,8 @@ class ControllerButton:
     @act
     def released(self: Self, callback: Callable, /):
         """Trigger callback function upon being released."""
-        def trigger_callback_whenever_not_pressing():
-            while True:
-                if not self.pressing():
-                    callback()
+        self.released_callbacks.append(callback)
 
-        Thread(group=None, target=trigger_callback_whenever_not_pressing, name=None,  # noqa: E501
-               args=(), kwargs={}, daemon=True).start()
+        # attached sources (e.g. replays) dispatch callbacks themselves
+        poll(lambda: (self.sense_source is None) and (not self.pressing()),
+             callback)
@@ -0,0 +1,205 @@
+"""Bindable joystick-axes-to-drivetrain arcade & tank mappings."""
+
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Sequence
+from time import monotonic
+from typing import Any, LiteralString, Optional, Self, TYPE_CHECKING
+
+from .._common_enums.percent import PERCENT
+from ..time.scheduler import LoopStats, PeriodicTask, Scheduler
+
+from .._util.decor import NO_READING
+from .._util.type import Num
+
+if TYPE_CHECKING:
+    from .axis import ControllerAxis
+
+
+__all__: Sequence[LiteralString] = 'ResponseCurve', 'DriveMapping'
+
+
+DEFAULT_RATE: Num = 50  # ticks per second
+
+
+class ResponseCurve:
+    """Precomputed axis-position-to-output lookup table.
+
+    Output for each integer position in [-100, 100] is computed once:
+    positions within `deadband` map to 0, the rest are rescaled to start
+    from 0 at the deadband edge, shaped by `expo` (0: linear, 1: cubic)
+    and multiplied by `scale`, so that applying the curve is one lookup.
+    """
+
+    def __init__(self: Self, /,
+                 deadband: Num = 0, expo: Num = 0, scale: Num = 1):
+        """Initialize Response Curve."""
+        assert 0 <= deadband < 100, \
+            ValueError(f'*** deadband {deadband} NOT IN [0, 100) ***')
+        assert 0 <= expo <= 1, ValueError(f'*** expo {expo} NOT IN [0, 1] ***')
+
+        self.deadband: Num = deadband
+        self.expo: Num = expo
+        self.scale: Num = scale
+
+        self.table: array = array('d', (self._shape(position)
+                                        for position in range(-100, 101)))
+
+    def __eq__(self: Self, other: Self, /) -> bool:
+        """Check equality."""
+        return (isinstance(other, ResponseCurve) and
+                (other.deadband == self.deadband) and
+                (other.expo == self.expo) and
+                (other.scale == self.scale))
+
+    def __hash__(self: Self, /) -> int:
+        """Return integer hash."""
+        return hash((self.deadband, self.expo, self.scale))
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return (f'{type(self).__name__}(deadband={self.deadband}, '
+                f'expo={self.expo}, scale={self.scale})')
+
+    def _shape(self: Self, position: int, /) -> float:
+        if abs(position) < self.deadband:
+            return 0.
+
+        x: float = ((abs(position) - self.deadband) / (100 - self.deadband) *
+                    (1 if position > 0 else -1))
+        return ((1 - self.expo) * x + self.expo * x ** 3) * self.scale * 100
+
+    def __call__(self: Self, position: Num, /) -> float:
+        """Return output percentage for axis position."""
+        return self.table[min(max(round(position), -100), 100) + 100]
+
+
+class DriveMapping:
+    """Joystick axes bound to a drivetrain, applied at a fixed rate.
+
+    Declared once, e.g. `DriveMapping.arcade(drivetrain, controller.axisA,
+    controller.axisC, turn_curve=ResponseCurve(deadband=5, expo=.5))`,
+    then either stepped explicitly through `step()` (deterministic, in the
+    caller's thread), registered with a Scheduler's tick loop through
+    `schedule(...)`, or run on its own background Scheduler through
+    `start()`.
+
+    Each tick reads both axes (straight from an attached sense source such
+    as a ControllerReplay when there is one), maps them through the curves'
+    lookup tables, and commands the drivetrain only if the side velocities
+    changed: through its `arcade(...)` if it has one, else by setting &
+    spinning its group engine's sides at those velocities.
+    """
+
+    ARCADE: LiteralString = 'arcade'
+    TANK: LiteralString = 'tank'
+
+    def __init__(self: Self, drivetrain: Any, mode: LiteralString,
+                 axes: tuple[ControllerAxis, ControllerAxis],
+                 curves: tuple[ResponseCurve, ResponseCurve], /,
+                 rate: Num = DEFAULT_RATE,
+                 clock: Callable[[], float] = monotonic):
+        # pylint: disable=too-many-arguments
+        """Initialize Drive Mapping."""
+        assert mode in (self.ARCADE, self.TANK), \
+            ValueError(f'*** mode {mode} NEITHER arcade NOR tank ***')
+        assert rate > 0, ValueError(f'*** rate {rate} NOT POSITIVE ***')
+
+        self.drivetrain: Any = drivetrain
+        self.mode: LiteralString = mode
+        self.axes: tuple[ControllerAxis, ControllerAxis] = axes
+        self.curves: tuple[ResponseCurve, ResponseCurve] = curves
+        self.clock: Callable[[], float] = clock
+
+        self.rate: Num = rate
+        self.stats: LoopStats = LoopStats(1 / rate)
+        self.scheduler: Optional[Scheduler] = None
+
+        self.side_velocities: tuple[float, float] = (0., 0.)
+        self.n_commands: int = 0
+
+    @classmethod
+    def arcade(cls, drivetrain: Any,
+               drive_axis: ControllerAxis, turn_axis: ControllerAxis, /,
+               drive_curve: ResponseCurve = ResponseCurve(),
+               turn_curve: ResponseCurve = ResponseCurve(),
+               rate: Num = DEFAULT_RATE,
+               clock: Callable[[], float] = monotonic) -> Self:
+        # pylint: disable=too-many-arguments
+        """Bind drive & turn axes to drivetrain in arcade mode."""
+        return cls(drivetrain, cls.ARCADE, (drive_axis, turn_axis),
+                   (drive_curve, turn_curve), rate=rate, clock=clock)
+
+    @classmethod
+    def tank(cls, drivetrain: Any,
+             left_axis: ControllerAxis, right_axis: ControllerAxis, /,
+             curve: ResponseCurve = ResponseCurve(),
+             rate: Num = DEFAULT_RATE,
+             clock: Callable[[], float] = monotonic) -> Self:
+        # pylint: disable=too-many-arguments
+        """Bind left & right axes to drivetrain in tank mode."""
+        return cls(drivetrain, cls.TANK, (left_axis, right_axis),
+                   (curve, curve), rate=rate, clock=clock)
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return (f'{type(self).__name__}.{self.mode}({self.drivetrain}, '
+                f'{self.axes[0]}, {self.axes[1]})')
+
+    @staticmethod
+    def _read(axis: ControllerAxis, /) -> Num:
+        if (((source := axis.sense_source) is not None) and
+                ((reading := source.read(axis, 'position', ())) is not NO_READING)):  # noqa: E501
+            return reading
+        return axis.position()
+
+    def step(self: Self, /) -> tuple[float, float]:
+        """Apply mapping once, returning commanded side velocities."""
+        first: float = self.curves[0](self._read(self.axes[0]))
+        second: float = self.curves[1](self._read(self.axes[1]))
+
+        left, right = ((first + second, first - second)
+                       if self.mode == self.ARCADE
+                       else (first, second))
+        # (clamped in both modes, as curves may scale beyond full speed)
+        left: float = min(max(left, -100), 100)
+        right: float = min(max(right, -100), 100)
+
+        if (left, right) != self.side_velocities:
+            self.side_velocities: tuple[float, float] = (left, right)
+            self.n_commands += 1
+
+            if hasattr(self.drivetrain, 'arcade'):
+                self.drivetrain.arcade((left + right) / 2, (left - right) / 2)
+            else:
+                self.drivetrain.engine.set_side_velocities((left, right),
+                                                           PERCENT)
+                self.drivetrain.engine.spin_sides((left, right))
+
+        return self.side_velocities
+
+    def schedule(self: Self, scheduler: Scheduler, /) -> PeriodicTask:
+        """Register mapping to run in Scheduler's loop at mapping's rate."""
+        task: PeriodicTask = scheduler.add(self.step, self.rate,
+                                           name=repr(self))
+        self.stats: LoopStats = task.stats
+        return task
+
+    def start(self: Self, /):
+        """Start applying mapping at fixed rate in background."""
+        if self.scheduler is not None:
+            return
+
+        self.scheduler: Scheduler = Scheduler(clock=self.clock)
+        self.schedule(self.scheduler)
+        self.scheduler.start()
+
+    def stop(self: Self, /):
+        """Stop applying mapping in background."""
+        if self.scheduler is None:
+            return
+
+        self.scheduler.stop()
+        self.scheduler: Optional[Scheduler] = None
@@ -0,0 +1,526 @@
+"""Controller input recording & deterministic replay."""
+
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Callable, Sequence
+from threading import Event, Lock, Thread
+from time import monotonic, sleep
+from typing import Any, LiteralString, Optional, Self, TYPE_CHECKING
+
+from .._util.decor import NO_READING
+from .._util.type import Num
+from .axis import (AxisChangeFilter,
+                   DEFAULT_CHANGE_MAX_RATE, DEFAULT_CHANGE_MIN_DELTA)
+
+if TYPE_CHECKING:
+    from . import Controller
+
+
+__all__: Sequence[LiteralString] = ('ControllerRecording',
+                                    'ControllerRecorder',
+                                    'ControllerReplay')
+
+
+AXIS_NAMES: tuple[LiteralString, ...] = ('axisA', 'axisB', 'axisC', 'axisD')
+
+BUTTON_NAMES: tuple[LiteralString, ...] = ('buttonEUp', 'buttonEDown',
+                                           'buttonFUp', 'buttonFDown',
+                                           'buttonLUp', 'buttonLDown',
+                                           'buttonL3',
+                                           'buttonRUp', 'buttonRDown',
+                                           'buttonR3')
+
+INPUT_NAMES: tuple[LiteralString, ...] = AXIS_NAMES + BUTTON_NAMES
+
+N_AXES: int = len(AXIS_NAMES)
+N_INPUTS: int = len(INPUT_NAMES)
+
+# number of events between full-state keyframes used for seeking
+KEYFRAME_INTERVAL: int = 256
+
+_MAGIC: bytes = b'VXCR'
+_FORMAT_VERSION: int = 1
+
+_USEC_PER_SEC: int = 1_000_000
+
+
+def _write_varint(buffer: bytearray, n: int, /):
+    """Append unsigned LEB128-encoded integer."""
+    while n > 0x7F:
+        buffer.append((n & 0x7F) | 0x80)
+        n >>= 7
+    buffer.append(n)
+
+
+def _read_varint(data: bytes, offset: int, /) -> tuple[int, int]:
+    """Read unsigned LEB128-encoded integer, returning it & next offset."""
+    n: int = 0
+    shift: int = 0
+    while True:
+        byte: int = data[offset]
+        offset += 1
+        n |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return n, offset
+        shift += 7
+
+
+def _zigzag(n: int, /) -> int:
+    return (n << 1) ^ (n >> 63)
+
+
+def _unzigzag(n: int, /) -> int:
+    return (n >> 1) ^ -(n & 1)
+
+
+class ControllerRecording:
+    """Timestamped, delta-encoded log of Controller inputs.
+
+    Only input changes are stored, as (time, input index, value) events
+    in contiguous arrays, with full-state keyframes every
+    `KEYFRAME_INTERVAL` events so that seeking costs O(log n).
+    """
+
+    def __init__(self: Self, initial: Sequence[int] = (0,) * N_INPUTS, /):
+        """Initialize empty Controller Recording from initial input state."""
+        assert len(initial) == N_INPUTS, \
+            ValueError(f'*** initial {initial} NOT OF LENGTH {N_INPUTS} ***')
+
+        self.initial: array = array('h', initial)
+
+        self.times: array = array('q')  # microseconds since recording start
+        self.inputs: array = array('B')
+        self.values: array = array('h')
+
+        self._keyframes: list[array] = []
+        self._state: array = array('h', initial)
+
+    def __eq__(self: Self, other: Self, /) -> bool:
+        """Check equality."""
+        return (isinstance(other, ControllerRecording) and
+                (other.initial == self.initial) and
+                (other.times == self.times) and
+                (other.inputs == self.inputs) and
+                (other.values == self.values))
+
+    def __len__(self: Self, /) -> int:
+        """Return number of recorded input-change events."""
+        return len(self.times)
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return (f'{type(self).__name__}({len(self)} events, '
+                f'{self.duration:.3f}s)')
+
+    @property
+    def duration(self: Self, /) -> float:
+        """Time of last recorded event, in seconds."""
+        return self.times[-1] / _USEC_PER_SEC if self.times else 0.
+
+    def append(self: Self, time_usec: int, index: int, value: int, /):
+        """Append input-change event, with time in microseconds."""
+        assert (not self.times) or (time_usec >= self.times[-1]), \
+            ValueError(f'*** time_usec {time_usec} EARLIER THAN LAST EVENT ***')  # noqa: E501
+        assert 0 <= index < N_INPUTS, \
+            ValueError(f'*** index {index} NOT IN [0, {N_INPUTS}) ***')
+
+        if len(self.times) % KEYFRAME_INTERVAL == 0:
+            self._keyframes.append(array('h', self._state))
+
+        self.times.append(time_usec)
+        self.inputs.append(index)
+        self.values.append(value)
+        self._state[index] = value
+
+    def state_at(self: Self, time: Num, /) -> array:
+        """Return input state at specified time (in seconds)."""
+        return self.state_after(bisect_right(self.times,
+                                             round(time * _USEC_PER_SEC)))
+
+    def state_after(self: Self, n_events: int, /) -> array:
+        """Return input state after the first `n_events` events."""
+        if n_events == 0:
+            return array('h', self.initial)
+
+        keyframe_index: int = (n_events - 1) // KEYFRAME_INTERVAL
+        state: array = array('h', self._keyframes[keyframe_index])
+        for i in range(keyframe_index * KEYFRAME_INTERVAL, n_events):
+            state[self.inputs[i]] = self.values[i]
+        return state
+
+    def to_bytes(self: Self, /) -> bytes:
+        """Serialize to compact binary log.
+
+        Event times are stored as varint deltas from the previous event,
+        and values as zigzag-varint deltas from the previous value
+        of the same input.
+        """
+        buffer: bytearray = bytearray(_MAGIC)
+        buffer.append(_FORMAT_VERSION)
+        _write_varint(buffer, len(self))
+
+        for value in self.initial:
+            _write_varint(buffer, _zigzag(value))
+
+        state: array = array('h', self.initial)
+        prev_time: int = 0
+        for time_usec, index, value in zip(self.times, self.inputs, self.values):  # noqa: E501
+            _write_varint(buffer, time_usec - prev_time)
+            buffer.append(index)
+            _write_varint(buffer, _zigzag(value - state[index]))
+            prev_time, state[index] = time_usec, value
+
+        return bytes(buffer)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, /) -> ControllerRecording:
+        """Deserialize from compact binary log."""
+        assert data[:len(_MAGIC)] == _MAGIC, \
+            ValueError('*** DATA NOT A CONTROLLER RECORDING ***')
+        assert data[len(_MAGIC)] == _FORMAT_VERSION, \
+            ValueError(f'*** UNSUPPORTED FORMAT VERSION {data[len(_MAGIC)]} ***')  # noqa: E501
+
+        offset: int = len(_MAGIC) + 1
+        n_events, offset = _read_varint(data, offset)
+
+        initial: list[int] = []
+        for _ in range(N_INPUTS):
+            zigzagged, offset = _read_varint(data, offset)
+            initial.append(_unzigzag(zigzagged))
+
+        recording: ControllerRecording = cls(initial)
+        state: list[int] = initial
+        time_usec: int = 0
+        for _ in range(n_events):
+            delta_time, offset = _read_varint(data, offset)
+            index: int = data[offset]
+            zigzagged, offset = _read_varint(data, offset + 1)
+            time_usec += delta_time
+            state[index] += _unzigzag(zigzagged)
+            recording.append(time_usec, index, state[index])
+
+        return recording
+
+
+class ControllerRecorder:
+    """Record a Controller session into a Controller Recording."""
+
+    def __init__(self: Self, controller: Controller, /,
+                 clock: Callable[[], float] = monotonic):
+        """Initialize Controller Recorder."""
+        self.controller: Controller = controller
+        self.clock: Callable[[], float] = clock
+
+        self.recording: Optional[ControllerRecording] = None
+        self._start_time: Optional[float] = None
+        self._state: list[int] = []
+
+    def _read_inputs(self: Self, /) -> list[int]:
+        return ([getattr(self.controller, name).position()
+                 for name in AXIS_NAMES] +
+                [int(getattr(self.controller, name).pressing())
+                 for name in BUTTON_NAMES])
+
+    def start(self: Self, /):
+        """Start recording, reading initial input state."""
+        self._state: list[int] = self._read_inputs()
+        self.recording: ControllerRecording = ControllerRecording(self._state)
+        self._start_time: float = self.clock()
+
+    def sample(self: Self, /):
+        """Read all inputs once, logging those that changed."""
+        assert self.recording is not None, \
+            ValueError('*** RECORDER NOT STARTED; CALL start() FIRST ***')
+
+        time_usec: int = round((self.clock() - self._start_time) * _USEC_PER_SEC)  # noqa: E501
+        for index, value in enumerate(self._read_inputs()):
+            if value != self._state[index]:
+                self.recording.append(time_usec, index, value)
+                self._state[index] = value
+
+    def stop(self: Self, /) -> ControllerRecording:
+        """Stop recording & return the Controller Recording."""
+        recording, self.recording = self.recording, None
+        return recording
+
+    def record(self: Self, duration: Num, /,
+               period: Num = 0.01) -> ControllerRecording:
+        """Record for specified duration, sampling every period (seconds)."""
+        self.start()
+        end_time: float = self._start_time + duration
+        next_time: float = self._start_time
+        while next_time < end_time:
+            self.sample()
+            next_time += period
+            if (delay := next_time - self.clock()) > 0:
+                sleep(delay)
+        return self.stop()
+
+
+class ControllerReplay:
+    """Deterministically replay a Controller Recording.
+
+    Once attached to a Controller, its axes' `position()`/`value()` and
+    buttons' `pressing()` report the replayed state, and `changed`/`pressed`/
+    `released` callbacks fire on recorded input changes: axes' `changed`
+    callbacks sampled, filtered & coalesced as when live (i.e. at their
+    `max_rate`, in replay time).
+
+    Replay time advances either explicitly through `advance(...)`/
+    `advance_to(...)` (deterministic, in the caller's thread), or in real time
+    through `play()`, scaled by `speed`. `seek(...)` jumps in O(log n)
+    without firing callbacks.
+    """
+
+    def __init__(self: Self, recording: ControllerRecording, /,
+                 speed: Num = 1, clock: Callable[[], float] = monotonic):
+        """Initialize Controller Replay."""
+        self.recording: ControllerRecording = recording
+        self.clock: Callable[[], float] = clock
+
+        self.controller: Optional[Controller] = None
+        self._devices: list[Any] = []
+        self._indices: dict[Any, int] = {}
+
+        self._state: array = array('h', recording.initial)
+        self._n_events: int = 0
+        self._time: float = 0.
+        self._lock: Lock = Lock()
+
+        # axes' changed callbacks' filters & next sample times (usec)
+        self._tickers: dict[tuple[int, int], list] = {}
+
+        self._speed: float = speed
+        self._anchor_wall_time: Optional[float] = None
+        self._anchor_time: float = 0.
+        self._stop_playing: Event = Event()
+        self._player: Optional[Thread] = None
+
+    @property
+    def time(self: Self, /) -> float:
+        """Current replay time, in seconds."""
+        return self._time
+
+    @property
+    def speed(self: Self, /) -> float:
+        """Replay speed multiplier."""
+        return self._speed
+
+    @speed.setter
+    def speed(self: Self, speed: Num, /):
+        assert speed > 0, ValueError(f'*** speed {speed} NOT POSITIVE ***')
+        if self._anchor_wall_time is not None:
+            self._anchor_time: float = self._playing_time()
+            self._anchor_wall_time: float = self.clock()
+        self._speed: float = speed
+
+    @property
+    def is_finished(self: Self, /) -> bool:
+        """Whether all recorded events have been replayed."""
+        return self._n_events >= len(self.recording)
+
+    def attach(self: Self, controller: Controller, /):
+        """Attach to Controller, overriding its axes' & buttons' readings."""
+        self.detach()
+        self.controller: Controller = controller
+        self._devices: list[Any] = [getattr(controller, name)
+                                    for name in INPUT_NAMES]
+        self._indices: dict[Any, int] = {device: index
+                                         for index, device
+                                         in enumerate(self._devices)}
+        for device in self._devices:
+            device.sense_source = self
+
+    def detach(self: Self, /):
+        """Detach from Controller, restoring its default readings."""
+        for device in self._devices:
+            if device.sense_source is self:
+                device.sense_source = None
+        self.controller: Optional[Controller] = None
+        self._devices: list[Any] = []
+        self._indices: dict[Any, int] = {}
+        self._tickers.clear()
+
+    def read(self: Self, device: Any, method_name: str, args: tuple, /) -> Any:  # noqa: E501
+        # pylint: disable=unused-argument
+        """Return replayed reading for attached Controller axis or button."""
+        if (index := self._indices.get(device)) is None:
+            return NO_READING
+
+        if index < N_AXES:
+            if method_name == 'position':
+                return self._state[index]
+            if method_name == 'value':
+                return round(self._state[index] * 127 / 100)
+        elif method_name == 'pressing':
+            return bool(self._state[index])
+
+        return NO_READING
+
+    def seek(self: Self, time: Num, /):
+        """Jump to specified replay time (seconds), without callbacks."""
+        with self._lock:
+            self._n_events: int = bisect_right(self.recording.times,
+                                               round(time * _USEC_PER_SEC))
+            self._state: array = self.recording.state_after(self._n_events)
+            self._time: float = time
+            self._tickers.clear()
+
+            if self._anchor_wall_time is not None:
+                self._anchor_time: float = time
+                self._anchor_wall_time: float = self.clock()
+
+    def advance_to(self: Self, time: Num, /):
+        """Replay all events up to specified time (seconds), in order."""
+        end: int = bisect_right(self.recording.times,
+                                round(time * _USEC_PER_SEC))
+
+        with self._lock:
+            start: int = self._n_events
+            start_usec: int = round(self._time * _USEC_PER_SEC)
+            events: list[tuple[int, int, int, int]] = []
+            for i in range(start, end):
+                index: int = self.recording.inputs[i]
+                value: int = self.recording.values[i]
+                if value != (prev_value := self._state[index]):
+                    self._state[index] = value
+                    events.append((self.recording.times[i], index,
+                                   prev_value, value))
+            self._n_events: int = max(self._n_events, end)
+            self._time: float = max(self._time, time)
+
+        # (time in microseconds, axis samples before button events, order)
+        deliveries: list[tuple[int, int, int, Callable[[], Any]]] = [
+            (time_usec, 1, i,
+             lambda index=index, prev_value=prev_value, value=value:
+             self._dispatch(index, prev_value, value))
+            for i, (time_usec, index, prev_value, value) in enumerate(events)
+            if index >= N_AXES]
+        deliveries.extend(self._axis_ticks(start, end, start_usec,
+                                           round(time * _USEC_PER_SEC)))
+
+        for *_, deliver in sorted(deliveries, key=lambda d: d[:3]):
+            deliver()
+
+    def advance(self: Self, duration: Num, /):
+        """Replay events over specified wall-clock duration, scaled by speed."""  # noqa: E501
+        self.advance_to(self._time + duration * self._speed)
+
+    def _axis_ticks(self: Self, start: int, end: int,
+                    start_usec: int, end_usec: int, /) \
+            -> list[tuple[int, int, int, Callable[[], Any]]]:
+        # axes' changed callbacks fire as they would live: each callback
+        # samples its axis every 1/max_rate seconds of replay time through
+        # an Axis Change Filter (skipping samples between axis changes,
+        # which cannot deliver anything new)
+        deliveries: list[tuple[int, int, int, Callable[[], Any]]] = []
+        if not self._devices:
+            return deliveries
+
+        for index, device in enumerate(self._devices[:N_AXES]):
+            changes: list[int] = [self.recording.times[i]
+                                  for i in range(start, end)
+                                  if self.recording.inputs[i] == index]
+
+            for k, callback in enumerate(device.changed_callbacks):
+                min_delta, max_rate = device.changed_options.get(
+                    k, (DEFAULT_CHANGE_MIN_DELTA, DEFAULT_CHANGE_MAX_RATE))
+                period: int = round(_USEC_PER_SEC / max_rate)
+
+                if (ticker := self._tickers.get((index, k))) is None:
+                    self._tickers[(index, k)] = ticker = [
+                        AxisChangeFilter(
+                            self.recording.state_after(start)[index],
+                            min_delta=min_delta,
+                            deadband=self.controller.deadband),
+                        start_usec + period]
+                change_filter, tick = ticker
+
+                n_seen: int = 0
+                while tick <= end_usec:
+                    change_filter.deadband = self.controller.deadband
+                    if change_filter.update(self._state_at_usec(tick)[index]):  # noqa: E501
+                        deliveries.append(
+                            (tick, 0, len(deliveries),
+                             lambda device=device, callback=callback,
+                             position=change_filter.delivered_position:
+                             self._deliver_change(device, callback,
+                                                  position)))
+
+                    while (n_seen < len(changes)) and (changes[n_seen] <= tick):  # noqa: E501
+                        n_seen += 1
+                    tick += period * (
+                        (end_usec - tick) // period + 1
+                        if n_seen == len(changes)
+                        else -(-(changes[n_seen] - tick) // period))
+
+                ticker[1] = tick
+
+        return deliveries
+
+    def _state_at_usec(self: Self, time_usec: int, /) -> array:
+        return self.recording.state_after(bisect_right(self.recording.times,
+                                                       time_usec))
+
+    @staticmethod
+    def _deliver_change(device: Any, callback: Callable, position: int, /):
+        device.changed_position = position
+        callback()
+
+    def _dispatch(self: Self, index: int, prev_value: int, value: int, /):
+        device: Any = self._devices[index] if self._devices else None
+        if device is None:
+            return
+
+        if value and not prev_value:
+            callbacks: list[Callable] = device.pressed_callbacks
+        else:
+            callbacks: list[Callable] = device.released_callbacks
+
+        for callback in callbacks:
+            callback()
+
+    def _playing_time(self: Self, /) -> float:
+        return (self._anchor_time +
+                (self.clock() - self._anchor_wall_time) * self._speed)
+
+    def play(self: Self, /):
+        """Start replaying in real time (scaled by speed) in background."""
+        if self._player is not None:
+            return
+
+        self._anchor_time: float = self._time
+        self._anchor_wall_time: float = self.clock()
+        self._stop_playing.clear()
+
+        def replay_in_real_time():
+            while not (self._stop_playing.is_set() or self.is_finished):
+                self.advance_to(self._playing_time())
+
+                if self.is_finished:
+                    break
+
+                # sleep until next recorded event, or axis sample, is due
+                next_time: float = min(
+                    [self.recording.times[self._n_events]] +
+                    [tick for _, tick in self._tickers.values()]) / _USEC_PER_SEC  # noqa: E501
+                self._stop_playing.wait(
+                    max(next_time - self._playing_time(), 0) / self._speed)
+
+        self._player: Thread = Thread(group=None, target=replay_in_real_time,
+                                      name=None, args=(), kwargs={},
+                                      daemon=True)
+        self._player.start()
+
+    def pause(self: Self, /):
+        """Stop real-time replay, keeping current replay time."""
+        if self._player is None:
+            return
+
+        self._stop_playing.set()
+        self._player.join()
+        self._player: Optional[Thread] = None
+        self._anchor_wall_time: Optional[float] = None
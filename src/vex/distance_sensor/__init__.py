@@ -4,12 +4,11 @@
 from collections.abc import Sequence
 from typing import LiteralString, Self
 
-from abm.decor import sense
-
-from .._device import Device
+from .._device import Device, V5DeviceType
 from ..brain.port import Ports
 from .._common_enums.distance import DistanceUnits, MM, INCHES
 
+from .._util.decor import sense
 from .._util.doc import vexcode_doc
 from .._util.type import Num
 
@@ -23,6 +22,8 @@ __all__: Sequence[LiteralString] = 'Distance', 'ObjectSizeType', 'Sonar'
 class Distance(Device):
     """Distance Sensor."""
 
+    _V5_DEVICE_TYPE: V5DeviceType = V5DeviceType.RANGE
+
     def __init__(self: Self, port: Ports, /):
         """Initialize Distance Sensor."""
         self.port: Ports = port
@@ -4,12 +4,11 @@
 from collections.abc import Sequence
 from typing import LiteralString, Self, overload
 
-from abm.decor import act, sense
-
-from .._device import Device
+from .._device import Device, V5DeviceType
 from ..brain.port import Ports
-from .._common_enums.distance import DistanceUnits, MM, INCHES
+from .._common_enums.distance import DistanceUnits, MM, INCHES, _Distance
 
+from .._util.decor import act, sense
 from .._util.doc import robotmesh_doc, vexcode_doc
 from .._util.type import Num
 
@@ -24,6 +23,8 @@ __all__: Sequence[LiteralString] = ('Sonar',)
 class Sonar(Device):
     """Sonar."""
 
+    _V5_DEVICE_TYPE: V5DeviceType = V5DeviceType.SONAR
+
     @robotmesh_doc("""
         Creates new sonar sensor object on the port specified in the parameter.
 
@@ -34,8 +35,7 @@ class Sonar(Device):
         """Initialize Sonar."""
         self.port: Ports = index
 
-        self.max_distance: dict[DistanceUnits, Num] = \
-            dict[DistanceUnits, Num]()
+        self.max_distance: _Distance = _Distance(2500, MM)
 
     def __hash__(self: Self) -> int:
         """Return integer hash."""
@@ -52,7 +52,7 @@ class Sonar(Device):
     def set_maximum(self: Self,
                     distance: Num, distanceUnits: DistanceUnits = MM, /):
         """Set maximum measurable distance."""
-        self.max_distance[distanceUnits] = distance
+        self.max_distance: _Distance = _Distance(distance, distanceUnits)
 
     @vexcode_doc("""
         Distance Found Object
@@ -4,12 +4,12 @@
 from collections.abc import Sequence
 from typing import Literal, LiteralString, Self, overload
 
-from abm.decor import act, sense
-
-from .._device import Device
+from .._device import Device, V5DeviceType
 from ..brain.port import Ports
 from .._common_enums import RotationUnits, DEGREES
+from .._common_enums.rotation import _Rotation
 
+from .._util.decor import act, sense
 from .._util.doc import robotmesh_doc, vexcode_doc
 
 from .calibration import GyroCalibrationType
@@ -25,6 +25,8 @@ __all__: Sequence[LiteralString] = 'Gyro', 'GyroCalibrationType'
 class Gyro(Device):
     """Gyro Sensor."""
 
+    _V5_DEVICE_TYPE: V5DeviceType = V5DeviceType.GYRO
+
     @robotmesh_doc("""
         Creates a new gyro object on the port specified in the parameter.
 
@@ -37,8 +39,8 @@ class Gyro(Device):
         self.port: Ports = index
         self.is_calibrated: bool = calibrate
 
-        self._heading: dict[RotationUnits, float] = dict[RotationUnits, float]()  # noqa: E501
-        self._rotation: dict[RotationUnits, float] = dict[RotationUnits, float]()  # noqa: E501
+        self._heading: _Rotation = _Rotation(0, DEGREES)
+        self._rotation: _Rotation = _Rotation(0, DEGREES)
 
     def __eq__(self: Self, other: Self) -> bool:
         """Check equality."""
@@ -131,7 +133,7 @@ class Gyro(Device):
     @act
     def set_heading(self: Self, value: float, unit: Literal[DEGREES] = DEGREES, /):  # noqa: E501
         """Set heading angle."""
-        self._heading[unit] = value
+        self._heading: _Rotation = _Rotation(value, unit)
 
     @overload
     def set_rotation(self: Self, value: float, unit: Literal[DEGREES] = DEGREES, /):  # noqa: E501
@@ -165,7 +167,7 @@ class Gyro(Device):
     @act
     def set_rotation(self: Self, value: float, unit: Literal[DEGREES] = DEGREES, /):  # noqa: E501
         """Set rotational angle."""
-        self._rotation[unit] = value
+        self._rotation: _Rotation = _Rotation(value, unit)
 
     @overload
     def heading(self: Self, unit: Literal[DEGREES] = DEGREES, /) -> float:
@@ -5,14 +5,14 @@
 
 
 from collections.abc import Sequence
+from fractions import Fraction
 from typing import Literal, LiteralString, Optional, Self, overload
 
-from abm.decor import act, sense
-
 from .._device import Device
 from .._device.v5 import V5DeviceType
 from ..brain.port import Ports
 from ..time import TimeUnits, SECONDS
+from ..time.units import _Time
 from .._common_enums.percent import PercentUnits, PERCENT
 from .._common_enums.rotation import RotationUnits, DEGREES
 from .._common_enums.temperature import TemperatureUnits
@@ -21,12 +21,18 @@ from .._common_enums.velocity import VelocityUnits
 from .brake import BrakeType, COAST, BRAKE, HOLD
 from .current import CurrentUnits
 from .direction import DirectionType, FORWARD, REVERSE
-from .gear import GearSetting
+from .gear import GearSetting, ENCODER_TICKS, MAX_RPM
+from .mailbox import CommandMailbox, MotorCommand
+from .profile import Move, PROFILE_CACHE
+from .state import MotorStates, NO_BRAKE, max_torque_percent
 from .torque import TorqueUnits
 from .turn import TurnType, LEFT, RIGHT
 from .voltage import VoltageUnits
 
+from .._util.conversion import UnitTable, unit_table
+from .._util.decor import act, sense
 from .._util.doc import robotmesh_doc, vexcode_doc
+from .._util.sync import synchronized
 from .._util.type import Num
 
 
@@ -40,6 +46,21 @@ __all__: Sequence[LiteralString] = ('Motor',
                                     'VoltageUnits')
 
 
+# rotation units, incl. RAW encoder ticks, per gear setting (None: IQ motor)
+_ROTATION_UNITS: dict[Optional[GearSetting], UnitTable] = {
+    gear_setting: unit_table(RotationUnits).with_unit(
+        RotationUnits.RAW, Fraction(360, ticks))
+    for gear_setting, ticks in ENCODER_TICKS.items()}
+
+# velocity units, incl. PCT of max speed & RAW encoder ticks per second,
+# per gear setting (None: IQ motor)
+_VELOCITY_UNITS: dict[Optional[GearSetting], UnitTable] = {
+    gear_setting: unit_table(VelocityUnits).with_unit(
+        VelocityUnits.PCT, Fraction(max_rpm * 6, 100)).with_unit(
+        VelocityUnits.RAW, Fraction(360, ENCODER_TICKS[gear_setting]))
+    for gear_setting, max_rpm in MAX_RPM.items()}
+
+
 @robotmesh_doc("""
     Robot Mesh VEX IQ Python B:
     robotmesh.com/studio/content/docs/vexiq-python_b/html/classvex_1_1_motor.html
@@ -51,6 +72,8 @@ class Motor(Device):
     # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """Motor."""
 
+    _V5_DEVICE_TYPE: V5DeviceType = V5DeviceType.MOTOR
+
     @overload
     def __init__(self: Self, index: Ports, reverse: bool = False, /) -> None:
         """Initialize Motor."""
@@ -99,17 +122,20 @@ class Motor(Device):
             assert isinstance(self.reverse, bool), \
                 TypeError(f'*** 3ND ARG reverse={self.reverse} NOT BOOL ***')
 
-        self._rotation: dict[RotationUnits, float] = dict[RotationUnits, float]()  # noqa: E501
+        # position, velocity, torque limit & stopping mode settings live in
+        # one slot of (possibly motor-group-shared) struct-of-arrays storage
+        self.states: MotorStates = MotorStates()
+        self.slot: int = 0
 
-        self.selected_velocity_unit: VelocityUnits = PERCENT
-        self._velocity: dict[VelocityUnits, Num] = {PERCENT: 50}
+        self._timeout: Optional[_Time] = None
 
-        self.stopping_mode: Optional[BrakeType] = None
+        self.max_torque_current: Optional[float] = None
 
-        self._timeout: dict[TimeUnits, Num] = dict[TimeUnits, Num]()
+        # profile of latest spin_for(...) move, from precomputed cache
+        self.motion: Optional[Move] = None
 
-        self.max_torque: dict[TorqueUnits, Num] = dict[TorqueUnits, Num]()
-        self.max_torque_current: Optional[float] = None
+        # latest command, possibly posted concurrently from several threads
+        self.mailbox: CommandMailbox = CommandMailbox()
 
     def __eq__(self: Self, other: Self) -> bool:
         """Check equality."""
@@ -128,6 +154,41 @@ class Motor(Device):
                                                             if self.reverse
                                                             else ')')
 
+    @property
+    def rotation_units(self: Self, /) -> UnitTable:
+        """Rotation unit conversion table for this motor's gear setting."""
+        return _ROTATION_UNITS[self.gear_setting]
+
+    @property
+    def velocity_units(self: Self, /) -> UnitTable:
+        """Velocity unit conversion table for this motor's gear setting."""
+        return _VELOCITY_UNITS[self.gear_setting]
+
+    @property
+    def selected_velocity_unit(self: Self, /) -> VelocityUnits:
+        """Unit of set velocity."""
+        return VelocityUnits(self.states.velocity_unit[self.slot])
+
+    @selected_velocity_unit.setter
+    def selected_velocity_unit(self: Self, unit: VelocityUnits, /):
+        self.states.velocity_unit[self.slot] = unit
+
+    @property
+    def stopping_mode(self: Self, /) -> Optional[BrakeType]:
+        """Set stopping mode, if any."""
+        return (None
+                if (brake := self.states.brake[self.slot]) == NO_BRAKE
+                else BrakeType(brake))
+
+    @stopping_mode.setter
+    def stopping_mode(self: Self, mode: Optional[BrakeType], /):
+        self.states.brake[self.slot] = NO_BRAKE if mode is None else mode
+
+    @property
+    def max_torque(self: Self, /) -> float:
+        """Torque limit, in percent of max torque."""
+        return self.states.max_torque[self.slot]
+
     @robotmesh_doc("""
         Use this function to reverse setting for the motor.
 
@@ -169,6 +230,8 @@ class Motor(Device):
         assert isinstance(unit, RotationUnits), \
             TypeError(f'*** unit {unit} NOT ONE OF RotationUnits ***')
 
+        self.states.position[self.slot] = self._degrees(position, unit)
+
     @robotmesh_doc("""
         Sets value of motor's encoder to value specified in parameter.
 
@@ -188,7 +251,7 @@ class Motor(Device):
             TypeError(f'*** rotationUnits {rotationUnits} '
                       'NOT ONE OF RotationUnits ***')
 
-        self._rotation[rotationUnits] = value
+        self.states.position[self.slot] = self._degrees(value, rotationUnits)
 
     @robotmesh_doc("""
         Resets the motor's encoder to the value of zero.
@@ -196,8 +259,7 @@ class Motor(Device):
     @act
     def reset_rotation(self: Self):
         """Reset rotational angle to 0."""
-        for rotation_unit in self._rotation:
-            self._rotation[rotation_unit] = 0
+        self.states.position[self.slot] = 0
 
     @overload
     def set_velocity(self: Self, value: Num, unit: VelocityUnits = PERCENT, /):
@@ -236,6 +298,7 @@ class Motor(Device):
         Setting velocity to 0 will prevent the Motor/Motor Group from spinning.
     """)
     @act
+    @synchronized
     def set_velocity(self: Self,
                      value: Num, unit: VelocityUnits = PERCENT, /):
         """Set velocity."""
@@ -245,8 +308,8 @@ class Motor(Device):
         assert (unit is PERCENT) or isinstance(unit, VelocityUnits), \
             TypeError(f'*** unit {unit} NOT ONE OF VelocityUnits ***')
 
+        self.states.velocity[self.slot] = value
         self.selected_velocity_unit: VelocityUnits = unit
-        self._velocity[unit]: Num = value
 
     @overload
     def set_stopping(self: Self, value: BrakeType, /):
@@ -328,7 +391,7 @@ class Motor(Device):
 
         assert unit is SECONDS, ValueError('*** unit MUST BE SECONDS ***')
 
-        self._timeout[unit] = value
+        self._timeout: _Time = _Time(value, unit)
 
     @robotmesh_doc("""
         Returns a timeout in given time unit.
@@ -338,7 +401,12 @@ class Motor(Device):
         assert isinstance(timeUnits, TimeUnits), \
             TypeError('*** timeUnits MUST BE ONE OF TimeUnits ***')
 
-        return self._timeout[timeUnits]
+        assert self._timeout is not None, \
+            ValueError('*** NO TIMEOUT SET YET; '
+                       'PLEASE CALL set_timeout(...) FIRST ***')
+
+        return unit_table(TimeUnits).convert(self._timeout.measurement,
+                                             self._timeout.unit, timeUnits)
 
     @overload
     def set_max_torque(self: Self, value: Num, unit: Literal[PERCENT], /):
@@ -376,7 +444,8 @@ class Motor(Device):
         assert (unit is PERCENT) or isinstance(unit, TorqueUnits), \
             TypeError('*** unit MUST BE ONE OF TorqueUnits ***')
 
-        self.max_torque[unit] = value
+        self.states.max_torque[self.slot] = \
+            max_torque_percent(value, unit, self.gear_setting)
 
     @robotmesh_doc("""
         Sets the max torque of the motor as a percentage.
@@ -390,7 +459,7 @@ class Motor(Device):
         assert isinstance(value, int), TypeError('*** value MUST BE int ***')
         assert 1 <= value <= 100, ValueError('*** value MUST BE 1-100 ***')
 
-        self.max_torque[PERCENT] = value
+        self.states.max_torque[self.slot] = value
 
     @robotmesh_doc("""
         Sets the max torque of the motor.
@@ -407,29 +476,55 @@ class Motor(Device):
 
         self.max_torque_current: float = value
 
+    def _post(self: Self, name: str, percent: float, /,
+              motion: Optional[Move] = None) -> MotorCommand:
+        # post command, then apply latest command's state until no later
+        # command was posted meanwhile, so that the latest command wins
+        command: MotorCommand = self.mailbox.post(name, percent, motion)
+        while True:
+            latest: MotorCommand = self.mailbox.latest
+            self.states.command[self.slot] = latest.percent
+            self.motion: Optional[Move] = latest.motion
+            if self.mailbox.latest is latest:
+                return command
+
+    def _degrees(self: Self, rotation: Num, unit: RotationUnits, /) -> float:
+        # rotation in degrees (RAW in encoder ticks of this motor's gearing)
+        return self.rotation_units.convert(rotation, unit, DEGREES)
+
+    def _plan_move(self: Self, rotation_degrees: float,
+                   velocity_percent: float, /) -> Optional[Move]:
+        # move profile from set position, from precomputed cache
+        return (PROFILE_CACHE.move(rotation_degrees, velocity_percent,
+                                   start=self.states.position[self.slot],
+                                   gear_setting=self.gear_setting)
+                if velocity_percent
+                else None)
+
+    def _velocity_percent(self: Self, velocity: Optional[Num],
+                          velocity_unit: Optional[VelocityUnits], /) -> float:
+        velocity, velocity_unit = self._resolve_velocity_and_unit(
+            velocity, velocity_unit)
+        return self.velocity_units.convert(velocity, velocity_unit, PERCENT)
+
+    @synchronized
     def _resolve_velocity_and_unit(self: Self,
                                    velocity: Optional[Num],
                                    velocity_unit: Optional[VelocityUnits], /) \
             -> tuple[Num, VelocityUnits]:
         if velocity is None:
             if velocity_unit is None:
-                assert self.selected_velocity_unit in self._velocity, \
-                    ValueError('*** NO VELOCITY SET YET; '
-                               'PLEASE CALL set_velocity(...) FIRST ***')
-
-                return (self._velocity[self.selected_velocity_unit],
-                        self.selected_velocity_unit)
+                velocity_unit: VelocityUnits = self.selected_velocity_unit
 
             assert ((velocity_unit is PERCENT) or
                     isinstance(velocity_unit, VelocityUnits)), \
                 TypeError(f'*** velocity_unit {velocity_unit} '
                           'NOT ONE OF VelocityUnits ***')
 
-            assert velocity_unit in self._velocity, \
-                ValueError(f'*** NO VELOCITY SET FOR UNIT {velocity_unit} YET;'
-                           ' PLEASE CALL set_velocity(...) FIRST ***')
-
-            return self._velocity[velocity_unit], velocity_unit
+            velocity: float = self.velocity_units.convert(
+                self.states.velocity[self.slot],
+                self.selected_velocity_unit, velocity_unit)
+            return velocity, velocity_unit
 
         assert isinstance(velocity, Num), \
             TypeError('*** velocity {velocity} NEITHER None, A FLOAT NOR AN INT ***')  # noqa: E501
@@ -482,6 +577,10 @@ class Motor(Device):
         velocity, velocity_unit = self._resolve_velocity_and_unit(
             velocity, velocity_unit)
 
+        percent: float = self.velocity_units.convert(velocity, velocity_unit,
+                                                     PERCENT)
+        self._post('spin', -percent if direction is REVERSE else percent)
+
         return self._spin(direction=direction,
                           velocity=velocity, velocity_unit=velocity_unit)
 
@@ -579,6 +678,14 @@ class Motor(Device):
         velocity, velocity_unit = self._resolve_velocity_and_unit(
             velocity, self.selected_velocity_unit)
 
+        rotation_degrees: float = self._degrees(rotation, rotation_unit)
+        velocity_percent: float = self.velocity_units.convert(
+            velocity, velocity_unit, PERCENT)
+        self._post('spin_for', 0,
+                   self._plan_move(-rotation_degrees if direction is REVERSE
+                                   else rotation_degrees,
+                                   velocity_percent))
+
         return self._spin_for(direction=direction,
                               rotation=rotation, rotation_unit=rotation_unit,
                               velocity=velocity, velocity_unit=velocity_unit,
@@ -626,6 +733,11 @@ class Motor(Device):
 
         assert isinstance(wait, bool), TypeError(f'*** wait {wait} NOT A BOOL ***')  # noqa: E501
 
+        self._post('spin_to_position', 0,
+                   self._plan_move(self._degrees(angle, units) -
+                                   self.states.position[self.slot],
+                                   self._velocity_percent(None, None)))
+
     @robotmesh_doc("""
         Turns on the motor and spins it to an absolute target rotation value
         at a specified velocity.
@@ -669,6 +781,12 @@ class Motor(Device):
         assert isinstance(waitForCompletion, bool), \
             TypeError(f'*** waitForCompletion {waitForCompletion} NOT A BOOL ***')  # noqa: E501
 
+        self._post('spin_to', 0,
+                   self._plan_move(self._degrees(rotation, rotationUnits) -
+                                   self.states.position[self.slot],
+                                   self._velocity_percent(velocity,
+                                                          velocityUnits)))
+
     @robotmesh_doc("""
         Turns on the motor and spins it
         to a relative target time value at a specified velocity.
@@ -705,6 +823,9 @@ class Motor(Device):
                 isinstance(velocityUnits, VelocityUnits)), \
             TypeError('**** velocityUnits MUST BE ONE OF VelocityUnits ***')
 
+        percent: float = self._velocity_percent(velocity, velocityUnits)
+        self._post('spin_for_time', -percent if dir is REVERSE else percent)
+
     @robotmesh_doc("""
         Starts spinning a motor to a relative target rotation
         but does not wait for the motor to reach that target.
@@ -743,6 +864,13 @@ class Motor(Device):
             TypeError(f'**** velocityUnits {velocityUnits} '
                       'NOT ONE OF VelocityUnits ***')
 
+        rotation_degrees: float = self._degrees(rotation, rotationUnits)
+        self._post('start_spin_for', 0,
+                   self._plan_move(-rotation_degrees if dir is REVERSE
+                                   else rotation_degrees,
+                                   self._velocity_percent(velocity,
+                                                          velocityUnits)))
+
     @robotmesh_doc("""
         Starts spinning a motor to an absolute target rotation
         but does not wait for the motor to reach that target.
@@ -775,6 +903,12 @@ class Motor(Device):
             TypeError(f'**** velocityUnits {velocityUnits} '
                       'NOT ONE OF VelocityUnits ***')
 
+        self._post('start_spin_to', 0,
+                   self._plan_move(self._degrees(rotation, rotationUnits) -
+                                   self.states.position[self.slot],
+                                   self._velocity_percent(velocity,
+                                                          velocityUnits)))
+
     @overload
     def stop(self: Self):
         ...
@@ -800,6 +934,8 @@ class Motor(Device):
         assert (mode is None) or isinstance(mode, BrakeType), \
             TypeError(f'*** mode {mode} NEITHER None NOR A BrakeType ***')
 
+        self._post('stop', 0)
+
         self._stop(self.stopping_mode
                    if (mode is None) and (self.stopping_mode is not None)
                    else mode)
@@ -1005,7 +1141,7 @@ class Motor(Device):
     """)
     def type(self: Self, /) -> Literal[V5DeviceType.MOTOR]:
         """Return device type, in the case of V5 only."""
-        return V5DeviceType.MOTOR
+        return self._V5_DEVICE_TYPE
 
     @robotmesh_doc("""
         Get status of what is installed
@@ -5,6 +5,7 @@ from collections.abc import Sequence
 from enum import IntEnum, auto
 from typing import LiteralString
 
+from .._util.conversion import define_units
 from .._util.measurement_with_unit import _MeasurementWithUnitABC
 
 
@@ -19,3 +20,6 @@ class CurrentUnits(IntEnum):
 
 class _Current(_MeasurementWithUnitABC):  # pylint: disable=too-few-public-methods
     unit: CurrentUnits = CurrentUnits.AMP
+
+
+define_units(CurrentUnits, {CurrentUnits.AMP: 1.})
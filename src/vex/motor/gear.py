@@ -3,12 +3,12 @@
 
 from collections.abc import Sequence
 from enum import IntEnum
-from typing import LiteralString
+from typing import LiteralString, Optional
 
 from .._util.doc import robotmesh_doc
 
 
-__all__: Sequence[LiteralString] = ('GearSetting',)
+__all__: Sequence[LiteralString] = 'GearSetting', 'MAX_RPM', 'ENCODER_TICKS'
 
 
 @robotmesh_doc("""
@@ -26,3 +26,21 @@ class GearSetting(IntEnum):
 
     # unit representing gear setting for upgraded gears (blue) (max rpm = 600)
     RATIO_6_1 = RATIO6_1 = 2
+
+
+# max speed (in rpm) per gear setting (None: IQ motor)
+MAX_RPM: dict[Optional[GearSetting], int] = {
+    None: 127,
+    GearSetting.RATIO_36_1: 100,
+    GearSetting.RATIO_18_1: 200,
+    GearSetting.RATIO_6_1: 600,
+}
+
+# encoder ticks (RAW rotation units) per output revolution per gear setting
+# (None: IQ motor)
+ENCODER_TICKS: dict[Optional[GearSetting], int] = {
+    None: 960,
+    GearSetting.RATIO_36_1: 1800,
+    GearSetting.RATIO_18_1: 900,
+    GearSetting.RATIO_6_1: 300,
+}
@@ -0,0 +1,177 @@
+"""Lock-free latest-command-wins mailboxes of motor commands."""
+
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from itertools import count
+from threading import Thread
+from time import perf_counter, sleep
+from typing import Any, LiteralString, Optional, Self
+
+from .direction import FORWARD, REVERSE
+from .profile import Move
+
+
+__all__: Sequence[LiteralString] = ('MotorCommand', 'CommandMailbox',
+                                    'ContentionStats', 'contention_benchmark')
+
+
+class MotorCommand:
+    """Command posted to a motor: spin at velocity, or move (if motion).
+
+    A move is pending until completed (by a simulator) or preempted by any
+    later command posted to the same mailbox; commands without motion are
+    complete as soon as they are posted.
+    """
+
+    __slots__: tuple[str, ...] = ('mailbox', 'sequence', 'name', 'percent',
+                                  'motion', 'completed', 'timed_out')
+
+    def __init__(self: Self, mailbox: 'CommandMailbox', sequence: int,
+                 name: str, percent: float, motion: Optional[Move], /):
+        # pylint: disable=too-many-arguments
+        """Initialize Motor Command."""
+        self.mailbox: CommandMailbox = mailbox
+        self.sequence: int = sequence
+        self.name: str = name
+        self.percent: float = percent
+        self.motion: Optional[Move] = motion
+        self.completed: bool = motion is None
+        self.timed_out: bool = False
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return (f'{type(self).__name__}(#{self.sequence} {self.name} @ '
+                f'{self.percent}%' +
+                (', preempted)' if self.preempted
+                 else ', done)' if self.completed
+                 else ')'))
+
+    @property
+    def preempted(self: Self, /) -> bool:
+        """Whether a later command was posted before this one completed."""
+        return (not self.completed) and (self is not self.mailbox.latest)
+
+    @property
+    def done(self: Self, /) -> bool:
+        """Whether command completed or was preempted."""
+        return self.completed or (self is not self.mailbox.latest)
+
+    def complete(self: Self, /, timed_out: bool = False):
+        """Mark move completed (or timed out)."""
+        self.timed_out = timed_out
+        self.completed = True
+
+    def wait(self: Self, /, timeout: Optional[float] = None) -> bool:
+        """Wait until done (or timeout seconds), returning whether done.
+
+        Polls with exponential backoff instead of blocking on a lock, so
+        that preempting commands never contend with waiters.
+        """
+        deadline: float = (float('inf') if timeout is None
+                           else perf_counter() + timeout)
+        delay: float = 1e-4
+        while not self.done:
+            if (remaining := deadline - perf_counter()) <= 0:
+                return False
+            sleep(min(delay, remaining))
+            delay: float = min(2 * delay, 1e-2)
+        return True
+
+
+class CommandMailbox:
+    """Single-slot mailbox of a motor's latest command.
+
+    Posting is one reference store, atomic without locking (also on
+    free-threaded builds), so that of concurrent posters the last to
+    store wins; every earlier pending command is thereby preempted.
+    Posters apply the latest command's state to the motor & re-check that
+    no later command arrived meanwhile (see `Motor._post`), so that the
+    motor ends up in the state of the winning command.
+    """
+
+    def __init__(self: Self, /):
+        """Initialize empty Command Mailbox."""
+        self.latest: Optional[MotorCommand] = None
+        self._sequence: count = count(1)
+
+        # whether a simulator completes this motor's moves (see MotorModel)
+        self.tracked: bool = False
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return f'{type(self).__name__}({self.latest})'
+
+    def post(self: Self, name: str, percent: float, /,
+             motion: Optional[Move] = None) -> MotorCommand:
+        """Post command, preempting any pending one."""
+        # (`next` on a counter is atomic, unlike `+=` on an int)
+        command: MotorCommand = MotorCommand(self, next(self._sequence),
+                                             name, percent, motion)
+        self.latest = command
+        return command
+
+
+@dataclass(frozen=True)
+class ContentionStats:
+    """Results of concurrent posting of commands to one motor."""
+
+    n_threads: int
+    n_commands: int
+    seconds: float
+    max_command_seconds: float
+    consistent: bool
+
+    @property
+    def commands_per_second(self: Self, /) -> float:
+        """Posting throughput across all threads."""
+        return self.n_commands / self.seconds if self.seconds else 0.
+
+
+def contention_benchmark(
+        motor: Any, /,
+        n_threads: int = 8,
+        n_commands_per_thread: int = 1_000,
+        commands: Optional[Sequence[Callable[[Any, int], Any]]] = None) \
+        -> ContentionStats:
+    """Benchmark threads concurrently commanding motor.
+
+    Each thread calls the commands (by default spins & moves at varying
+    velocities & stops) in turn with the motor & a step number. Reports
+    throughput, the slowest single command & whether the motor ended up
+    in the state of its latest command.
+    """
+    if commands is None:
+        commands: Sequence[Callable[[Any, int], Any]] = (
+            lambda motor, i: motor.spin(FORWARD, i % 100 + 1),
+            lambda motor, i: motor.spin_for(REVERSE, i % 360 + 1),
+            lambda motor, i: motor.stop())
+
+    max_command_seconds: list[float] = [0.] * n_threads
+
+    def run(thread_index: int, /):
+        slowest: float = 0.
+        for i in range(n_commands_per_thread):
+            start: float = perf_counter()
+            commands[i % len(commands)](motor, i)
+            slowest: float = max(slowest, perf_counter() - start)
+        max_command_seconds[thread_index] = slowest
+
+    threads: list[Thread] = [Thread(group=None, target=run, name=None,
+                                    args=(i,), kwargs={}, daemon=True)
+                             for i in range(n_threads)]
+    start: float = perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds: float = perf_counter() - start
+
+    latest: MotorCommand = motor.mailbox.latest
+    return ContentionStats(
+        n_threads=n_threads,
+        n_commands=n_threads * n_commands_per_thread,
+        seconds=seconds,
+        max_command_seconds=max(max_command_seconds),
+        consistent=((motor.states.command[motor.slot] == latest.percent) and
+                    (motor.motion is latest.motion)))
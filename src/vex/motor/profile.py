@@ -0,0 +1,245 @@
+"""Precomputed trapezoidal motion profiles, cached by move parameters."""
+
+
+from array import array
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from math import ceil, sqrt
+from threading import Lock
+from typing import LiteralString, Optional, Self
+
+from .gear import GearSetting, MAX_RPM
+
+from .._util.type import Num
+
+
+__all__: Sequence[LiteralString] = ('MotionProfile', 'Move',
+                                    'ProfileCache', 'PROFILE_CACHE')
+
+
+# default acceleration limit, in percent of max speed per second
+DEFAULT_ACCELERATION: Num = 400
+
+# default sampling interval (seconds)
+DEFAULT_DT: float = .01
+
+
+class MotionProfile:
+    """Trapezoidal (or, for short moves, triangular) move from rest to rest.
+
+    Motor positions (degrees) & velocities (degrees per second) are sampled
+    every `dt` seconds into arrays when the profile is generated, so that
+    looking up the state of a move at any time is O(1).
+    """
+
+    def __init__(self: Self, distance: Num, velocity: Num, /,
+                 acceleration: Num = DEFAULT_ACCELERATION,
+                 gear_setting: Optional[GearSetting] = None,
+                 dt: float = DEFAULT_DT):
+        # pylint: disable=too-many-arguments,too-many-locals
+        """Generate profile for distance (degrees) at velocity (percent)."""
+        assert distance >= 0, \
+            ValueError(f'*** distance {distance} NEGATIVE ***')
+        assert velocity > 0, \
+            ValueError(f'*** velocity {velocity} NOT POSITIVE ***')
+        assert acceleration > 0, \
+            ValueError(f'*** acceleration {acceleration} NOT POSITIVE ***')
+        assert dt > 0, ValueError(f'*** dt {dt} NOT POSITIVE ***')
+
+        self.distance: float = float(distance)
+        self.velocity: Num = velocity
+        self.acceleration: Num = acceleration
+        self.gear_setting: Optional[GearSetting] = gear_setting
+        self.dt: float = dt
+
+        # percentages of max speed -> degrees per second (per second)
+        max_dps: float = MAX_RPM[gear_setting] * 6
+        cruise_velocity: float = min(velocity, 100) / 100 * max_dps
+        accel: float = acceleration / 100 * max_dps
+
+        if cruise_velocity ** 2 / accel > self.distance:
+            cruise_velocity: float = sqrt(self.distance * accel)
+        accel_time: float = cruise_velocity / accel
+        accel_distance: float = cruise_velocity * accel_time / 2
+        cruise_time: float = ((self.distance - 2 * accel_distance) /
+                              cruise_velocity
+                              if cruise_velocity
+                              else 0.)
+
+        self.peak_velocity: float = cruise_velocity
+        self.duration: float = 2 * accel_time + cruise_time
+
+        self.positions: array = array('d')
+        self.velocities: array = array('d')
+        for k in range(ceil(self.duration / dt) + 1):
+            if (t := min(k * dt, self.duration)) < accel_time:
+                self.positions.append(accel * t * t / 2)
+                self.velocities.append(accel * t)
+            elif t <= accel_time + cruise_time:
+                self.positions.append(accel_distance +
+                                      cruise_velocity * (t - accel_time))
+                self.velocities.append(cruise_velocity)
+            else:
+                remaining_time: float = self.duration - t
+                self.positions.append(self.distance -
+                                      accel * remaining_time ** 2 / 2)
+                self.velocities.append(accel * remaining_time)
+
+    def __len__(self: Self, /) -> int:
+        """Return number of samples."""
+        return len(self.positions)
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return (f'{type(self).__name__}({self.distance}deg @ '
+                f'{self.velocity}%, {self.duration:.3f}s)')
+
+    def _interpolate(self: Self, samples: array, time: float, /) -> float:
+        if time <= 0:
+            return samples[0]
+        if time >= self.duration:
+            return samples[-1]
+
+        # last sample is at duration, possibly less than dt after previous
+        index: int = min(int(time / self.dt), len(samples) - 2)
+        start_time: float = index * self.dt
+        fraction: float = ((time - start_time) /
+                           (min(start_time + self.dt, self.duration) -
+                            start_time))
+        return samples[index] + (samples[index + 1] - samples[index]) * fraction  # noqa: E501
+
+    def position_at(self: Self, time: float, /) -> float:
+        """Return distance (degrees) covered at time (seconds) into move."""
+        return self._interpolate(self.positions, time)
+
+    def velocity_at(self: Self, time: float, /) -> float:
+        """Return velocity (degrees per second) at time into move."""
+        return self._interpolate(self.velocities, time)
+
+
+@dataclass(frozen=True)
+class Move:
+    """Shared (cached) profile applied from a start position, in a direction.
+
+    The profile's arrays are never copied: a move only offsets & signs them.
+    """
+
+    profile: MotionProfile
+    start: float = 0.
+    sign: int = 1
+
+    @property
+    def target(self: Self, /) -> float:
+        """Final position (degrees)."""
+        return self.start + self.sign * self.profile.distance
+
+    @property
+    def duration(self: Self, /) -> float:
+        """Duration (seconds)."""
+        return self.profile.duration
+
+    def position_at(self: Self, time: float, /) -> float:
+        """Return position (degrees) at time (seconds) into move."""
+        return self.start + self.sign * self.profile.position_at(time)
+
+    def velocity_at(self: Self, time: float, /) -> float:
+        """Return velocity (degrees per second) at time into move."""
+        return self.sign * self.profile.velocity_at(time)
+
+
+class ProfileCache:
+    """Least-recently-used cache of motion profiles.
+
+    Profiles are keyed by (distance, velocity, acceleration, gear setting,
+    sampling interval), with distance rounded to a micro-degree so that the
+    same move expressed in different units hits the same entry. Hit, miss &
+    eviction counts are kept for monitoring.
+
+    Lookups & updates are made under a lock, so that the cache can be
+    shared by threads (also on free-threaded builds); profiles are generated
+    outside of it.
+    """
+
+    def __init__(self: Self, /, maxsize: int = 128):
+        """Initialize empty Profile Cache."""
+        assert maxsize > 0, ValueError(f'*** maxsize {maxsize} NOT POSITIVE ***')  # noqa: E501
+
+        self.maxsize: int = maxsize
+        self.profiles: OrderedDict[tuple, MotionProfile] = OrderedDict()
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+        self._lock: Lock = Lock()
+
+    def __len__(self: Self, /) -> int:
+        """Return number of cached profiles."""
+        return len(self.profiles)
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return (f'{type(self).__name__}({len(self)}/{self.maxsize} profiles, '
+                f'hit rate {self.hit_rate:.1%})')
+
+    @property
+    def hit_rate(self: Self, /) -> float:
+        """Fraction of lookups served from cache."""
+        return (self.hits / n_lookups if (n_lookups := self.hits + self.misses)
+                else 0.)
+
+    def get(self: Self, distance: Num, velocity: Num, /,
+            acceleration: Num = DEFAULT_ACCELERATION,
+            gear_setting: Optional[GearSetting] = None,
+            dt: float = DEFAULT_DT) -> MotionProfile:
+        # pylint: disable=too-many-arguments
+        """Return (cached or newly generated) profile for move parameters."""
+        key: tuple = (round(distance, 6), velocity, acceleration,
+                      gear_setting, dt)
+
+        with self._lock:
+            if (profile := self.profiles.get(key)) is not None:
+                self.hits += 1
+                self.profiles.move_to_end(key)
+                return profile
+            self.misses += 1
+
+        profile: MotionProfile = MotionProfile(
+            key[0], velocity, acceleration=acceleration,
+            gear_setting=gear_setting, dt=dt)
+
+        with self._lock:
+            # (keep profile generated meanwhile by another thread, if any)
+            profile: MotionProfile = self.profiles.setdefault(key, profile)
+            self.profiles.move_to_end(key)
+            if len(self.profiles) > self.maxsize:
+                self.profiles.popitem(last=False)
+                self.evictions += 1
+
+        return profile
+
+    def move(self: Self, distance: Num, velocity: Num, /,
+             start: float = 0.,
+             acceleration: Num = DEFAULT_ACCELERATION,
+             gear_setting: Optional[GearSetting] = None) -> Move:
+        # pylint: disable=too-many-arguments
+        """Return move of signed distance (degrees) at velocity (percent).
+
+        Negative distance or velocity reverses the move, as for motors.
+        """
+        sign: int = -1 if (distance < 0) != (velocity < 0) else 1
+        return Move(self.get(abs(distance), abs(velocity),
+                             acceleration=acceleration,
+                             gear_setting=gear_setting),
+                    start=start, sign=sign)
+
+    def clear(self: Self, /):
+        """Forget all cached profiles & reset counters."""
+        with self._lock:
+            self.profiles.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+# profiles shared by all motors & drivetrains in this program
+PROFILE_CACHE: ProfileCache = ProfileCache()
@@ -0,0 +1,131 @@
+"""Struct-of-arrays storage of motor settings."""
+
+
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import LiteralString, Optional, Self, TYPE_CHECKING
+
+from .._common_enums.percent import PercentUnits, PERCENT
+from .._common_enums.rotation import RotationUnits, DEGREES
+
+from .gear import GearSetting
+from .torque import TorqueUnits
+
+from .._util.conversion import convert, convert_array, unit_table
+from .._util.type import Num
+
+if TYPE_CHECKING:
+    from . import Motor
+
+
+__all__: Sequence[LiteralString] = ('MotorStates', 'NO_BRAKE',
+                                    'MAX_TORQUE_NM',
+                                    'MAX_CURRENT_A', 'FREE_CURRENT_A',
+                                    'max_torque_percent')
+
+
+# brake column value of motors whose stopping mode has not been set
+NO_BRAKE: int = -1
+
+
+# max torque (in Newton meters) per gear setting (None: IQ motor)
+MAX_TORQUE_NM: dict[Optional[GearSetting], float] = {
+    None: 0.414,
+    GearSetting.RATIO_36_1: 2.1,
+    GearSetting.RATIO_18_1: 1.05,
+    GearSetting.RATIO_6_1: 0.35,
+}
+
+# max (stall) current (in Amps), per VEXcode's documented reporting range,
+# & (assumed) current of a motor spinning freely at full speed
+MAX_CURRENT_A: float = 2.5
+FREE_CURRENT_A: float = .2
+
+
+def max_torque_percent(value: Num, unit: TorqueUnits | PercentUnits,
+                       gear_setting: Optional[GearSetting], /) -> float:
+    """Return torque limit as percentage of motor's max torque."""
+    if unit is PERCENT:
+        return value
+
+    return (unit_table(TorqueUnits).convert(value, unit, TorqueUnits.NM) /
+            MAX_TORQUE_NM[gear_setting] * 100)
+
+
+class MotorStates:
+    """Contiguous settings of one or more motors, one array per setting.
+
+    Slot `i` of every array belongs to one motor, so that setting or reading
+    a setting for a whole group is a single array operation:
+    - position: set rotational position, in degrees
+    - velocity: set velocity, in the unit recorded in `velocity_unit`
+    - velocity_unit: VelocityUnits value of each set velocity
+    - max_torque: torque limit, in percent of motor's max torque
+    - brake: BrakeType value of stopping mode, or NO_BRAKE if not set
+    - command: velocity motor is currently commanded to spin at,
+               in percent of max speed (0 when stopped)
+
+    Each Motor is a view onto one slot (its `states` & `slot` attributes).
+    """
+
+    COLUMNS: tuple[str, ...] = ('position', 'velocity', 'velocity_unit',
+                                'max_torque', 'brake', 'command')
+
+    def __init__(self: Self, n_motors: int = 1, /):
+        """Initialize Motor States with default settings."""
+        self.position: array = array('d', [0.]) * n_motors
+        self.velocity: array = array('d', [50.]) * n_motors
+        self.velocity_unit: array = array('B', [PERCENT]) * n_motors
+        self.max_torque: array = array('d', [100.]) * n_motors
+        self.brake: array = array('b', [NO_BRAKE]) * n_motors
+        self.command: array = array('d', [0.]) * n_motors
+
+        # whether any slot's motor has since moved on to other storage
+        self.moved: bool = False
+
+    def __len__(self: Self, /) -> int:
+        """Return number of motor slots."""
+        return len(self.position)
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return f'{type(self).__name__}({len(self)} motors)'
+
+    @classmethod
+    def gather(cls, motors: Sequence['Motor'], /) -> Self:
+        """Move motors' current settings into new shared storage.
+
+        Motors are rebound to their slots in the new storage, so they stay
+        views of their own settings (a motor belongs to the storage of the
+        group created last with it); their previous storages are marked as
+        `moved`, so that earlier groups can follow them.
+        """
+        states: Self = cls(len(motors))
+
+        for slot, motor in enumerate(motors):
+            for column in cls.COLUMNS:
+                getattr(states, column)[slot] = \
+                    getattr(motor.states, column)[motor.slot]
+
+            motor.states.moved = True
+            motor.states, motor.slot = states, slot
+
+        return states
+
+    @staticmethod
+    def fill(column: array, value: Num | Iterable[Num], /,
+             slots: slice = slice(None)):
+        """Set one setting of (a range of) slots to one or per-slot values."""
+        n_slots: int = len(range(*slots.indices(len(column))))
+
+        column[slots] = (array(column.typecode, [value]) * n_slots
+                         if isinstance(value, Num)
+                         else array(column.typecode, value))
+
+    def positions(self: Self, unit: RotationUnits = DEGREES, /) -> array:
+        """Return set positions of all slots in specified unit."""
+        return convert_array(self.position, DEGREES, unit)
+
+    def set_positions(self: Self, value: Num, unit: RotationUnits, /):
+        """Set position of all slots to value in specified unit."""
+        self.fill(self.position, convert(value, unit, DEGREES))
@@ -7,6 +7,7 @@ from typing import Literal, LiteralString
 
 from .._common_enums.percent import PercentUnits, PERCENT
 
+from .._util.conversion import define_units
 from .._util.doc import robotmesh_doc
 from .._util.measurement_with_unit import _MeasurementWithUnitABC
 
@@ -32,3 +33,8 @@ class TorqueUnits(IntEnum):
 
 class _Torque(_MeasurementWithUnitABC):  # pylint: disable=too-few-public-methods
     unit: TorqueUnits | PercentUnits | Literal[PERCENT] = PERCENT
+
+
+# sizes in Newton meters
+define_units(TorqueUnits,
+             {TorqueUnits.NM: 1., TorqueUnits.IN_LB: 0.112984829})
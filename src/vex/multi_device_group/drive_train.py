@@ -2,22 +2,25 @@
 
 
 from collections.abc import Sequence
+from math import pi
 from typing import Literal, LiteralString, Optional, Self
 
-from abm.decor import act, sense
-
 from ..motor import Motor
 from ..motor.brake import BrakeType, BRAKE
 from ..motor.current import CurrentUnits
-from ..motor.direction import DirectionType, FORWARD
+from ..motor.direction import DirectionType, FORWARD, REVERSE
+from ..motor.mailbox import MotorCommand
 from ..motor.turn import TurnType, RIGHT
 from ..time.units import SECONDS
 from .._common_enums.distance import DistanceUnits, MM
 from .._common_enums.rotation import DEGREES
-from .._common_enums.velocity import VelocityUnits, PERCENT
+from .._common_enums.velocity import VelocityUnits, PERCENT, _Velocity
 
+from .engine import GroupEngine
 from .motor_group import MotorGroup
 
+from .._util.conversion import convert
+from .._util.decor import act, sense
 from .._util.doc import vexcode_doc
 from .._util.type import Num
 
@@ -28,43 +31,63 @@ __all__: Sequence[LiteralString] = 'DriveTrain', 'Drivetrain'
 class DriveTrain(MotorGroup):  # pylint: disable=too-many-instance-attributes
     """Drive Train."""
 
-    def __init__(self: Self, left_motor: Motor, right_motor: Motor,
-                 wheel_base: float = 200, track_width: float = 176,
-                 length_unit: DistanceUnits = MM, gear_ratio: float = 1, /):
-        # pylint: disable=too-many-arguments
-        """Initialize Drivetrain."""
-        super().__init__(left_motor, right_motor)
-
-        self.left_motor: Motor = left_motor
-        self.right_motor: Motor = right_motor
-        self.wheel_base: float = wheel_base
+    def __init__(self: Self,
+                 left_motor: Motor | MotorGroup | list[Motor] | tuple[Motor],
+                 right_motor: Motor | MotorGroup | list[Motor] | tuple[Motor],
+                 wheel_travel: float = 200, track_width: float = 176,
+                 length_unit: DistanceUnits = MM, gear_ratio: float = 1,
+                 wheel_base: Optional[float] = None, /):
+        # pylint: disable=super-init-not-called,too-many-arguments
+        """Initialize Drivetrain.
+
+        Wheel travel is the wheels' circumference; wheel base, if known, is
+        the front-to-back distance between the wheels.
+        """
+        # left & right sides of any numbers of motors, in one shared engine
+        self.engine: GroupEngine = GroupEngine(left_motor, right_motor)
+        self.motors: tuple[Motor, ...] = self.engine.motors
+
+        self.left_motor: Motor | MotorGroup | list[Motor] | tuple[Motor] = \
+            left_motor
+        self.right_motor: Motor | MotorGroup | list[Motor] | tuple[Motor] = \
+            right_motor
+        self.wheel_travel: float = wheel_travel
         self.track_width: float = track_width
+        self.wheel_base: Optional[float] = wheel_base
         self.length_unit: DistanceUnits = length_unit
         self.gear_ratio: float = gear_ratio
 
-        self.drive_velocities: dict[VelocityUnits, float] = \
-            dict[VelocityUnits, float]()
-        self.turn_velocities: dict[VelocityUnits, float] = \
-            dict[VelocityUnits, float]()
-        self.stopping_mode: Optional[BrakeType] = None
-        self.timeout: Optional[float] = None
+        self.drive_velocity: Optional[_Velocity] = None
+        self.turn_velocity: Optional[_Velocity] = None
 
     def __eq__(self: Self, other: Self) -> bool:
         """Check equality."""
         return (isinstance(other, DriveTrain) and
-                (other.left_motor == self.left_motor) and
-                (other.right_motor == self.right_motor) and
-                (other.wheel_base == self.wheel_base) and
+                (other.engine == self.engine) and
+                (other.wheel_travel == self.wheel_travel) and
                 (other.track_width == self.track_width) and
+                (other.wheel_base == self.wheel_base) and
                 (other.length_unit == self.length_unit) and
                 (other.gear_ratio == self.gear_ratio))
 
     def __hash__(self: Self) -> int:
         """Return integer hash."""
-        return hash((self.left_motor, self.right_motor,
-                     self.wheel_base, self.track_width,
+        return hash((self.engine,
+                     self.wheel_travel, self.track_width, self.wheel_base,
                      self.length_unit, self.gear_ratio))
 
+    def _wheel_degrees(self: Self, distance: Num, unit: DistanceUnits, /) \
+            -> float:
+        # wheels turn 360 degrees (times gear ratio) per wheel travel
+        return (convert(distance, unit, MM) /
+                convert(self.wheel_travel, self.length_unit, MM) *
+                360 * self.gear_ratio)
+
+    def _percent(self: Self, velocity: Optional[_Velocity], /) -> float:
+        # set drive/turn velocity, in percent (50% if not set)
+        return (50 if velocity is None
+                else self.engine.percent(velocity.measurement, velocity.unit))
+
     @vexcode_doc("""
         Drive
 
@@ -84,6 +107,8 @@ class DriveTrain(MotorGroup):  # pylint: disable=too-many-instance-attributes
     @act
     def drive(self: Self, direction: DirectionType = FORWARD):
         """Drive in specified direction."""
+        percent: float = self._percent(self.drive_velocity)
+        self.engine.spin(-percent if direction is REVERSE else percent)
 
     @vexcode_doc("""
         Drive For
@@ -123,6 +148,12 @@ class DriveTrain(MotorGroup):  # pylint: disable=too-many-instance-attributes
                   distance: Num = 200, units: DistanceUnits = MM,
                   wait: bool = True):
         """Drive for a distance."""
+        rotation: float = self._wheel_degrees(distance, units)
+        commands: tuple[MotorCommand, ...] = self.engine.move(
+            'drive_for', -rotation if direction is REVERSE else rotation,
+            self._percent(self.drive_velocity))
+        if wait:
+            self.engine.wait(commands)
 
     @vexcode_doc("""
         Turn
@@ -142,6 +173,9 @@ class DriveTrain(MotorGroup):  # pylint: disable=too-many-instance-attributes
     @act
     def turn(self: Self, direction: TurnType = RIGHT):
         """Turn in specified direction."""
+        percent: float = self._percent(self.turn_velocity)
+        self.engine.spin_sides((percent, -percent) if direction is RIGHT
+                               else (-percent, percent))
 
     @vexcode_doc("""
         Turn For
@@ -170,10 +204,21 @@ class DriveTrain(MotorGroup):  # pylint: disable=too-many-instance-attributes
     def turn_for(self: Self, direction: TurnType = RIGHT,
                  angle: Num = 90, units: Literal[DEGREES] = DEGREES,
                  wait: bool = True):
-        # pylint: disable=unused-argument
         """Turn for an angle."""
         assert units is DEGREES, ValueError('*** ANGULAR UNIT MUST BE DEGREES ***')  # noqa: E501
 
+        # wheels travel along the turning circle of the track width
+        rotation: float = self._wheel_degrees(pi * self.track_width * angle / 360,
+                                              self.length_unit)
+        if direction is not RIGHT:
+            rotation: float = -rotation
+        percent: float = self._percent(self.turn_velocity)
+        commands: tuple[MotorCommand, ...] = (
+            self.engine.move('turn_for', rotation, percent, side=0) +
+            self.engine.move('turn_for', -rotation, percent, side=1))
+        if wait:
+            self.engine.wait(commands)
+
     @vexcode_doc("""
         Stop
 
@@ -185,6 +230,7 @@ class DriveTrain(MotorGroup):  # pylint: disable=too-many-instance-attributes
     @act
     def stop(self: Self):
         """Stop motors."""
+        self.engine.stop()
 
     @vexcode_doc("""
         Set Drive Velocity
@@ -215,7 +261,7 @@ class DriveTrain(MotorGroup):  # pylint: disable=too-many-instance-attributes
     def set_drive_velocity(self: Self, velocity: Num = 50,
                            units: VelocityUnits = PERCENT):
         """Set driving velocity."""
-        self.drive_velocities[units] = velocity
+        self.drive_velocity: _Velocity = _Velocity(velocity, units)
 
     @vexcode_doc("""
         Set Turn Velocity
@@ -246,7 +292,7 @@ class DriveTrain(MotorGroup):  # pylint: disable=too-many-instance-attributes
     def set_turn_velocity(self: Self, velocity: Num = 50,
                           units: VelocityUnits = PERCENT):
         """Set turning velocity."""
-        self.turn_velocities[units] = velocity
+        self.turn_velocity: _Velocity = _Velocity(velocity, units)
 
     @vexcode_doc("""
         Set Motor Stopping
@@ -267,7 +313,7 @@ class DriveTrain(MotorGroup):  # pylint: disable=too-many-instance-attributes
     def set_stopping(self: Self, mode: BrakeType = BRAKE):
         # pylint: disable=arguments-differ
         """Set stopping mode."""
-        self.stopping_mode: BrakeType = mode
+        self.engine.set_stopping(mode)
 
     @vexcode_doc("""
         Set Timeout
@@ -283,9 +329,8 @@ class DriveTrain(MotorGroup):  # pylint: disable=too-many-instance-attributes
     @act
     def set_timeout(self: Self,
                     time: Num = 1, /, units: Literal[SECONDS] = SECONDS):
-        # pylint: disable=unused-argument
         """Set timeout."""
-        self.timeout: float = time
+        self.engine.set_timeout(time, units)
 
     @vexcode_doc("""
         Drive Is Moving
@@ -0,0 +1,297 @@
+"""Group-execution engine shared by all motor groups & drive trains."""
+
+
+from collections.abc import Iterable, Sequence
+from time import perf_counter
+from typing import Any, LiteralString, Optional, Self
+
+from ..brain.port import Ports
+from ..motor import Motor
+from ..motor.brake import BrakeType
+from ..motor.mailbox import MotorCommand
+from ..motor.profile import Move
+from ..motor.state import MotorStates, max_torque_percent
+from ..motor.torque import TorqueUnits
+from ..time.units import TimeUnits, SECONDS, _Time
+from .._common_enums.percent import PercentUnits, PERCENT
+from .._common_enums.rotation import RotationUnits, DEGREES
+from .._common_enums.velocity import VelocityUnits
+
+from .._util.conversion import unit_table
+from .._util.sync import DEVICE_LOCKS
+from .._util.type import Num
+
+
+__all__: Sequence[LiteralString] = ('GroupEngine', 'flatten_motors',
+                                    'port_mask')
+
+
+def flatten_motors(motors: Any, /) -> tuple[Motor, ...]:
+    """Flatten motor, motor group or (nested) list/tuple into motors."""
+    if isinstance(motors, Motor):
+        return (motors,)
+
+    if isinstance(motors, list | tuple):
+        return tuple(motor
+                     for member in motors
+                     for motor in flatten_motors(member))
+
+    assert isinstance(members := getattr(motors, 'motors', None), Sequence), \
+        TypeError(f'*** {motors} NEITHER A MOTOR, A MOTOR GROUP '
+                  'NOR A LIST/TUPLE OF MOTORS ***')
+    return tuple(members)
+
+
+def port_mask(ports: Iterable[Ports], /) -> int:
+    """Return bitmask of ports, with bit `i` set if `Ports(i)` is included."""
+    mask: int = 0
+    for port in ports:
+        mask |= 1 << port
+    return mask
+
+
+class GroupEngine:
+    # pylint: disable=too-many-instance-attributes,too-many-public-methods
+    """Shared execution engine of motor groups & drive trains.
+
+    Holds one or more sides (e.g. a motor group's single side, or a drive
+    train's left & right sides), each of any number of motors, whose
+    settings are gathered into one contiguous MotorStates storage with
+    each side occupying a contiguous slot range. Every group setting goes
+    through one hot path: an array assignment over all or one side's slots.
+    Spin, move & stop commands are instead posted to each motor's mailbox,
+    so that the latest command wins whether posted to a motor or to a
+    group (e.g. a drive train's drive preempts a pending per-motor move).
+
+    Building a later group or drive train from the same motors (e.g. motor
+    groups as a drive train's sides) moves them into its storage: this
+    engine then follows them there if they still occupy one contiguous
+    slot range, and otherwise writes through each motor's own slot.
+
+    The working set of ports is precomputed as a frozenset & a port bitmask
+    (bit `i` set if `Ports(i)` is used), and each side's port & reversed
+    motors' bitmasks into a cached hash, as members are fixed at
+    construction: hashing, equality, membership & overlap checks are
+    constant-time integer operations, and stable while in sets or dicts.
+    """
+
+    def __init__(self: Self, *sides: Any):
+        """Initialize Group Engine from sides of motors/motor groups."""
+        assert sides, ValueError('*** NO MOTORS GIVEN ***')
+
+        self.sides: tuple[tuple[Motor, ...], ...] = tuple(
+            flatten_motors(side) for side in sides)
+        assert all(self.sides), ValueError('*** EMPTY SIDE OF MOTORS ***')
+
+        self.motors: tuple[Motor, ...] = tuple(motor
+                                               for side in self.sides
+                                               for motor in side)
+
+        self.side_slots: tuple[slice, ...] = ()
+        start: int = 0
+        for side in self.sides:
+            self.side_slots += (slice(start, start := start + len(side)),)
+
+        self.states: MotorStates = MotorStates.gather(self.motors)
+        self.slots: slice = slice(0, len(self.motors))
+        self._write_through: bool = False
+
+        self.ports: frozenset[Ports] = frozenset(motor.port
+                                                 for motor in self.motors)
+        self.port_mask: int = port_mask(self.ports)
+        self.side_masks: tuple[int, ...] = tuple(
+            port_mask(motor.port for motor in side) for side in self.sides)
+        # each side's ports & reversed motors' ports
+        self._key: tuple[tuple[int, int], ...] = tuple(
+            (side_mask, port_mask(motor.port for motor in side
+                                  if motor.reverse))
+            for side_mask, side in zip(self.side_masks, self.sides))
+        self._hash: int = hash(self._key)
+
+        self._timeout: Optional[_Time] = None
+
+        self.motion: Optional[Move] = None
+
+    def __len__(self: Self, /) -> int:
+        """Return number of motors."""
+        return len(self.motors)
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return f'{type(self).__name__}{self.sides}'
+
+    def __eq__(self: Self, other: Self, /) -> bool:
+        """Check equality of sides' working sets of ports & reversal."""
+        return isinstance(other, GroupEngine) and (other._key == self._key)
+
+    def __hash__(self: Self, /) -> int:
+        """Return cached integer hash."""
+        return self._hash
+
+    def __contains__(self: Self, member: Motor | Ports, /) -> bool:
+        """Check whether motor (or port) is in working set."""
+        port: Ports = member.port if isinstance(member, Motor) else member
+        return bool(self.port_mask >> port & 1)
+
+    def overlaps(self: Self, other: Any, /) -> bool:
+        """Check whether other engine/group contends for any same port."""
+        return bool(self.port_mask &
+                    (other if isinstance(other, GroupEngine)
+                     else other.engine).port_mask)
+
+    def _follow_motors(self: Self, /):
+        # motors moved into another (later group's) storage: follow them
+        # if still in one contiguous slot range, in this engine's order
+        first: Motor = self.motors[0]
+        if all((motor.states is first.states) and
+               (motor.slot == first.slot + i)
+               for i, motor in enumerate(self.motors)):
+            self.side_slots: tuple[slice, ...] = tuple(
+                slice(first.slot + slots.start, first.slot + slots.stop)
+                for slots in self.side_slots)
+            self.slots: slice = slice(first.slot,
+                                      first.slot + len(self.motors))
+            self.states: MotorStates = first.states
+            self._write_through: bool = False
+        else:
+            self._write_through: bool = True
+
+    def fill(self: Self, column: str, value: Num | Sequence[Num], /,
+             side: Optional[int] = None):
+        """Set one setting (column) of all motors (or of one side's)."""
+        if self.states.moved and not self._write_through:
+            self._follow_motors()
+
+        if self._write_through:
+            motors: tuple[Motor, ...] = (self.motors if side is None
+                                         else self.sides[side])
+            for motor, motor_value in zip(motors,
+                                          [value] * len(motors)
+                                          if isinstance(value, Num)
+                                          else value):
+                getattr(motor.states, column)[motor.slot] = motor_value
+            return
+
+        self.states.fill(getattr(self.states, column), value,
+                         self.slots if side is None
+                         else self.side_slots[side])
+
+    def set_velocity(self: Self,
+                     value: Num, unit: VelocityUnits | PercentUnits, /,
+                     side: Optional[int] = None):
+        """Set velocity of all motors (or of one side's motors)."""
+        # (under the motors' locks, so that no motor's velocity is read
+        # with the other unit)
+        with DEVICE_LOCKS.locking(self.motors if side is None
+                                  else self.sides[side]):
+            self.fill('velocity', value, side=side)
+            self.fill('velocity_unit', unit, side=side)
+
+    def set_side_velocities(self: Self, values: Sequence[Num],
+                            unit: VelocityUnits | PercentUnits, /):
+        """Set velocity of each side's motors, e.g. for arcade/tank drive."""
+        for side, value in enumerate(values):
+            self.set_velocity(value, unit, side=side)
+
+    def set_stopping(self: Self, mode: BrakeType, /):
+        """Set stopping mode of all motors."""
+        self.fill('brake', mode)
+
+    def set_rotation(self: Self, value: Num, unit: RotationUnits, /):
+        """Set rotational position of all motors."""
+        self.fill('position', self.degrees(value, unit))
+
+    def reset_rotation(self: Self, /):
+        """Reset rotational position of all motors to 0."""
+        self.fill('position', 0)
+
+    def set_max_torque(self: Self,
+                       value: Num, unit: TorqueUnits | PercentUnits, /):
+        """Set torque limit of all motors."""
+        self.fill('max_torque',
+                  [max_torque_percent(value, unit, motor.gear_setting)
+                   for motor in self.motors])
+
+    def degrees(self: Self, rotation: Num, unit: RotationUnits, /) -> float:
+        """Convert rotation to motors' degrees."""
+        return self.motors[0].rotation_units.convert(rotation, unit, DEGREES)
+
+    def percent(self: Self, velocity: Num,
+                unit: VelocityUnits | PercentUnits, /) -> float:
+        """Convert velocity to percent of motors' max speed."""
+        return self.motors[0].velocity_units.convert(velocity, unit, PERCENT)
+
+    def velocity_percent(self: Self, /) -> float:
+        """Return motors' set velocity in percent."""
+        # pylint: disable=protected-access
+        return self.motors[0]._velocity_percent(None, None)
+
+    def _post(self: Self, name: str, percent: Num, /,
+              side: Optional[int] = None):
+        for motor in self.motors if side is None else self.sides[side]:
+            motor._post(name, percent)  # pylint: disable=protected-access
+
+    def spin(self: Self, percent: Num, /, side: Optional[int] = None):
+        """Command all motors (or one side's motors) to spin at velocity."""
+        self._post('spin', percent, side=side)
+
+    def spin_sides(self: Self, percents: Sequence[Num], /):
+        """Command each side's motors to spin, e.g. to drive or turn."""
+        for side, percent in enumerate(percents):
+            self.spin(percent, side=side)
+
+    def stop(self: Self, /):
+        """Command all motors to stop."""
+        self._post('stop', 0)
+
+    def move(self: Self, name: str, rotation: Num, percent: Num, /,
+             side: Optional[int] = None,
+             absolute: bool = False) -> tuple[MotorCommand, ...]:
+        """Command all motors (or one side's motors) to turn by rotation.
+
+        Rotation (or, if absolute, target position) is in motor degrees;
+        each motor's move is planned from its own position & posted to its
+        mailbox, preempting any pending command.
+        """
+        # pylint: disable=protected-access
+        commands: tuple[MotorCommand, ...] = ()
+        for motor in self.motors if side is None else self.sides[side]:
+            motion: Optional[Move] = motor._plan_move(
+                rotation - motor.states.position[motor.slot] if absolute
+                else rotation,
+                percent)
+            commands += (motor._post(name, 0, motion),)
+
+        self.motion: Optional[Move] = commands[0].motion
+        return commands
+
+    def wait(self: Self, commands: Sequence[MotorCommand], /) -> bool:
+        """Wait until commands are done, returning whether all completed.
+
+        Only moves of motors tracked by a simulator (see `MotorModel`) can
+        complete, so other commands are not waited on; waiting is bounded
+        by the group timeout, if set.
+        """
+        if all(command.mailbox.tracked for command in commands):
+            deadline: float = (float('inf') if self._timeout is None
+                               else perf_counter() + self.timeout(SECONDS))
+            for command in commands:
+                if not command.wait(None if deadline == float('inf')
+                                    else max(deadline - perf_counter(), 0)):
+                    break
+
+        return all(command.completed and not command.timed_out
+                   for command in commands)
+
+    def set_timeout(self: Self, value: Num, unit: TimeUnits, /):
+        """Set timeout of group commands."""
+        self._timeout: _Time = _Time(value, unit)
+
+    def timeout(self: Self, unit: TimeUnits, /) -> Num:
+        """Return timeout of group commands in specified unit."""
+        assert self._timeout is not None, \
+            ValueError('*** NO TIMEOUT SET YET; '
+                       'PLEASE CALL set_timeout(...) FIRST ***')
+
+        return unit_table(TimeUnits).convert(self._timeout.measurement,
+                                             self._timeout.unit, unit)
@@ -1,21 +1,25 @@
-"""2-Motor Group."""
+"""Motor Group."""
 
 
 from collections.abc import Sequence
-from typing import Literal, LiteralString, Self
-
-from abm.decor import act, sense
+from typing import Any, Literal, LiteralString, Self
+from warnings import warn
 
+from ..brain.port import Ports
 from ..motor import Motor
 from ..motor.brake import BrakeType, BRAKE
 from ..motor.current import CurrentUnits
-from ..motor.direction import DirectionType, FORWARD
+from ..motor.direction import DirectionType, FORWARD, REVERSE
+from ..motor.mailbox import MotorCommand
 from ..motor.torque import TorqueUnits
 from ..time.units import TimeUnits, SECONDS
 from .._common_enums.percent import PERCENT
 from .._common_enums.rotation import RotationUnits, DEGREES
 from .._common_enums.velocity import VelocityUnits
 
+from .engine import GroupEngine
+
+from .._util.decor import act, sense
 from .._util.type import Num
 
 
@@ -23,22 +27,43 @@ __all__: Sequence[LiteralString] = ('MotorGroup',)
 
 
 class MotorGroup:
-    """2-Motor Group."""
-
-    def __init__(self: Self, motor_a: Motor, motor_b: Motor, /):
-        """Initialize 2-Motor Group."""
-        self.motor_a: Motor = motor_a
-        self.motor_b: Motor = motor_b
+    """Motor Group."""
+
+    def __init__(self: Self, *motors: Motor | list[Motor] | tuple[Motor]):
+        """Initialize Motor Group."""
+        self.engine: GroupEngine = GroupEngine(motors)
+        self.motors: tuple[Motor, ...] = self.engine.motors
+
+    @property
+    def motor_a(self: Self, /) -> Motor:
+        """First motor (deprecated alias of `motors[0]`)."""
+        warn('MotorGroup.motor_a is deprecated; use MotorGroup.motors[0]',
+             DeprecationWarning, stacklevel=2)
+        return self.motors[0]
+
+    @property
+    def motor_b(self: Self, /) -> Motor:
+        """Second motor (deprecated alias of `motors[1]`)."""
+        warn('MotorGroup.motor_b is deprecated; use MotorGroup.motors[1]',
+             DeprecationWarning, stacklevel=2)
+        return self.motors[1]
 
     def __eq__(self: Self, other: Self) -> bool:
         """Check equality."""
         return (isinstance(other, MotorGroup) and
-                (other.motor_a == self.motor_a) and
-                (other.motor_b == self.motor_b))
+                (other.engine == self.engine))
 
     def __hash__(self: Self) -> int:
         """Return integer hash."""
-        return hash((self.motor_a, self.motor_b))
+        return hash(self.engine)
+
+    def __contains__(self: Self, member: Motor | Ports, /) -> bool:
+        """Check whether motor (or port) is in group."""
+        return member in self.engine
+
+    def overlaps(self: Self, other: Any, /) -> bool:
+        """Check whether other motor group/drivetrain shares any motor."""
+        return self.engine.overlaps(other)
 
     @sense
     def current(self: Self,
@@ -47,11 +72,11 @@ class MotorGroup:
 
     @sense
     def is_done(self: Self) -> bool:
-        """Check whether both motors have finished spinning."""
+        """Check whether all motors have finished spinning."""
 
     @sense
     def is_spinning(self: Self) -> bool:
-        """Check whether one or both of the motors is/are still spinning."""
+        """Check whether one or more of the motors is/are still spinning."""
 
     @sense
     def position(self: Self, units: RotationUnits = DEGREES) -> float:
@@ -60,43 +85,62 @@ class MotorGroup:
     @act
     def set_max_torque(self: Self, value: Num = 50, units: TorqueUnits = PERCENT):  # noqa: E501
         """Set max torque limit."""
+        self.engine.set_max_torque(value, units)
 
     @act
     def set_position(self: Self, value: Num = 0, units: RotationUnits = DEGREES):  # noqa: E501
         """Set rotational position to specified angle."""
+        self.engine.set_rotation(value, units)
 
     @act
     def set_stopping(self: Self, mode: BrakeType = BRAKE):
         """Set motor braking/stopping mode."""
+        self.engine.set_stopping(mode)
 
     @act
     def set_timeout(self: Self, time: Num = 1, /, units: TimeUnits = SECONDS):  # noqa: E501
         """Set motor timeout."""
+        self.engine.set_timeout(time, units)
 
     @act
     def set_velocity(self: Self,
                      velocity: Num = 50, units: VelocityUnits = PERCENT):
         """Set velocity."""
+        self.engine.set_velocity(velocity, units)
 
     @act
     def spin(self: Self, direction: DirectionType = FORWARD):
         """Spin motors in specified direction."""
+        percent: float = self.engine.velocity_percent()
+        self.engine.spin(-percent if direction is REVERSE else percent)
 
     @act
     def spin_for(self: Self, direction: DirectionType = FORWARD,
                  rotation: Num = 90, unit: RotationUnits = DEGREES,
                  wait: bool = True):
         """Spin motors in specified direction by specified angle."""
+        rotation: float = self.engine.degrees(rotation, unit)
+        commands: tuple[MotorCommand, ...] = self.engine.move(
+            'spin_for', -rotation if direction is REVERSE else rotation,
+            self.engine.velocity_percent())
+        if wait:
+            self.engine.wait(commands)
 
     @act
     def spin_to_position(self: Self,
                          angle: Num = 90, units: RotationUnits = DEGREES,
                          wait: bool = True):
         """Spin motors to specified rotational position."""
+        commands: tuple[MotorCommand, ...] = self.engine.move(
+            'spin_to_position', self.engine.degrees(angle, units),
+            self.engine.velocity_percent(), absolute=True)
+        if wait:
+            self.engine.wait(commands)
 
     @act
     def stop(self: Self):
         """Stop motors."""
+        self.engine.stop()
 
     @sense
     def velocity(self: Self, units: VelocityUnits = PERCENT) -> float:
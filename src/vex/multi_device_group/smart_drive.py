@@ -4,8 +4,6 @@
 from collections.abc import Sequence
 from typing import Literal, LiteralString, Self
 
-from abm.decor import act, sense
-
 from ..motor import Motor
 from ..brain.inertial_sensor import Inertial
 from ..gyro_sensor import Gyro
@@ -13,7 +11,9 @@ from .._common_enums.distance import MM
 from .._common_enums.rotation import DEGREES
 
 from .drive_train import DriveTrain
+from .motor_group import MotorGroup
 
+from .._util.decor import act, sense
 from .._util.doc import vexcode_doc
 from .._util.type import Num
 
@@ -24,12 +24,14 @@ __all__: Sequence[LiteralString] = 'SmartDrive', 'Smartdrive'
 class SmartDrive(DriveTrain):
     """Smart Drive Train."""
 
-    def __init__(self: Self, left_motor: Motor, right_motor: Motor,
+    def __init__(self: Self,
+                 left_motor: Motor | MotorGroup | list[Motor] | tuple[Motor],
+                 right_motor: Motor | MotorGroup | list[Motor] | tuple[Motor],
                  gyro_sensor: Inertial | Gyro = Inertial(),
                  wheel_size: float = 200, /):
         """Initialize Smart Drive Train."""
         super().__init__(left_motor, right_motor,
-                         None,  # wheel_base
+                         wheel_size,  # wheel_travel
                          None,  # track_width
                          MM,  # length_unit
                          1  # gear_ratio
@@ -42,14 +44,13 @@ class SmartDrive(DriveTrain):
     def __eq__(self: Self, other: Self) -> bool:
         """Check equality."""
         return (isinstance(other, DriveTrain) and
-                (other.left_motor == self.left_motor) and
-                (other.right_motor == self.right_motor) and
+                (other.engine == self.engine) and
                 (other.gyro_sensor == self.gyro_sensor) and
                 (other.wheel_size == self.wheel_size))
 
     def __hash__(self: Self) -> int:
         """Return integer hash."""
-        return hash((self.left_motor, self.right_motor,
+        return hash((self.engine,
                      self.gyro_sensor, self.wheel_size))
 
     @vexcode_doc("""
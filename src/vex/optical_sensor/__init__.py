@@ -2,17 +2,16 @@
 
 
 from collections.abc import Callable, Sequence
-from threading import Thread
 from typing import Literal, LiteralString, Self
 
-from abm.decor import act, sense
-
-from .._device import Device
+from .._device import Device, V5DeviceType
 from ..brain.port import Ports
 from .._common_enums.color import Color
 from .._common_enums.percent import PERCENT
 
+from .._util.decor import act, sense
 from .._util.doc import vexcode_doc
+from .._util.sync import poll
 
 from .gesture import GestureType, GestureInfo
 from .led import LedStateType
@@ -51,6 +50,8 @@ GESTURE_CALLBACK_DOCSTR: LiteralString = """
 class Optical(Device):
     """Optical Sensor."""
 
+    _V5_DEVICE_TYPE: V5DeviceType = V5DeviceType.OPTICAL
+
     def __init__(self: Self, port: Ports, /):
         """Initialize Optical Sensor."""
         self.port: Ports = port
@@ -227,13 +228,7 @@ class Optical(Device):
     @act
     def object_detected(self: Self, callback: Callable, /):
         """Trigger callback function upon detecting an object."""
-        def trigger_callback_whenever_near_object():
-            while True:
-                if self.is_near_object():
-                    callback()
-
-        Thread(group=None, target=trigger_callback_whenever_near_object, name=None,  # noqa: E501
-               args=(), kwargs={}, daemon=True).start()
+        poll(self.is_near_object, callback)
 
     @vexcode_doc("""
         Optical Object Lost
@@ -252,58 +247,28 @@ class Optical(Device):
     @act
     def object_lost(self: Self, callback: Callable, /):
         """Trigger callback function upon losing previously-detected object."""
-        def trigger_callback_whenever_not_near_object():
-            while True:
-                if not self.is_near_object():
-                    callback()
-
-        Thread(group=None, target=trigger_callback_whenever_not_near_object,
-               name=None, args=(), kwargs={}, daemon=True).start()
+        poll(lambda: not self.is_near_object(), callback)
 
     @vexcode_doc(GESTURE_CALLBACK_DOCSTR)
     @act
     def gesture_up(self: Self, callback: Callable, /):
         """Trigger callback function upon detecting UP gesture."""
-        def trigger_callback_whenever_detecting_up_gesture():
-            while True:
-                if self.get_gesture().type == GestureType.UP:
-                    callback()
-
-        Thread(group=None, target=trigger_callback_whenever_detecting_up_gesture,  # noqa: E501
-               name=None, args=(), kwargs={}, daemon=True).start()
+        poll(lambda: self.get_gesture().type == GestureType.UP, callback)
 
     @vexcode_doc(GESTURE_CALLBACK_DOCSTR)
     @act
     def gesture_down(self: Self, callback: Callable, /):
         """Trigger callback function upon detecting DOWN gesture."""
-        def trigger_callback_whenever_detecting_down_gesture():
-            while True:
-                if self.get_gesture().type == GestureType.DOWN:
-                    callback()
-
-        Thread(group=None, target=trigger_callback_whenever_detecting_down_gesture,  # noqa: E501
-               name=None, args=(), kwargs={}, daemon=True).start()
+        poll(lambda: self.get_gesture().type == GestureType.DOWN, callback)
 
     @vexcode_doc(GESTURE_CALLBACK_DOCSTR)
     @act
     def gesture_left(self: Self, callback: Callable, /):
         """Trigger callback function upon detecting LEFT gesture."""
-        def trigger_callback_whenever_detecting_left_gesture():
-            while True:
-                if self.get_gesture().type == GestureType.LEFT:
-                    callback()
-
-        Thread(group=None, target=trigger_callback_whenever_detecting_left_gesture,  # noqa: E501
-               name=None, args=(), kwargs={}, daemon=True).start()
+        poll(lambda: self.get_gesture().type == GestureType.LEFT, callback)
 
     @vexcode_doc(GESTURE_CALLBACK_DOCSTR)
     @act
     def gesture_right(self: Self, callback: Callable, /):
         """Trigger callback function upon detecting RIGHT gesture."""
-        def trigger_callback_whenever_detecting_right_gesture():
-            while True:
-                if self.get_gesture().type == GestureType.RIGHT:
-                    callback()
-
-        Thread(group=None, target=trigger_callback_whenever_detecting_right_gesture,  # noqa: E501
-               name=None, args=(), kwargs={}, daemon=True).start()
+        poll(lambda: self.get_gesture().type == GestureType.RIGHT, callback)
@@ -0,0 +1,37 @@
+"""Simulation of robots on a field: collisions, contacts & device models."""
+
+
+from collections.abc import Sequence
+from typing import LiteralString
+
+from .battery import BatteryModel, Projection
+from .bridge import BridgeEndpoint, DeviceBridge
+from .bumper import BumperEvent, SimulatedBumpers
+from .checkpoint import Checkpoint, WorldState
+from .collision import CollisionWorld, Contact, drive_geometry
+from .env import (AsyncVectorEnv, EnvThroughputStats, RobotEnv, Sense,
+                  SyncVectorEnv, VectorEnv, env_throughput_benchmark)
+from .forkserver import (ForkServer, SpawnLatencyStats,
+                         register_reset_hook, reset_state,
+                         spawn_latency_benchmark)
+from .motor import MotorModel
+from .subinterpreter import (ProgramRun, SubinterpreterRunner,
+                             subinterpreters_available)
+
+
+__all__: Sequence[LiteralString] = ('CollisionWorld', 'Contact',
+                                    'drive_geometry',
+                                    'SimulatedBumpers', 'BumperEvent',
+                                    'BatteryModel', 'Projection',
+                                    'MotorModel',
+                                    'DeviceBridge', 'BridgeEndpoint',
+                                    'SubinterpreterRunner', 'ProgramRun',
+                                    'subinterpreters_available',
+                                    'ForkServer', 'register_reset_hook',
+                                    'reset_state', 'SpawnLatencyStats',
+                                    'spawn_latency_benchmark',
+                                    'WorldState', 'Checkpoint',
+                                    'Sense', 'RobotEnv', 'VectorEnv',
+                                    'SyncVectorEnv', 'AsyncVectorEnv',
+                                    'EnvThroughputStats',
+                                    'env_throughput_benchmark')
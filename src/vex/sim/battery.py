@@ -0,0 +1,204 @@
+"""Brain battery discharged by simulated motor & sensor loads."""
+
+
+from collections.abc import Iterable, Sequence
+from typing import Any, LiteralString, NamedTuple, Optional, Self
+
+from ..motor import Motor
+from ..motor.state import FREE_CURRENT_A, MAX_CURRENT_A, MotorStates
+
+from .._util.decor import NO_READING
+
+from .collision import CollisionWorld
+
+
+__all__: Sequence[LiteralString] = 'BatteryModel', 'Projection'
+
+
+# charge (Amp hours) of a full IQ battery
+CAPACITY_AH: float = 2.
+
+# open-circuit voltage of full & empty battery (linear in between), voltage
+# at which motors reach full speed, & internal resistance (Ohms)
+FULL_VOLTAGE: float = 8.4
+EMPTY_VOLTAGE: float = 6.
+NOMINAL_VOLTAGE: float = 7.2
+RESISTANCE: float = .25
+
+# current (Amps) drawn by brain itself
+IDLE_CURRENT_A: float = .1
+
+
+class Projection(NamedTuple):
+    """Projected battery state at end of a load plan."""
+
+    capacity: float
+    voltage: float
+    min_voltage: float
+    depleted_at: Optional[float]
+
+
+class BatteryModel:
+    # pylint: disable=too-many-instance-attributes
+    """Battery whose charge is drawn down by the motors & sensors it powers.
+
+    Motors are registered a group at a time (drive train, motor group or
+    single motor), as slot ranges of their contiguous MotorStates storage.
+    Each `step(dt)` sums every group's current in one pass over its command
+    array: a motor commanded at `c` percent draws `|c|` percent of its
+    free-running current, rising to `|c|` percent of stall current as its
+    robot's drive is blocked in the collision world. Constant loads (brain,
+    sensors) are added on top.
+
+    Open-circuit voltage falls linearly with charge, and the terminal
+    voltage sags further by current times internal resistance; below
+    nominal voltage, the robot's speed in the collision world is scaled
+    down in proportion. A load plan (e.g. a whole match) can be projected
+    in closed form, one linear segment per (duration, current) pair.
+
+    Attached as the brain battery's sense source, this answers `capacity()`.
+    """
+
+    def __init__(self: Self, /,
+                 world: Optional[CollisionWorld] = None,
+                 body: Optional[int] = None,
+                 capacity: float = CAPACITY_AH,
+                 resistance: float = RESISTANCE):
+        """Initialize fully-charged Battery Model (capacity in Amp hours)."""
+        assert capacity > 0, \
+            ValueError(f'*** capacity {capacity} NOT POSITIVE ***')
+
+        self.world: Optional[CollisionWorld] = world
+        self.body: Optional[int] = body
+        self.capacity: float = capacity
+        self.resistance: float = resistance
+
+        self.charge: float = capacity
+        self.load_current: float = IDLE_CURRENT_A
+        self.last_current: float = self.load_current
+        self.time: float = 0.
+
+        # motor groups: storage, slot range & body whose contacts load them
+        self.groups: list[tuple[MotorStates, slice, Optional[int]]] = []
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return (f'{type(self).__name__}({self.percent():.1f}%, '
+                f'{self.voltage():.2f}V)')
+
+    def add_motors(self: Self, motors: Any, /, body: Optional[int] = None):
+        """Power motor, or drive train's/motor group's motors.
+
+        Defaults to this battery's body for loads from contacts.
+        """
+        # (each motor's current storage & slot, e.g. those of a later group)
+        for motor in ((motors,) if isinstance(motors, Motor)
+                      else motors.engine.motors):
+            self.groups.append((motor.states,
+                                slice(motor.slot, motor.slot + 1),
+                                self.body if body is None else body))
+
+    def add_load(self: Self, current: float, /):
+        """Add constant load (Amps), e.g. of a sensor."""
+        self.load_current += current
+
+    def attach(self: Self, battery: Any, /):
+        """Answer brain battery's capacity readings."""
+        battery.sense_source = self
+
+    def current(self: Self, /) -> float:
+        """Return total current (Amps) drawn at current commands & loads."""
+        blocked: Any = None if self.world is None else self.world.blocked
+
+        current: float = self.load_current
+        for states, slots, body in self.groups:
+            per_motor: float = (
+                FREE_CURRENT_A if (blocked is None) or (body is None)
+                else (FREE_CURRENT_A +
+                      (MAX_CURRENT_A - FREE_CURRENT_A) * blocked[body]))
+            current += sum(map(abs, states.command[slots])) / 100 * per_motor
+
+        return current
+
+    def percent(self: Self, /) -> float:
+        """Return remaining charge as percentage of capacity."""
+        return self.charge / self.capacity * 100
+
+    def _open_voltage(self: Self, charge: float, /) -> float:
+        return (EMPTY_VOLTAGE +
+                (FULL_VOLTAGE - EMPTY_VOLTAGE) * charge / self.capacity)
+
+    def voltage(self: Self, current: Optional[float] = None, /) -> float:
+        """Return terminal voltage under current (default: last drawn)."""
+        return max(self._open_voltage(self.charge) -
+                   (self.last_current if current is None else current) *
+                   self.resistance,
+                   0.)
+
+    def speed_scale(self: Self, /) -> float:
+        """Return fraction of commanded speed motors can reach."""
+        return min(self.voltage() / NOMINAL_VOLTAGE, 1.)
+
+    def step(self: Self, dt: float, /) -> float:
+        """Draw current for dt seconds, returning the current (Amps)."""
+        self.last_current = current = self.current()
+        self.charge = max(self.charge - current * dt / 3600, 0.)
+        self.time += dt
+
+        if (self.world is not None) and (self.body is not None):
+            self.world.speed_scale[self.body] = self.speed_scale()
+
+        return current
+
+    def _cutoff_charge(self: Self, current: float, /) -> float:
+        # charge at which terminal voltage under current drops to empty
+        return max(self.capacity * current * self.resistance /
+                   (FULL_VOLTAGE - EMPTY_VOLTAGE),
+                   0.)
+
+    def endurance(self: Self, current: Optional[float] = None, /) -> float:
+        """Return seconds until depletion at constant current.
+
+        Defaults to current drawn at current commands & loads.
+        """
+        if current is None:
+            current: float = self.current()
+        if current <= 0:
+            return float('inf')
+        return max(self.charge - self._cutoff_charge(current), 0.) / current * 3600  # noqa: E501
+
+    def project(self: Self, plan: Iterable[tuple[float, float]], /) -> Projection:  # noqa: E501
+        """Project state after plan of (seconds, Amps) segments.
+
+        Each segment drains charge linearly, so its lowest terminal voltage
+        is at its end & depletion (terminal voltage down to empty voltage)
+        within it is found directly, without stepping.
+        """
+        charge: float = self.charge
+        voltage: float = self.voltage()
+        min_voltage: float = voltage
+        depleted_at: Optional[float] = None
+
+        time: float = 0.
+        for duration, current in plan:
+            end_charge: float = max(charge - current * duration / 3600, 0.)
+
+            if (depleted_at is None) and (current > 0) and \
+                    (end_charge <= (cutoff := self._cutoff_charge(current))):
+                depleted_at = time + max(charge - cutoff, 0.) / current * 3600  # noqa: E501
+
+            charge = end_charge
+            voltage = max(self._open_voltage(charge) -
+                          current * self.resistance, 0.)
+            min_voltage = min(min_voltage, voltage)
+            time += duration
+
+        return Projection(charge / self.capacity * 100, voltage, min_voltage,
+                          depleted_at)
+
+    def read(self: Self, device: Any, method_name: str, args: tuple, /) -> Any:  # noqa: E501
+        # pylint: disable=unused-argument
+        """Return brain battery's capacity (percent)."""
+        if method_name != 'capacity':
+            return NO_READING
+        return round(self.percent())
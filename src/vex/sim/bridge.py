@@ -0,0 +1,246 @@
+"""Shared-memory bridge between isolated robot programs & simulation."""
+
+
+from collections.abc import Sequence
+from math import isnan, nan
+from mmap import mmap
+import os
+from tempfile import mkstemp
+from threading import Event, Thread
+from typing import Any, LiteralString, Optional, Self
+
+from .._common_enums.percent import PERCENT
+from .._common_enums.rotation import DEGREES
+from .._device import DEVICE_REGISTRY, Device, DeviceRegistry
+from .._util.decor import NO_READING
+from ..motor import Motor
+from ..motor.gear import MAX_RPM
+
+
+__all__: Sequence[LiteralString] = ('DeviceBridge', 'BridgeEndpoint',
+                                    'FIELDS')
+
+
+# per-port fields, each a float64:
+# - written by programs: V5 device type (0 if none), commanded velocity
+#   (percent) & set velocity (percent)
+# - written by simulation: position (degrees), actual velocity (percent) &
+#   reading of any other device (NaN if none)
+FIELDS: tuple[str, ...] = ('device_type', 'command', 'velocity',
+                           'position', 'speed', 'reading')
+
+N_PORTS: int = DeviceRegistry.N_PORTS
+
+# seconds between publications of programs' commands
+PUBLISH_INTERVAL: float = .005
+
+
+class DeviceBridge:
+    """Device state of many programs in one shared-memory block.
+
+    Each program owns a table of one row of `FIELDS` per brain port, laid
+    out contiguously as float64s in a memory-mapped file (on the shared
+    memory file system if there is one), so that programs in other
+    interpreters or processes attach to it by path & exchange state without
+    serialization: programs publish their devices & motor commands through
+    their `endpoint(...)`, the simulation core reads those & writes back
+    positions, velocities & readings.
+    """
+
+    def __init__(self: Self, n_programs: int = 1, /,
+                 path: Optional[str] = None):
+        """Create (or, if path given, attach to) Device Bridge."""
+        assert n_programs > 0, \
+            ValueError(f'*** n_programs {n_programs} NOT POSITIVE ***')
+
+        self.n_programs: int = n_programs
+        size: int = n_programs * N_PORTS * len(FIELDS) * 8
+
+        self.owner: bool = path is None
+        if self.owner:
+            fd, path = mkstemp(prefix='vex-bridge-',
+                               dir='/dev/shm' if os.path.isdir('/dev/shm')
+                               else None)
+            os.ftruncate(fd, size)
+        else:
+            fd: int = os.open(path, os.O_RDWR)
+
+        self.path: str = path
+        try:
+            self._mmap: mmap = mmap(fd, size)
+        finally:
+            os.close(fd)
+        self.values: memoryview = memoryview(self._mmap).cast('d')
+
+        if self.owner:
+            for program in range(n_programs):
+                for port in range(N_PORTS):
+                    self.set(program, port, 'reading', nan)
+
+    @classmethod
+    def attach(cls, path: str, n_programs: int = 1, /) -> Self:
+        """Attach to Device Bridge created by another interpreter."""
+        return cls(n_programs, path=path)
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return f'{type(self).__name__}({self.n_programs} programs)'
+
+    def __enter__(self: Self, /) -> Self:
+        """Enter context."""
+        return self
+
+    def __exit__(self: Self, *exc_info: Any):
+        """Close (& remove if created here)."""
+        self.close()
+
+    def index(self: Self, program: int, port: int, field: str, /) -> int:
+        """Return index of program's port's field."""
+        return (program * N_PORTS + port) * len(FIELDS) + FIELDS.index(field)
+
+    def get(self: Self, program: int, port: int, field: str, /) -> float:
+        """Return program's port's field."""
+        return self.values[self.index(program, port, field)]
+
+    def set(self: Self, program: int, port: int, field: str,
+            value: float, /):
+        """Set program's port's field."""
+        self.values[self.index(program, port, field)] = value
+
+    def column(self: Self, program: int, field: str, /) -> list[float]:
+        """Return field of all of program's ports."""
+        start: int = self.index(program, 0, field)
+        return self.values[start:start + N_PORTS * len(FIELDS):len(FIELDS)].tolist()  # noqa: E501
+
+    def motor_ports(self: Self, program: int, /) -> list[int]:
+        """Return ports of program's motors."""
+        return [port
+                for port, device_type in enumerate(self.column(program,
+                                                               'device_type'))
+                if device_type == Motor._V5_DEVICE_TYPE]  # pylint: disable=protected-access  # noqa: E501
+
+    def integrate(self: Self, dt: float, /):
+        """Turn all programs' motors at their commands for dt seconds.
+
+        A minimal simulation core, for programs without a world model.
+        """
+        for program in range(self.n_programs):
+            for port in self.motor_ports(program):
+                command: float = self.get(program, port, 'command')
+                self.set(program, port, 'speed', command)
+                self.set(program, port, 'position',
+                         self.get(program, port, 'position') +
+                         command / 100 * MAX_RPM[None] * 6 * dt)
+
+    def endpoint(self: Self, program: int, /) -> 'BridgeEndpoint':
+        """Return program's end of bridge."""
+        assert 0 <= program < self.n_programs, \
+            ValueError(f'*** program {program} NOT IN BRIDGE ***')
+        return BridgeEndpoint(self, program)
+
+    def close(self: Self, /):
+        """Unmap (& remove if created here)."""
+        self.values.release()
+        self._mmap.close()
+        if self.owner and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class BridgeEndpoint:
+    """A program's end of a Device Bridge.
+
+    Publishes the program's registered devices & motor commands into its
+    table, and, as the sense source of those devices, answers motor
+    position & velocity readings (and other devices' readings) from the
+    simulation's latest values.
+    """
+
+    def __init__(self: Self, bridge: DeviceBridge, program: int, /):
+        """Initialize Bridge Endpoint."""
+        self.bridge: DeviceBridge = bridge
+        self.program: int = program
+        self._stopped: Event = Event()
+        self._thread: Optional[Thread] = None
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return f'{type(self).__name__}(program {self.program})'
+
+    def publish(self: Self, /):
+        """Publish registered devices & motor commands."""
+        present: set[int] = set()
+        for device in DEVICE_REGISTRY:
+            port: int = int(device.port)
+            present.add(port)
+            self.bridge.set(self.program, port, 'device_type', device.type())
+
+            if getattr(device, 'sense_source', None) is None:
+                device.sense_source = self
+
+            if isinstance(device, Motor):
+                self.bridge.set(self.program, port, 'command',
+                                device.states.command[device.slot])
+                self.bridge.set(self.program, port, 'velocity',
+                                device._velocity_percent(None, None))  # pylint: disable=protected-access  # noqa: E501
+
+        for port in range(N_PORTS):
+            if port not in present:
+                self.bridge.set(self.program, port, 'device_type', 0)
+
+    def start(self: Self, /, interval: float = PUBLISH_INTERVAL):
+        """Answer all devices' readings & publish every interval seconds.
+
+        This endpoint becomes the default sense source of all devices in
+        this interpreter (which runs a single program), until stopped.
+        Where threads are not allowed (in isolated sub-interpreters before
+        3.12), publishes before answering each reading instead.
+        """
+        Device.sense_source = self
+
+        def publish_until_stopped():
+            while not self._stopped.wait(interval):
+                self.publish()
+
+        # (not a daemon thread: isolated sub-interpreters do not allow them)
+        thread: Thread = Thread(group=None, target=publish_until_stopped,
+                                name=None, args=(), kwargs={}, daemon=False)
+        try:
+            thread.start()
+        except RuntimeError:
+            return
+        self._thread: Optional[Thread] = thread
+
+    def stop(self: Self, /):
+        """Stop publishing, after publishing final state."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.publish()
+
+        if Device.__dict__.get('sense_source') is self:
+            del Device.sense_source
+
+    def read(self: Self, device: Any, method_name: str, args: tuple, /) -> Any:  # noqa: E501
+        """Return reading from simulation's latest values."""
+        if self._thread is None:
+            self.publish()
+
+        port: int = int(device.port)
+
+        if isinstance(device, Motor):
+            if method_name in ('position', 'rotation'):
+                return device.rotation_units.convert(
+                    self.bridge.get(self.program, port, 'position'),
+                    DEGREES, args[0] if args else DEGREES)
+            if method_name == 'velocity':
+                return device.velocity_units.convert(
+                    self.bridge.get(self.program, port, 'speed'),
+                    PERCENT, args[0] if args else PERCENT)
+            if method_name == 'is_spinning':
+                return bool(self.bridge.get(self.program, port, 'speed'))
+            return NO_READING
+
+        if args or isnan(reading := self.bridge.get(self.program, port,
+                                                    'reading')):
+            return NO_READING
+        return reading
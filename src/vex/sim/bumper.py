@@ -0,0 +1,171 @@
+"""Simulated bumper switches, pressed by collision contacts & debounced."""
+
+
+from array import array
+from collections import deque
+from collections.abc import Sequence
+from math import cos, sin
+from typing import Any, LiteralString, NamedTuple, Optional, Self
+
+from .._util.decor import NO_READING
+
+from .collision import CollisionWorld
+
+
+__all__: Sequence[LiteralString] = 'BumperEvent', 'SimulatedBumpers'
+
+
+class BumperEvent(NamedTuple):
+    """Debounced press (or release) of a bumper at a simulated time."""
+
+    time: float
+    bumper: Any
+    pressed: bool
+
+
+class SimulatedBumpers:
+    # pylint: disable=too-many-instance-attributes
+    """Bumpers mounted on simulated robots, pressed by collision contacts.
+
+    Each bumper is mounted at a point of its robot's chassis (mm forward
+    & left of the chassis center). After each collision-world step,
+    `update(dt)` goes once through the world's contacts: a bumper is in
+    contact if its mount point lies on (within `reach` of) the body its
+    robot touches. Contact must persist (or cease) for `debounce` seconds
+    before the bumper's reported state flips, like a mechanical switch
+    settling; only bumpers whose contact differs from their reported
+    state are looked at, so each tick costs one pass over the contacts.
+
+    Attached as the bumpers' sense source, this answers `pressing()` with
+    the debounced state. Each flip is put on the `events` queue (which can
+    be shared between several sets of bumpers), and `dispatch()` runs the
+    bumpers' `pressed`/`released` callbacks for queued events in the
+    caller's thread, so that no polling threads are needed.
+    """
+
+    def __init__(self: Self, world: CollisionWorld, /,
+                 debounce: float = .01, reach: float = 2.,
+                 events: Optional[deque[BumperEvent]] = None):
+        """Initialize Simulated Bumpers."""
+        assert debounce >= 0, \
+            ValueError(f'*** debounce {debounce} NEGATIVE ***')
+
+        self.world: CollisionWorld = world
+        self.debounce: float = debounce
+        self.reach: float = reach
+        self.events: deque[BumperEvent] = deque() if events is None else events
+        self.time: float = 0.
+
+        # struct-of-arrays mounts: body, chassis-frame point & states
+        self.bumpers: list[Any] = []
+        self.bodies: array = array('l')
+        self.mount_x: array = array('d')
+        self.mount_y: array = array('d')
+        self.pressed: array = array('B')
+
+        self._indices: dict[int, int] = {}
+        self._mounts_by_body: dict[int, list[int]] = {}
+        # pressed mounts, & mounts settling into a new state since when
+        self._down: set[int] = set()
+        self._pending: dict[int, float] = {}
+
+    def __len__(self: Self, /) -> int:
+        """Return number of mounted bumpers."""
+        return len(self.bumpers)
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return (f'{type(self).__name__}({len(self)} bumpers, '
+                f'{len(self._down)} pressed)')
+
+    def mount(self: Self, bumper: Any, body: int, x: float, y: float, /):
+        """Mount bumper on body at (x, y) mm in chassis frame."""
+        index: int = len(self.bumpers)
+        self.bumpers.append(bumper)
+        self.bodies.append(body)
+        self.mount_x.append(x)
+        self.mount_y.append(y)
+        self.pressed.append(False)
+
+        self._indices[id(bumper)] = index
+        self._mounts_by_body.setdefault(body, []).append(index)
+        bumper.sense_source = self
+
+    def read(self: Self, device: Any, method_name: str, args: tuple, /) -> Any:  # noqa: E501
+        # pylint: disable=unused-argument
+        """Return debounced pressed state of mounted bumper."""
+        if (method_name != 'pressing') or \
+                ((index := self._indices.get(id(device))) is None):
+            return NO_READING
+        return bool(self.pressed[index])
+
+    def _touches(self: Self, index: int, other: int, /) -> bool:
+        # whether mount point (in world frame) lies on other body
+        world: CollisionWorld = self.world
+        body: int = self.bodies[index]
+
+        heading: float = world.heading[body]
+        c, s = cos(heading), sin(heading)
+        dx: float = (world.x[body] - world.x[other] +
+                     self.mount_x[index] * c - self.mount_y[index] * s)
+        dy: float = (world.y[body] - world.y[other] +
+                     self.mount_x[index] * s + self.mount_y[index] * c)
+
+        other_heading: float = world.heading[other]
+        c, s = cos(other_heading), sin(other_heading)
+        return ((abs(dx * c + dy * s) <=
+                 world.half_length[other] + self.reach) and
+                (abs(dy * c - dx * s) <=
+                 world.half_width[other] + self.reach))
+
+    def update(self: Self, dt: float, /) -> int:
+        """Advance dt seconds with world's current contacts.
+
+        Returns number of new events.
+        """
+        self.time += dt
+
+        touching: set[int] = set()
+        for contact in self.world.contacts:
+            for body, other in ((contact.first, contact.second),
+                                (contact.second, contact.first)):
+                for index in self._mounts_by_body.get(body, ()):
+                    if (index not in touching) and self._touches(index, other):  # noqa: E501
+                        touching.add(index)
+
+        # mounts whose contact differs from their reported state settle
+        # for `debounce` seconds before flipping; the others stop settling
+        changed: set[int] = touching ^ self._down
+        for index in [index for index in self._pending
+                      if index not in changed]:
+            del self._pending[index]
+
+        n_events: int = 0
+        for index in changed:
+            since: float = self._pending.setdefault(index, self.time)
+            # (with tolerance for rounding of summed time steps)
+            if self.time - since >= self.debounce - 1e-9:
+                del self._pending[index]
+
+                if pressed := index not in self._down:
+                    self._down.add(index)
+                else:
+                    self._down.discard(index)
+                self.pressed[index] = pressed
+
+                self.events.append(BumperEvent(self.time,
+                                               self.bumpers[index], pressed))
+                n_events += 1
+
+        return n_events
+
+    def dispatch(self: Self, /) -> int:
+        """Run callbacks of queued events, returning how many events."""
+        n_events: int = 0
+        while self.events:
+            event: BumperEvent = self.events.popleft()
+            for callback in (event.bumper.pressed_callbacks if event.pressed
+                             else event.bumper.released_callbacks):
+                callback()
+            n_events += 1
+        return n_events
@@ -0,0 +1,285 @@
+"""Whole-world simulation state checkpoints in contiguous buffers."""
+
+
+from array import array
+from collections.abc import Callable, Sequence
+from copy import copy
+import random as _random
+from typing import Any, LiteralString, NamedTuple, Optional, Self
+
+from ..motor import Motor
+from ..motor.state import MotorStates
+
+
+__all__: Sequence[LiteralString] = ('WorldState', 'Checkpoint')
+
+
+# region saved in a checkpoint: array copy, or bytes if deserialized
+Segment = array | bytes
+
+
+class _Region(NamedTuple):
+    """State region: array getter & setter (from saved segment)."""
+
+    name: str
+    get: Callable[[], array]
+    set: Callable[[Segment], Any]
+
+
+def _nbytes(segment: Segment, /) -> int:
+    return (segment.itemsize * len(segment) if isinstance(segment, array)
+            else len(segment))
+
+
+def _copy_into(values: array, segment: Segment, /):
+    # memcpy-style slice assignment (resizing, e.g. growing timelines)
+    if not isinstance(segment, array):
+        data: bytes = segment
+        segment: array = array(values.typecode)
+        segment.frombytes(data)
+    values[:] = segment
+
+
+class Checkpoint:
+    """Simulation state at one instant, as one saved segment per region.
+
+    Segments of regions unchanged since the base checkpoint are the base's
+    own segments (never modified), shared rather than copied. Object
+    references (e.g. pending motor commands) are kept alongside, not in
+    the segments.
+    """
+
+    __slots__: tuple[str, ...] = ('segments', 'objects')
+
+    def __init__(self: Self, segments: tuple[Segment, ...],
+                 objects: tuple = (), /):
+        """Initialize Checkpoint."""
+        self.segments: tuple[Segment, ...] = segments
+        self.objects: tuple = objects
+
+    def __len__(self: Self, /) -> int:
+        """Return number of regions."""
+        return len(self.segments)
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return f'{type(self).__name__}({len(self)} regions, {self.nbytes} B)'
+
+    @property
+    def nbytes(self: Self, /) -> int:
+        """Total size of regions (bytes)."""
+        return sum(map(_nbytes, self.segments))
+
+    def shared_bytes(self: Self, other: Self, /) -> int:
+        """Return size of regions (bytes) shared with other checkpoint."""
+        return sum(_nbytes(segment)
+                   for segment, other_segment in zip(self.segments,
+                                                     other.segments)
+                   if segment is other_segment)
+
+    def to_bytes(self: Self, /) -> bytes:
+        """Serialize regions into one contiguous buffer.
+
+        The buffer is a header of region count & sizes (uint64), followed
+        by the regions in order; object references are not serialized.
+        """
+        return (array('Q', [len(self.segments), *map(_nbytes, self.segments)]).tobytes() +  # noqa: E501
+                b''.join(self.segments))
+
+    @classmethod
+    def from_bytes(cls, buffer: bytes, /) -> Self:
+        """Deserialize regions from contiguous buffer."""
+        with memoryview(buffer) as view:
+            sizes: array = array('Q')
+            sizes.frombytes(view[:8])
+            n_regions: int = sizes.pop()
+            sizes.frombytes(view[8:8 * (n_regions + 1)])
+
+            segments: list[bytes] = []
+            offset: int = 8 * (n_regions + 1)
+            for size in sizes:
+                segments.append(bytes(view[offset:offset + size]))
+                offset += size
+
+        return cls(tuple(segments))
+
+
+class WorldState:
+    """Registry of a simulation's state, checkpointed & restored in bulk.
+
+    Registered state is held in regions: each array attribute of a model
+    (collision world, motor model, battery, LED animator, ...) is a region,
+    as are each object's numeric scalars (packed as float64s), each motor
+    storage's settings & the RNG state. Pending motor commands & motions,
+    and lists (e.g. a motor model's tracked moves), are kept as object
+    references.
+
+    Taking a checkpoint compares each region with the base checkpoint's
+    in place & copies only the regions that changed; restoring copies
+    each region straight back into its array. The registered objects (and
+    so the regions) must stay the same between checkpoint & restore;
+    timer-wheel schedules are not captured.
+    """
+
+    def __init__(self: Self, /):
+        """Initialize empty World State."""
+        self.regions: list[_Region] = []
+        self.objects: list[tuple[Callable[[], Any], Callable[[Any], Any]]] = []  # noqa: E501
+        self.last: Optional[Checkpoint] = None
+        self._states: set[int] = set()
+
+    def __len__(self: Self, /) -> int:
+        """Return number of regions."""
+        return len(self.regions)
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return f'{type(self).__name__}({[region.name for region in self.regions]})'  # noqa: E501
+
+    def add_array(self: Self, obj: Any, attr: str, /):
+        """Register array attribute (looked up afresh, as models rebind)."""
+        self.regions.append(_Region(
+            f'{type(obj).__name__}.{attr}',
+            lambda: getattr(obj, attr),
+            lambda data: _copy_into(getattr(obj, attr), data)))
+
+    def add_scalars(self: Self, obj: Any, attrs: Sequence[str], /):
+        """Register numeric attributes (incl. int enums) as one region."""
+        types: list[type] = [type(getattr(obj, attr)) for attr in attrs]
+
+        def restore(segment: Segment, /):
+            for attr, type_, value in zip(attrs, types, array('d', segment)):
+                setattr(obj, attr,
+                        type_(int(value) if issubclass(type_, int) else value)
+                        if type_ is not float else value)
+
+        self.regions.append(_Region(
+            f'{type(obj).__name__}{tuple(attrs)}',
+            lambda: array('d', [getattr(obj, attr) for attr in attrs]),
+            restore))
+
+    def add_object(self: Self, capture: Callable[[], Any],
+                   restore: Callable[[Any], Any], /):
+        """Register state captured & restored by reference."""
+        self.objects.append((capture, restore))
+
+    def add_list(self: Self, obj: Any, attr: str, /):
+        """Register list attribute, captured as a shallow copy by reference.
+
+        E.g. a motor model's tracked moves, restored in place.
+        """
+        def restore(items: list, /):
+            getattr(obj, attr)[:] = items
+
+        self.add_object(lambda: list(getattr(obj, attr)), restore)
+
+    def add(self: Self, obj: Any, /):
+        """Register all array, numeric & list attributes of object.
+
+        E.g. a collision world, motor/battery model, LED animator, virtual
+        clock or brain screen.
+        """
+        scalars: list[str] = []
+        for attr, value in vars(obj).items():
+            if isinstance(value, array):
+                self.add_array(obj, attr)
+            elif isinstance(value, int | float):
+                scalars.append(attr)
+            elif isinstance(value, list):
+                self.add_list(obj, attr)
+        if scalars:
+            self.add_scalars(obj, scalars)
+
+    def add_motors(self: Self, motors: Any, /):
+        """Register motor(s) or drive train's/motor group's motors.
+
+        Includes their settings storage & their pending commands.
+        """
+        if isinstance(motors, Motor):
+            members: tuple[Motor, ...] = (motors,)
+        else:
+            members: tuple[Motor, ...] = motors.engine.motors
+            engine: Any = motors.engine
+            self.add_object(lambda: engine.motion,
+                            lambda motion: setattr(engine, 'motion', motion))
+
+        for motor in members:
+            # (each motor's current storage, e.g. that of a later group)
+            if id(states := motor.states) not in self._states:
+                self._states.add(id(states))
+                for column in MotorStates.COLUMNS:
+                    self.add_array(states, column)
+
+            self.add_object(*_command_state(motor))
+
+    def add_rng(self: Self, rng: Any = _random, /):
+        """Register state of random generator (default: `random` module)."""
+        # (version, whether a Gaussian is kept, kept Gaussian, internal
+        # state words: not NaN for None, so that equal states compare equal)
+        def get() -> array:
+            version, internal, gauss = rng.getstate()
+            return array('d', [version, gauss is not None, gauss or 0.,
+                               *internal])
+
+        def set_(segment: Segment, /):
+            values: array = array('d', segment)
+            rng.setstate((int(values[0]),
+                          tuple(int(value) for value in values[3:]),
+                          values[2] if values[1] else None))
+
+        self.regions.append(_Region(getattr(rng, '__name__', 'rng'),
+                                    get, set_))
+
+    def checkpoint(self: Self, /, base: Optional[Checkpoint] = None) -> Checkpoint:  # noqa: E501
+        """Take checkpoint, sharing regions unchanged since base.
+
+        Base defaults to the last checkpoint taken.
+        """
+        if base is None:
+            base: Optional[Checkpoint] = self.last
+
+        segments: list[Segment] = []
+        for i, region in enumerate(self.regions):
+            values: array = region.get()
+            segments.append(base.segments[i]
+                            if (base is not None) and (values == base.segments[i])  # noqa: E501
+                            else copy(values))
+
+        self.last = checkpoint = Checkpoint(
+            tuple(segments),
+            tuple(capture() for capture, _ in self.objects))
+        return checkpoint
+
+    def restore(self: Self, checkpoint: Checkpoint, /):
+        """Restore state of checkpoint.
+
+        Object references are restored too if kept (i.e. unless the
+        checkpoint was deserialized).
+        """
+        assert len(checkpoint) == len(self.regions), \
+            ValueError(f'*** {checkpoint} NOT OF {len(self)} REGIONS ***')
+
+        for region, segment in zip(self.regions, checkpoint.segments):
+            region.set(segment)
+
+        if checkpoint.objects:
+            for (_, restore), captured in zip(self.objects,
+                                              checkpoint.objects):
+                restore(captured)
+
+
+def _command_state(motor: Motor, /) -> tuple[Callable[[], tuple],
+                                             Callable[[tuple], Any]]:
+    # capture & restore of motor's motion & latest command (with its flags)
+    def capture() -> tuple:
+        latest: Any = motor.mailbox.latest
+        return (motor.motion, latest,
+                None if latest is None
+                else (latest.completed, latest.timed_out))
+
+    def restore(captured: tuple, /):
+        motor.motion, motor.mailbox.latest, flags = captured
+        if flags is not None:
+            motor.mailbox.latest.completed, motor.mailbox.latest.timed_out = flags  # noqa: E501
+
+    return capture, restore
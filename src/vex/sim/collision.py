@@ -0,0 +1,445 @@
+"""2-D collision detection & response for simulated robots & field elements."""
+
+
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+from math import cos, degrees, floor, hypot, inf, radians, sin
+from typing import Any, LiteralString, Optional, Self
+
+from ..motor import Motor
+from ..motor.gear import MAX_RPM
+from ..motor.state import MAX_CURRENT_A, MAX_TORQUE_NM
+from ..motor.torque import TorqueUnits
+from .._common_enums.distance import DistanceUnits, MM
+
+from .._util.conversion import convert, unit_table
+from .._util.decor import NO_READING
+
+
+__all__: Sequence[LiteralString] = ('CollisionWorld', 'Contact',
+                                    'drive_geometry')
+
+
+# IQ field (6 ft x 8 ft), in millimeters
+FIELD_WIDTH: float = 1828.8
+FIELD_LENGTH: float = 2438.4
+
+# max distance (mm) reported by Distance Sensors
+DISTANCE_RANGE: float = 2000.
+
+# robot footprint length (mm) where drivetrain's wheel base is not set
+ROBOT_LENGTH: float = 200.
+
+
+def _length_unit(drivetrain: Any, /) -> DistanceUnits:
+    return (getattr(drivetrain, 'length_unit', None) or
+            getattr(drivetrain, 'distance_unit', None) or
+            MM)
+
+
+def drive_geometry(drivetrain: Any, /) -> tuple[float, float, float]:
+    """Return drivetrain's wheel travel & track width (mm), & gear ratio.
+
+    Works for both VEXcode (`wheel_travel`/`wheel_size`, `length_unit`) &
+    Robot Mesh (`wheel_travel`, `distance_unit`) drivetrains, falling back
+    to VEXcode's defaults (200 mm travel, 176 mm track) where not set.
+    """
+    unit: DistanceUnits = _length_unit(drivetrain)
+
+    travel: float = next((value
+                          for name in ('wheel_travel', 'wheel_size')
+                          if (value := getattr(drivetrain, name, None))),
+                         200)
+    track: float = getattr(drivetrain, 'track_width', None) or 176
+
+    return (convert(travel, unit, MM), convert(track, unit, MM),
+            getattr(drivetrain, 'gear_ratio', None) or 1)
+
+
+@dataclass(frozen=True)
+class Contact:
+    """Overlap of two bodies, with unit normal pointing from first to second.
+
+    `depth` is the penetration (mm) along the normal before separation.
+    """
+
+    first: int
+    second: int
+    normal_x: float
+    normal_y: float
+    depth: float
+
+
+class CollisionWorld:
+    # pylint: disable=too-many-instance-attributes
+    """Field of oriented rectangular bodies, stepped at a fixed interval.
+
+    Bodies are indices into struct-of-arrays storage of pose (x, y in mm,
+    heading in radians counterclockwise from the x axis), half-extents &
+    static flag. Robot bodies are bound to drivetrains: each step moves
+    them by differential-drive kinematics from their motors' commanded
+    velocities (see `MotorStates.command`).
+
+    Each step then finds contacts in two phases: a broad phase hashing
+    bodies' bounding boxes into a uniform grid of `cell_size` cells
+    (static bodies are hashed once), so that only bodies sharing a cell
+    are paired, and a narrow phase running the separating-axis test on
+    each candidate pair's two rectangles. Overlapping bodies are pushed
+    apart along the axis of least penetration.
+
+    Attached as sense source to robots' motors & to bumpers, the world
+    answers `Motor.current()`/`torque()` (stall load in proportion to how
+    much of the motor's commanded drive is blocked by contacts) &
+    `Bumper.pressing()` (whether its body touches anything). Attached to
+    other sensors, it answers `heading()`/`rotation()` (the body's heading,
+    clockwise as inertial sensors report it) &
+    `object_distance()`/`is_object_detected()` (distance from the body's
+    front to the nearest other body straight ahead, up to
+    `DISTANCE_RANGE`).
+    """
+
+    def __init__(self: Self, /, cell_size: float = 300.):
+        """Initialize empty Collision World."""
+        assert cell_size > 0, \
+            ValueError(f'*** cell_size {cell_size} NOT POSITIVE ***')
+
+        self.cell_size: float = cell_size
+
+        self.x: array = array('d')
+        self.y: array = array('d')
+        self.heading: array = array('d')
+        self.half_length: array = array('d')
+        self.half_width: array = array('d')
+        self.radius: array = array('d')
+        self.static: array = array('B')
+
+        # fraction of commanded speed each body can reach (e.g. as limited
+        # by its battery's voltage)
+        self.speed_scale: array = array('d')
+
+        # fraction of each body's commanded drive pushing into contacts,
+        # & whether each body is touching anything, as of last step
+        self.blocked: array = array('d')
+        self.touching: array = array('B')
+
+        # robots' drivetrains by body, & attached devices (with their
+        # bodies) by identity, as equal devices on different robots share
+        # ports and hence compare equal
+        self.drivetrains: dict[int, Any] = {}
+        self.attached: dict[int, tuple[Any, int]] = {}
+
+        self.contacts: list[Contact] = []
+        self.n_steps: int = 0
+        self.n_candidates: int = 0
+
+        self._static_cells: dict[int, list[int]] = {}
+        self._dynamic: list[int] = []
+
+        # robots' kinematics, precomputed when added: body, command arrays
+        # & slices of left & right sides, mm/s per percent & track width
+        self._robots: list[tuple[int, array, slice, slice, float, float]] = []
+
+    def __len__(self: Self, /) -> int:
+        """Return number of bodies."""
+        return len(self.x)
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return (f'{type(self).__name__}({len(self)} bodies, '
+                f'{len(self.drivetrains)} robots)')
+
+    def add_box(self: Self, x: float, y: float, length: float, width: float,
+                /, heading: float = 0., static: bool = True) -> int:
+        # pylint: disable=too-many-arguments
+        """Add rectangular body centered at (x, y) mm, returning its index.
+
+        Length is along heading (degrees counterclockwise from x axis).
+        """
+        assert (length > 0) and (width > 0), \
+            ValueError(f'*** {length} x {width} NOT A POSITIVE SIZE ***')
+
+        body: int = len(self)
+        self.x.append(x)
+        self.y.append(y)
+        self.heading.append(radians(heading))
+        self.half_length.append(length / 2)
+        self.half_width.append(width / 2)
+        self.radius.append(hypot(length, width) / 2)
+        self.static.append(static)
+        self.speed_scale.append(1.)
+        self.blocked.append(0.)
+        self.touching.append(False)
+
+        if static:
+            for cell in self._cells(body):
+                self._static_cells.setdefault(cell, []).append(body)
+        else:
+            self._dynamic.append(body)
+
+        return body
+
+    def add_walls(self: Self, /,
+                  length: float = FIELD_LENGTH, width: float = FIELD_WIDTH,
+                  thickness: float = 50.) -> tuple[int, ...]:
+        """Add static perimeter walls around [0, length] x [0, width] mm."""
+        return (self.add_box(length / 2, -thickness / 2,
+                             length + 2 * thickness, thickness),
+                self.add_box(length / 2, width + thickness / 2,
+                             length + 2 * thickness, thickness),
+                self.add_box(-thickness / 2, width / 2, thickness, width),
+                self.add_box(length + thickness / 2, width / 2,
+                             thickness, width))
+
+    def add_robot(self: Self, drivetrain: Any, x: float, y: float, /,
+                  heading: float = 0.) -> int:
+        """Add drivetrain's footprint at (x, y) mm, driven by its motors.
+
+        The footprint is wheel base (along heading; ROBOT_LENGTH if not
+        set) by track width, and the world becomes the sense source of the
+        drivetrain's motors.
+        """
+        travel, track, gear_ratio = drive_geometry(drivetrain)
+        length: float = (
+            ROBOT_LENGTH
+            if (wheel_base := getattr(drivetrain, 'wheel_base', None)) is None
+            else convert(wheel_base, _length_unit(drivetrain), MM))
+        body: int = self.add_box(x, y, length, track,
+                                 heading=heading, static=False)
+
+        self.drivetrains[body] = drivetrain
+        for motor in drivetrain.engine.motors:
+            self.attach(motor, body)
+
+        engine: Any = drivetrain.engine
+        left, right = engine.side_slots
+        self._robots.append(
+            (body, engine.states.command, left, right,
+             MAX_RPM[engine.motors[0].gear_setting] / 60 * travel /
+             gear_ratio / 100,
+             track))
+
+        return body
+
+    def attach(self: Self, device: Any, body: int, /):
+        """Answer device's contact-dependent readings from body's state."""
+        self.attached[id(device)] = device, body
+        device.sense_source = self
+
+    def detach(self: Self, device: Any, /):
+        """Restore device's default readings."""
+        self.attached.pop(id(device), None)
+        if getattr(device, 'sense_source', None) is self:
+            device.sense_source = None
+
+    def pose(self: Self, body: int, /) -> tuple[float, float, float]:
+        """Return body's x & y (mm) & heading (degrees)."""
+        return self.x[body], self.y[body], degrees(self.heading[body])
+
+    def ray_distance(self: Self, body: int, /) -> float:
+        """Return distance (mm) from body's front to nearest body ahead.
+
+        Infinite if no body lies straight ahead.
+        """
+        x, y, heading = self.x[body], self.y[body], self.heading[body]
+        nearest: float = inf
+
+        for other in range(len(self)):
+            if other == body:
+                continue
+
+            # ray in other body's frame, clipped by its slabs
+            c, s = cos(self.heading[other]), sin(self.heading[other])
+            dx, dy = x - self.x[other], y - self.y[other]
+            near, far = 0., nearest
+            for origin, direction, half in (
+                    (dx * c + dy * s, cos(heading - self.heading[other]),
+                     self.half_length[other]),
+                    (dy * c - dx * s, sin(heading - self.heading[other]),
+                     self.half_width[other])):
+                if abs(direction) < 1e-12:
+                    if abs(origin) > half:
+                        break
+                    continue
+                first, second = sorted(((-half - origin) / direction,
+                                        (half - origin) / direction))
+                near, far = max(near, first), min(far, second)
+                if near > far:
+                    break
+            else:
+                nearest: float = near
+
+        return max(nearest - self.half_length[body], 0.)
+
+    def read(self: Self, device: Any, method_name: str, args: tuple, /) -> Any:  # noqa: E501
+        """Return contact-dependent reading of attached device."""
+        if (entry := self.attached.get(id(device))) is None:
+            return NO_READING
+        body: int = entry[1]
+
+        if method_name == 'pressing':
+            return bool(self.touching[body])
+
+        if isinstance(device, Motor) and (method_name in ('current',
+                                                          'torque')):
+            load: float = min(abs(device.states.command[device.slot]) *
+                              self.blocked[body],
+                              device.max_torque) / 100
+
+            if method_name == 'current':
+                return load * MAX_CURRENT_A
+
+            return unit_table(TorqueUnits).convert(
+                load * MAX_TORQUE_NM[device.gear_setting],
+                TorqueUnits.NM, args[0] if args else TorqueUnits.NM)
+
+        if isinstance(device, Motor):
+            return NO_READING
+
+        if method_name in ('heading', 'rotation'):
+            rotation: float = -degrees(self.heading[body])
+            return rotation % 360 if method_name == 'heading' else rotation
+
+        if method_name == 'object_distance':
+            return convert(min(self.ray_distance(body), DISTANCE_RANGE),
+                           MM, args[0] if args else MM)
+
+        if method_name == 'is_object_detected':
+            return self.ray_distance(body) < DISTANCE_RANGE
+
+        return NO_READING
+
+    def _cells(self: Self, body: int, /) -> list[int]:
+        # keys of grid cells covered by body's axis-aligned bounding box
+        x, y, heading, size = (self.x[body], self.y[body], self.heading[body],
+                               self.cell_size)
+        c, s = abs(cos(heading)), abs(sin(heading))
+        hl, hw = self.half_length[body], self.half_width[body]
+        half_x, half_y = hl * c + hw * s, hl * s + hw * c
+        return [(i << 32) + j
+                for i in range(floor((x - half_x) / size),
+                               floor((x + half_x) / size) + 1)
+                for j in range(floor((y - half_y) / size),
+                               floor((y + half_y) / size) + 1)]
+
+    def _move_robots(self: Self, dt: float, /):
+        for body, command, left_slots, right_slots, scale, track in \
+                self._robots:
+            left_commands: array = command[left_slots]
+            right_commands: array = command[right_slots]
+            left: float = (sum(left_commands) / len(left_commands) * scale
+                           if left_commands else 0.)
+            right: float = (sum(right_commands) / len(right_commands) *
+                            scale
+                            if right_commands else 0.)
+
+            if not (left or right):
+                continue
+
+            if (speed_scale := self.speed_scale[body]) != 1:
+                left *= speed_scale
+                right *= speed_scale
+
+            speed: float = (left + right) / 2
+            self.heading[body] += (right - left) / track * dt
+            self.x[body] += speed * cos(self.heading[body]) * dt
+            self.y[body] += speed * sin(self.heading[body]) * dt
+
+    def _candidates(self: Self, /) -> set[tuple[int, int]]:
+        # broad phase: pairs of bodies sharing a grid cell
+        static_cells: dict[int, list[int]] = self._static_cells
+        cells: dict[int, list[int]] = {}
+        pairs: set[tuple[int, int]] = set()
+
+        for body in self._dynamic:
+            for cell in self._cells(body):
+                for other in static_cells.get(cell, ()):
+                    pairs.add((other, body))
+
+                if (occupants := cells.get(cell)) is None:
+                    cells[cell] = [body]
+                else:
+                    for other in occupants:
+                        pairs.add((other, body))
+                    occupants.append(body)
+
+        return pairs
+
+    def _separation(self: Self, first: int, second: int, /) \
+            -> Optional[tuple[float, float, float]]:
+        # narrow phase: separating-axis test of two oriented rectangles,
+        # returning normal (first -> second) & depth of least penetration
+        dx: float = self.x[second] - self.x[first]
+        dy: float = self.y[second] - self.y[first]
+        if (dx * dx + dy * dy >=
+                (self.radius[first] + self.radius[second]) ** 2):
+            return None
+
+        c1, s1 = cos(self.heading[first]), sin(self.heading[first])
+        c2, s2 = cos(self.heading[second]), sin(self.heading[second])
+        hl1, hw1 = self.half_length[first], self.half_width[first]
+        hl2, hw2 = self.half_length[second], self.half_width[second]
+
+        # (normal x, normal y, depth) of least penetration so far
+        best: tuple[float, float, float] = (0., 0., float('inf'))
+        for nx, ny in ((c1, s1), (-s1, c1), (c2, s2), (-s2, c2)):
+            distance: float = dx * nx + dy * ny
+            depth: float = (hl1 * abs(c1 * nx + s1 * ny) +
+                            hw1 * abs(c1 * ny - s1 * nx) +
+                            hl2 * abs(c2 * nx + s2 * ny) +
+                            hw2 * abs(c2 * ny - s2 * nx) -
+                            abs(distance))
+            if depth <= 0:
+                return None
+
+            if depth < best[2]:
+                best = ((nx, ny, depth) if distance >= 0
+                        else (-nx, -ny, depth))
+
+        return best
+
+    def _resolve(self: Self, contact: Contact, /):
+        # push bodies apart & accumulate how much their drive is blocked
+        first, second = contact.first, contact.second
+        nx, ny, depth = contact.normal_x, contact.normal_y, contact.depth
+
+        share: float = .5 if not (self.static[first] or
+                                  self.static[second]) else 1.
+        for body, sign in ((first, -1), (second, 1)):
+            self.touching[body] = True
+            if self.static[body]:
+                continue
+
+            self.x[body] += sign * nx * depth * share
+            self.y[body] += sign * ny * depth * share
+
+            if (drivetrain := self.drivetrains.get(body)) is not None:
+                command: float = sum(drivetrain.engine.states.command)
+                if command:
+                    heading: float = self.heading[body]
+                    push: float = -sign * (nx * cos(heading) +
+                                           ny * sin(heading))
+                    if command < 0:
+                        push: float = -push
+                    self.blocked[body] = max(self.blocked[body], push)
+
+    def step(self: Self, dt: float, /) -> list[Contact]:
+        """Advance by dt seconds, returning resulting contacts."""
+        self._move_robots(dt)
+
+        n_bodies: int = len(self)
+        self.blocked: array = array('d', bytes(8 * n_bodies))
+        self.touching: array = array('B', bytes(n_bodies))
+
+        candidates: set[tuple[int, int]] = self._candidates()
+        self.n_candidates: int = len(candidates)
+
+        self.contacts: list[Contact] = []
+        for first, second in candidates:
+            if (separation := self._separation(first, second)) is not None:
+                contact: Contact = Contact(first, second, *separation)
+                self.contacts.append(contact)
+                self._resolve(contact)
+
+        self.n_steps += 1
+        return self.contacts
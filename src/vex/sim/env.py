@@ -0,0 +1,584 @@
+"""Gymnasium-style environments of simulated robots, single & vectorized."""
+
+
+from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from math import inf, nan
+import multiprocessing
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
+import os
+import random
+from time import perf_counter
+import traceback
+from typing import Any, LiteralString, NamedTuple, Optional, Self
+
+from ..motor import Motor
+from ..motor.direction import FORWARD
+from .._common_enums.percent import PERCENT
+from .._util.decor import NO_READING
+
+from .checkpoint import Checkpoint, WorldState
+from .collision import FIELD_LENGTH, FIELD_WIDTH, CollisionWorld
+from .motor import MotorModel
+
+try:
+    import gymnasium
+except ImportError:
+    gymnasium = None
+
+
+__all__: Sequence[LiteralString] = ('Sense', 'RobotEnv',
+                                    'VectorEnv', 'SyncVectorEnv',
+                                    'AsyncVectorEnv',
+                                    'EnvThroughputStats',
+                                    'env_throughput_benchmark')
+
+
+# attributes of vision objects observed, in order
+VISION_OBJECT_FIELDS: tuple[str, ...] = ('exists', 'centerX', 'centerY',
+                                         'width', 'height')
+
+
+def _flatten(reading: Any, /) -> tuple[float, ...]:
+    # numbers (incl. bools & int enums), vision objects, or sequences
+    if reading is None:
+        return (nan,)
+    if isinstance(reading, int | float):
+        return (float(reading),)
+    if hasattr(reading, 'centerX'):
+        return tuple(float(getattr(reading, field) or 0)
+                     for field in VISION_OBJECT_FIELDS)
+    return tuple(map(float, reading))
+
+
+def _clamp(percent: float, /) -> float:
+    return min(max(float(percent), -100.), 100.)
+
+
+class Sense(NamedTuple):
+    """Declared observation: device's sensing method, called with args.
+
+    E.g. `Sense(motor, 'position')`, `Sense(inertial, 'heading')`,
+    `Sense(distance, 'object_distance', (MM,))` or
+    `Sense(vision, 'largest_object')` (observed as its
+    `VISION_OBJECT_FIELDS`).
+    """
+
+    device: Any
+    method_name: str
+    args: tuple = ()
+
+    def read(self: Self, /) -> tuple[float, ...]:
+        """Return reading, flattened into floats.
+
+        Asks the device's sense source first, so that properties (e.g.
+        `Vision.largest_object`) are answered by simulations too.
+        """
+        if (((source := getattr(self.device, 'sense_source', None)) is None) or
+                ((reading := source.read(self.device, self.method_name,
+                                         self.args)) is NO_READING)):
+            reading: Any = getattr(self.device, self.method_name)
+            if callable(reading):
+                reading: Any = reading(*self.args)
+        return _flatten(reading)
+
+
+class RobotEnv:
+    # pylint: disable=too-many-instance-attributes
+    """Gymnasium-style environment of one simulated robot on a field.
+
+    The robot's drivetrain is added to a collision world (by default, an
+    empty IQ field, with the robot in its middle) & its motors to a motor
+    model, and declared senses' other devices without sense sources are
+    attached to its body: observations are the vex API's own readings
+    (e.g. `Motor.position`, `Inertial.heading`, `Distance.object_distance`)
+    flattened into a float64 array.
+
+    Actions are percent velocities: of the given motors (each set with
+    `Motor.set_velocity` & spun forward), or else arcade drive & turn
+    (with `DriveTrain.arcade` where there is one). Rewards & terminations
+    come from optional functions of the environment; episodes are
+    truncated after `max_episode_steps`. Resets restore a checkpoint of the
+    whole simulation taken at construction (see `WorldState`), including
+    the environment's own random generator `rng` (independent of other
+    environments' & of the `random` module), reseeded if given a seed.
+
+    Follows Gymnasium's `Env` API, with its spaces if it is installed.
+    """
+
+    def __init__(self: Self, drivetrain: Any, senses: Iterable[Sense], /,
+                 motors: Sequence[Motor] = (),
+                 world: Optional[CollisionWorld] = None,
+                 body: Optional[int] = None,
+                 dt: float = .05,
+                 max_episode_steps: int = 500,
+                 reward: Optional[Callable[[Self], float]] = None,
+                 terminated: Optional[Callable[[Self], bool]] = None):
+        # pylint: disable=too-many-arguments
+        """Set up simulation & take its initial checkpoint."""
+        assert dt > 0, ValueError(f'*** dt {dt} NOT POSITIVE ***')
+
+        if world is None:
+            world: CollisionWorld = CollisionWorld()
+            world.add_walls()
+            body: int = world.add_robot(drivetrain,
+                                        FIELD_LENGTH / 2, FIELD_WIDTH / 2)
+        assert body is not None, \
+            ValueError(f"*** {world}'s robot body NOT GIVEN ***")
+
+        self.drivetrain: Any = drivetrain
+        self.senses: tuple[Sense, ...] = tuple(senses)
+        self.motors: tuple[Motor, ...] = tuple(motors)
+        self.world: CollisionWorld = world
+        self.body: int = body
+        self.dt: float = dt
+        self.max_episode_steps: int = max_episode_steps
+        self.reward: Optional[Callable[[Self], float]] = reward
+        self.terminated: Optional[Callable[[Self], bool]] = terminated
+        self.n_steps: int = 0
+        self.rng: random.Random = random.Random()
+
+        self.model: MotorModel = MotorModel(world=world)
+        self.model.attach(drivetrain, body=body)
+        drive_motors: set[int] = set(map(id, drivetrain.engine.motors))
+        for motor in self.motors:
+            if id(motor) not in drive_motors:
+                self.model.attach(motor)
+
+        for sense in self.senses:
+            if ((not isinstance(sense.device, Motor)) and
+                    (getattr(sense.device, 'sense_source', None) is None)):
+                world.attach(sense.device, body)
+
+        self.state: WorldState = WorldState()
+        self.state.add(world)
+        self.state.add(self.model)
+        self.state.add_motors(drivetrain)
+        for motor in self.motors:
+            self.state.add_motors(motor)
+        self.state.add_rng(self.rng)
+        self.initial: Checkpoint = self.state.checkpoint()
+
+        self.observation_size: int = len(self.observe())
+        self.action_size: int = len(self.motors) or 2
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return (f'{type(self).__name__}({self.observation_size} observed, '
+                f'{self.action_size} actions)')
+
+    @property
+    def observation_space(self: Self, /) -> Any:
+        """Gymnasium space of observations."""
+        return _box(-inf, inf, self.observation_size)
+
+    @property
+    def action_space(self: Self, /) -> Any:
+        """Gymnasium space of actions (percent velocities)."""
+        return _box(-100., 100., self.action_size)
+
+    def observe(self: Self, /) -> array:
+        """Return readings of declared senses."""
+        observation: array = array('d')
+        for sense in self.senses:
+            observation.extend(sense.read())
+        return observation
+
+    def act(self: Self, action: Sequence[float], /):
+        """Command motors' velocities, or arcade drive & turn (percent)."""
+        assert len(action) == self.action_size, \
+            ValueError(f'*** action {action} NOT OF {self.action_size} ***')
+
+        if self.motors:
+            for motor, velocity in zip(self.motors, action):
+                motor.set_velocity(_clamp(velocity), PERCENT)
+                motor.spin(FORWARD)
+
+        elif hasattr(self.drivetrain, 'arcade'):
+            self.drivetrain.arcade(*map(_clamp, action))
+
+        else:
+            drive, turn = action
+            sides: tuple[float, float] = (_clamp(drive + turn),
+                                          _clamp(drive - turn))
+            self.drivetrain.engine.set_side_velocities(sides, PERCENT)
+            self.drivetrain.engine.spin_sides(sides)
+
+    def reset(self: Self, /, seed: Optional[int] = None,
+              options: Optional[dict] = None) -> tuple[array, dict]:
+        # pylint: disable=unused-argument
+        """Restore initial state (seeding RNG), returning observation."""
+        self.state.restore(self.initial)
+        if seed is not None:
+            self.rng.seed(seed)
+        self.n_steps: int = 0
+        return self.observe(), {}
+
+    def step(self: Self, action: Sequence[float], /) \
+            -> tuple[array, float, bool, bool, dict]:
+        """Act & advance dt seconds, returning observation & outcome."""
+        self.act(action)
+        self.world.step(self.dt)
+        self.model.step(self.dt)
+        self.n_steps += 1
+
+        return (self.observe(),
+                0. if self.reward is None else float(self.reward(self)),
+                False if self.terminated is None
+                else bool(self.terminated(self)),
+                self.n_steps >= self.max_episode_steps,
+                {})
+
+    def close(self: Self, /):
+        """Close (nothing to release)."""
+
+
+def _box(low: float, high: float, size: int, /) -> Any:
+    assert gymnasium is not None, \
+        ImportError('*** gymnasium NOT INSTALLED ***')
+    return gymnasium.spaces.Box(low, high, (size,), dtype=float)
+
+
+class _Buffers(NamedTuple):
+    """Flat views of vector environment's (possibly shared) buffers."""
+
+    observations: memoryview
+    actions: memoryview
+    rewards: memoryview
+    terminations: memoryview
+    truncations: memoryview
+
+
+# typecodes of buffers, in _Buffers' order
+TYPECODES: str = 'dddBB'
+
+
+def _views(raw: Sequence[Any], /) -> _Buffers:
+    # (cast via bytes, as e.g. shared ctypes arrays have non-native formats)
+    return _Buffers(*(memoryview(buffer).cast('B').cast(typecode)
+                      for buffer, typecode in zip(raw, TYPECODES)))
+
+
+def _allocate(typecode: str, length: int, /) -> array:
+    return array(typecode, bytes(array(typecode).itemsize * length))
+
+
+def _reset_envs(envs: Sequence[RobotEnv], start: int, buffers: _Buffers,
+                seeds: Sequence[Optional[int]], options: Optional[dict],
+                /) -> dict:
+    size: int = envs[0].observation_size
+    for i, env in enumerate(envs, start=start):
+        buffers.observations[i * size:(i + 1) * size], _ = env.reset(
+            seed=seeds[i], options=options)
+    return {}
+
+
+def _step_envs(envs: Sequence[RobotEnv], start: int, buffers: _Buffers, /) -> dict:  # noqa: E501
+    # step envs (numbered from start), autoresetting finished episodes:
+    # their final observations are returned in infos
+    size: int = envs[0].observation_size
+    n_actions: int = envs[0].action_size
+    infos: dict = {}
+
+    for i, env in enumerate(envs, start=start):
+        (observation, buffers.rewards[i], terminated, truncated,
+         _) = env.step(buffers.actions[i * n_actions:(i + 1) * n_actions])
+        buffers.terminations[i], buffers.truncations[i] = terminated, truncated
+
+        if terminated or truncated:
+            infos.setdefault('final_observation', {})[i] = observation
+            observation, _ = env.reset()
+
+        buffers.observations[i * size:(i + 1) * size] = observation
+
+    return infos
+
+
+class VectorEnv(ABC):
+    """Many robot environments stepped as one batch.
+
+    Observations, actions, rewards, terminations & truncations live in
+    flat, preallocated float64/uint8 buffers, one row per environment:
+    `step(actions)` & `reset()` return views of them (overwritten by the
+    next call; e.g. `numpy.asarray(...)` wraps them without copying).
+    Environments whose episodes end are reset within the same step, with
+    their final observations in infos' `final_observation` by index.
+
+    Follows Gymnasium's `VectorEnv` API; tracks env steps per second.
+    """
+
+    def __init__(self: Self, n_envs: int,
+                 observation_size: int, action_size: int, /,
+                 allocate: Callable[[str, int], Any] = _allocate):
+        """Allocate buffers for n_envs environments."""
+        assert n_envs > 0, ValueError(f'*** n_envs {n_envs} NOT POSITIVE ***')
+
+        self.num_envs: int = n_envs
+        self.observation_size: int = observation_size
+        self.action_size: int = action_size
+
+        self.raw: tuple = tuple(
+            allocate(typecode, n_envs * size)
+            for typecode, size in zip(TYPECODES, (observation_size,
+                                                  action_size, 1, 1, 1)))
+        self.buffers: _Buffers = _views(self.raw)
+
+        self.observations: memoryview = \
+            self.buffers.observations.cast('B').cast(
+                'd', (n_envs, observation_size))
+        self.rewards: memoryview = self.buffers.rewards
+        self.terminations: memoryview = \
+            self.buffers.terminations.cast('B').cast('?')
+        self.truncations: memoryview = \
+            self.buffers.truncations.cast('B').cast('?')
+
+        self.n_env_steps: int = 0
+        self.step_seconds: float = 0.
+        self._started: float = 0.
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return (f'{type(self).__name__}({self.num_envs} envs, '
+                f'{self.steps_per_second:.0f} steps/s)')
+
+    def __enter__(self: Self, /) -> Self:
+        """Enter context."""
+        return self
+
+    def __exit__(self: Self, *exc_info: Any):
+        """Close."""
+        self.close()
+
+    @property
+    def steps_per_second(self: Self, /) -> float:
+        """Environment steps per second of stepping so far."""
+        return self.n_env_steps / self.step_seconds if self.step_seconds else 0.  # noqa: E501
+
+    def seeds(self: Self, seed: Optional[int | Sequence[int]], /) \
+            -> list[Optional[int]]:
+        """Return per-environment seeds (consecutive from an int seed)."""
+        if seed is None:
+            return [None] * self.num_envs
+        if isinstance(seed, int):
+            return [seed + i for i in range(self.num_envs)]
+        assert len(seed) == self.num_envs, \
+            ValueError(f'*** {len(seed)} SEEDS NOT {self.num_envs} ***')
+        return list(seed)
+
+    def _write_actions(self: Self, actions: Sequence[Sequence[float]], /):
+        assert len(actions) == self.num_envs, \
+            ValueError(f'*** {len(actions)} ACTIONS NOT {self.num_envs} ***')
+
+        size: int = self.action_size
+        for i, action in enumerate(actions):
+            assert len(action) == size, \
+                ValueError(f'*** action {action} NOT OF {size} ***')
+            self.buffers.actions[i * size:(i + 1) * size] = \
+                array('d', map(float, action))
+
+        self._started: float = perf_counter()
+
+    def _results(self: Self, infos: dict, /) -> tuple:
+        self.step_seconds += perf_counter() - self._started
+        self.n_env_steps += self.num_envs
+        return (self.observations, self.rewards, self.terminations,
+                self.truncations, infos)
+
+    @abstractmethod
+    def reset(self: Self, /, seed: Optional[int | Sequence[int]] = None,
+              options: Optional[dict] = None) -> tuple[memoryview, dict]:
+        """Reset all environments, returning observations."""
+
+    @abstractmethod
+    def step(self: Self, actions: Sequence[Sequence[float]], /) -> tuple:
+        """Step all environments, returning observations & outcomes."""
+
+    def close(self: Self, /):
+        """Close environments."""
+
+
+class SyncVectorEnv(VectorEnv):
+    """Vector environment stepping all environments in this process."""
+
+    def __init__(self: Self, env_fns: Iterable[Callable[[], RobotEnv]], /):
+        """Construct environments."""
+        self.envs: list[RobotEnv] = [env_fn() for env_fn in env_fns]
+        super().__init__(len(self.envs), self.envs[0].observation_size,
+                         self.envs[0].action_size)
+
+    def reset(self: Self, /, seed: Optional[int | Sequence[int]] = None,
+              options: Optional[dict] = None) -> tuple[memoryview, dict]:
+        """Reset all environments, returning observations."""
+        return (self.observations,
+                _reset_envs(self.envs, 0, self.buffers, self.seeds(seed),
+                            options))
+
+    def step(self: Self, actions: Sequence[Sequence[float]], /) -> tuple:
+        """Step all environments, returning observations & outcomes."""
+        self._write_actions(actions)
+        return self._results(_step_envs(self.envs, 0, self.buffers))
+
+    def close(self: Self, /):
+        """Close environments."""
+        for env in self.envs:
+            env.close()
+
+
+def _worker(env_fns: Sequence[Callable[[], RobotEnv]], start: int,
+            raw: Sequence[Any], connection: Connection, /):
+    # serve commands for a slice of environments, over shared buffers
+    try:
+        envs: list[RobotEnv] = [env_fn() for env_fn in env_fns]
+        buffers: _Buffers = _views(raw)
+        connection.send((True, None))
+
+        while (message := connection.recv())[0] != 'close':
+            command, data = message
+            try:
+                connection.send((True,
+                                 _step_envs(envs, start, buffers)
+                                 if command == 'step'
+                                 else _reset_envs(envs, start, buffers,
+                                                  *data)))
+            except Exception:  # pylint: disable=broad-exception-caught
+                connection.send((False, traceback.format_exc()))
+
+    except Exception:  # pylint: disable=broad-exception-caught
+        connection.send((False, traceback.format_exc()))
+
+    finally:
+        connection.close()
+
+
+class AsyncVectorEnv(VectorEnv):
+    """Vector environment stepping slices of environments in processes.
+
+    Each worker process constructs & steps a contiguous slice of the
+    environments; actions & results are exchanged through the shared
+    memory buffers, and the pipes to workers only carry short commands &
+    infos. Workers are forked from this process where possible (so
+    environment functions need not be picklable), else spawned.
+    """
+
+    def __init__(self: Self, env_fns: Sequence[Callable[[], RobotEnv]], /,
+                 n_workers: Optional[int] = None,
+                 context: Optional[BaseContext] = None):
+        """Construct environments in worker processes."""
+        env_fns: list[Callable[[], RobotEnv]] = list(env_fns)
+        if context is None:
+            context: BaseContext = multiprocessing.get_context(
+                'fork' if hasattr(os, 'fork') else 'spawn')
+
+        # (sizes from one probe environment, to allocate shared buffers)
+        probe: RobotEnv = env_fns[0]()
+        super().__init__(len(env_fns), probe.observation_size,
+                         probe.action_size,
+                         allocate=context.RawArray)
+        probe.close()
+
+        n_workers: int = min(n_workers or os.cpu_count() or 1, self.num_envs)
+        bounds: list[int] = [self.num_envs * worker // n_workers
+                             for worker in range(n_workers + 1)]
+
+        self.connections: list[Connection] = []
+        self.processes: list[Any] = []
+        for start, stop in zip(bounds, bounds[1:]):
+            connection, child_connection = context.Pipe()
+            process: Any = context.Process(
+                target=_worker,
+                args=(env_fns[start:stop], start, self.raw, child_connection),
+                daemon=True)
+            process.start()
+            child_connection.close()
+            self.connections.append(connection)
+            self.processes.append(process)
+
+        self._receive()
+
+    def _receive(self: Self, /) -> dict:
+        infos: dict = {}
+        for connection in self.connections:
+            ok, worker_infos = connection.recv()
+            assert ok, RuntimeError(f'*** WORKER FAILED: {worker_infos} ***')
+            for key, value in (worker_infos or {}).items():
+                infos.setdefault(key, {}).update(value)
+        return infos
+
+    def reset(self: Self, /, seed: Optional[int | Sequence[int]] = None,
+              options: Optional[dict] = None) -> tuple[memoryview, dict]:
+        """Reset all environments, returning observations."""
+        for connection in self.connections:
+            connection.send(('reset', (self.seeds(seed), options)))
+        return self.observations, self._receive()
+
+    def step_async(self: Self, actions: Sequence[Sequence[float]], /):
+        """Start stepping all environments."""
+        self._write_actions(actions)
+        for connection in self.connections:
+            connection.send(('step', None))
+
+    def step_wait(self: Self, /) -> tuple:
+        """Wait for steps, returning observations & outcomes."""
+        return self._results(self._receive())
+
+    def step(self: Self, actions: Sequence[Sequence[float]], /) -> tuple:
+        """Step all environments, returning observations & outcomes."""
+        self.step_async(actions)
+        return self.step_wait()
+
+    def close(self: Self, /):
+        """Stop worker processes."""
+        for connection in self.connections:
+            try:
+                connection.send(('close', None))
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+        for process in self.processes:
+            process.join()
+        self.connections.clear()
+        self.processes.clear()
+
+
+@dataclass(frozen=True)
+class EnvThroughputStats:
+    """Environment steps per second of vector environments."""
+
+    n_envs: int
+    n_steps: int
+    sync_steps_per_second: float
+    async_steps_per_second: float
+
+    @property
+    def speedup(self: Self, /) -> float:
+        """Async over sync steps per second."""
+        return (self.async_steps_per_second / self.sync_steps_per_second
+                if self.sync_steps_per_second else 0.)
+
+
+def env_throughput_benchmark(env_fn: Callable[[], RobotEnv], /,
+                             n_envs: int = 8, n_steps: int = 100,
+                             n_workers: Optional[int] = None,
+                             action: Optional[Sequence[float]] = None) -> EnvThroughputStats:  # noqa: E501
+    """Benchmark env steps per second of synchronous & async stepping.
+
+    All environments repeat one action (by default, 50% on every axis).
+    """
+    results: list[float] = []
+    for vector_env in (lambda: SyncVectorEnv([env_fn] * n_envs),
+                       lambda: AsyncVectorEnv([env_fn] * n_envs,
+                                              n_workers=n_workers)):
+        with vector_env() as env:
+            actions: list[Sequence[float]] = \
+                [action or [50.] * env.action_size] * n_envs
+            env.reset(seed=0)
+            for _ in range(n_steps):
+                env.step(actions)
+            results.append(env.steps_per_second)
+
+    return EnvThroughputStats(n_envs=n_envs, n_steps=n_steps,
+                              sync_steps_per_second=results[0],
+                              async_steps_per_second=results[1])
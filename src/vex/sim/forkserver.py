@@ -0,0 +1,252 @@
+"""Fork-server: robot programs forked from a warm, pre-imported parent."""
+
+
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from importlib import import_module, reload
+import os
+import random
+from statistics import median
+import subprocess
+import sys
+from tempfile import mkdtemp
+from time import monotonic, perf_counter, sleep
+import traceback
+from typing import Any, LiteralString, Optional, Self
+
+from .._device import DEVICE_REGISTRY, Device
+from .._util.decor import set_sense_cache
+
+from .subinterpreter import ProgramRun
+
+
+__all__: Sequence[LiteralString] = ('ForkServer',
+                                    'register_reset_hook', 'reset_state',
+                                    'SpawnLatencyStats',
+                                    'spawn_latency_benchmark')
+
+
+# modules imported (& so warmed) by fork-server parents by default
+WARM_MODULES: tuple[str, ...] = ('vex', 'vex.sim', 'vexcode')
+
+
+def _clear_devices():
+    DEVICE_REGISTRY.clear()
+    if 'sense_source' in Device.__dict__:
+        del Device.sense_source
+    set_sense_cache(None)
+
+
+def _recreate_vexcode_devices():
+    # VEXcode's module-level devices (e.g. `drivetrain`) are constructed
+    # again, so that each program gets fresh ones registered on their ports
+    if (vexcode := sys.modules.get('vexcode')) is not None:
+        reload(vexcode)
+
+
+def _reseed_random():
+    # (forked children would otherwise all share the parent's RNG state)
+    random.seed()
+
+
+# hooks resetting library state in each forked child, in order
+RESET_HOOKS: list[Callable[[], Any]] = [_clear_devices,
+                                        _recreate_vexcode_devices,
+                                        _reseed_random]
+
+
+def register_reset_hook(hook: Callable[[], Any], /) -> Callable[[], Any]:
+    """Register hook resetting state in forked children (e.g. clocks).
+
+    Returns hook, so that this can be used as a decorator.
+    """
+    RESET_HOOKS.append(hook)
+    return hook
+
+
+def reset_state():
+    """Reset library state for a new program, running all reset hooks."""
+    for hook in RESET_HOOKS:
+        hook()
+
+
+class ForkServer:
+    """Warm parent process forking a clean child per robot program.
+
+    The parent imports the library once (and optionally runs a warm-up
+    program, e.g. to fill the motion profile cache); each program then
+    runs in a child forked from it, sharing the parent's imported modules
+    copy-on-write, after `reset_state()` has cleared device registries &
+    recreated module-level devices. Spawning a program then costs a fork
+    instead of an interpreter start-up & imports.
+
+    The parent should not start threads, as locks held by them at fork
+    time would stay held in children. POSIX only.
+    """
+
+    def __init__(self: Self, /,
+                 modules: Iterable[str] = WARM_MODULES,
+                 warmup: Optional[str] = None):
+        """Import modules & run warm-up source."""
+        assert hasattr(os, 'fork'), \
+            NotImplementedError('*** FORK NOT SUPPORTED ON THIS PLATFORM ***')
+
+        self.modules: tuple[str, ...] = tuple(modules)
+        for module in self.modules:
+            import_module(module)
+
+        if warmup is not None:
+            exec(compile(warmup, '<warmup>', 'exec'),  # pylint: disable=exec-used  # noqa: E501
+                 {'__name__': '__warmup__'})
+            reset_state()
+
+        # pid -> (program, error pipe's reading end, start time)
+        self.children: dict[int, tuple[int, int, float]] = {}
+        self.runs: dict[int, ProgramRun] = {}
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return (f'{type(self).__name__}({len(self.children)} running, '
+                f'{len(self.runs)} done)')
+
+    def start(self: Self, program: int, source: str, /,
+              filename: str = '<program>') -> int:
+        """Fork child running program's source, returning its pid."""
+        read_fd, write_fd = os.pipe()
+
+        # (so that children do not print parent's buffered output again)
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        start: float = perf_counter()
+
+        if not (pid := os.fork()):
+            # child: never returns into caller's code
+            os.close(read_fd)
+            status: int = 0
+            try:
+                reset_state()
+                exec(compile(source, filename, 'exec'),  # pylint: disable=exec-used  # noqa: E501
+                     {'__name__': '__main__'})
+            except SystemExit as exit_:
+                # (as the interpreter does: None is success, other
+                # non-integer codes are reported as the error, with exit
+                # status 1)
+                if exit_.code is None:
+                    status: int = 0
+                elif isinstance(exit_.code, int):
+                    status: int = exit_.code
+                else:
+                    os.write(write_fd, str(exit_.code).encode())
+                    status: int = 1
+            except BaseException:  # pylint: disable=broad-exception-caught
+                os.write(write_fd,
+                         traceback.format_exc().strip().splitlines()[-1]
+                         .encode())
+                status: int = 1
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(status)  # pylint: disable=protected-access
+
+        os.close(write_fd)
+        self.children[pid] = program, read_fd, start
+        return pid
+
+    def wait(self: Self, pid: int, /) -> ProgramRun:
+        """Wait for child to exit, returning its program's run."""
+        program, read_fd, start = self.children.pop(pid)
+
+        with os.fdopen(read_fd, 'rb') as errors:
+            error: str = errors.read().decode()
+        _, status = os.waitpid(pid, 0)
+
+        if (not error) and (code := os.waitstatus_to_exitcode(status)):
+            error: str = f'exit status {code}'
+
+        self.runs[program] = run = ProgramRun(program, perf_counter() - start,
+                                              error or None)
+        return run
+
+    def run(self: Self, program: int, source: str, /,
+            filename: str = '<program>') -> ProgramRun:
+        """Run program's source to completion in a forked child."""
+        return self.wait(self.start(program, source, filename=filename))
+
+    def join(self: Self, /) -> dict[int, ProgramRun]:
+        """Wait for all children, returning all programs' runs."""
+        for pid in tuple(self.children):
+            self.wait(pid)
+        return self.runs
+
+
+@dataclass(frozen=True)
+class SpawnLatencyStats:
+    """Seconds from spawning a program to its first instruction."""
+
+    n_spawns: int
+    fork_median: float
+    fork_max: float
+    fresh_median: float
+
+    @property
+    def speedup(self: Self, /) -> float:
+        """Fresh-interpreter over fork-server median latency."""
+        return self.fresh_median / self.fork_median if self.fork_median else 0.  # noqa: E501
+
+
+def _latency(spawn: Callable[[str], Any], imports: str, path: str, /) -> float:  # noqa: E501
+    # program importing library, then recording (system-wide monotonic)
+    # time of its first own instruction, into file at path
+    spawned_at: float = monotonic()
+    spawn(f'{imports}\n'
+          'from time import monotonic\n'
+          'started_at = monotonic()\n'
+          'import os\n'
+          f'with open({path + ".tmp"!r}, "w") as f:\n'
+          '    f.write(repr(started_at))\n'
+          f'os.replace({path + ".tmp"!r}, {path!r})\n')
+
+    while not os.path.exists(path):
+        sleep(1e-4)
+    with open(path, encoding='utf-8') as f:
+        latency: float = float(f.read()) - spawned_at
+    os.remove(path)
+    return latency
+
+
+def spawn_latency_benchmark(n_spawns: int = 10, /,
+                            modules: Iterable[str] = WARM_MODULES,
+                            n_fresh_spawns: Optional[int] = None) -> SpawnLatencyStats:  # noqa: E501
+    """Benchmark spawn-to-first-instruction latency of programs.
+
+    Compares programs forked from a fork server against programs each
+    started in a fresh interpreter, all importing the library modules
+    first (free for forked programs, whose parent already imported them).
+    """
+    modules: tuple[str, ...] = tuple(modules)
+    imports: str = '\n'.join(f'import {module}' for module in modules)
+    directory: str = mkdtemp(prefix='vex-spawn-')
+
+    server: ForkServer = ForkServer(modules=modules)
+    fork_latencies: list[float] = []
+    for i in range(n_spawns):
+        fork_latencies.append(_latency(
+            lambda source, i=i: server.start(i, source),
+            imports, os.path.join(directory, f'fork-{i}')))
+    server.join()
+
+    fresh_latencies: list[float] = []
+    for i in range(n_spawns if n_fresh_spawns is None else n_fresh_spawns):
+        # (run to completion: latency is still timed by the program itself)
+        fresh_latencies.append(_latency(
+            lambda source: subprocess.run((sys.executable, '-c', source),
+                                          check=True),
+            imports, os.path.join(directory, f'fresh-{i}')))
+
+    os.rmdir(directory)
+
+    return SpawnLatencyStats(n_spawns=n_spawns,
+                             fork_median=median(fork_latencies),
+                             fork_max=max(fork_latencies),
+                             fresh_median=median(fresh_latencies))
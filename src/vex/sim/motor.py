@@ -0,0 +1,381 @@
+"""Lumped electrical, thermal & efficiency model of simulated motors."""
+
+
+from array import array
+from collections.abc import Sequence
+from math import exp, pi
+from typing import Any, LiteralString, Optional, Self
+
+from ..motor import Motor
+from ..motor.gear import GearSetting, MAX_RPM
+from ..motor.state import (FREE_CURRENT_A, MAX_CURRENT_A, MAX_TORQUE_NM,
+                           MotorStates)
+from ..motor.profile import Move
+from ..motor.torque import TorqueUnits
+from .._common_enums.percent import PERCENT
+from .._common_enums.rotation import DEGREES
+from .._common_enums.temperature import TemperatureUnits
+
+from .._util.conversion import unit_table
+from .._util.decor import NO_READING
+
+from .collision import CollisionWorld
+
+
+__all__: Sequence[LiteralString] = ('MotorModel', 'EFFICIENCY_TABLES')
+
+
+# supply voltage, & winding resistance drawing stall current from it (Ohms)
+VOLTAGE: float = 7.2
+WINDING_RESISTANCE: float = VOLTAGE / MAX_CURRENT_A
+
+# load (fraction of stall torque) & heat (Watts) of internal friction of a
+# motor spinning at full speed
+FRICTION_LOAD: float = .05
+FRICTION_W: float = .5
+
+# ambient temperature (Celsius), thermal resistance to ambient air
+# (Celsius per Watt) & heat capacity (Joules per Celsius)
+AMBIENT_C: float = 25.
+THERMAL_RESISTANCE: float = 4.
+HEAT_CAPACITY: float = 40.
+
+# current limit (fraction of stall current) from each temperature (Celsius)
+# up, stepped down as motors heat up (as V5 motors' limits are), reaching
+# zero at shutdown temperature
+CURRENT_LIMITS: tuple[tuple[float, float], ...] = ((55., .5), (60., .25),
+                                                   (70., 0.))
+SHUTDOWN_C: float = CURRENT_LIMITS[-1][0]
+
+
+def _efficiency_table(gear_setting: Optional[GearSetting], /) -> array:
+    # efficiency (percent) at each whole percent of stall torque: output
+    # power torque * speed (falling linearly from free speed to stall) over
+    # input power voltage * current (rising linearly from free to stall)
+    max_power: float = (MAX_TORQUE_NM[gear_setting] *
+                        MAX_RPM[gear_setting] * pi / 30)
+    return array('d', [
+        100 * x * (1 - x) * max_power /
+        (VOLTAGE * (FREE_CURRENT_A + (MAX_CURRENT_A - FREE_CURRENT_A) * x))
+        for x in (load / 100 for load in range(101))])
+
+
+# efficiency (percent) by gear setting & load (whole percent of stall torque)
+EFFICIENCY_TABLES: dict[Optional[GearSetting], array] = {
+    gear_setting: _efficiency_table(gear_setting)
+    for gear_setting in MAX_TORQUE_NM}
+
+
+class MotorModel:
+    # pylint: disable=too-many-instance-attributes
+    """Speed, current, torque, efficiency & temperature of simulated motors.
+
+    Attached motors occupy slots of struct-of-arrays state, and `step(dt)`
+    updates it column by column: each quantity (drive, load, speed,
+    current, ...) is recomputed for all motors in one comprehension over
+    the parallel arrays, with per-motor conditions (e.g. stalled, move
+    active) as conditional expressions. Each motor is a DC motor driven at a
+    fraction of full voltage (its active `spin_for` move's velocity, else
+    its commanded velocity): torque falls linearly from stall torque at
+    standstill to zero at free speed (back-EMF), so a load (internal
+    friction plus any external load, in fractions of stall torque) slows
+    it down, and a robot's drive blocked in the collision world holds its
+    motors back. Delivered torque is clamped by the motor's max torque &
+    max torque current settings & its temperature-dependent current limit;
+    a motor whose load exceeds that clamp stalls. Current rises linearly
+    with torque from free-running to stall current, and efficiency is
+    looked up from precomputed per-gear-setting tables.
+
+    Moves progress at modeled speed: one not reaching its distance within
+    the motor's timeout (see `Motor.set_timeout`) stops & is reported as
+    timed out. Attached motors' mailboxes are marked as tracked, so that
+    group commands can wait for their moves to complete.
+
+    Each motor is one lumped thermal mass: heated by its winding's I^2 R
+    loss plus friction, cooled by convection to ambient air. The exact
+    exponential solution over each step keeps long steps stable, so long
+    endurance simulations can use coarse time steps. Motors' encoders
+    (their set positions) turn at modeled speeds.
+
+    Attached as motors' sense source, this answers `position()`,
+    `rotation()`, `velocity()`, `is_spinning()`, `is_done()`,
+    `did_timeout()`, `current()`, `torque()`, `efficiency()` &
+    `temperature()`, passing other readings on to the motor's previous
+    sense source (e.g. a collision world).
+    """
+
+    def __init__(self: Self, /,
+                 world: Optional[CollisionWorld] = None,
+                 ambient: float = AMBIENT_C):
+        """Initialize Motor Model without motors."""
+        self.world: Optional[CollisionWorld] = world
+        self.ambient: float = ambient
+        self.time: float = 0.
+
+        self.motors: list[Motor] = []
+        self._indices: dict[int, int] = {}
+        self._fallbacks: list[Any] = []
+
+        # struct-of-arrays slots: motor settings' storage & slot, robot
+        # body loading it (-1 if none), gear-dependent constants & state
+        self.states: list[MotorStates] = []
+        self.slots: array = array('l')
+        self.bodies: array = array('l')
+        self.stall_torque: array = array('d')
+        self.tables: list[array] = []
+
+        self.free_speed: array = array('d')
+        self.external: array = array('d')
+
+        self.direction: array = array('b')
+        self.speed: array = array('d')
+        self.load: array = array('d')
+        self.current: array = array('d')
+        self.torque: array = array('d')
+        self.efficiency: array = array('d')
+        self.temperature: array = array('d')
+
+        # moves (see Motor.spin_for) being tracked: whether still active,
+        # distance covered (degrees), time taken & whether timed out
+        self.moves: list[Optional[Move]] = []
+        self.move_active: array = array('B')
+        self.move_progress: array = array('d')
+        self.move_time: array = array('d')
+        self.timed_out: array = array('B')
+
+    def __len__(self: Self, /) -> int:
+        """Return number of attached motors."""
+        return len(self.motors)
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return (f'{type(self).__name__}({len(self)} motors, '
+                f'max {max(self.temperature, default=self.ambient):.1f}C)')
+
+    def attach(self: Self, motors: Any, /, body: Optional[int] = None):
+        """Model motor, or drive train's/motor group's motors.
+
+        Motors on a robot body are loaded by that body's blocked drive.
+        """
+        for motor in ((motors,) if isinstance(motors, Motor)
+                      else motors.engine.motors):
+            self._indices[id(motor)] = len(self.motors)
+            self.motors.append(motor)
+            self._fallbacks.append(getattr(motor, 'sense_source', None))
+
+            self.states.append(motor.states)
+            self.slots.append(motor.slot)
+            self.bodies.append(-1 if body is None else body)
+            self.stall_torque.append(MAX_TORQUE_NM[motor.gear_setting])
+            self.tables.append(EFFICIENCY_TABLES[motor.gear_setting])
+            # free speed, in degrees per second
+            self.free_speed.append(MAX_RPM[motor.gear_setting] * 6)
+
+            for values in (self.external, self.direction, self.speed,
+                           self.load, self.current, self.torque,
+                           self.efficiency,
+                           self.move_active, self.move_progress,
+                           self.move_time, self.timed_out):
+                values.append(0)
+            self.temperature.append(self.ambient)
+            self.moves.append(None)
+
+            motor.sense_source = self
+            motor.mailbox.tracked = True
+
+    def current_limit(self: Self, temperature: float, /) -> float:
+        """Return current limit (fraction of stall) at temperature."""
+        limit: float = 1.
+        for threshold, threshold_limit in CURRENT_LIMITS:
+            if temperature < threshold:
+                break
+            limit: float = threshold_limit
+        return limit
+
+    def set_load(self: Self, motor: Motor, torque: float, /,
+                 unit: TorqueUnits = TorqueUnits.NM):
+        """Set external load torque (e.g. of an arm's weight) on motor."""
+        index: int = self._indices[id(motor)]
+        self.external[index] = (
+            unit_table(TorqueUnits).convert(torque, unit, TorqueUnits.NM) /
+            self.stall_torque[index])
+
+    def step(self: Self, dt: float, /) -> float:
+        # pylint: disable=protected-access,too-many-locals
+        """Advance all motors by dt seconds, returning total current."""
+        motors: list[Motor] = self.motors
+        blocked: Optional[array] = (None if self.world is None
+                                    else self.world.blocked)
+
+        # motors regrouped into new storage, & moves started, since last step
+        for index, motor in enumerate(motors):
+            if motor.states is not self.states[index]:
+                self.states[index], self.slots[index] = (motor.states,
+                                                         motor.slot)
+
+            if motor.motion is not self.moves[index]:
+                self.moves[index] = motor.motion
+                self.move_active[index] = motor.motion is not None
+                self.move_progress[index] = self.move_time[index] = 0.
+                self.timed_out[index] = False
+
+        # signed voltage fractions: of active moves' velocities, else of
+        # commanded velocities
+        voltages: list[float] = [
+            ((move.sign * move.profile.velocity) if active
+             else states.command[slot]) / 100
+            for move, active, states, slot in zip(self.moves,
+                                                  self.move_active,
+                                                  self.states, self.slots)]
+        self.direction = array('b', [(voltage > 0) - (voltage < 0)
+                                     for voltage in voltages])
+        drives: list[float] = [min(abs(voltage), 1.) for voltage in voltages]
+
+        # torque caps (fractions of stall torque): max torque setting, max
+        # torque current setting & temperature-dependent current limit
+        caps: list[float] = [
+            min(states.max_torque[slot] / 100,
+                1. if motor.max_torque_current is None
+                else max(motor.max_torque_current - FREE_CURRENT_A * drive,
+                         0.) / (MAX_CURRENT_A - FREE_CURRENT_A),
+                self.current_limit(temp))
+            for motor, states, slot, drive, temp in zip(
+                motors, self.states, self.slots, drives, self.temperature)]
+
+        # DC motor: torque falls linearly from stall (at drive voltage) to
+        # zero at free speed, so speed under a load is drive minus load;
+        # blocked robots' motors are further held back kinematically
+        loads: list[float] = [FRICTION_LOAD * drive + external if drive else 0.
+                              for drive, external in zip(drives,
+                                                         self.external)]
+        speeds: list[float] = [
+            min(max(drive - load, 0.),
+                drive * (1 - (blocked[body] if (body >= 0) and (blocked is not None)  # noqa: E501
+                              else 0.)))
+            for drive, load, body in zip(drives, loads, self.bodies)]
+
+        # masks of motors whose load exceeds their torque cap: they stall
+        stalled: list[bool] = [load > cap for load, cap in zip(loads, caps)]
+        self.speed = array('d', [0. if stall else speed
+                                 for speed, stall in zip(speeds, stalled)])
+        # motors' encoders (set positions) turn at modeled speeds
+        for states, slot, direction, speed, free_speed in zip(
+                self.states, self.slots, self.direction, self.speed,
+                self.free_speed):
+            if speed:
+                states.position[slot] += direction * speed * free_speed * dt
+
+        self.load = array('d', [min(drive - speed, cap)
+                                for drive, speed, cap in zip(drives, speeds,
+                                                             caps)])
+
+        self.current = array('d', [
+            (FREE_CURRENT_A * drive +
+             (MAX_CURRENT_A - FREE_CURRENT_A) * load) if drive else 0.
+            for drive, load in zip(drives, self.load)])
+        self.torque = array('d', [load * stall_torque
+                                  for load, stall_torque
+                                  in zip(self.load, self.stall_torque)])
+        self.efficiency = array('d', [table[round(load * 100)]
+                                      for table, load
+                                      in zip(self.tables, self.load)])
+
+        # exact first-order approach to steady-state temperature
+        decay: float = 1 - exp(-dt / (THERMAL_RESISTANCE * HEAT_CAPACITY))
+        self.temperature = array('d', [
+            temp + (self.ambient + THERMAL_RESISTANCE *
+                    (current * current * WINDING_RESISTANCE +
+                     FRICTION_W * speed) - temp) * decay
+            for temp, current, speed in zip(self.temperature, self.current,
+                                            self.speed)])
+
+        # active moves progress at modeled speeds, completing on reaching
+        # their distance, or timing out (& stopping) past motors' timeouts
+        self.move_progress = array('d', [
+            progress + speed * free_speed * dt if active else progress
+            for progress, speed, free_speed, active in zip(
+                self.move_progress, self.speed, self.free_speed,
+                self.move_active)])
+        self.move_time = array('d', [time + dt if active else time
+                                     for time, active in zip(self.move_time,
+                                                             self.move_active)])  # noqa: E501
+        done: list[bool] = [
+            active and (progress >= move.profile.distance)
+            for active, progress, move in zip(self.move_active,
+                                              self.move_progress, self.moves)]
+        timeouts: list[Optional[float]] = [
+            None if motor._timeout is None else motor.timeout()
+            for motor in motors]
+        timed_out: list[bool] = [
+            active and not finished and (timeout is not None) and
+            (time >= timeout)
+            for active, finished, time, timeout in zip(
+                self.move_active, done, self.move_time, timeouts)]
+
+        self.move_active = array('B', [
+            active and not (finished or timeout)
+            for active, finished, timeout in zip(self.move_active, done,
+                                                 timed_out)])
+        self.timed_out = array('B', [previous or timeout
+                                     for previous, timeout
+                                     in zip(self.timed_out, timed_out)])
+
+        # complete finished moves' commands (unless already preempted)
+        for index in [index for index, (finished, timeout)
+                      in enumerate(zip(done, timed_out))
+                      if finished or timeout]:
+            if ((command := motors[index].mailbox.latest) is not None) and \
+                    (command.motion is self.moves[index]):
+                command.complete(timed_out=timed_out[index])
+
+        self.time += dt
+        return sum(self.current)
+
+    def read(self: Self, device: Any, method_name: str, args: tuple, /) -> Any:  # noqa: E501
+        # pylint: disable=too-many-return-statements
+        """Return modeled reading of attached motor."""
+        if (index := self._indices.get(id(device))) is None:
+            return NO_READING
+
+        if method_name == 'current':
+            return self.current[index]
+
+        if method_name == 'torque':
+            return unit_table(TorqueUnits).convert(
+                self.torque[index],
+                TorqueUnits.NM, args[0] if args else TorqueUnits.NM)
+
+        if method_name in ('position', 'rotation'):
+            return device.rotation_units.convert(
+                self.states[index].position[self.slots[index]],
+                DEGREES, args[0] if args else DEGREES)
+
+        if method_name == 'velocity':
+            return device.velocity_units.convert(
+                self.direction[index] * self.speed[index] * 100,
+                PERCENT, args[0] if args else PERCENT)
+
+        if method_name == 'is_spinning':
+            return bool(self.speed[index])
+
+        if method_name == 'is_done':
+            return not self.move_active[index]
+
+        if method_name == 'did_timeout':
+            return bool(self.timed_out[index])
+
+        if method_name == 'efficiency':
+            return self.efficiency[index]
+
+        if method_name == 'temperature':
+            unit: TemperatureUnits = (args[0] if args
+                                      else TemperatureUnits.CELSIUS)
+            if unit is TemperatureUnits.PCT:
+                return ((self.temperature[index] - self.ambient) /
+                        (SHUTDOWN_C - self.ambient) * 100)
+            return unit_table(TemperatureUnits).convert(
+                self.temperature[index], TemperatureUnits.CELSIUS, unit)
+
+        if (fallback := self._fallbacks[index]) is not None:
+            return fallback.read(device, method_name, args)
+        return NO_READING
@@ -0,0 +1,194 @@
+"""Robot programs run each in an isolated sub-interpreter."""
+
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+import subprocess
+import sys
+from threading import Thread
+from time import perf_counter
+from types import ModuleType
+from typing import Any, LiteralString, Optional, Self
+
+from .bridge import DeviceBridge
+
+
+__all__: Sequence[LiteralString] = ('SubinterpreterRunner', 'ProgramRun',
+                                    'subinterpreters_available')
+
+
+def _interpreters_module() -> Optional[ModuleType]:
+    # public module from 3.14, private ones on 3.13 & 3.12
+    for name in ('concurrent.interpreters', '_interpreters',
+                 '_xxsubinterpreters'):
+        try:
+            return __import__(name, fromlist=('create',))
+        except ImportError:
+            continue
+    return None
+
+
+_INTERPRETERS: Optional[ModuleType] = _interpreters_module()
+
+
+def subinterpreters_available() -> bool:
+    """Check whether this Python can run sub-interpreters."""
+    return _INTERPRETERS is not None
+
+
+# script run in each isolated interpreter: attach to bridge, run program
+# with its devices published to & answered from program's table
+_BOOTSTRAP: str = '''
+import sys
+sys.path[:0] = [path for path in {sys_path!r} if path not in sys.path]
+
+from vex.sim.bridge import DeviceBridge
+
+bridge = DeviceBridge.attach({bridge_path!r}, {n_programs!r})
+endpoint = bridge.endpoint({program!r})
+endpoint.start()
+# (program's globals kept until final publish, as they hold its devices)
+program_globals = {{'__name__': '__main__'}}
+try:
+    exec(compile({source!r}, {filename!r}, 'exec'), program_globals)
+finally:
+    endpoint.stop()
+    del endpoint
+    bridge.close()
+'''
+
+
+@dataclass(frozen=True)
+class ProgramRun:
+    """Outcome of one program's run."""
+
+    program: int
+    seconds: float
+    error: Optional[str]
+
+    @property
+    def ok(self: Self, /) -> bool:
+        """Whether program ran to completion."""
+        return self.error is None
+
+
+class SubinterpreterRunner:
+    """Runs robot programs each in its own interpreter, sharing a bridge.
+
+    Each program runs in a fresh sub-interpreter with its own GIL (on
+    3.12+), so that module singletons (`Brain()`, `vexcode.drivetrain`,
+    the device registry, ...) are never shared between programs, at a
+    fraction of a process's memory & start-up time. Module objects cannot
+    be shared across interpreters with their own GILs, so each imports
+    `vex` afresh, from the bytecode cached on disk by the first.
+
+    Programs' device states are reachable by the simulation core through
+    the runner's shared-memory `bridge`, one table per program.
+
+    Where sub-interpreters are not available (before 3.12), or if
+    `processes` is set, each program runs in a subprocess instead, with the
+    same bridge & isolation.
+    """
+
+    def __init__(self: Self, n_programs: int = 1, /,
+                 processes: bool = False):
+        """Initialize Runner (with bridge) for number of programs."""
+        self.bridge: DeviceBridge = DeviceBridge(n_programs)
+        self.processes: bool = processes or not subinterpreters_available()
+        self.runs: list[Optional[ProgramRun]] = [None] * n_programs
+        self._threads: list[Thread] = []
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return (f'{type(self).__name__}({self.bridge.n_programs} programs, '
+                f"{'processes' if self.processes else 'sub-interpreters'})")
+
+    def __enter__(self: Self, /) -> Self:
+        """Enter context."""
+        return self
+
+    def __exit__(self: Self, *exc_info: Any):
+        """Wait for programs, then remove bridge."""
+        self.join()
+        self.bridge.close()
+
+    def script(self: Self, program: int, source: str, /,
+               filename: str = '<program>') -> str:
+        """Return script running program's source in an interpreter."""
+        return _BOOTSTRAP.format(sys_path=sys.path,
+                                 bridge_path=self.bridge.path,
+                                 n_programs=self.bridge.n_programs,
+                                 program=program, source=source,
+                                 filename=filename)
+
+    def _run_in_subinterpreter(self: Self, script: str, /) -> Optional[str]:
+        interpreters: ModuleType = _INTERPRETERS
+
+        # concurrent.interpreters (3.14+)
+        if hasattr(interpreters, 'Interpreter'):
+            interpreter: Any = interpreters.create()
+            try:
+                interpreter.exec(script)
+            except interpreters.ExecutionFailed as error:
+                return str(error)
+            finally:
+                interpreter.close()
+            return None
+
+        # _interpreters (3.13) returns failures, _xxsubinterpreters (3.12)
+        # raises them
+        legacy: bool = interpreters.__name__ == '_xxsubinterpreters'
+        interpreter_id: Any = (interpreters.create(isolated=True) if legacy
+                               else interpreters.create())
+        try:
+            if legacy:
+                interpreters.run_string(interpreter_id, script)
+                return None
+            failure: Any = interpreters.exec(interpreter_id, script)
+            return None if failure is None else str(failure)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            return str(error)
+        finally:
+            interpreters.destroy(interpreter_id)
+
+    @staticmethod
+    def _run_in_process(script: str, /) -> Optional[str]:
+        completed: subprocess.CompletedProcess = subprocess.run(
+            (sys.executable, '-c', script),
+            capture_output=True, text=True, check=False)
+        if not completed.returncode:
+            return None
+
+        # (last line of traceback, if any was printed)
+        lines: list[str] = completed.stderr.strip().splitlines()
+        return lines[-1] if lines else f'exit status {completed.returncode}'
+
+    def run(self: Self, program: int, source: str, /,
+            filename: str = '<program>') -> ProgramRun:
+        """Run program's source to completion in a new interpreter."""
+        script: str = self.script(program, source, filename=filename)
+
+        start: float = perf_counter()
+        error: Optional[str] = (self._run_in_process(script)
+                                if self.processes
+                                else self._run_in_subinterpreter(script))
+        self.runs[program] = run = ProgramRun(program,
+                                              perf_counter() - start, error)
+        return run
+
+    def start(self: Self, program: int, source: str, /,
+              filename: str = '<program>') -> Thread:
+        """Start running program's source in a new interpreter."""
+        thread: Thread = Thread(group=None, target=self.run, name=None,
+                                args=(program, source),
+                                kwargs={'filename': filename}, daemon=True)
+        self._threads.append(thread)
+        thread.start()
+        return thread
+
+    def join(self: Self, /) -> list[Optional[ProgramRun]]:
+        """Wait for started programs, returning all programs' runs."""
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+        return self.runs
@@ -6,14 +6,20 @@ from typing import LiteralString, overload
 
 from abm.decor import act
 
+from .scheduler import (Histogram, LoopStats, PeriodicTask, Scheduler,
+                        VirtualClock)
 from .timer import Timer
 from .units import TimeUnits, SECONDS, MSEC
+from .wheel import TimerWheel
 
 from .._util.doc import robotmesh_doc, vexcode_doc
 from .._util.type import Num
 
 
 __all__: Sequence[LiteralString] = ('Timer',
+                                    'Scheduler', 'PeriodicTask',
+                                    'VirtualClock', 'LoopStats', 'Histogram',
+                                    'TimerWheel',
                                     'TimeUnits', 'SECONDS', 'MSEC',
                                     'clock', 'wait')
 
@@ -0,0 +1,326 @@
+"""Fixed-rate periodic-task scheduler on a real or virtual clock."""
+
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Callable, Sequence
+from heapq import heappop, heappush
+from itertools import count
+from math import sqrt
+from threading import Event, Thread
+from time import monotonic
+from typing import Any, LiteralString, Optional, Self
+
+from .._util.type import Num
+
+
+__all__: Sequence[LiteralString] = ('Histogram',
+                                    'LoopStats',
+                                    'PeriodicTask',
+                                    'Scheduler',
+                                    'VirtualClock')
+
+
+# default histogram bin edges (seconds): 0, then 10us doubling up to ~1.3s
+DEFAULT_EDGES: tuple[float, ...] = (0.,) + tuple(1e-5 * 2 ** k
+                                                 for k in range(18))
+
+
+class Histogram:
+    """Fixed-bin histogram of non-negative durations.
+
+    Bin `i` counts values in [edges[i], edges[i + 1]), with the last bin
+    open-ended, so recording a value is one bisection & one increment.
+    """
+
+    def __init__(self: Self, edges: Sequence[float] = DEFAULT_EDGES, /):
+        """Initialize empty Histogram."""
+        assert list(edges) == sorted(edges), \
+            ValueError(f'*** edges {edges} NOT SORTED ***')
+
+        self.edges: array = array('d', edges)
+        self.counts: array = array('Q', bytes(8 * len(edges)))
+
+    def __len__(self: Self, /) -> int:
+        """Return number of recorded values."""
+        return sum(self.counts)
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return (f'{type(self).__name__}({len(self)} values, '
+                f'p50<={self.percentile(50)}, p99<={self.percentile(99)})')
+
+    def record(self: Self, value: float, /):
+        """Count value in its bin."""
+        self.counts[max(bisect_right(self.edges, value) - 1, 0)] += 1
+
+    def percentile(self: Self, percent: Num, /) -> float:
+        """Return upper edge of bin holding specified percentile.
+
+        Returns infinity if that bin is the open-ended last one.
+        """
+        if not (n_values := len(self)):
+            return 0.
+
+        rank: float = n_values * percent / 100
+        cumulative_count: int = 0
+        for i, bin_count in enumerate(self.counts):
+            if (cumulative_count := cumulative_count + bin_count) >= rank:
+                return (self.edges[i + 1] if i + 1 < len(self.edges)
+                        else float('inf'))
+        return float('inf')
+
+    def clear(self: Self, /):
+        """Forget all recorded values."""
+        self.counts: array = array('Q', bytes(8 * len(self.edges)))
+
+
+class LoopStats:
+    """Achieved tick rate, latency & jitter of a fixed-rate loop.
+
+    Latency is how late each tick starts relative to its deadline, and
+    jitter is how far each interval between tick starts is off the period.
+    Both are accumulated as running sums & histograms, so updating costs
+    O(1). Overruns (ticks still running at the next tick's deadline) are
+    counted by whoever runs the loop, e.g. a Scheduler's PeriodicTask.
+    """
+
+    def __init__(self: Self, period: float, /):
+        """Initialize Loop Stats."""
+        self.period: float = period
+
+        self.n_ticks: int = 0
+        self.n_overruns: int = 0
+        self.first_time: Optional[float] = None
+        self.last_time: Optional[float] = None
+
+        self.latency: Histogram = Histogram()
+        self.max_latency: float = 0.
+        self._latency_sum: float = 0.
+
+        self.jitter: Histogram = Histogram()
+        self.max_jitter: float = 0.
+        self._jitter_sum: float = 0.
+        self._jitter_sq_sum: float = 0.
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return (f'{type(self).__name__}({self.n_ticks} ticks, '
+                f'{self.rate:.1f}/s, jitter {self.mean_jitter * 1e3:.3f}ms)')
+
+    def record(self: Self, scheduled_time: float, time: float, /):
+        """Record tick started at time, scheduled for scheduled_time."""
+        latency: float = max(time - scheduled_time, 0.)
+        self.latency.record(latency)
+        self._latency_sum += latency
+        self.max_latency: float = max(self.max_latency, latency)
+
+        if self.last_time is None:
+            self.first_time: float = time
+        else:
+            jitter: float = abs(time - self.last_time - self.period)
+            self.jitter.record(jitter)
+            self._jitter_sum += jitter
+            self._jitter_sq_sum += jitter * jitter
+            self.max_jitter: float = max(self.max_jitter, jitter)
+
+        self.n_ticks += 1
+        self.last_time: float = time
+
+    @property
+    def rate(self: Self, /) -> float:
+        """Achieved ticks per second."""
+        if self.n_ticks < 2:
+            return 0.
+        return (self.n_ticks - 1) / (self.last_time - self.first_time)
+
+    @property
+    def mean_latency(self: Self, /) -> float:
+        """Mean delay of tick starts after deadlines (seconds)."""
+        return self._latency_sum / self.n_ticks if self.n_ticks else 0.
+
+    @property
+    def mean_jitter(self: Self, /) -> float:
+        """Mean absolute deviation of tick intervals from period (seconds)."""
+        return (self._jitter_sum / (self.n_ticks - 1) if self.n_ticks > 1
+                else 0.)
+
+    @property
+    def rms_jitter(self: Self, /) -> float:
+        """Root-mean-square deviation of tick intervals from period (s)."""
+        return (sqrt(self._jitter_sq_sum / (self.n_ticks - 1))
+                if self.n_ticks > 1
+                else 0.)
+
+
+class VirtualClock:
+    """Manually-advanced clock, for deterministic simulation & testing.
+
+    Calling it returns the current virtual time; `sleep(...)` advances
+    virtual time instantly instead of blocking.
+    """
+
+    def __init__(self: Self, time: float = 0., /):
+        """Initialize Virtual Clock."""
+        self.time: float = time
+
+    def __call__(self: Self, /) -> float:
+        """Return current virtual time (seconds)."""
+        return self.time
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return f'{type(self).__name__}({self.time})'
+
+    def sleep(self: Self, duration: float, /):
+        """Advance virtual time by duration (seconds)."""
+        self.time += max(duration, 0.)
+
+    advance = sleep
+
+
+class PeriodicTask:
+    """Callback run by a Scheduler against absolute, fixed-rate deadlines."""
+
+    def __init__(self: Self, callback: Callable[[], Any], rate: Num,
+                 deadline: float, /, name: Optional[str] = None):
+        """Initialize Periodic Task."""
+        assert rate > 0, ValueError(f'*** rate {rate} NOT POSITIVE ***')
+
+        self.callback: Callable[[], Any] = callback
+        self.rate: Num = rate
+        self.period: float = 1 / rate
+        self.name: str = (getattr(callback, '__qualname__', repr(callback))
+                          if name is None
+                          else name)
+
+        # deadlines are origin + k * period, computed afresh (not summed)
+        # so that floating-point error does not accumulate into drift
+        self.origin: float = deadline
+        self.n_periods: int = 0
+        self.deadline: float = deadline
+        self.n_skipped: int = 0
+        self.stats: LoopStats = LoopStats(self.period)
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return f'{type(self).__name__}({self.name} @ {self.rate}/s)'
+
+    def run(self: Self, time: float, clock: Callable[[], float], /):
+        """Run callback & schedule next deadline.
+
+        Deadlines stay on the original fixed-rate grid. A run still going
+        at the next deadline is an overrun, after which the next run starts
+        immediately (late); deadlines a whole period or more in the past
+        are skipped (counted in `n_skipped`) instead of being run
+        back-to-back to catch up.
+        """
+        self.stats.record(self.deadline, time)
+        self.callback()
+
+        self.n_periods += 1
+        self.deadline: float = self.origin + self.n_periods * self.period
+        if (lateness := clock() - self.deadline) > 0:
+            self.stats.n_overruns += 1
+
+            if (n_missed := int(lateness // self.period)) > 0:
+                self.n_periods += n_missed
+                self.deadline: float = (self.origin +
+                                        self.n_periods * self.period)
+                self.n_skipped += n_missed
+
+
+class Scheduler:
+    """Run periodic tasks at fixed rates against absolute deadlines.
+
+    Unlike `while True: ...; wait(20, MSEC)` loops, whose sleeps are
+    relative to the end of each iteration and so accumulate drift, each
+    task's deadlines are `start + k * period`, so a 50 Hz task stays at
+    50 Hz however long (up to the period) each run takes. Runs on the real
+    monotonic clock by default, or on a VirtualClock for simulation, in
+    the caller's thread through `run(...)` or in the background through
+    `start()`.
+    """
+
+    def __init__(self: Self, /,
+                 clock: Callable[[], float] = monotonic,
+                 sleep: Optional[Callable[[float], Any]] = None):
+        """Initialize Scheduler."""
+        self.clock: Callable[[], float] = clock
+
+        self._stop_running: Event = Event()
+        self.sleep: Callable[[float], Any] = (
+            sleep if sleep is not None
+            else getattr(clock, 'sleep', self._stop_running.wait))
+
+        self.tasks: list[PeriodicTask] = []
+        self._queue: list[tuple[float, int, PeriodicTask]] = []
+        self._sequence: count = count()
+        self._runner: Optional[Thread] = None
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return f'{type(self).__name__}({self.tasks})'
+
+    def add(self: Self, callback: Callable[[], Any], rate: Num, /,
+            name: Optional[str] = None) -> PeriodicTask:
+        """Register callback to run at rate (per second), starting now."""
+        task: PeriodicTask = PeriodicTask(callback, rate, self.clock(),
+                                          name=name)
+        self.tasks.append(task)
+        heappush(self._queue, (task.deadline, next(self._sequence), task))
+        return task
+
+    def remove(self: Self, task: PeriodicTask, /):
+        """Unregister task."""
+        self.tasks.remove(task)
+        self._queue: list[tuple[float, int, PeriodicTask]] = [
+            entry for entry in self._queue if entry[2] is not task]
+
+    def run_pending(self: Self, /) -> int:
+        """Run all tasks whose deadlines have passed, returning how many."""
+        n_run: int = 0
+        while self._queue and (self._queue[0][0] <= (now := self.clock())):
+            _, _, task = heappop(self._queue)
+            task.run(now, self.clock)
+            heappush(self._queue, (task.deadline, next(self._sequence), task))
+            n_run += 1
+        return n_run
+
+    def run(self: Self, duration: Optional[Num] = None, /):
+        """Run tasks for duration (seconds), or until stopped."""
+        self._stop_running.clear()
+        self._run(duration)
+
+    def _run(self: Self, duration: Optional[Num] = None, /):
+        end_time: float = (float('inf') if duration is None
+                           else self.clock() + duration)
+
+        while self._queue and not self._stop_running.is_set():
+            if (deadline := self._queue[0][0]) > end_time:
+                self.sleep(end_time - self.clock())
+                return
+
+            if (delay := deadline - self.clock()) > 0:
+                self.sleep(delay)
+
+            self.run_pending()
+
+    def start(self: Self, /):
+        """Start running tasks in background."""
+        if self._runner is not None:
+            return
+
+        self._stop_running.clear()
+        self._runner: Thread = Thread(group=None, target=self._run,
+                                      name=None, args=(), kwargs={},
+                                      daemon=True)
+        self._runner.start()
+
+    def stop(self: Self, /):
+        """Stop running tasks."""
+        self._stop_running.set()
+
+        if self._runner is not None:
+            self._runner.join()
+            self._runner: Optional[Thread] = None
@@ -3,8 +3,10 @@
 
 from collections.abc import Sequence
 from enum import IntEnum
+from fractions import Fraction
 from typing import LiteralString
 
+from .._util.conversion import define_units
 from .._util.doc import robotmesh_doc
 from .._util.measurement_with_unit import _MeasurementWithUnitABC
 
@@ -35,3 +37,7 @@ MSEC: TimeUnits = TimeUnits.MSEC
 
 class _Time(_MeasurementWithUnitABC):  # pylint: disable=too-few-public-methods
     unit: TimeUnits = SECONDS
+
+
+# sizes in seconds
+define_units(TimeUnits, {SECONDS: 1, MSEC: Fraction(1, 1000)})
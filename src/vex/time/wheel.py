@@ -0,0 +1,159 @@
+"""Hierarchical timer wheel of one-shot timers on a tick clock."""
+
+
+from collections.abc import Callable, Sequence
+from math import ceil, floor
+from typing import Any, LiteralString, Self
+
+
+__all__: Sequence[LiteralString] = ('TimerWheel',)
+
+
+class WheelTimer:  # pylint: disable=too-few-public-methods
+    """One-shot timer: callback(*args) due at a tick."""
+
+    __slots__: tuple[str, ...] = ('tick', 'callback', 'args', 'cancelled')
+
+    def __init__(self: Self, tick: int, callback: Callable[..., Any],
+                 args: tuple, /):
+        """Initialize Wheel Timer."""
+        self.tick: int = tick
+        self.callback: Callable[..., Any] = callback
+        self.args: tuple = args
+        self.cancelled: bool = False
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return f'{type(self).__name__}(@{self.tick}: {self.callback})'
+
+
+class TimerWheel:
+    """One-shot timers bucketed by due tick into nested wheels of slots.
+
+    Level 0 has one slot per tick for the next `2 ** bits[0]` ticks; each
+    higher level has slots each spanning a whole lap of the level below.
+    Scheduling & cancelling are O(1); when a level's lap completes, the
+    next slot of the level above is cascaded down, so that each timer is
+    moved at most once per level before it fires. Advancing over ticks
+    without any timers is skipped.
+
+    Time (seconds) maps to ticks of `resolution` seconds; timers fire in
+    due-tick order, in the caller's thread, through `advance_to(...)`.
+    """
+
+    def __init__(self: Self, /,
+                 resolution: float = .001,
+                 bits: Sequence[int] = (8, 6, 6, 6)):
+        """Initialize empty Timer Wheel."""
+        assert resolution > 0, \
+            ValueError(f'*** resolution {resolution} NOT POSITIVE ***')
+
+        self.resolution: float = resolution
+
+        self._shifts: list[int] = []
+        shift: int = 0
+        for n_bits in bits:
+            self._shifts.append(shift)
+            shift += n_bits
+        self._masks: list[int] = [(1 << n_bits) - 1 for n_bits in bits]
+        self._horizon: int = 1 << shift
+
+        self.levels: list[list[list[WheelTimer]]] = [
+            [[] for _ in range(1 << n_bits)] for n_bits in bits]
+
+        self.now: int = 0
+        self.n_timers: int = 0
+        self.n_fired: int = 0
+
+    def __len__(self: Self, /) -> int:
+        """Return number of pending timers."""
+        return self.n_timers
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return (f'{type(self).__name__}({self.n_timers} timers '
+                f'@ {self.now * self.resolution:.3f}s)')
+
+    def to_tick(self: Self, time: float, /) -> int:
+        """Return tick at or after time (seconds)."""
+        # (with tolerance for rounding of time / resolution)
+        return ceil(time / self.resolution - 1e-6)
+
+    def _place(self: Self, timer: WheelTimer, /):
+        # level k holds timers due within a lap of level k + 1's slot,
+        # in the slot of their due tick (slots come up a lap after the
+        # current one, so timers due a whole top-level lap away or more
+        # park in the top level's slot just before the current one)
+        delta: int = timer.tick - self.now
+        top: int = len(self.levels) - 1
+
+        if delta >= self._horizon:
+            level: int = top
+            index: int = ((self.now >> self._shifts[top]) - 1) & \
+                self._masks[top]
+        else:
+            level: int = 0
+            while (level < top) and (delta >> self._shifts[level + 1]):
+                level += 1
+            index: int = ((timer.tick >> self._shifts[level]) &
+                          self._masks[level])
+
+        self.levels[level][index].append(timer)
+
+    def schedule(self: Self, time: float, callback: Callable[..., Any],
+                 /, *args: Any) -> WheelTimer:
+        """Schedule callback(*args) at time (seconds), returning timer.
+
+        Timers due at or before the current tick fire on next advance.
+        """
+        timer: WheelTimer = WheelTimer(max(self.to_tick(time), self.now + 1),
+                                       callback, args)
+        self._place(timer)
+        self.n_timers += 1
+        return timer
+
+    def cancel(self: Self, timer: WheelTimer, /):
+        """Cancel pending timer (lazily dropped when its slot comes up)."""
+        if not timer.cancelled:
+            timer.cancelled = True
+            self.n_timers -= 1
+
+    def _cascade(self: Self, level: int, /):
+        index: int = (self.now >> self._shifts[level]) & self._masks[level]
+        if (index == 0) and (level + 1 < len(self.levels)):
+            self._cascade(level + 1)
+
+        timers: list[WheelTimer] = self.levels[level][index]
+        self.levels[level][index] = []
+        for timer in timers:
+            if not timer.cancelled:
+                self._place(timer)
+
+    def advance_to(self: Self, time: float, /) -> int:
+        """Fire timers due up to time (seconds), returning how many."""
+        target: int = floor(time / self.resolution + 1e-6)
+        n_fired: int = 0
+
+        while self.now < target:
+            if not self.n_timers:
+                self.now = target
+                break
+
+            self.now += 1
+            if (len(self.levels) > 1) and not self.now & self._masks[0]:
+                self._cascade(1)
+
+            slot: list[WheelTimer] = self.levels[0][self.now & self._masks[0]]
+            if not slot:
+                continue
+
+            self.levels[0][self.now & self._masks[0]] = []
+            for timer in slot:
+                if not timer.cancelled:
+                    timer.cancelled = True
+                    self.n_timers -= 1
+                    timer.callback(*timer.args)
+                    n_fired += 1
+
+        self.n_fired += n_fired
+        return n_fired
@@ -2,21 +2,21 @@
 
 
 from collections.abc import Callable, Sequence
-from threading import Thread
-from typing import LiteralString, Optional, Self
+from typing import Any, LiteralString, Optional, Self
 
-from abm.decor import act, sense
-
-from .._device import Device
+from .._device import Device, V5DeviceType
 from ..brain.port import Ports
 from .._common_enums.color import Color
 
+from .._util.decor import act, sense
 from .._util.doc import robotmesh_doc, vexcode_doc
+from .._util.sync import poll
 
+from .animation import LedAnimator, COLOR_RGB
 from .fade import FadeType
 
 
-__all__: Sequence[LiteralString] = 'Touchled', 'FadeType'
+__all__: Sequence[LiteralString] = 'Touchled', 'FadeType', 'LedAnimator'
 
 
 @robotmesh_doc("""
@@ -28,15 +28,24 @@ __all__: Sequence[LiteralString] = 'Touchled', 'FadeType'
 class Touchled(Device):
     """Touch LED."""
 
+    _V5_DEVICE_TYPE: V5DeviceType = V5DeviceType.LED
+
     def __init__(self: Self, index: Ports, /):
         """Initialize Touch LED."""
         self.port: Ports = index
 
         self.fade_type: Optional[FadeType] = None
 
+        # LED Animator simulating displayed colors, if attached
+        self.animator: Optional[LedAnimator] = None
+
     def __hash__(self: Self) -> int:
         """Return integer hash."""
-        raise hash(self.port)
+        return hash(self.port)
+
+    def _animate(self: Self, command: str, /, *args: Any):
+        if self.animator is not None:
+            getattr(self.animator, command)(self, *args)
 
     @vexcode_doc("""
         Set TouchLED Fade
@@ -78,6 +87,7 @@ class Touchled(Device):
     @act
     def set_brightness(self: Self, brightness: int = 0, /):
         """Set brightness percentage level."""
+        self._animate('set_brightness', brightness)
 
     @robotmesh_doc("""
         Turn on the led in the touchled sensor, or change current brightness.
@@ -88,6 +98,7 @@ class Touchled(Device):
     @act
     def brightness(self: Self, brightness: int, /):
         """Set brightness percentage level."""
+        self._animate('set_brightness', brightness)
 
     @vexcode_doc("""
         Set TouchLED Color
@@ -115,6 +126,7 @@ class Touchled(Device):
     @act
     def set_color(self: Self, color: Optional[Color] = None, /):
         """Set color."""
+        self._animate('color', 0 if color is None else COLOR_RGB[color])
 
     @robotmesh_doc("""
         Turn on the led in the touchled sensor.
@@ -126,6 +138,7 @@ class Touchled(Device):
     @act
     def on(self: Self, color: hex, brightness: int = 100, /):
         """Turn on color (hex)."""
+        self._animate('on', color, brightness)
 
     @robotmesh_doc("""
         Turn on the led in the touchled sensor.
@@ -137,6 +150,7 @@ class Touchled(Device):
     @act
     def on_hue(self: Self, colorHue: Color, brightness: int = 100, /):
         """Turn on color hue."""
+        self._animate('on', COLOR_RGB[colorHue], brightness)
 
     @robotmesh_doc("""
         Turn on the led in the touchled sensor.
@@ -150,6 +164,7 @@ class Touchled(Device):
     @act
     def on_rgb(self: Self, red: int, green: int, blue: int, brightness: int = 100, /):  # noqa: E501
         """Turn on RGB color."""
+        self._animate('on', (red << 16) | (green << 8) | blue, brightness)
 
     @robotmesh_doc("""
         Turn off the led in the touchled sensor.
@@ -157,6 +172,7 @@ class Touchled(Device):
     @act
     def off(self: Self):
         """Turn off LED."""
+        self._animate('off')
 
     @robotmesh_doc("""
         Set the led in the touchled sensor as blinking.
@@ -170,6 +186,7 @@ class Touchled(Device):
     def blink(self: Self,
               color: hex, on_time: float = 0.25, off_time: float = 0.25, /):
         """Blink color (hex)."""
+        self._animate('blink', color, on_time, off_time)
 
     @robotmesh_doc("""
         Set the led in the touchled sensor as blinking.
@@ -183,6 +200,7 @@ class Touchled(Device):
     def blink_hue(self: Self, colorHue: Color,
                   on_time: float = 0.25, off_time: float = 0.25, /):
         """Blink color hue."""
+        self._animate('blink', COLOR_RGB[colorHue], on_time, off_time)
 
     @robotmesh_doc("""
         Set the led in the touchled sensor as blinking.
@@ -199,6 +217,8 @@ class Touchled(Device):
                   on_time: float = 0.25, off_time: float = 0.25, /):
         # pylint: disable=too-many-arguments
         """Blink RGB color."""
+        self._animate('blink', (red << 16) | (green << 8) | blue,
+                      on_time, off_time)
 
     @robotmesh_doc("""
         Get the pressed status of the touchled device.
@@ -236,13 +256,7 @@ class Touchled(Device):
     """)
     def pressed(self: Self, callback: Callable, /):
         """Trigger callback function upon being pressed."""
-        def trigger_callback_whenever_pressing():
-            while True:
-                if self.pressing():
-                    callback()
-
-        Thread(group=None, target=trigger_callback_whenever_pressing, name=None,  # noqa: E501
-               args=(), kwargs={}, daemon=True).start()
+        poll(self.pressing, callback)
 
     @vexcode_doc("""
         TouchLED Released
@@ -263,10 +277,4 @@ class Touchled(Device):
     """)
     def released(self: Self, callback: Callable, /):
         """Trigger callback function upon being released."""
-        def trigger_callback_whenever_not_pressing():
-            while True:
-                if not self.pressing():
-                    callback()
-
-        Thread(group=None, target=trigger_callback_whenever_not_pressing, name=None,  # noqa: E501
-               args=(), kwargs={}, daemon=True).start()
+        poll(lambda: not self.pressing(), callback)
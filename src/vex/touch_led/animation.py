@@ -0,0 +1,284 @@
+"""Touch LED colors, fades & blinks, scheduled on a shared timer wheel."""
+
+
+from array import array
+from collections.abc import Callable, Iterator, Sequence
+from threading import RLock
+from time import monotonic
+from typing import Any, LiteralString, NamedTuple, Optional, Self
+
+from .._common_enums.color import Color
+from ..time.wheel import TimerWheel, WheelTimer
+
+from .fade import FadeType
+
+
+__all__: Sequence[LiteralString] = ('LedAnimator', 'LedState',
+                                    'COLOR_RGB', 'FADE_TIME')
+
+
+# 0xRRGGBB values of named colors
+COLOR_RGB: dict[Color, int] = {
+    Color.NONE: 0x000000,
+    Color.RED: 0xFF0000,
+    Color.RED_ORANGE: 0xFF4000,
+    Color.ORANGE: 0xFF8000,
+    Color.YELLOW_ORANGE: 0xFFBF00,
+    Color.YELLOW: 0xFFFF00,
+    Color.YELLOW_GREEN: 0x80FF00,
+    Color.GREEN: 0x00FF00,
+    Color.BLUE_GREEN: 0x00FF80,
+    Color.BLUE: 0x0000FF,
+    Color.BLUE_VIOLET: 0x4000FF,
+    Color.VIOLET: 0x8000FF,
+    Color.RED_VIOLET: 0xFF0080,
+    Color.WHITE: 0xFFFFFF,
+    Color.PURPLE: 0x800080,
+    Color.BLACK: 0x000000,
+}
+
+# seconds taken to fade to a new color/brightness (LEDs without a fade type
+# set change instantly)
+FADE_TIME: dict[Optional[FadeType], float] = {
+    None: 0.,
+    FadeType.OFF: 0.,
+    FadeType.FAST: .1,
+    FadeType.SLOW: .5,
+}
+
+
+class LedState(NamedTuple):
+    """Timeline entry: LED starts fading to color & brightness at time."""
+
+    time: float
+    led: int
+    rgb: int
+    brightness: int
+    fade: float
+
+
+def _lerp_rgb(start: int, end: int, fraction: float, /) -> int:
+    rgb: int = 0
+    for shift in (16, 8, 0):
+        channel: int = (start >> shift) & 0xFF
+        rgb |= round(channel +
+                     (((end >> shift) & 0xFF) - channel) * fraction) << shift
+    return rgb
+
+
+class LedAnimator:
+    # pylint: disable=too-many-instance-attributes
+    """Colors, fades & blinks of many Touch LEDs, without threads.
+
+    Each attached LED's latest command is kept in struct-of-arrays form:
+    the state displayed when the command was given, the target color &
+    brightness, the fade duration (from the LED's fade type) & blink on/off
+    times. The color & brightness displayed at any instant since then are
+    computed in O(1): a linear fade from the previous state, or, for a
+    blinking LED, the phase within its blink period (blink edges switch
+    instantly).
+
+    Every command & blink edge is recorded into a compact timeline of
+    parallel arrays (19 bytes per entry). Blink edges are recorded by
+    one pending timer per blinking LED on a shared hierarchical timer
+    wheel, which `update()` advances to the current clock time, so dozens
+    of blinking LEDs cost no threads or sleep loops. Commands & updates
+    are made under a lock, so that LEDs may be commanded from callback
+    threads.
+    """
+
+    def __init__(self: Self, /,
+                 clock: Callable[[], float] = monotonic,
+                 wheel: Optional[TimerWheel] = None):
+        """Initialize LED Animator."""
+        self.clock: Callable[[], float] = clock
+        self.wheel: TimerWheel = TimerWheel() if wheel is None else wheel
+        # (skip empty ticks from time 0 up to clock's current time)
+        self.wheel.advance_to(clock())
+
+        self.leds: list[Any] = []
+        self._indices: dict[int, int] = {}
+        self._timers: list[Optional[WheelTimer]] = []
+
+        # struct-of-arrays latest commands
+        self.t0: array = array('d')
+        self.from_rgb: array = array('L')
+        self.from_brightness: array = array('d')
+        self.rgb: array = array('L')
+        self.brightness: array = array('d')
+        self.fade: array = array('d')
+        self.on_time: array = array('d')
+        self.off_time: array = array('d')
+        # brightness level restored when LED is turned back on
+        self.level: array = array('d')
+
+        # timeline
+        self.times: array = array('d')
+        self.timeline_leds: array = array('H')
+        self.timeline_rgbs: array = array('L')
+        self.timeline_brightnesses: array = array('B')
+        self.timeline_fades: array = array('f')
+
+        self._lock: RLock = RLock()
+
+    def __len__(self: Self, /) -> int:
+        """Return number of attached LEDs."""
+        return len(self.leds)
+
+    def __repr__(self: Self, /) -> str:
+        """Return string representation."""
+        return (f'{type(self).__name__}({len(self)} LEDs, '
+                f'{len(self.times)} timeline entries)')
+
+    def attach(self: Self, led: Any, /) -> int:
+        """Attach (initially dark) LED, returning its index."""
+        with self._lock:
+            index: int = len(self.leds)
+            self.leds.append(led)
+            self._indices[id(led)] = index
+            self._timers.append(None)
+
+            for values in (self.t0, self.from_rgb, self.from_brightness,
+                           self.rgb, self.brightness, self.fade,
+                           self.on_time, self.off_time):
+                values.append(0)
+            self.level.append(100.)
+
+        led.animator = self
+        return index
+
+    def index(self: Self, led: Any, /) -> int:
+        """Return index of attached LED."""
+        assert (index := self._indices.get(id(led))) is not None, \
+            ValueError(f'*** {led} NOT ATTACHED ***')
+        return index
+
+    def _record(self: Self, time: float, index: int, rgb: int,
+                brightness: float, fade: float, /):
+        # pylint: disable=too-many-arguments
+        self.times.append(time)
+        self.timeline_leds.append(index)
+        self.timeline_rgbs.append(rgb)
+        self.timeline_brightnesses.append(round(brightness))
+        self.timeline_fades.append(fade)
+
+    def _command(self: Self, led: Any, rgb: int, brightness: float, /,
+                 on_time: float = 0., off_time: float = 0.):
+        # pylint: disable=too-many-arguments
+        with self._lock:
+            # record blink edges due so far, so the timeline stays in order
+            self.update()
+
+            index: int = self.index(led)
+            now: float = self.clock()
+
+            if (timer := self._timers[index]) is not None:
+                self.wheel.cancel(timer)
+                self._timers[index] = None
+
+            self.from_rgb[index] = self.color_at(led, now)
+            self.from_brightness[index] = self.brightness_at(led, now)
+            self.t0[index] = now
+            self.rgb[index] = rgb
+            self.brightness[index] = brightness
+            self.on_time[index] = on_time
+            self.off_time[index] = off_time
+
+            if off_time:
+                self.fade[index] = 0.
+                self._timers[index] = self.wheel.schedule(
+                    now + on_time, self._edge, index, now + on_time, False)
+            else:
+                self.fade[index] = FADE_TIME[getattr(led, 'fade_type', None)]
+
+            self._record(now, index, rgb, brightness, self.fade[index])
+
+    def _edge(self: Self, index: int, time: float, lit: bool, /):
+        # record blink edge at time & schedule next one
+        self._record(time, index, self.rgb[index],
+                     self.brightness[index] if lit else 0, 0.)
+
+        time += self.on_time[index] if lit else self.off_time[index]
+        self._timers[index] = self.wheel.schedule(time, self._edge,
+                                                  index, time, not lit)
+
+    def on(self: Self, led: Any, rgb: int, brightness: float = 100, /):
+        """Turn on LED with color (0xRRGGBB) at brightness (percent)."""
+        with self._lock:
+            self.level[self.index(led)] = brightness
+            self._command(led, rgb, brightness if rgb else 0)
+
+    def color(self: Self, led: Any, rgb: int, /):
+        """Set LED color (0xRRGGBB), turning it on (off if black)."""
+        with self._lock:
+            self._command(led, rgb, self.level[self.index(led)] if rgb else 0)
+
+    def set_brightness(self: Self, led: Any, brightness: float, /):
+        """Set LED brightness (percent), turning it on."""
+        with self._lock:
+            index: int = self.index(led)
+            self.level[index] = brightness
+            self._command(led, self.rgb[index],
+                          brightness if self.rgb[index] else 0)
+
+    def off(self: Self, led: Any, /):
+        """Turn off LED, keeping its color & brightness level."""
+        with self._lock:
+            self._command(led, self.rgb[self.index(led)], 0)
+
+    def blink(self: Self, led: Any, rgb: int,
+              on_time: float = .25, off_time: float = .25, /):
+        """Blink LED with color (0xRRGGBB) for on & off times (seconds)."""
+        assert (on_time > 0) and (off_time >= 0), \
+            ValueError(f'*** on/off times {on_time}/{off_time} INVALID ***')
+
+        with self._lock:
+            self._command(led, rgb, self.level[self.index(led)] if rgb else 0,
+                          on_time=on_time, off_time=off_time)
+
+    def _progress(self: Self, index: int, time: float, /) -> Optional[float]:
+        # fraction of fade done at time, or None if in blink's off phase
+        if off_time := self.off_time[index]:
+            on_time: float = self.on_time[index]
+            return (1. if (time - self.t0[index]) % (on_time + off_time) < on_time  # noqa: E501
+                    else None)
+
+        if (elapsed := time - self.t0[index]) >= (fade := self.fade[index]):
+            return 1.
+        return max(elapsed, 0.) / fade
+
+    def color_at(self: Self, led: Any, time: Optional[float] = None, /) -> int:  # noqa: E501
+        """Return color (0xRRGGBB) displayed at time (default now).
+
+        Time must be no earlier than LED's latest command.
+        """
+        index: int = self.index(led)
+        if (fraction := self._progress(
+                index, self.clock() if time is None else time)) is None:
+            return self.rgb[index]
+        return _lerp_rgb(self.from_rgb[index], self.rgb[index], fraction)
+
+    def brightness_at(self: Self, led: Any, time: Optional[float] = None, /) -> float:  # noqa: E501
+        """Return brightness (percent) displayed at time (default now).
+
+        Time must be no earlier than LED's latest command.
+        """
+        index: int = self.index(led)
+        if (fraction := self._progress(
+                index, self.clock() if time is None else time)) is None:
+            return 0.
+        start: float = self.from_brightness[index]
+        return start + (self.brightness[index] - start) * fraction
+
+    def update(self: Self, /) -> int:
+        """Record blink edges due by now, returning how many."""
+        with self._lock:
+            return self.wheel.advance_to(self.clock())
+
+    def entries(self: Self, /, start: int = 0) -> Iterator[LedState]:
+        """Iterate over timeline entries from start index."""
+        for i in range(start, len(self.times)):
+            yield LedState(self.times[i], self.timeline_leds[i],
+                           self.timeline_rgbs[i],
+                           self.timeline_brightnesses[i],
+                           self.timeline_fades[i])
@@ -4,11 +4,10 @@
 from collections.abc import Sequence
 from typing import LiteralString, Optional, Self
 
-from abm.decor import sense
-
-from .._device import Device
+from .._device import Device, V5DeviceType
 from ..brain.port import Ports
 
+from .._util.decor import sense
 from .._util.doc import robotmesh_doc, vexcode_doc
 
 from .object import VisionObject
@@ -27,6 +26,8 @@ __all__: Sequence[LiteralString] = 'Vision', 'VisionObject'
 class Vision(Device):
     """Vision Sensor."""
 
+    _V5_DEVICE_TYPE: V5DeviceType = V5DeviceType.VISION
+
     @robotmesh_doc("""
         Creates a new vision object on the port specified.
 
@@ -0,0 +1,88 @@
+"""vex._device.registry tests."""
+
+
+import gc
+import unittest
+import warnings
+import weakref
+
+from vex import Brain, Distance, Motor, Optical, Touchled, Ports
+from vex._device import DEVICE_REGISTRY, PortConflict, PortConflictWarning, V5DeviceType
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+class TestDeviceRegistry(unittest.TestCase):
+    def setUp(self):
+        DEVICE_REGISTRY.clear()
+        self.brain = Brain()
+
+    def tearDown(self):
+        DEVICE_REGISTRY.strict = False
+        DEVICE_REGISTRY.clear()
+
+    def test_lookup_by_port_and_type(self):
+        motor_1, motor_2 = Motor(Ports.PORT1), Motor(Ports.PORT5)
+        distance = Distance(Ports.PORT22)
+
+        self.assertIs(self.brain.devices[Ports.PORT5], motor_2)
+        self.assertIs(self.brain.devices[Ports.PORT22], distance)
+        self.assertIsNone(self.brain.devices[Ports.PORT2])
+        self.assertNotIn(Ports.PORT2, self.brain.devices)
+        self.assertEqual(len(self.brain.devices), 3)
+
+        self.assertEqual(self.brain.devices.of_type(V5DeviceType.MOTOR), (motor_1, motor_2))
+        self.assertEqual(self.brain.devices.of_type(V5DeviceType.RANGE), (distance,))
+
+    def test_device_types(self):
+        self.assertIs(Motor(Ports.PORT1).type(), V5DeviceType.MOTOR)
+        self.assertIs(Optical(Ports.PORT2).type(), V5DeviceType.OPTICAL)
+        self.assertIs(Touchled(Ports.PORT3).type(), V5DeviceType.LED)
+
+    def test_redeclaration_is_no_conflict(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            Motor(Ports.PORT1)
+            motor = Motor(Ports.PORT1, True)
+        self.assertIs(self.brain.devices[Ports.PORT1], motor)
+        self.assertEqual(len(self.brain.devices.of_type(V5DeviceType.MOTOR)), 1)
+
+    def test_conflict(self):
+        motor = Motor(Ports.PORT1)
+        with self.assertWarnsRegex(PortConflictWarning,
+                                   r'^Touchled constructed on PORT1 already occupied by Motor\(PORT1\)$'):
+            led = Touchled(Ports.PORT1)
+        self.assertEqual(self.brain.devices.conflicts,
+                         [PortConflict(Ports.PORT1, Motor, Touchled)])
+        # the record does not keep the displaced device alive
+        motor_ref = weakref.ref(motor)
+        del motor
+        gc.collect()
+        self.assertIsNone(motor_ref())
+        self.assertIs(self.brain.devices[Ports.PORT1], led)
+        self.assertEqual(self.brain.devices.of_type(V5DeviceType.MOTOR), ())
+
+        DEVICE_REGISTRY.strict = True
+        with self.assertRaises(AssertionError):
+            Motor(Ports.PORT1)
+
+    def test_unused_devices_free_their_ports(self):
+        Motor(Ports.PORT1)
+        gc.collect()
+        self.assertNotIn(Ports.PORT1, self.brain.devices)
+        self.assertEqual(self.brain.devices.of_type(V5DeviceType.MOTOR), ())
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            Touchled(Ports.PORT1)
+
+    def test_port_change(self):
+        motor = Motor(Ports.PORT1)
+        motor.port = Ports.PORT2
+        self.assertIsNone(self.brain.devices[Ports.PORT1])
+        self.assertIs(self.brain.devices[Ports.PORT2], motor)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""vex.brain.snapshot tests."""
+
+
+from typing import Optional
+import unittest
+
+from vex import Brain, Controller, Motor, Ports, DEGREES
+from vex.brain import SnapshotSpec
+from vex.controller import ControllerRecording, ControllerReplay
+from vex._util.io import replace_stdin
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.brain = Brain()
+        self.motor = Motor(Ports.PORT1)
+        self.controller = Controller()
+
+        self.replay = ControllerReplay(ControllerRecording([30, -40] + [0] * 12))
+        self.replay.attach(self.controller)
+
+        self.spec = SnapshotSpec(position=(self.motor.position, DEGREES),
+                                 drive=self.controller.axisA.position,
+                                 turn=self.controller.axisB.position)
+
+    def tearDown(self):
+        self.replay.detach()
+
+    def test_snapshot(self):
+        with replace_stdin('123.5'):
+            snapshot = self.brain.snapshot(self.spec)
+
+        self.assertEqual(snapshot.position, 123.5)
+        self.assertEqual(snapshot['drive'], 30)
+        self.assertEqual(snapshot[2], -40)
+        self.assertEqual(list(snapshot), [123.5, 30, -40])
+        self.assertEqual(snapshot.as_dict(), {'position': 123.5, 'drive': 30, 'turn': -40})
+
+    def test_snapshot_is_immutable(self):
+        with replace_stdin('0'):
+            snapshot = self.brain.snapshot(self.spec)
+
+        with self.assertRaises(AttributeError):
+            snapshot.time = 0
+        with self.assertRaises(TypeError):
+            snapshot.values[0] = 1
+
+
+class Reader:
+    def optional(self) -> Optional[int]:
+        return None
+
+    def unannotated(self):
+        return ('not', 'a', 'number')
+
+
+class TestSnapshotSpec(unittest.TestCase):
+    def test_non_numeric_readings_rejected_when_declared(self):
+        with self.assertRaises(AssertionError):
+            SnapshotSpec(reading=Reader().optional)
+
+    def test_non_numeric_reading_rejected_after_reading_all(self):
+        spec = SnapshotSpec(reading=Reader().unannotated)
+        with self.assertRaises(AssertionError) as raised:
+            spec.read()
+        self.assertIn('NOT NUMERIC', str(raised.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,13 @@
 import unittest
 
 from vex import ColorSensor, ColorHue, Ports
+from vex._device import DEVICE_REGISTRY
 from vex._util.io import replace_stdin
 
 
 class TestColorSensor(unittest.TestCase):
     def setUp(self):
+        DEVICE_REGISTRY.clear()
         self.colorSensor = ColorSensor(Ports.PORT1)
 
     def test_is_near_object(self):
@@ -0,0 +1,117 @@
+"""vex.control tests."""
+
+
+import unittest
+
+from drivetrain import Drivetrain
+from vex import DriveTrain, Motor, MotorGroup, Ports, DEGREES, PERCENT
+from vex.control import PID, ControlLoop, MotorPlant, step_response
+from vex.sim import MotorModel
+from vex.time import Scheduler, VirtualClock
+from vex._util.io import replace_stdin
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+class TestPID(unittest.TestCase):
+    def test_terms(self):
+        pid = PID(2, 1, .5, kf=.1, ks=3)
+        # first update: no derivative kick
+        self.assertAlmostEqual(pid.update(10, 4, .1), 2 * 6 + 1 * .6 + .1 * 10 + 3)
+        self.assertAlmostEqual(pid.update(10, 6, .1), 2 * 4 + 1 * 1 + .5 * -20 + .1 * 10 + 3)
+
+    def test_anti_windup(self):
+        pid = PID(1, 10)
+        for _ in range(100):
+            self.assertEqual(pid.update(1000, 0, .01), 100)
+        self.assertEqual(pid.integral[0], 0)
+
+        pid = PID(0, 10, integral_limit=2)
+        for _ in range(100):
+            pid.update(5, 0, .1)
+        self.assertEqual(pid.integral[0], 2)
+
+    def test_slew_rate(self):
+        pid = PID(1, slew_rate=100)
+        pid.update(0, 0, .1)
+        self.assertEqual(pid.update(100, 0, .1), 10)
+        self.assertEqual(pid.update(100, 0, .1), 20)
+
+    def test_vectorized(self):
+        bank = PID([1, 2, 3], .5, .1)
+        singles = [PID(kp, .5, .1) for kp in (1, 2, 3)]
+        for measurements in ([0, 1, 2], [3, 2, 1]):
+            outputs = bank.update_all(10, measurements, .02)
+            self.assertEqual(list(outputs),
+                             [pid.update(10, measurement, .02)
+                              for pid, measurement in zip(singles, measurements)])
+
+
+class TestControlLoop(unittest.TestCase):
+    def test_motor(self):
+        motor = Motor(Ports.PORT1)
+        loop = ControlLoop(motor, PID(.5), setpoint=90)
+        with replace_stdin('30'):
+            self.assertEqual(loop.step(), 30)
+        self.assertEqual(motor._resolve_velocity_and_unit(None, None), (30, PERCENT))
+        self.assertEqual(motor.states.command[motor.slot], 30)
+
+    def test_motor_group(self):
+        group = MotorGroup(Motor(Ports.PORT1), Motor(Ports.PORT2))
+        ControlLoop(group, PID(.5), measure=lambda: 150, setpoint=90).apply(-30)
+        self.assertEqual(list(group.engine.states.velocity), [-30, -30])
+        self.assertEqual(list(group.engine.states.command), [-30, -30])
+
+    def test_closed_loop_turns_motor(self):
+        motor = Motor(Ports.PORT1)
+        model = MotorModel()
+        model.attach(motor)
+        loop = ControlLoop(motor, PID(2, 0, .05), setpoint=180, rate=100)
+        for _ in range(200):
+            loop.step()
+            model.step(loop.period)
+        self.assertAlmostEqual(motor.position(DEGREES), 180, delta=5)
+
+    def test_drivetrain_steering(self):
+        heading = [10]
+        drivetrain = DriveTrain(Motor(Ports.PORT1), Motor(Ports.PORT2))
+        loop = ControlLoop(drivetrain, PID(2), measure=lambda: heading[0], base_velocity=50)
+        loop.step()
+        self.assertEqual(list(drivetrain.engine.states.velocity), [30, 70])
+
+        drivetrain = Drivetrain(Motor(Ports.PORT1), Motor(Ports.PORT2))
+        loop = ControlLoop(drivetrain, PID(2), measure=lambda: heading[0], base_velocity=50)
+        loop.step()
+        self.assertEqual(list(drivetrain.engine.states.velocity), [30, 70])
+
+    def test_scheduled_closed_loop(self):
+        plant = MotorPlant()
+        loop = ControlLoop(Motor(Ports.PORT1), PID(2, 0, .05), measure=lambda: plant.position[0],
+                           setpoint=180, rate=100)
+        loop.apply = lambda output: plant.step([output], loop.period)
+
+        scheduler = Scheduler(clock=VirtualClock())
+        loop.schedule(scheduler)
+        scheduler.run(2)
+        self.assertAlmostEqual(plant.position[0], 180, delta=1)
+        self.assertAlmostEqual(loop.stats.rate, 100)
+
+
+class TestTuning(unittest.TestCase):
+    def test_step_response(self):
+        gentle, aggressive = step_response(PID([1, 20], 0, [.05, 0]), 360)
+        self.assertLess(gentle.overshoot, 5)
+        self.assertLess(gentle.settle_time, 1)
+        self.assertGreater(aggressive.overshoot, gentle.overshoot)
+        self.assertAlmostEqual(gentle.steady_state_error, 0, delta=.1)
+
+    def test_never_settles(self):
+        response, = step_response(PID(.01), 360, duration=.5)
+        self.assertIsNone(response.settle_time)
+        self.assertIsNone(response.rise_time)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+"""vex.controller.axis tests."""
+
+
+import unittest
+
+from vex.controller.axis import AxisChangeFilter
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+class TestAxisChangeFilter(unittest.TestCase):
+    def test_compares_against_last_delivered_position(self):
+        change_filter = AxisChangeFilter(0, min_delta=5)
+        self.assertFalse(change_filter.update(3))
+        self.assertFalse(change_filter.update(4))
+        self.assertTrue(change_filter.update(6))
+        self.assertEqual(change_filter.delivered_position, 6)
+        self.assertFalse(change_filter.update(10))
+        self.assertTrue(change_filter.update(11))
+
+    def test_deadband(self):
+        change_filter = AxisChangeFilter(0, min_delta=1, deadband=10)
+        self.assertFalse(change_filter.update(9))
+        self.assertFalse(change_filter.update(-9))
+        self.assertTrue(change_filter.update(10))
+        self.assertTrue(change_filter.update(5))
+        self.assertEqual(change_filter.delivered_position, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""vex.controller.drive_mapping tests."""
+
+
+from time import sleep
+import unittest
+
+from drivetrain import Drivetrain
+from vex import Controller, DriveTrain, Motor, Ports
+from vex.controller import (ControllerRecording, ControllerReplay,
+                            DriveMapping, ResponseCurve)
+from vex.time import Scheduler, VirtualClock
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+class TestResponseCurve(unittest.TestCase):
+    def test_linear(self):
+        curve = ResponseCurve()
+        self.assertEqual([curve(p) for p in (-100, -37, 0, 37, 100)], [-100, -37, 0, 37, 100])
+        self.assertEqual(curve(150), 100)
+
+    def test_deadband_expo_scale(self):
+        curve = ResponseCurve(deadband=10, expo=1, scale=.5)
+        self.assertEqual(curve(9), 0)
+        self.assertEqual(curve(10), 0)
+        self.assertAlmostEqual(curve(55), 6.25)
+        self.assertAlmostEqual(curve(-100), -50)
+
+
+class TestDriveMapping(unittest.TestCase):
+    def setUp(self):
+        self.controller = Controller()
+        self.replay = ControllerReplay(ControllerRecording([60, 0, 20, -40] + [0] * 10))
+        self.replay.attach(self.controller)
+
+        self.motors = [Motor(Ports.PORT1), Motor(Ports.PORT2)]
+
+    def tearDown(self):
+        self.replay.detach()
+
+    def test_arcade(self):
+        drivetrain = Drivetrain(*self.motors)
+        mapping = DriveMapping.arcade(drivetrain, self.controller.axisA, self.controller.axisC)
+
+        self.assertEqual(mapping.step(), (80, 40))
+        self.assertEqual(list(drivetrain.engine.states.velocity), [80, 40])
+
+        mapping.step()
+        self.assertEqual(mapping.n_commands, 1)
+
+    def test_tank_without_arcade(self):
+        drivetrain = DriveTrain(*self.motors)
+        mapping = DriveMapping.tank(drivetrain, self.controller.axisA, self.controller.axisD,
+                                    curve=ResponseCurve(scale=.5))
+
+        self.assertEqual(mapping.step(), (30, -20))
+        self.assertEqual(list(drivetrain.engine.states.velocity), [30, -20])
+
+    def test_tank_clamped(self):
+        drivetrain = DriveTrain(*self.motors)
+        mapping = DriveMapping.tank(drivetrain, self.controller.axisA, self.controller.axisD,
+                                    curve=ResponseCurve(scale=2))
+
+        self.assertEqual(mapping.step(), (100, -80))
+        self.assertEqual(list(drivetrain.engine.states.velocity), [100, -80])
+
+    def test_scheduled(self):
+        clock = VirtualClock()
+        scheduler = Scheduler(clock=clock)
+        drivetrain = Drivetrain(*self.motors)
+        mapping = DriveMapping.arcade(drivetrain, self.controller.axisA, self.controller.axisC,
+                                      rate=100)
+        mapping.schedule(scheduler)
+
+        scheduler.run(1)
+        self.assertEqual(mapping.stats.n_ticks, 101)
+        self.assertAlmostEqual(mapping.stats.rate, 100)
+        self.assertEqual(mapping.n_commands, 1)
+
+    def test_background_loop(self):
+        drivetrain = Drivetrain(*self.motors)
+        mapping = DriveMapping.arcade(drivetrain, self.controller.axisA, self.controller.axisC,
+                                      rate=200)
+        mapping.start()
+        while mapping.stats.n_ticks < 5:
+            sleep(.001)
+        mapping.stop()
+
+        self.assertEqual(mapping.side_velocities, (80, 40))
+        self.assertGreater(mapping.stats.rate, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""vex.controller.recording tests."""
+
+
+import unittest
+
+from vex import Controller
+from vex.controller import (ControllerRecording,
+                            ControllerRecorder,
+                            ControllerReplay)
+from vex.controller.recording import KEYFRAME_INTERVAL, N_INPUTS
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.
+
+    def __call__(self):
+        return self.now
+
+
+class TestControllerRecording(unittest.TestCase):
+    def setUp(self):
+        self.recording = ControllerRecording()
+        self.recording.append(10_000, 0, 50)     # axisA -> 50 at 10ms
+        self.recording.append(20_000, 4, 1)      # buttonEUp pressed at 20ms
+        self.recording.append(30_000, 0, -25)    # axisA -> -25 at 30ms
+        self.recording.append(40_000, 4, 0)      # buttonEUp released at 40ms
+
+    def test_state_at(self):
+        self.assertEqual(self.recording.state_at(0)[0], 0)
+        self.assertEqual(self.recording.state_at(0.015)[0], 50)
+        self.assertEqual(self.recording.state_at(0.025)[4], 1)
+        self.assertEqual(self.recording.state_at(1)[0], -25)
+        self.assertEqual(self.recording.state_at(1)[4], 0)
+
+    def test_seek_across_keyframes(self):
+        recording = ControllerRecording()
+        for i in range(3 * KEYFRAME_INTERVAL + 7):
+            recording.append(i * 1000, i % 4, i % 100)
+        for i in (0, KEYFRAME_INTERVAL - 1, KEYFRAME_INTERVAL,
+                  2 * KEYFRAME_INTERVAL + 5, 3 * KEYFRAME_INTERVAL + 6):
+            self.assertEqual(recording.state_at(i / 1000)[i % 4], i % 100)
+
+    def test_bytes_round_trip(self):
+        data = self.recording.to_bytes()
+        self.assertEqual(ControllerRecording.from_bytes(data), self.recording)
+        self.assertLess(len(data), 4 + 1 + 1 + N_INPUTS + 4 * 5)
+
+
+class TestControllerReplay(unittest.TestCase):
+    def setUp(self):
+        self.controller = Controller()
+
+        recording = ControllerRecording()
+        recording.append(10_000, 0, 50)
+        recording.append(20_000, 4, 1)
+        recording.append(30_000, 0, -25)
+        recording.append(40_000, 4, 0)
+
+        self.replay = ControllerReplay(recording)
+        self.replay.attach(self.controller)
+
+    def tearDown(self):
+        self.replay.detach()
+
+    def test_readings(self):
+        self.replay.advance_to(0.025)
+        self.assertEqual(self.controller.axisA.position(), 50)
+        self.assertTrue(self.controller.buttonEUp.pressing())
+        self.assertFalse(self.controller.buttonR3.pressing())
+
+    def test_callbacks(self):
+        fired = []
+        self.controller.axisA.changed_callbacks.append(lambda: fired.append('changed'))
+        self.controller.buttonEUp.pressed_callbacks.append(lambda: fired.append('pressed'))
+        self.controller.buttonEUp.released_callbacks.append(lambda: fired.append('released'))
+
+        self.replay.advance_to(1)
+        self.assertEqual(fired, ['changed', 'pressed', 'changed', 'released'])
+
+    def test_changed_filtered_as_when_live(self):
+        recording = ControllerRecording()
+        for time_usec, value in ((1_000, 3), (2_000, 60), (3_000, 62),
+                                 (4_000, 61), (100_000, 80)):
+            recording.append(time_usec, 0, value)
+        replay = ControllerReplay(recording)
+        replay.attach(self.controller)
+
+        delivered = []
+        self.controller.set_deadband(5)
+        # (as registered by axisA.changed(..., min_delta=5, max_rate=50))
+        self.controller.axisA.changed_options[0] = 5, 50
+        self.controller.axisA.changed_callbacks.append(
+            lambda: delivered.append((replay.time, self.controller.axisA.changed_position)))
+
+        # sampled every 20 ms: burst coalesced, deadband & min_delta applied
+        for _ in range(15):
+            replay.advance(.01)
+        self.assertEqual([position for _, position in delivered], [61, 80])
+        replay.detach()
+
+    def test_seek_does_not_fire_callbacks(self):
+        fired = []
+        self.controller.axisA.changed_callbacks.append(lambda: fired.append('changed'))
+
+        self.replay.seek(0.035)
+        self.assertEqual(self.controller.axisA.position(), -25)
+        self.assertEqual(fired, [])
+
+    def test_speed(self):
+        self.replay.speed = 2
+        self.replay.advance(0.01)
+        self.assertEqual(self.replay.time, 0.02)
+        self.assertEqual(self.controller.axisA.position(), 50)
+
+
+class TestControllerRecorder(unittest.TestCase):
+    def test_record_then_replay(self):
+        controller = Controller()
+        source = ControllerReplay(ControllerRecording([7] + [0] * (N_INPUTS - 1)))
+        source.attach(controller)
+
+        clock = FakeClock()
+        recorder = ControllerRecorder(controller, clock=clock)
+        recorder.start()
+        clock.now = 0.5
+        source._state[0] = 42
+        recorder.sample()
+        recording = recorder.stop()
+        source.detach()
+
+        self.assertEqual(recording.initial[0], 7)
+        self.assertEqual(len(recording), 1)
+        self.assertEqual(recording.state_at(0.5)[0], 42)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""vex.multi_device_group.engine tests."""
+
+
+import unittest
+
+from drivetrain import Drivetrain
+from motor_group import MotorGroup as RobotMeshMotorGroup
+from vex import DriveTrain, MotorGroup, Motor, Ports, DEGREES, HOLD, PERCENT, SECONDS, MSEC
+from vex.multi_device_group.engine import GroupEngine, flatten_motors
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+class TestGroupEngine(unittest.TestCase):
+    def setUp(self):
+        self.motors = [Motor(Ports.PORT1), Motor(Ports.PORT2), Motor(Ports.PORT3)]
+
+    def test_sides(self):
+        engine = GroupEngine(self.motors[0], self.motors[1:])
+        self.assertEqual(len(engine), 3)
+        self.assertEqual(engine.side_slots, (slice(0, 1), slice(1, 3)))
+
+        engine.set_velocity(20, PERCENT, side=1)
+        self.assertEqual(list(engine.states.velocity), [50, 20, 20])
+
+    def test_flatten(self):
+        group = MotorGroup(*self.motors)
+        self.assertEqual(flatten_motors(group), tuple(self.motors))
+        with self.assertRaises(AssertionError):
+            flatten_motors(1)
+
+    def test_hash_and_membership(self):
+        group = MotorGroup(self.motors[0], self.motors[2])
+        self.assertEqual(group.engine.port_mask, 0b101)
+        self.assertEqual(group, MotorGroup(self.motors[0], Motor(Ports.PORT3)))
+        self.assertEqual(len({group, MotorGroup(self.motors[0], self.motors[2])}), 1)
+
+        self.assertIn(self.motors[2], group)
+        self.assertIn(Ports.PORT1, group)
+        self.assertNotIn(self.motors[1], group)
+
+        self.assertTrue(group.overlaps(DriveTrain(self.motors[1], self.motors[2])))
+        self.assertFalse(group.overlaps(MotorGroup(self.motors[1])))
+
+    def test_hash_covers_reversal_and_is_stable(self):
+        group = MotorGroup(self.motors[0], self.motors[1])
+        self.assertNotEqual(group, MotorGroup(self.motors[0], Motor(Ports.PORT2, True)))
+
+        # members are fixed at construction: the hash does not change
+        # while the group is in a set
+        groups = {group}
+        self.motors[1].port = Ports.PORT5
+        self.assertIn(group, groups)
+        self.assertIn(Ports.PORT2, group)
+
+    def test_robotmesh_motor_group_is_hashable(self):
+        group = RobotMeshMotorGroup(self.motors)
+        self.assertEqual(hash(group), hash(RobotMeshMotorGroup(self.motors[::-1])))
+        self.assertEqual(group, RobotMeshMotorGroup(self.motors[::-1]))
+
+    def test_motor_group_of_any_size(self):
+        group = MotorGroup(*self.motors)
+        group.set_stopping(HOLD)
+        self.assertTrue(all(motor.stopping_mode is HOLD for motor in self.motors))
+
+    def test_nested_groups_keep_commanding_motors(self):
+        motors = self.motors + [Motor(Ports.PORT4)]
+        left, right = MotorGroup(*motors[:2]), MotorGroup(*motors[2:])
+        drivetrain = DriveTrain(left, right)
+
+        left.set_velocity(30)
+        left.set_stopping(HOLD)
+        right.engine.set_rotation(90, DEGREES)
+        self.assertEqual([motor.states.velocity[motor.slot] for motor in motors],
+                         [30, 30, 50, 50])
+        self.assertEqual([motor.stopping_mode for motor in motors], [HOLD, HOLD, None, None])
+        self.assertEqual(list(drivetrain.engine.states.position), [0, 0, 90, 90])
+
+        # regrouped out of order: written through each motor's own slot
+        MotorGroup(motors[1], motors[0])
+        left.set_velocity(70)
+        self.assertEqual([motor.states.velocity[motor.slot] for motor in motors[:2]],
+                         [70, 70])
+
+    def test_deprecated_motor_aliases(self):
+        group = MotorGroup(*self.motors[:2])
+        with self.assertWarns(DeprecationWarning):
+            self.assertIs(group.motor_a, self.motors[0])
+        with self.assertWarns(DeprecationWarning):
+            self.assertIs(group.motor_b, self.motors[1])
+
+    def test_drive_train_with_motor_list(self):
+        drivetrain = DriveTrain(self.motors[0], self.motors[1:])
+        self.assertEqual(drivetrain, DriveTrain(self.motors[0], self.motors[1:]))
+        self.assertIsInstance(hash(drivetrain), int)
+
+        drivetrain.set_timeout(2)
+        self.assertEqual(drivetrain.engine.timeout(MSEC), 2000)
+
+    def test_arcade(self):
+        drivetrain = Drivetrain(self.motors[0], self.motors[1:])
+        drivetrain.arcade(60, 20)
+        self.assertEqual(list(drivetrain.engine.states.velocity), [80, 40, 40])
+        drivetrain.arcade(90, -30)
+        self.assertEqual(list(drivetrain.engine.states.command), [60, 100, 100])
+
+        drivetrain.set_timeout(1.5, SECONDS)
+        self.assertEqual(drivetrain.engine.timeout(MSEC), 1500)
+
+
+if __name__ == "__main__":
+    unittest.main()
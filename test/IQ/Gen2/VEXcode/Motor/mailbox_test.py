@@ -0,0 +1,114 @@
+"""vex.motor.mailbox tests."""
+
+
+from threading import Thread
+import unittest
+
+from vex import DriveTrain, Motor, MotorGroup, Ports, FORWARD, REVERSE, DEGREES, TURNS, PERCENT
+from vex.motor.mailbox import contention_benchmark
+from vex.sim import MotorModel
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+class TestCommandMailbox(unittest.TestCase):
+    def setUp(self):
+        self.motor = Motor(Ports.PORT1)
+
+    def test_latest_command_wins(self):
+        self.motor.spin(FORWARD, 30, PERCENT)
+        spin = self.motor.mailbox.latest
+        self.assertTrue(spin.done)
+        self.assertFalse(spin.preempted)
+
+        self.motor.spin_for(REVERSE, 90, DEGREES)
+        move = self.motor.mailbox.latest
+        self.assertFalse(move.done)
+        self.assertEqual(self.motor.states.command[0], 0)
+        self.assertIs(self.motor.motion, move.motion)
+
+        self.motor.spin(FORWARD, 40, PERCENT)
+        self.assertTrue(move.preempted)
+        self.assertTrue(move.done)
+        self.assertIsNone(self.motor.motion)
+        self.assertEqual(self.motor.states.command[0], 40)
+        self.assertGreater(self.motor.mailbox.latest.sequence, move.sequence)
+
+    def test_start_spin_to(self):
+        self.motor.set_position(90, DEGREES)
+        self.motor.start_spin_to(-1, TURNS)
+        self.assertAlmostEqual(self.motor.motion.target, -360)
+
+    def test_wait_returns_on_preemption(self):
+        self.motor.start_spin_for(FORWARD, 10, TURNS)
+        move = self.motor.mailbox.latest
+        self.assertFalse(move.wait(timeout=.01))
+
+        thread = Thread(target=self.motor.stop)
+        thread.start()
+        self.assertTrue(move.wait(timeout=5))
+        thread.join()
+
+    def test_simulated_move_completes(self):
+        model = MotorModel()
+        model.attach(self.motor)
+        self.motor.spin_for(FORWARD, 90, DEGREES)
+        move = self.motor.mailbox.latest
+        for _ in range(100):
+            model.step(.01)
+        self.assertTrue(move.completed)
+        self.assertFalse(move.timed_out)
+
+    def test_drivetrain_command_preempts_motor_move(self):
+        right = Motor(Ports.PORT6, True)
+        drivetrain = DriveTrain(self.motor, right)
+        model = MotorModel()
+        model.attach(drivetrain)
+
+        self.motor.start_spin_for(FORWARD, 10, TURNS)
+        move = self.motor.mailbox.latest
+        drivetrain.drive(REVERSE)
+        self.assertTrue(move.preempted)
+        self.assertIsNone(self.motor.motion)
+        self.assertEqual(self.motor.mailbox.latest.name, 'spin')
+
+        for _ in range(10):
+            model.step(.01)
+        self.assertLess(self.motor.position(DEGREES), 0)
+
+        drivetrain.stop()
+        self.assertEqual(right.mailbox.latest.name, 'stop')
+        self.assertEqual(list(drivetrain.engine.states.command), [0, 0])
+
+    def test_motor_group_command_preempts_motor_move(self):
+        other = Motor(Ports.PORT6)
+        group = MotorGroup(self.motor, other)
+        model = MotorModel()
+        model.attach(group)
+
+        self.motor.start_spin_for(FORWARD, 10, TURNS)
+        move = self.motor.mailbox.latest
+        group.spin(REVERSE)
+        self.assertTrue(move.preempted)
+        self.assertIsNone(self.motor.motion)
+        self.assertEqual(self.motor.mailbox.latest.name, 'spin')
+
+        for _ in range(10):
+            model.step(.01)
+        self.assertLess(self.motor.position(DEGREES), 0)
+
+        group.stop()
+        self.assertEqual(other.mailbox.latest.name, 'stop')
+        self.assertEqual(list(group.engine.states.command), [0, 0])
+
+    def test_contention(self):
+        stats = contention_benchmark(self.motor, n_threads=4, n_commands_per_thread=500)
+        self.assertTrue(stats.consistent)
+        self.assertEqual(stats.n_commands, 2000)
+        self.assertGreater(stats.commands_per_second, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
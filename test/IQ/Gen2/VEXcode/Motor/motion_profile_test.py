@@ -0,0 +1,81 @@
+"""vex.motor.profile tests."""
+
+
+import unittest
+
+from drivetrain import Drivetrain
+from vex import DriveTrain, Motor, Ports, FORWARD, REVERSE, DEGREES, TURNS, MM, INCHES, PERCENT
+from vex.motor.gear import GearSetting
+from vex.motor.profile import MotionProfile, ProfileCache, PROFILE_CACHE
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+class TestMotionProfile(unittest.TestCase):
+    def test_trapezoid(self):
+        # 100% of 127 rpm = 762 deg/s, accelerating at 400%/s = 3048 deg/s^2
+        profile = MotionProfile(1000, 100)
+        self.assertAlmostEqual(profile.peak_velocity, 762)
+        self.assertAlmostEqual(profile.duration, 1000 / 762 + 762 / 3048)
+        self.assertEqual(profile.position_at(0), 0)
+        self.assertAlmostEqual(profile.position_at(profile.duration), 1000)
+        self.assertAlmostEqual(profile.velocity_at(profile.duration / 2), 762)
+        self.assertAlmostEqual(profile.velocity_at(10), 0)
+
+    def test_triangle(self):
+        profile = MotionProfile(90, 100, gear_setting=GearSetting.RATIO_6_1)
+        self.assertLess(profile.peak_velocity, 3600)
+        self.assertAlmostEqual(profile.position_at(profile.duration / 2), 45, delta=.1)
+
+
+class TestProfileCache(unittest.TestCase):
+    def test_lru(self):
+        cache = ProfileCache(maxsize=2)
+        first = cache.get(360, 50)
+        self.assertIs(cache.get(360, 50), first)
+        cache.get(720, 50)
+        cache.get(360, 50)
+        cache.get(90, 50)
+        self.assertEqual(cache.evictions, 1)
+        self.assertIs(cache.get(360, 50), first)
+        self.assertEqual((cache.hits, cache.misses), (3, 3))
+        self.assertEqual(cache.hit_rate, .5)
+
+    def test_move_shares_profile(self):
+        cache = ProfileCache()
+        forward = cache.move(360, 50, start=100)
+        backward = cache.move(-360, 50)
+        self.assertIs(forward.profile, backward.profile)
+        self.assertAlmostEqual(forward.target, 460)
+        self.assertAlmostEqual(backward.position_at(forward.duration), -360)
+
+
+class TestMoves(unittest.TestCase):
+    def setUp(self):
+        PROFILE_CACHE.clear()
+
+    def test_repeated_spin_for_hits_cache(self):
+        motor = Motor(Ports.PORT1)
+        motor.spin_for(FORWARD, 1, TURNS)
+        motor.spin_for(REVERSE, 360, DEGREES)
+        self.assertIs(motor.motion.profile, PROFILE_CACHE.get(360, 50))
+        self.assertEqual(motor.motion.sign, -1)
+        self.assertEqual(PROFILE_CACHE.misses, 1)
+        self.assertEqual(PROFILE_CACHE.hits, 2)
+
+    def test_drive_for(self):
+        left, right = Motor(Ports.PORT1), Motor(Ports.PORT6, True)
+        drivetrain = DriveTrain(left, right)
+        drivetrain.drive_for(FORWARD, 400, MM)
+        self.assertAlmostEqual(drivetrain.engine.motion.target, 720)
+
+        robotmesh_drivetrain = Drivetrain(left, right)
+        robotmesh_drivetrain.drive_for(FORWARD, 400 / 25.4, INCHES, 50, PERCENT)
+        self.assertIs(robotmesh_drivetrain.engine.motion.profile,
+                      drivetrain.engine.motion.profile)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""vex.motor.state tests."""
+
+
+import unittest
+
+from motor_group import MotorGroup
+from vex import Motor, Ports, BRAKE, HOLD, FORWARD, DEGREES, TURNS, PERCENT, RPM, RotationUnits, VelocityUnits
+from vex.motor import GearSetting, TorqueUnits
+from vex.motor.state import MotorStates
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+class TestMotorStates(unittest.TestCase):
+    def setUp(self):
+        self.motors = [Motor(Ports.PORT1), Motor(Ports.PORT2), Motor(Ports.PORT3)]
+
+    def test_gather_keeps_motor_settings(self):
+        self.motors[1].set_velocity(30, RPM)
+        self.motors[2].set_stopping(HOLD)
+
+        states = MotorStates.gather(self.motors)
+
+        self.assertEqual(len(states), 3)
+        self.assertEqual(list(states.velocity), [50, 30, 50])
+        self.assertEqual(list(states.velocity_unit), [PERCENT, RPM, PERCENT])
+        self.assertIs(self.motors[2].stopping_mode, HOLD)
+        self.assertIsNone(self.motors[0].stopping_mode)
+
+    def test_motors_are_views(self):
+        group = MotorGroup(self.motors)
+
+        group.set_velocity(40, PERCENT)
+        group.set_stopping(BRAKE)
+        group.set_rotation(1, TURNS)
+        for motor in self.motors:
+            self.assertEqual(motor._resolve_velocity_and_unit(None, None), (40, PERCENT))
+            self.assertIs(motor.stopping_mode, BRAKE)
+        self.assertEqual(list(group.states.positions(DEGREES)), [360] * 3)
+
+        self.motors[0].set_rotation(90, DEGREES)
+        self.assertEqual(list(group.states.positions(TURNS)), [0.25, 1, 1])
+
+        group.reset_rotation()
+        self.assertEqual(list(group.states.position), [0] * 3)
+
+    def test_raw_rotation_in_encoder_ticks(self):
+        self.motors[0].set_position(480, RotationUnits.RAW)
+        self.motors[1].set_rotation(960, RotationUnits.RAW)
+        v5_motor = Motor(Ports.PORT4, GearSetting.RATIO_18_1, False)
+        v5_motor.set_rotation(450, RotationUnits.RAW)
+        self.assertEqual([motor.states.position[motor.slot]
+                          for motor in (*self.motors[:2], v5_motor)], [180, 360, 180])
+
+        group = MotorGroup(self.motors)
+        group.set_rotation(240, RotationUnits.RAW)
+        self.assertEqual(list(group.states.position), [90] * 3)
+
+    def test_raw_velocity_in_encoder_ticks_per_second(self):
+        # 960 ticks per second: 1 turn per second of an IQ motor's 127 rpm
+        self.motors[0].set_velocity(960, VelocityUnits.RAW)
+        self.motors[0].spin(FORWARD)
+        self.assertAlmostEqual(self.motors[0].states.command[self.motors[0].slot],
+                               100 * 60 / 127)
+        self.assertAlmostEqual(self.motors[0].velocity_units.convert(
+            100, PERCENT, VelocityUnits.RAW), 127 / 60 * 960)
+
+    def test_max_torque(self):
+        group = MotorGroup(self.motors)
+        group.set_max_torque(0.207, TorqueUnits.NM)
+        self.assertEqual([round(motor.max_torque) for motor in self.motors], [50] * 3)
+
+        group.set_max_torque_percent(80)
+        self.assertEqual(list(group.states.max_torque), [80] * 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
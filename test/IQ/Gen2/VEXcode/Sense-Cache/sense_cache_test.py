@@ -0,0 +1,69 @@
+"""vex.SenseCache tests."""
+
+
+import unittest
+
+from vex import Motor, Ports, SenseCache, DEGREES, TURNS, FORWARD
+from vex._util.io import replace_stdin
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSenseCache(unittest.TestCase):
+    def setUp(self):
+        self.motor = Motor(Ports.PORT1)
+        self.clock = FakeClock()
+        self.cache = SenseCache(clock=self.clock)
+        self.cache.enable()
+
+    def tearDown(self):
+        self.cache.disable()
+
+    def test_memoizes_within_tick(self):
+        with replace_stdin('90'):
+            self.assertEqual(self.motor.position(DEGREES), 90)
+        # no more stdin input: must be answered from cache
+        with replace_stdin(''):
+            self.assertEqual(self.motor.position(DEGREES), 90)
+            self.assertEqual(self.motor.position(), 90)
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 1))
+
+    def test_derives_other_units(self):
+        with replace_stdin('90'):
+            self.motor.position(DEGREES)
+        with replace_stdin(''):
+            self.assertEqual(self.motor.position(TURNS), 0.25)
+        self.assertEqual(self.cache.derivations, 1)
+
+    def test_clock_advance_invalidates(self):
+        with replace_stdin('90\n180'):
+            self.motor.position(DEGREES)
+            self.clock.now = 1
+            self.assertEqual(self.motor.position(DEGREES), 180)
+
+    def test_act_invalidates_device(self):
+        with replace_stdin('90\n0'):
+            self.motor.position(DEGREES)
+            self.motor.set_rotation(0, DEGREES)
+            self.assertEqual(self.motor.position(DEGREES), 0)
+        self.assertEqual(self.cache.invalidations, 1)
+
+    def test_context_manager(self):
+        self.cache.disable()
+        with SenseCache() as cache:
+            self.assertTrue(cache.is_enabled)
+        self.assertFalse(cache.is_enabled)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""vex.sim.battery tests."""
+
+
+import unittest
+
+from vex import Brain, DriveTrain, Motor, Ports, FORWARD
+from vex.sim import BatteryModel, CollisionWorld
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+class TestBatteryModel(unittest.TestCase):
+    def setUp(self):
+        self.world = CollisionWorld()
+        self.drivetrain = DriveTrain(Motor(Ports.PORT1), Motor(Ports.PORT6, True))
+        self.robot = self.world.add_robot(self.drivetrain, 1000, 500)
+        self.battery = BatteryModel(world=self.world, body=self.robot)
+        self.battery.add_motors(self.drivetrain)
+
+    def test_current_and_capacity(self):
+        self.assertAlmostEqual(self.battery.current(), .1)
+        self.drivetrain.drive(FORWARD)
+        # 2 motors at 50% of .2 A free-running current
+        self.assertAlmostEqual(self.battery.current(), .3)
+
+        self.battery.step(3600)
+        self.assertAlmostEqual(self.battery.percent(), 85)
+
+        brain = Brain()
+        self.battery.attach(brain.battery)
+        self.assertEqual(brain.battery.capacity(), 85)
+
+    def test_sag_slows_robot(self):
+        self.drivetrain.drive(FORWARD)
+        self.battery.charge = .2
+        self.battery.step(.001)
+        self.assertLess(self.battery.voltage(), 7.2)
+        self.assertLess(self.world.speed_scale[self.robot], 1)
+
+        x = self.world.x[self.robot]
+        self.world.step(1)
+        self.assertLess(self.world.x[self.robot] - x, 127 / 2 / 60 * 200)
+
+    def test_projection_matches_stepping(self):
+        plan = [(15, 1.), (45, 3.), (60, .5)] * 20
+        projection = self.battery.project(plan)
+
+        for duration, current in plan:
+            self.battery.add_load(current - self.battery.load_current)
+            for _ in range(round(duration)):
+                self.battery.step(1)
+
+        self.assertAlmostEqual(projection.capacity, self.battery.percent())
+        self.assertAlmostEqual(projection.voltage, self.battery.voltage())
+        self.assertIsNone(projection.depleted_at)
+
+    def test_depletion(self):
+        # terminal voltage under 4 A sags by 1 V, hitting 6 V with
+        # 1 / 2.4 of 2 Ah capacity left
+        self.assertAlmostEqual(self.battery.endurance(4.), (2 - 2 / 2.4) / 4 * 3600)
+        projection = self.battery.project([(600, 4.), (3600, 4.)])
+        self.assertAlmostEqual(projection.depleted_at, 1050)
+        self.assertEqual(projection.capacity, 0)
+        self.assertAlmostEqual(projection.min_voltage, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
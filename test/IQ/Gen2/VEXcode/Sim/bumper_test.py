@@ -0,0 +1,100 @@
+"""vex.sim.bumper tests."""
+
+
+from collections import deque
+import unittest
+
+from vex import Bumper, DriveTrain, Motor, Ports, FORWARD, REVERSE
+from vex.sim import CollisionWorld, SimulatedBumpers
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+class TestSimulatedBumpers(unittest.TestCase):
+    def setUp(self):
+        self.world = CollisionWorld()
+        self.world.add_walls(length=2000, width=1000)
+        self.drivetrain = DriveTrain(Motor(Ports.PORT1), Motor(Ports.PORT6, True))
+        self.robot = self.world.add_robot(self.drivetrain, 1000, 500)
+
+        self.bumpers = SimulatedBumpers(self.world, debounce=.01)
+        self.front, self.back = Bumper(Ports.PORT2), Bumper(Ports.PORT3)
+        self.bumpers.mount(self.front, self.robot, 100, 0)
+        self.bumpers.mount(self.back, self.robot, -100, 0)
+
+        self.log = []
+        self.front.pressed(lambda: self.log.append('front pressed'))
+        self.back.pressed(lambda: self.log.append('back pressed'))
+        self.back.released(lambda: self.log.append('back released'))
+
+    def run_for(self, seconds, dt=.001):
+        for _ in range(round(seconds / dt)):
+            self.world.step(dt)
+            self.bumpers.update(dt)
+
+    def test_no_polling_threads(self):
+        self.assertIs(self.front.sense_source, self.bumpers)
+        self.assertEqual(len(self.back.released_callbacks), 1)
+
+    def test_contact_presses_mounted_bumper_only(self):
+        self.drivetrain.drive(REVERSE)
+        self.run_for(5)
+        self.assertTrue(self.back.pressing())
+        self.assertFalse(self.front.pressing())
+
+        self.assertEqual(self.bumpers.dispatch(), 1)
+        self.assertEqual(self.log, ['back pressed'])
+        self.assertEqual(self.bumpers.dispatch(), 0)
+
+        self.drivetrain.drive(FORWARD)
+        self.run_for(.1)
+        self.assertFalse(self.back.pressing())
+        self.bumpers.dispatch()
+        self.assertEqual(self.log, ['back pressed', 'back released'])
+
+    def test_debounce(self):
+        self.drivetrain.drive(REVERSE)
+        while not self.world.contacts:
+            self.run_for(.001)
+        contact_time = self.bumpers.time
+
+        self.run_for(.005)
+        self.assertFalse(self.back.pressing())  # still settling
+
+        # brief chatter restarts debounce
+        self.drivetrain.stop()
+        self.run_for(.001)
+        self.drivetrain.drive(REVERSE)
+        self.run_for(.009)
+        self.assertFalse(self.back.pressing())
+        self.run_for(.003)
+        self.assertTrue(self.back.pressing())
+        self.assertGreater(self.bumpers.events[0].time - contact_time, .01)
+
+    def test_shared_event_queue(self):
+        events = deque()
+        other_world = CollisionWorld()
+        other_world.add_walls(length=2000, width=1000)
+        other_drivetrain = DriveTrain(Motor(Ports.PORT1), Motor(Ports.PORT6, True))
+        other_robot = other_world.add_robot(other_drivetrain, 1000, 500)
+
+        first = SimulatedBumpers(self.world, events=events)
+        second = SimulatedBumpers(other_world, debounce=0, events=events)
+        first.mount(Bumper(Ports.PORT4), self.robot, -100, 0)
+        second.mount(Bumper(Ports.PORT4), other_robot, 100, 0)
+
+        self.drivetrain.drive(REVERSE)
+        other_drivetrain.drive(FORWARD)
+        for _ in range(5000):
+            for world, bumpers in ((self.world, first), (other_world, second)):
+                world.step(.001)
+                bumpers.update(.001)
+
+        self.assertEqual([event.pressed for event in events], [True, True])
+        self.assertEqual(first.dispatch(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""vex.sim.checkpoint tests."""
+
+
+import random
+import unittest
+
+from vex import DriveTrain, Motor, Ports, FORWARD, REVERSE, PERCENT, DEGREES, TURNS
+from vex.brain.screen import BrainLcd
+from vex._common_enums.color import Color
+from vex.sim import BatteryModel, Checkpoint, CollisionWorld, MotorModel, WorldState
+from vex.time import VirtualClock
+from vex.touch_led import LedAnimator
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+class TestWorldState(unittest.TestCase):
+    def setUp(self):
+        self.world = CollisionWorld()
+        self.world.add_walls(length=2000, width=1000)
+        self.drivetrain = DriveTrain(Motor(Ports.PORT1), Motor(Ports.PORT6, True))
+        self.robot = self.world.add_robot(self.drivetrain, 1000, 500)
+        self.model = MotorModel(world=self.world)
+        self.model.attach(self.drivetrain, body=self.robot)
+        self.battery = BatteryModel(world=self.world, body=self.robot)
+        self.battery.add_motors(self.drivetrain)
+
+        self.clock = VirtualClock()
+        self.animator = LedAnimator(clock=self.clock)
+        self.led = type('Led', (), {})()
+        self.animator.attach(self.led)
+        self.screen = BrainLcd()
+
+        self.state = WorldState()
+        for obj in (self.world, self.model, self.battery, self.clock,
+                    self.animator, self.screen):
+            self.state.add(obj)
+        self.state.add_motors(self.drivetrain)
+        self.state.add_rng()
+
+    def run_for(self, seconds, dt=.01):
+        for _ in range(round(seconds / dt)):
+            self.world.step(dt)
+            self.model.step(dt)
+            self.battery.step(dt)
+            self.clock.advance(dt)
+
+    def snapshot(self):
+        return (self.world.pose(self.robot), list(self.model.speed),
+                self.battery.charge, self.clock(), list(self.animator.times),
+                self.screen.pen_color, list(self.drivetrain.engine.states.command),
+                self.drivetrain.engine.motors[0].mailbox.latest,
+                random.random())
+
+    def test_restore(self):
+        self.drivetrain.set_drive_velocity(100, PERCENT)
+        self.drivetrain.drive(FORWARD)
+        self.run_for(.5)
+        self.animator.on(self.led, 0xFF0000)
+
+        random.seed(1)
+        checkpoint = self.state.checkpoint()
+        expected = self.snapshot()
+        self.state.restore(checkpoint)
+
+        self.drivetrain.drive_for(REVERSE, 100, wait=False)
+        self.screen.pen_color = Color.RED
+        self.run_for(.5)
+        self.animator.off(self.led)
+        self.assertNotEqual(self.snapshot()[:-1], expected[:-1])
+
+        self.state.restore(checkpoint)
+        self.assertEqual(self.snapshot(), expected)
+        self.assertIs(self.screen.pen_color, Color.WHITE)
+
+    def test_restored_move_continues_deterministically(self):
+        motor = self.drivetrain.engine.motors[0]
+        motor.start_spin_for(FORWARD, 2, TURNS)
+        self.run_for(.2)
+        checkpoint = self.state.checkpoint()
+        self.run_for(2)
+        expected = motor.position(DEGREES), motor.mailbox.latest.completed
+        self.assertAlmostEqual(expected[0], 720, delta=1)
+        self.assertTrue(expected[1])
+
+        self.state.restore(checkpoint)
+        motor.start_spin_for(REVERSE, 1, TURNS)
+        self.run_for(.3)
+
+        self.state.restore(checkpoint)
+        self.run_for(2)
+        self.assertEqual((motor.position(DEGREES), motor.mailbox.latest.completed), expected)
+
+    def test_unchanged_regions_shared(self):
+        first = self.state.checkpoint()
+        self.drivetrain.drive(FORWARD)
+        self.run_for(.1)
+        second = self.state.checkpoint()
+
+        # e.g. body geometry & LED timeline unchanged, poses changed
+        self.assertGreater(second.shared_bytes(first), 0)
+        self.assertLess(second.shared_bytes(first), second.nbytes)
+        self.assertEqual(self.state.checkpoint().shared_bytes(second), second.nbytes)
+
+    def test_contiguous_buffer_round_trip(self):
+        self.drivetrain.drive(FORWARD)
+        self.run_for(.1)
+        checkpoint = self.state.checkpoint()
+        pose = self.world.pose(self.robot)
+        buffer = checkpoint.to_bytes()
+
+        self.run_for(.1)
+        self.state.restore(Checkpoint.from_bytes(buffer))
+        self.assertEqual(self.world.pose(self.robot), pose)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+"""vex.sim.collision tests."""
+
+
+import random
+import unittest
+
+from drivetrain import Drivetrain
+from vex import Bumper, Distance, DriveTrain, Inertial, Motor, Ports, FORWARD, REVERSE, RIGHT, INCHES, MM
+from vex.motor.torque import TorqueUnits
+from vex._device import DEVICE_REGISTRY
+from vex.sim import CollisionWorld, drive_geometry
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+class TestCollisionWorld(unittest.TestCase):
+    def setUp(self):
+        DEVICE_REGISTRY.clear()
+        self.world = CollisionWorld()
+        self.world.add_walls(length=2000, width=1000)
+        self.drivetrain = DriveTrain(Motor(Ports.PORT1), Motor(Ports.PORT6, True))
+        self.robot = self.world.add_robot(self.drivetrain, 1000, 500)
+
+    def run_for(self, seconds, dt=.001):
+        for _ in range(round(seconds / dt)):
+            self.world.step(dt)
+
+    def test_geometry(self):
+        self.assertEqual(drive_geometry(self.drivetrain), (200, 176, 1))
+        self.assertEqual(drive_geometry(Drivetrain(Motor(Ports.PORT1), Motor(Ports.PORT6), 8, 7, INCHES, 2)),
+                         (8 * 25.4, 7 * 25.4, 2))
+
+    def test_footprint_is_wheel_base_by_track_width(self):
+        drivetrain = DriveTrain(Motor(Ports.PORT2), Motor(Ports.PORT7, True), 250, 170, MM, 1, 120)
+        self.assertEqual(drive_geometry(drivetrain), (250, 170, 1))
+        robot = self.world.add_robot(drivetrain, 500, 500)
+        self.assertEqual(self.world.half_length[robot], 60)
+        self.assertEqual(self.world.half_width[robot], 85)
+
+        drivetrain.drive(FORWARD)
+        for _ in range(1000):
+            self.world.step(.001)
+        # 50% of 127 rpm, 250 mm per wheel turn
+        self.assertAlmostEqual(self.world.pose(robot)[0], 500 + 127 / 2 / 60 * 250, places=6)
+
+    def test_drive_and_turn(self):
+        self.drivetrain.drive(FORWARD)
+        self.run_for(1)
+        x, y, heading = self.world.pose(self.robot)
+        # 50% of 127 rpm, 200 mm per wheel turn
+        self.assertAlmostEqual(x, 1000 + 127 / 2 / 60 * 200, places=6)
+        self.assertAlmostEqual(y, 500)
+
+        self.drivetrain.turn(RIGHT)
+        self.run_for(.5)
+        self.assertLess(self.world.pose(self.robot)[2], 0)
+
+        self.drivetrain.stop()
+        pose = self.world.pose(self.robot)
+        self.run_for(.1)
+        self.assertEqual(self.world.pose(self.robot), pose)
+
+    def test_heading_and_distance_readings(self):
+        inertial, distance = Inertial(), Distance(Ports.PORT3)
+        for device in (inertial, distance):
+            self.world.attach(device, self.robot)
+        # front edge 100 mm ahead of center, wall face at x = 2000
+        self.assertAlmostEqual(distance.object_distance(), 900)
+        self.assertTrue(distance.is_object_detected())
+
+        self.drivetrain.turn(RIGHT)
+        self.run_for(.5)
+        self.assertAlmostEqual(inertial.rotation(), -self.world.pose(self.robot)[2])
+        self.assertGreater(inertial.heading(), 0)
+        self.assertLess(distance.object_distance(INCHES), 900 / 25.4)
+
+    def test_wall_blocks_robot_and_loads_motors(self):
+        bumper = Bumper(Ports.PORT2)
+        self.world.attach(bumper, self.robot)
+        motor = self.drivetrain.motors[0]
+
+        self.drivetrain.drive(REVERSE)
+        self.run_for(.1)
+        self.assertFalse(bumper.pressing())
+        self.assertEqual(motor.current(), 0)
+
+        self.run_for(5)
+        self.assertAlmostEqual(self.world.pose(self.robot)[0], 100, delta=1)
+        self.assertTrue(bumper.pressing())
+        self.assertAlmostEqual(self.world.blocked[self.robot], 1)
+        self.assertAlmostEqual(motor.current(), 1.25)
+        self.assertAlmostEqual(motor.torque(TorqueUnits.NM), .207)
+
+        self.drivetrain.drive(FORWARD)
+        self.run_for(.1)
+        self.assertFalse(bumper.pressing())
+        self.assertEqual(motor.torque(), 0)
+
+    def test_separating_axis(self):
+        world = CollisionWorld()
+        square = world.add_box(0, 0, 100, 100)
+        diamond = world.add_box(125, 0, 100, 100, heading=45, static=False)
+        self.assertEqual(len(world.step(.001)), 0)  # circles overlap, SAT separates
+
+        world.x[diamond] = 100
+        contacts = world.step(.001)
+        self.assertEqual(len(contacts), 1)
+        self.assertAlmostEqual(contacts[0].normal_x, 1)
+        self.assertAlmostEqual(world.x[diamond], 50 + 50 * 2 ** .5)
+        self.assertEqual(world.x[square], 0)
+
+    def test_broad_phase_scales(self):
+        random.seed(0)
+        world = CollisionWorld()
+        world.add_walls(length=10000, width=10000)
+        for _ in range(200):
+            drivetrain = DriveTrain(Motor(Ports.PORT1), Motor(Ports.PORT6, True))
+            world.add_robot(drivetrain, random.uniform(200, 9800), random.uniform(200, 9800),
+                            heading=random.uniform(0, 360))
+            drivetrain.drive(FORWARD)
+
+        for _ in range(10):
+            world.step(.001)
+        self.assertLess(world.n_candidates, 200 * 10)
+        for contact in world.contacts:
+            self.assertLess(world._separation(contact.first, contact.second) or (0, 0, 0),
+                            (2, 2, 1e-6))
+
+
+if __name__ == "__main__":
+    unittest.main()
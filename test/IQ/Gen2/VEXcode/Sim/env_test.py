@@ -0,0 +1,141 @@
+"""vex.sim.env tests."""
+
+
+import random
+from types import SimpleNamespace
+import unittest
+
+from vex import Distance, DriveTrain, Inertial, Motor, Ports, Vision
+from vex._util.decor import NO_READING
+from vex.sim import (AsyncVectorEnv, RobotEnv, Sense, SyncVectorEnv, VectorEnv,
+                     env_throughput_benchmark)
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+def make_env(max_episode_steps=500):
+    left, right = Motor(Ports.PORT1), Motor(Ports.PORT6, True)
+    return RobotEnv(DriveTrain(left, right),
+                    [Sense(left, 'position'), Sense(right, 'position'),
+                     Sense(Inertial(), 'heading'),
+                     Sense(Distance(Ports.PORT3), 'object_distance')],
+                    max_episode_steps=max_episode_steps,
+                    reward=lambda env: env.world.pose(env.body)[0])
+
+
+def make_short_env():
+    return make_env(max_episode_steps=3)
+
+
+class Camera:
+    def read(self, device, method_name, args):
+        return (SimpleNamespace(exists=True, centerX=160, centerY=100, width=40, height=30)
+                if method_name == 'largest_object' else NO_READING)
+
+
+class TestRobotEnv(unittest.TestCase):
+    def setUp(self):
+        self.env = make_env()
+
+    def test_observations_from_senses(self):
+        observation, info = self.env.reset()
+        self.assertEqual((self.env.observation_size, self.env.action_size), (4, 2))
+        self.assertEqual(observation.tolist(), [0, 0, 0, 2438.4 / 2 - 100])
+        self.assertEqual(info, {})
+
+        observation, reward, terminated, truncated, _ = self.env.step([100, 0])
+        self.assertGreater(observation[0], 0)
+        self.assertAlmostEqual(observation[0], observation[1])
+        self.assertLess(observation[3], 2438.4 / 2 - 100)
+        self.assertGreater(reward, 2438.4 / 2)
+        self.assertEqual((terminated, truncated), (False, False))
+
+        observation = self.env.step([0, 50])[0]
+        self.assertGreater(observation[2], 0)
+
+    def test_reset_restores_initial_state(self):
+        initial = self.env.reset()[0]
+        for _ in range(10):
+            self.env.step([80, 20])
+        self.assertNotEqual(self.env.observe(), initial)
+        self.assertEqual(self.env.reset()[0], initial)
+        self.assertEqual(self.env.n_steps, 0)
+
+    def test_motor_actions(self):
+        arm = Motor(Ports.PORT10)
+        env = RobotEnv(DriveTrain(Motor(Ports.PORT1), Motor(Ports.PORT6, True)),
+                       [Sense(arm, 'position'), Sense(arm, 'velocity')],
+                       motors=(arm,))
+        self.assertEqual(env.action_size, 1)
+        observation = env.step([-150])[0]
+        self.assertLess(observation[0], 0)
+        self.assertAlmostEqual(observation[1], -95)
+
+    def test_vision_object_flattened(self):
+        vision = Vision(Ports.PORT2)
+        vision.sense_source = Camera()
+        env = RobotEnv(DriveTrain(Motor(Ports.PORT1), Motor(Ports.PORT6, True)),
+                       [Sense(vision, 'largest_object')])
+        self.assertEqual(env.observe().tolist(), [1, 160, 100, 40, 30])
+
+
+class TestVectorEnv(unittest.TestCase):
+    def test_sync_batch_and_autoreset(self):
+        with SyncVectorEnv([make_short_env] * 3) as env:
+            observations, _ = env.reset(seed=0)
+            self.assertEqual(len(observations.tolist()), 3)
+
+            for _ in range(2):
+                observations, rewards, terminations, truncations, infos = \
+                    env.step([[100, 0], [50, 0], [0, 0]])
+            self.assertGreater(observations[0, 0], observations[1, 0])
+            self.assertEqual(observations[2, 0], 0)
+            self.assertEqual(truncations.tolist(), [False] * 3)
+
+            observations, rewards, terminations, truncations, infos = \
+                env.step([[100, 0]] * 3)
+            self.assertEqual(truncations.tolist(), [True] * 3)
+            self.assertEqual(terminations.tolist(), [False] * 3)
+            self.assertGreater(infos['final_observation'][0][0], 0)
+            self.assertEqual(observations[0, 0], 0)
+            self.assertEqual(env.n_env_steps, 9)
+            self.assertGreater(env.steps_per_second, 0)
+
+    def test_envs_have_independent_rngs(self):
+        global_state = random.getstate()
+        expected = random.Random(3)
+        with SyncVectorEnv([make_env] * 2) as env:
+            env.reset(seed=[3, 4])
+            self.assertEqual(env.envs[0].rng.random(), expected.random())
+            # (another env's reset does not reseed this env's draws)
+            env.envs[1].reset(seed=5)
+            self.assertEqual(env.envs[0].rng.random(), expected.random())
+            self.assertEqual(env.envs[1].rng.random(), random.Random(5).random())
+        self.assertEqual(random.getstate(), global_state)
+
+    def test_vector_env_is_abstract(self):
+        with self.assertRaises(TypeError):
+            VectorEnv(1, 1, 1)
+
+    def test_async_matches_sync(self):
+        actions = [[100, 0], [50, 20], [-30, 10], [0, -40]]
+        with SyncVectorEnv([make_env] * 4) as sync_env, \
+                AsyncVectorEnv([make_env] * 4, n_workers=2) as async_env:
+            self.assertEqual(sync_env.reset(seed=1)[0].tolist(),
+                             async_env.reset(seed=1)[0].tolist())
+            for _ in range(5):
+                expected = [result.tolist() for result in sync_env.step(actions)[:4]]
+                self.assertEqual([result.tolist() for result in async_env.step(actions)[:4]],
+                                 expected)
+
+    def test_throughput_benchmark(self):
+        stats = env_throughput_benchmark(make_env, n_envs=4, n_steps=5, n_workers=2)
+        self.assertEqual((stats.n_envs, stats.n_steps), (4, 5))
+        self.assertGreater(stats.sync_steps_per_second, 0)
+        self.assertGreater(stats.async_steps_per_second, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
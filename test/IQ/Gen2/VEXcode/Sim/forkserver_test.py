@@ -0,0 +1,63 @@
+"""vex.sim.forkserver tests."""
+
+
+import unittest
+
+from vex.sim import ForkServer, spawn_latency_benchmark
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+class TestForkServer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ForkServer()
+
+    def test_child_gets_fresh_vexcode_devices(self):
+        run = self.server.run(0, '''
+from vexcode import *
+from vex._device import DEVICE_REGISTRY
+
+assert len(DEVICE_REGISTRY) == 2, list(DEVICE_REGISTRY)
+assert drivetrain.left_motor.states.command[0] == 0
+drivetrain.drive(FORWARD)
+''')
+        self.assertTrue(run.ok, run.error)
+
+    def test_children_do_not_share_state(self):
+        # a device constructed by one program is gone in the next
+        self.assertTrue(self.server.run(0, 'from vex import Motor, Ports\n'
+                                           'Motor(Ports.PORT3)').ok)
+        run = self.server.run(1, 'from vex import Ports\n'
+                                 'from vex._device import DEVICE_REGISTRY\n'
+                                 'assert Ports.PORT3 not in DEVICE_REGISTRY')
+        self.assertTrue(run.ok, run.error)
+
+    def test_failures_reported(self):
+        pids = [self.server.start(0, 'raise ValueError("boom")'),
+                self.server.start(1, 'import sys\nsys.exit(3)')]
+        self.assertEqual(len(pids), 2)
+
+        runs = self.server.join()
+        self.assertEqual(runs[0].error, 'ValueError: boom')
+        self.assertEqual(runs[1].error, 'exit status 3')
+
+    def test_sys_exit_codes(self):
+        self.assertTrue(self.server.run(0, 'import sys\nsys.exit()').ok)
+        self.assertTrue(self.server.run(1, 'import sys\nsys.exit(0)').ok)
+        self.assertEqual(self.server.run(2, 'import sys\nsys.exit("gave up")').error,
+                         'gave up')
+
+
+class TestSpawnLatency(unittest.TestCase):
+    def test_fork_faster_than_fresh_interpreter(self):
+        stats = spawn_latency_benchmark(3, n_fresh_spawns=1)
+        self.assertEqual(stats.n_spawns, 3)
+        self.assertLess(stats.fork_median, stats.fresh_median)
+        self.assertGreater(stats.speedup, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,230 @@
+"""vex.sim.motor tests."""
+
+
+from threading import Event, Thread
+import unittest
+
+from motor_group import MotorGroup as RobotMeshMotorGroup
+from vex import DriveTrain, Motor, MotorGroup, Ports, FORWARD, REVERSE, RIGHT, MM, PERCENT, DEGREES, TURNS, SECONDS, TemperatureUnits
+from vex.motor.torque import TorqueUnits
+from vex.sim import CollisionWorld, MotorModel
+from vex.sim.motor import EFFICIENCY_TABLES
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+class TestMotorModel(unittest.TestCase):
+    def setUp(self):
+        self.world = CollisionWorld()
+        self.world.add_walls(length=2000, width=1000)
+        self.drivetrain = DriveTrain(Motor(Ports.PORT1), Motor(Ports.PORT6, True))
+        self.robot = self.world.add_robot(self.drivetrain, 1000, 500)
+        self.model = MotorModel(world=self.world)
+        self.model.attach(self.drivetrain, body=self.robot)
+        self.left = self.drivetrain.engine.motors[0]
+
+    def run_for(self, seconds, dt=.01):
+        for _ in range(round(seconds / dt)):
+            self.world.step(dt)
+            self.model.step(dt)
+
+    def test_efficiency_tables(self):
+        for table in EFFICIENCY_TABLES.values():
+            self.assertEqual((len(table), table[0], table[100]), (101, 0, 0))
+            self.assertGreater(max(table[10:40]), max(table[60:]))
+
+    def test_free_running(self):
+        self.drivetrain.set_drive_velocity(100, PERCENT)
+        self.drivetrain.drive(FORWARD)
+        self.run_for(1)
+        self.assertAlmostEqual(self.left.current(), .2 + 2.3 * .05)
+        self.assertAlmostEqual(self.left.torque(TorqueUnits.NM), .05 * .414)
+        self.assertGreater(self.left.efficiency(), 0)
+        self.assertLess(self.left.temperature(TemperatureUnits.CELSIUS), 26)
+
+    def test_encoder_turns_at_modeled_speed(self):
+        self.drivetrain.set_drive_velocity(100, PERCENT)
+        self.drivetrain.drive(FORWARD)
+        self.run_for(1)
+        self.assertAlmostEqual(self.left.position(DEGREES), (1 - .05) * 127 * 6)
+        self.assertAlmostEqual(self.left.rotation(TURNS), (1 - .05) * 127 / 60)
+
+        self.left.set_position(0, DEGREES)
+        self.drivetrain.drive(REVERSE)
+        self.run_for(.5)
+        self.assertLess(self.left.position(), 0)
+
+    def test_drive_for_travels_distance(self):
+        stepped = Event()
+
+        def step():
+            while not stepped.is_set():
+                self.world.step(.01)
+                self.model.step(.01)
+
+        # preempting a running drive
+        self.drivetrain.drive(FORWARD)
+        self.run_for(.2)
+        thread = Thread(target=step)
+        thread.start()
+        self.drivetrain.drive_for(FORWARD, 400, MM)
+        stepped.set()
+        thread.join()
+
+        # 200 mm wheel travel per turn, from each move's start
+        for motor in self.drivetrain.engine.motors:
+            move = motor.mailbox.latest
+            self.assertTrue(move.completed)
+            self.assertAlmostEqual((motor.position(DEGREES) - move.motion.start) / 360 * 200,
+                                   400, delta=5)
+
+    def test_turn_for_turns_sides_apart(self):
+        self.drivetrain.turn_for(RIGHT, 90, DEGREES, wait=False)
+        self.run_for(2)
+        left, right = (motor.position(DEGREES) for motor in self.drivetrain.engine.motors)
+        # wheels travel a quarter of the 176 mm track width's circle
+        self.assertAlmostEqual(left, 3.1416 * 176 / 4 / 200 * 360, delta=5)
+        self.assertAlmostEqual(right, -left, delta=5)
+
+    def test_stall_heats_and_limits_current(self):
+        self.drivetrain.set_drive_velocity(100, PERCENT)
+        self.drivetrain.drive(FORWARD)
+        self.run_for(5)
+        self.assertAlmostEqual(self.left.current(), 2.5)
+        self.assertEqual(self.left.efficiency(), 0)
+
+        # (robot stays pressed against wall)
+        for _ in range(600):
+            self.model.step(1)
+        self.assertGreaterEqual(self.left.temperature(), 55)
+        self.assertLessEqual(self.left.current(), .2 + 2.3 * .5)
+        self.assertGreater(self.left.temperature(TemperatureUnits.FAHRENHEIT), 131)
+
+    def test_max_torque(self):
+        self.left.set_max_torque_percent(20)
+        self.drivetrain.set_drive_velocity(100, PERCENT)
+        self.drivetrain.drive(FORWARD)
+        self.run_for(5)
+        self.assertAlmostEqual(self.left.torque(), .2 * .414)
+
+    def test_cools_when_stopped(self):
+        self.model.temperature[0] = 60
+        for _ in range(360):
+            self.model.step(10)
+        self.assertAlmostEqual(self.left.temperature(), 25, places=3)
+        self.assertEqual(self.left.current(), 0)
+
+
+class TestLimits(unittest.TestCase):
+    def setUp(self):
+        self.model = MotorModel()
+        self.arm = Motor(Ports.PORT2)
+        self.model.attach(self.arm)
+
+    def run_for(self, seconds, dt=.01):
+        for _ in range(round(seconds / dt)):
+            self.model.step(dt)
+
+    def test_load_slows_motor(self):
+        self.arm.spin(FORWARD, 100, PERCENT)
+        self.model.set_load(self.arm, .1656)
+        self.run_for(.1)
+        self.assertAlmostEqual(self.arm.velocity(PERCENT), 100 - 5 - 40)
+        self.assertTrue(self.arm.is_spinning())
+
+    def test_torque_limit_stalls_motor(self):
+        self.arm.set_max_torque_percent(30)
+        self.arm.spin(REVERSE, 100, PERCENT)
+        self.model.set_load(self.arm, .1656)
+        self.run_for(.1)
+        self.assertEqual(self.arm.velocity(PERCENT), 0)
+        self.assertFalse(self.arm.is_spinning())
+        self.assertAlmostEqual(self.arm.torque(), .3 * .414)
+
+    def test_current_limit(self):
+        self.arm.set_max_torque_current(.5)
+        self.arm.spin(FORWARD, 100, PERCENT)
+        self.model.set_load(self.arm, .3)
+        self.run_for(.1)
+        self.assertAlmostEqual(self.arm.current(), .5)
+        self.assertEqual(self.arm.velocity(PERCENT), 0)
+
+    def test_move_completes(self):
+        self.arm.set_timeout(1, SECONDS)
+        self.arm.spin_for(FORWARD, 90, DEGREES)
+        self.run_for(.1)
+        self.assertFalse(self.arm.is_done())
+        self.run_for(.2)
+        self.assertTrue(self.arm.is_done())
+        self.assertFalse(self.arm.did_timeout())
+        self.assertEqual(self.arm.velocity(PERCENT), 0)
+
+    def test_stalled_move_times_out(self):
+        self.arm.set_timeout(1, SECONDS)
+        self.model.set_load(self.arm, 1, TorqueUnits.NM)
+        self.arm.spin_for(FORWARD, 1, TURNS)
+        self.run_for(.99)
+        self.assertFalse(self.arm.did_timeout())
+        self.run_for(.02)
+        self.assertTrue(self.arm.did_timeout())
+        self.assertTrue(self.arm.is_done())
+
+        self.arm.spin_for(REVERSE, 1, TURNS)
+        self.run_for(.01)
+        self.assertFalse(self.arm.did_timeout())
+
+
+class TestMotorGroup(unittest.TestCase):
+    def setUp(self):
+        self.motors = [Motor(Ports.PORT1), Motor(Ports.PORT2)]
+        self.group = MotorGroup(*self.motors)
+        self.model = MotorModel()
+        self.model.attach(self.group)
+
+    def run_for(self, seconds, dt=.01):
+        for _ in range(round(seconds / dt)):
+            self.model.step(dt)
+
+    def test_spin_moves_motors(self):
+        self.group.set_velocity(100, PERCENT)
+        self.group.spin(FORWARD)
+        self.run_for(1)
+        for motor in self.motors:
+            self.assertAlmostEqual(motor.position(DEGREES), (1 - .05) * 127 * 6)
+
+        self.group.stop()
+        self.run_for(.01)
+        self.assertFalse(any(motor.is_spinning() for motor in self.motors))
+
+    def test_spin_for_waits_for_moves(self):
+        stepped = Event()
+
+        def step():
+            while not stepped.is_set():
+                self.model.step(.01)
+
+        thread = Thread(target=step)
+        thread.start()
+        self.group.spin_for(FORWARD, 90, DEGREES)
+        stepped.set()
+        thread.join()
+
+        self.assertTrue(all(motor.mailbox.latest.completed for motor in self.motors))
+        for motor in self.motors:
+            self.assertAlmostEqual(motor.position(DEGREES), 90, delta=5)
+
+    def test_robotmesh_start_spin_for(self):
+        group = RobotMeshMotorGroup(self.motors)
+        group.start_spin_for(REVERSE, 1, TURNS, 50, PERCENT)
+        self.run_for(.01)
+        self.assertFalse(any(motor.is_done() for motor in self.motors))
+        self.run_for(2)
+        self.assertTrue(all(motor.is_done() for motor in self.motors))
+        for motor in self.motors:
+            self.assertAlmostEqual(motor.position(DEGREES), -360, delta=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""vex.sim.subinterpreter tests."""
+
+
+import os
+from time import sleep
+import unittest
+
+from vex.sim import DeviceBridge, SubinterpreterRunner, subinterpreters_available
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+PROGRAM = '''
+from time import sleep
+from vex import Motor, Ports, FORWARD
+
+motor = Motor(Ports.PORT3)
+motor.spin(FORWARD, 40)
+motor.position()
+sleep(.1)
+assert motor.position() > 0, motor.position()
+'''
+
+
+class TestDeviceBridge(unittest.TestCase):
+    def test_attached_bridge_shares_values(self):
+        with DeviceBridge(2) as bridge:
+            attached = DeviceBridge.attach(bridge.path, 2)
+            attached.set(1, 4, 'command', 25)
+            self.assertEqual(bridge.get(1, 4, 'command'), 25)
+            self.assertEqual(bridge.column(1, 'command')[4], 25)
+            self.assertEqual(bridge.get(0, 4, 'command'), 0)
+            attached.close()
+
+            path = bridge.path
+        self.assertFalse(os.path.exists(path))
+
+    def test_integrate_turns_motors_at_commands(self):
+        with DeviceBridge() as bridge:
+            bridge.set(0, 2, 'device_type', 2)
+            bridge.set(0, 2, 'command', 50)
+            bridge.integrate(1)
+            self.assertEqual(bridge.motor_ports(0), [2])
+            self.assertEqual(bridge.get(0, 2, 'speed'), 50)
+            self.assertAlmostEqual(bridge.get(0, 2, 'position'), 127 * 3)
+
+
+class TestSubinterpreterRunner(unittest.TestCase):
+    def run_programs(self, processes):
+        with SubinterpreterRunner(2, processes=processes) as runner:
+            threads = [runner.start(0, PROGRAM),
+                       runner.start(1, 'raise ValueError("boom")')]
+            while any(thread.is_alive() for thread in threads):
+                runner.bridge.integrate(.01)
+                sleep(.005)
+            runs = runner.join()
+
+            self.assertTrue(runs[0].ok, runs[0].error)
+            self.assertIn('boom', runs[1].error)
+            self.assertEqual(runner.bridge.motor_ports(0), [2])
+            self.assertEqual(runner.bridge.get(0, 2, 'command'), 40)
+            self.assertEqual(runner.bridge.motor_ports(1), [])
+
+    def test_silent_exit_status_reported(self):
+        with SubinterpreterRunner(1, processes=True) as runner:
+            run = runner.run(0, 'import os\nos._exit(3)')
+        self.assertEqual(run.error, 'exit status 3')
+
+    @unittest.skipUnless(subinterpreters_available(), 'no sub-interpreters')
+    def test_programs_isolated_in_subinterpreters(self):
+        self.run_programs(processes=False)
+
+    def test_programs_isolated_in_processes(self):
+        self.run_programs(processes=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
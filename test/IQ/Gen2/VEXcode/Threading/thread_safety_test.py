@@ -0,0 +1,179 @@
+"""vex._util.sync tests."""
+
+
+from threading import Event, Thread
+from time import sleep
+import unittest
+
+from vex import Motor, Ports, PERCENT, RPM
+from vex.motor.profile import ProfileCache
+from vex.multi_device_group.engine import GroupEngine
+from vex.touch_led import LedAnimator
+from vex._util.cache import SenseCache
+from vex._util.sync import LockStripes, DEVICE_LOCKS, free_threaded, poll
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+N_THREADS = 8
+
+
+def hammer(*targets, n_threads=N_THREADS, n_iterations=2_000):
+    """Run each target(i) n_iterations times in n_threads threads each,
+    returning exceptions raised."""
+    errors = []
+
+    def run(target):
+        try:
+            for i in range(n_iterations):
+                target(i)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            errors.append(error)
+
+    threads = [Thread(group=None, target=run, name=None,
+                      args=(target,), kwargs={}, daemon=True)
+               for target in targets for _ in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+class TestLockStripes(unittest.TestCase):
+    def test_same_object_same_lock(self):
+        stripes, obj = LockStripes(8), object()
+        self.assertIs(stripes.lock_for(obj), stripes.lock_for(obj))
+        self.assertEqual(len(stripes), 8)
+
+    def test_locking_overlapping_sets_does_not_deadlock(self):
+        objs = [object() for _ in range(16)]
+        counter = [0]
+
+        def increment_forward(_):
+            with DEVICE_LOCKS.locking(objs):
+                counter[0] += 1
+
+        def increment_backward(_):
+            with DEVICE_LOCKS.locking(reversed(objs)):
+                counter[0] += 1
+
+        self.assertEqual(hammer(increment_forward, increment_backward,
+                                n_threads=4, n_iterations=500), [])
+        self.assertEqual(counter[0], 2 * 4 * 500)
+
+    def test_free_threaded(self):
+        self.assertIsInstance(free_threaded(), bool)
+
+
+class TestPoll(unittest.TestCase):
+    def test_calls_back_while_condition_holds_until_done(self):
+        holding, done, calls = Event(), Event(), []
+        thread = poll(holding.is_set, lambda: calls.append(1),
+                      until=done.is_set, interval=.001)
+
+        sleep(.02)
+        self.assertEqual(calls, [])
+
+        holding.set()
+        sleep(.05)
+        self.assertGreater(len(calls), 1)
+
+        done.set()
+        thread.join(timeout=1)
+        self.assertFalse(thread.is_alive())
+
+
+class TestMotorVelocity(unittest.TestCase):
+    PAIRS = {(50, PERCENT), (60, RPM)}
+
+    def test_velocity_and_unit_never_torn(self):
+        motor = Motor(Ports.PORT1)
+
+        def set_percent(_):
+            motor.set_velocity(50, PERCENT)
+
+        def set_rpm(_):
+            motor.set_velocity(60, RPM)
+
+        torn = []
+
+        def read(_):
+            if (pair := motor._resolve_velocity_and_unit(None, None)) not in self.PAIRS:  # pylint: disable=protected-access
+                torn.append(pair)
+
+        self.assertEqual(hammer(set_percent, set_rpm, read, n_threads=4), [])
+        self.assertEqual(torn, [])
+
+    def test_group_velocity_and_unit_never_torn(self):
+        motors = [Motor(port) for port in (Ports.PORT1, Ports.PORT2)]
+        engine = GroupEngine(*motors)
+
+        def set_percent(_):
+            engine.set_velocity(50, PERCENT)
+
+        def set_rpm(_):
+            engine.set_velocity(60, RPM)
+
+        torn = []
+
+        def read(i):
+            motor = motors[i % 2]
+            if (pair := motor._resolve_velocity_and_unit(None, None)) not in self.PAIRS:  # pylint: disable=protected-access
+                torn.append(pair)
+
+        self.assertEqual(hammer(set_percent, set_rpm, read, n_threads=4), [])
+        self.assertEqual(torn, [])
+
+
+class TestCaches(unittest.TestCase):
+    def test_profile_cache_lookups_all_counted(self):
+        cache = ProfileCache(maxsize=4)
+
+        def get(i):
+            cache.get(i % 8 * 10 + 10, 50)
+
+        n_iterations = 300
+        self.assertEqual(hammer(get, n_iterations=n_iterations), [])
+        self.assertEqual(cache.hits + cache.misses, N_THREADS * n_iterations)
+        self.assertLessEqual(len(cache), 4)
+
+    def test_sense_cache_lookups_all_counted(self):
+        cache = SenseCache()
+        devices = [object() for _ in range(4)]
+
+        def get_or_put(i):
+            device = devices[i % 4]
+            cache.get(device, 'position', (i % 3,))
+            cache.put(device, 'position', (i % 3,), i)
+            if not i % 50:
+                cache.invalidate(device)
+
+        self.assertEqual(hammer(get_or_put), [])
+        self.assertEqual(cache.hits + cache.derivations + cache.misses,
+                         N_THREADS * 2_000)
+
+
+class TestLedAnimator(unittest.TestCase):
+    def test_every_command_recorded(self):
+        animator = LedAnimator()
+        leds = [type('Led', (), {})() for _ in range(4)]
+        for led in leds:
+            animator.attach(led)
+
+        def command(i):
+            led = leds[i % 4]
+            if i % 3:
+                animator.on(led, 0xFF0000, i % 100)
+            else:
+                animator.set_brightness(led, i % 100)
+
+        self.assertEqual(hammer(command, n_iterations=500), [])
+        self.assertEqual(len(animator.times), N_THREADS * 500)
+        self.assertEqual(list(animator.times), sorted(animator.times))
+
+
+if __name__ == "__main__":
+    unittest.main()
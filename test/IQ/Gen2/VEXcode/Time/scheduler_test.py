@@ -0,0 +1,79 @@
+"""vex.time.scheduler tests."""
+
+
+from time import sleep
+import unittest
+
+from vex.time import Histogram, Scheduler, VirtualClock
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+class TestHistogram(unittest.TestCase):
+    def test_percentile(self):
+        histogram = Histogram((0, 1, 2, 4))
+        for value in (.5, .5, 1.5, 3, 10):
+            histogram.record(value)
+        self.assertEqual(list(histogram.counts), [2, 1, 1, 1])
+        self.assertEqual(histogram.percentile(40), 1)
+        self.assertEqual(histogram.percentile(80), 4)
+        self.assertEqual(histogram.percentile(100), float('inf'))
+
+
+class TestScheduler(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock()
+        self.scheduler = Scheduler(clock=self.clock)
+
+    def test_fixed_rate_under_load(self):
+        task = self.scheduler.add(lambda: self.clock.advance(.015), 50)
+        self.scheduler.run(1)
+
+        self.assertEqual(task.stats.n_ticks, 51)
+        self.assertAlmostEqual(task.stats.rate, 50)
+        self.assertAlmostEqual(task.stats.max_jitter, 0)
+        self.assertEqual(task.stats.n_overruns, 0)
+
+    def test_overrun(self):
+        durations = iter([.03] + [0] * 100)
+        task = self.scheduler.add(lambda: self.clock.advance(next(durations)), 50)
+        self.scheduler.run(.1)
+
+        self.assertEqual(task.stats.n_overruns, 1)
+        self.assertEqual(task.n_skipped, 0)
+        self.assertAlmostEqual(task.stats.max_latency, .01)
+        # back on the original 20ms grid after the late tick
+        self.assertAlmostEqual(task.stats.last_time, .1)
+
+    def test_skip_missed_periods(self):
+        durations = iter([.07] + [0] * 100)
+        task = self.scheduler.add(lambda: self.clock.advance(next(durations)), 50)
+        self.scheduler.run(.2)
+
+        self.assertEqual(task.n_skipped, 2)
+        self.assertEqual(task.stats.n_ticks, 9)
+
+    def test_multiple_rates(self):
+        fast = self.scheduler.add(lambda: None, 50, name='fast')
+        slow = self.scheduler.add(lambda: None, 10, name='slow')
+        self.scheduler.run(1)
+        self.assertEqual((fast.stats.n_ticks, slow.stats.n_ticks), (51, 11))
+
+        self.scheduler.remove(slow)
+        self.scheduler.run(1)
+        self.assertEqual((fast.stats.n_ticks, slow.stats.n_ticks), (101, 11))
+
+    def test_real_clock(self):
+        scheduler = Scheduler()
+        task = scheduler.add(lambda: None, 200)
+        scheduler.start()
+        while task.stats.n_ticks < 5:
+            sleep(.001)
+        scheduler.stop()
+        self.assertGreater(task.stats.rate, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
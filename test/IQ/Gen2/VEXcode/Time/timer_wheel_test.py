@@ -0,0 +1,50 @@
+"""vex.time.wheel tests."""
+
+
+import random
+import unittest
+
+from vex.time import TimerWheel
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+class TestTimerWheel(unittest.TestCase):
+    def test_fires_in_order_on_due_ticks(self):
+        wheel = TimerWheel(bits=(4, 3, 3))
+        rng = random.Random(0)
+        ticks = [rng.randint(1, 5000) for _ in range(500)] + [16, 128, 1024, 1 << 12]
+        fired = []
+        for tick in ticks:
+            wheel.schedule(tick * wheel.resolution,
+                           lambda tick: fired.append((tick, wheel.now)), tick)
+
+        wheel.advance_to(2.5)
+        self.assertTrue(all(tick == now for tick, now in fired))
+        wheel.advance_to(6)
+        self.assertEqual(sorted(ticks), [tick for tick, _ in fired])
+        self.assertEqual(len(wheel), 0)
+
+    def test_cancel(self):
+        wheel = TimerWheel()
+        fired = []
+        timer = wheel.schedule(.5, fired.append, 'cancelled')
+        wheel.schedule(.6, fired.append, 'kept')
+        wheel.cancel(timer)
+        self.assertEqual(len(wheel), 1)
+        self.assertEqual(wheel.advance_to(1), 1)
+        self.assertEqual(fired, ['kept'])
+
+    def test_skips_empty_ticks(self):
+        wheel = TimerWheel()
+        wheel.advance_to(1e6)
+        fired = []
+        wheel.schedule(1e6 + .01, fired.append, True)
+        wheel.advance_to(1e6 + .01)
+        self.assertEqual(fired, [True])
+
+
+if __name__ == "__main__":
+    unittest.main()
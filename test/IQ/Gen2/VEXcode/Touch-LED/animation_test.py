@@ -0,0 +1,68 @@
+"""vex.touch_led.animation tests."""
+
+
+import unittest
+
+from vex import Touchled, FadeType, Ports, ColorHue
+from vex.time import VirtualClock
+from vex.touch_led import LedAnimator
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+class TestLedAnimator(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock()
+        self.animator = LedAnimator(clock=self.clock)
+        self.led = Touchled(Ports.PORT1)
+        self.animator.attach(self.led)
+
+    def test_instant_color(self):
+        self.led.set_color(ColorHue.RED)
+        self.assertEqual(self.animator.color_at(self.led), 0xFF0000)
+        self.assertEqual(self.animator.brightness_at(self.led), 100)
+        self.led.set_brightness(25)
+        self.led.off()
+        self.assertEqual(self.animator.brightness_at(self.led), 0)
+        self.led.set_color(ColorHue.BLUE)
+        self.assertEqual(self.animator.brightness_at(self.led), 25)
+
+    def test_fade(self):
+        self.led.on_rgb(0, 0, 200)
+        self.led.set_fade(FadeType.SLOW)
+        self.clock.sleep(1)
+        self.led.on_rgb(200, 0, 0, 50)
+        self.assertEqual(self.animator.color_at(self.led, 1.25), 0x640064)
+        self.assertAlmostEqual(self.animator.brightness_at(self.led, 1.25), 75)
+        self.assertEqual(self.animator.color_at(self.led, 2), 0xC80000)
+
+    def test_blink_timeline(self):
+        leds = [Touchled(Ports.PORT2), Touchled(Ports.PORT3)]
+        for led in leds:
+            self.animator.attach(led)
+        leds[0].blink(0x00FF00, .25, .25)
+        leds[1].blink_hue(ColorHue.WHITE, .1, .3)
+
+        self.assertEqual(self.animator.brightness_at(leds[0], 1.2), 100)
+        self.assertEqual(self.animator.brightness_at(leds[0], 1.3), 0)
+        self.assertEqual(self.animator.brightness_at(leds[1], 1.35), 0)
+
+        self.clock.sleep(1)
+        self.assertEqual(self.animator.update(), 4 + 5)
+        self.assertEqual(len(self.animator.wheel), 2)
+
+        entries = list(self.animator.entries())
+        self.assertEqual([(entry.time, entry.brightness) for entry in entries
+                          if entry.led == 1],
+                         [(0, 100), (.25, 0), (.5, 100), (.75, 0), (1, 100)])
+
+        leds[0].off()
+        self.assertEqual(len(self.animator.wheel), 1)
+        self.assertEqual(entries[-1].time, 1)
+        self.assertEqual(self.animator.entries(len(entries)).__next__().brightness, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
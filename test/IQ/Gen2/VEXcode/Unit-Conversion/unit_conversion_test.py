@@ -0,0 +1,80 @@
+"""vex._util.conversion tests."""
+
+
+import unittest
+
+from vex import (Motor, Ports, SenseCache,
+                 AnalogUnits, DEGREES, TURNS, INCHES, MM, PERCENT, RPM, DPS,
+                 SECONDS, MSEC, TemperatureUnits, VelocityUnits, GearSetting)
+from vex._util.conversion import convert, convert_array, unit_table
+from vex._util.io import replace_stdin
+
+
+# flake8: noqa
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+
+CELSIUS, FAHRENHEIT = TemperatureUnits.CELSIUS, TemperatureUnits.FAHRENHEIT
+
+
+class TestConversion(unittest.TestCase):
+    def test_scalar(self):
+        self.assertEqual(convert(2, TURNS, DEGREES), 720)
+        self.assertEqual(convert(60, RPM, DPS), 360)
+        self.assertEqual(convert(1500, MSEC, SECONDS), 1.5)
+        self.assertAlmostEqual(convert(254, MM, INCHES), 10)
+
+    def test_same_unit_is_exact(self):
+        value = 0.1 + 0.2
+        self.assertIs(convert(value, INCHES, INCHES), value)
+
+    def test_affine_temperature(self):
+        self.assertEqual(convert(100, CELSIUS, FAHRENHEIT), 212)
+        self.assertEqual(convert(-40, FAHRENHEIT, CELSIUS), -40)
+
+    def test_percent(self):
+        self.assertAlmostEqual(convert(100, PERCENT, AnalogUnits.RANGE_12BIT), 4095)
+        self.assertEqual(convert(2500, AnalogUnits.MV, PERCENT), 50)
+
+    def test_array(self):
+        self.assertEqual(list(convert_array([0, 1, 2.5], TURNS, DEGREES)),
+                         [0, 360, 900])
+        self.assertEqual(list(convert_array([0, 100], CELSIUS, FAHRENHEIT)),
+                         [32, 212])
+
+    def test_unconvertible(self):
+        with self.assertRaises(AssertionError):
+            convert(1, VelocityUnits.RAW, RPM)
+        with self.assertRaises(AssertionError):
+            convert(1, RPM, DEGREES)
+
+
+class TestMotorUnits(unittest.TestCase):
+    def test_velocity_read_in_any_unit(self):
+        motor = Motor(Ports.PORT1)
+        motor.set_velocity(60, RPM)
+        self.assertEqual(motor._resolve_velocity_and_unit(None, DPS), (360, DPS))
+        self.assertAlmostEqual(motor._resolve_velocity_and_unit(None, PERCENT)[0],
+                               60 / 1.27)
+
+    def test_velocity_percent_depends_on_gear(self):
+        motor = Motor(Ports.PORT1, GearSetting.RATIO_6_1, False)
+        self.assertEqual(motor.velocity_units.convert(50, PERCENT, RPM), 300)
+
+    def test_timeout(self):
+        motor = Motor(Ports.PORT1)
+        motor.set_timeout(1.5, SECONDS)
+        self.assertEqual(motor.timeout(MSEC), 1500)
+
+    def test_sense_cache_derives_temperature(self):
+        motor = Motor(Ports.PORT1)
+        with SenseCache() as cache:
+            with replace_stdin('100'):
+                self.assertEqual(motor.temperature(CELSIUS), 100)
+            with replace_stdin(''):
+                self.assertEqual(motor.temperature(FAHRENHEIT), 212)
+            self.assertEqual(cache.derivations, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()